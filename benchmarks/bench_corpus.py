@@ -0,0 +1,170 @@
+"""Corpus benchmark of every parser and formatter, in every language.
+
+Replays the inputs of the unit test suite (see ``benchmarks/corpus.py``)
+through the public ``lingua_franca.parse`` and ``lingua_franca.format``
+functions, and reports for each (function, language):
+
+* ops/sec over all timed calls
+* p50 and p99 latency of a single call, in microseconds
+* peak memory allocated during one pass over the inputs (tracemalloc)
+* inputs which raised, which are left out of the timings
+
+Results can be written to a JSON file with stable ordering, so that runs
+on two commits can be diffed, or compared directly with ``--compare``.
+
+Usage:
+    python -m benchmarks.bench_corpus [-f FUNCTION ...] [-l LANG ...]
+                                      [-r REPEAT] [-o RESULTS.json]
+                                      [--compare BASELINE.json]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import tracemalloc
+import warnings
+from time import perf_counter
+
+import lingua_franca
+import lingua_franca.format
+import lingua_franca.parse
+from benchmarks.corpus import FUNCTIONS, ROOT_DIR, ANCHOR, load_corpus
+
+
+def _get_function(name):
+    return getattr(lingua_franca.parse, name, None) or \
+        getattr(lingua_franca.format, name)
+
+
+def _make_call(function, name, lang, args, kwargs):
+    if name == "extract_datetime":
+        return lambda: function(args[0], ANCHOR, lang=lang)
+    return lambda: function(*args, lang=lang, **kwargs)
+
+
+def _percentile(samples, percent):
+    """Nearest-rank percentile of a sorted, non-empty list"""
+    rank = max(int(round(percent / 100 * len(samples))), 1)
+    return samples[rank - 1]
+
+
+def bench(name, lang, inputs, repeat):
+    """Benchmark one function in one language
+
+    Returns:
+        dict: the results, see the module docstring
+    """
+    function = _get_function(name)
+    calls = []
+    errors = 0
+    # warm up, and weed out the inputs this language can't handle
+    for args, kwargs in inputs:
+        call = _make_call(function, name, lang, args, kwargs)
+        try:
+            call()
+        except Exception:
+            errors += 1
+        else:
+            calls.append(call)
+    if not calls:
+        return {"inputs": len(inputs), "errors": errors}
+
+    samples = []
+    for _ in range(repeat):
+        for call in calls:
+            start = perf_counter()
+            call()
+            samples.append(perf_counter() - start)
+    samples.sort()
+
+    tracemalloc.start()
+    for call in calls:
+        call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"inputs": len(inputs),
+            "errors": errors,
+            "ops_per_sec": round(len(samples) / sum(samples), 1),
+            "p50_us": round(_percentile(samples, 50) * 1e6, 2),
+            "p99_us": round(_percentile(samples, 99) * 1e6, 2),
+            "peak_kib": round(peak / 1024, 1)}
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short",
+                                        "HEAD"], cwd=ROOT_DIR,
+                                       stderr=subprocess.DEVNULL,
+                                       universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_results(results, baseline=None):
+    header = "{:<18}{:<6}{:>8}{:>12}{:>12}{:>12}{:>10}".format(
+        "function", "lang", "inputs", "ops/sec", "p50 [us]", "p99 [us]",
+        "peak KiB")
+    if baseline:
+        header += "{:>10}".format("speedup")
+    print(header)
+    for name, by_lang in results.items():
+        for lang, result in by_lang.items():
+            if "ops_per_sec" not in result:
+                print("{:<18}{:<6}{:>8}  all inputs raised".format(
+                    name, lang, result["inputs"]))
+                continue
+            line = "{:<18}{:<6}{:>8}{:>12.0f}{:>12.1f}{:>12.1f}{:>10.1f}" \
+                .format(name, lang, result["inputs"], result["ops_per_sec"],
+                        result["p50_us"], result["p99_us"],
+                        result["peak_kib"])
+            old = (baseline or {}).get(name, {}).get(lang, {})
+            if old.get("ops_per_sec"):
+                line += "{:>9.2f}x".format(result["ops_per_sec"] /
+                                           old["ops_per_sec"])
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-f", "--functions", nargs="+", default=FUNCTIONS,
+                        choices=FUNCTIONS)
+    parser.add_argument("-l", "--langs", nargs="+",
+                        default=lingua_franca.get_supported_langs())
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timed passes over the inputs")
+    parser.add_argument("-o", "--output", help="write results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run "
+                                          "to compare against")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    lingua_franca.load_languages(list(args.langs))
+    corpus = load_corpus()
+
+    results = {}
+    for name in args.functions:
+        results[name] = {}
+        for lang in args.langs:
+            if lang in corpus[name]:
+                results[name][lang] = bench(name, lang, corpus[name][lang],
+                                            args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    _print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": {"commit": _git_commit(),
+                                "python": platform.python_version(),
+                                "repeat": args.repeat},
+                       "results": results},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
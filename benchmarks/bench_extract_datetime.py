@@ -0,0 +1,116 @@
+"""Benchmark extract_datetime in every language.
+
+Replays the extract_datetime inputs of the unit test suite (see
+``benchmarks/corpus.py``) through ``lingua_franca.parse.extract_datetime``,
+anchored at ``benchmarks.corpus.ANCHOR``, and reports for each language
+the number of inputs, the mean time of a call over all of them, and that
+time relative to English. Inputs which raise are left out of the timings.
+
+With ``--chars``, consecutive inputs are joined into utterances of at
+least that many characters, e.g. ``--chars 200`` for the long utterances
+where the cleaning step of extract_datetime dominates.
+
+With ``--cache``, the results are cached (see
+``lingua_franca.datetime_cache``), and as every pass after the first
+replays the same inputs, the timings are those of cache hits. The first
+pass, from an empty cache, is timed on its own: each of its calls is a
+miss, which parses the input twice. The anchor is then 5 seconds after
+``ANCHOR``, as a miss at an anchor on the minute parses the input once.
+
+Usage:
+    python -m benchmarks.bench_extract_datetime [-l LANG ...] [-n NUMBER]
+                                                [-r REPEAT] [-c CHARS]
+                                                [--cache SIZE]
+"""
+import argparse
+import timeit
+import warnings
+from datetime import timedelta
+
+import lingua_franca
+import lingua_franca.parse
+from lingua_franca import config
+from lingua_franca.datetime_cache import clear_datetime_cache
+from benchmarks.corpus import ANCHOR, load_corpus
+
+
+def joined_texts(texts, chars):
+    """Join consecutive ``texts`` into utterances of ``chars`` or more"""
+    joined, utterance = [], ""
+    for text in texts:
+        utterance = utterance + " " + text if utterance else text
+        if len(utterance) >= chars:
+            joined.append(utterance)
+            utterance = ""
+    return joined
+
+
+def usable_texts(lang, texts):
+    """The ``texts`` extract_datetime doesn't raise on"""
+    usable = []
+    for text in texts:
+        try:
+            lingua_franca.parse.extract_datetime(text, ANCHOR, lang=lang)
+        except Exception:
+            continue
+        usable.append(text)
+    return usable
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--langs", nargs="+")
+    parser.add_argument("-n", "--number", type=int, default=3,
+                        help="passes over the inputs per timing run")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timing runs, the best one is reported")
+    parser.add_argument("-c", "--chars", type=int,
+                        help="join the inputs into utterances this long")
+    parser.add_argument("--cache", type=int, default=0, metavar="SIZE",
+                        help="cache up to SIZE extract_datetime results")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    corpus = load_corpus()["extract_datetime"]
+    langs = args.langs or list(corpus)
+    lingua_franca.load_languages(langs)
+
+    print("{:<6}{:>8}{:>14}{:>12}{}".format(
+        "lang", "inputs", "us per call", "vs en",
+        "{:>14}".format("us per miss") if args.cache else ""))
+    reference = None
+    for lang in sorted(langs, key=lambda lang: lang != "en"):
+        texts = [args[0] for args, _ in corpus.get(lang, [])]
+        if args.chars:
+            texts = joined_texts(texts, args.chars)
+        texts = usable_texts(lang, texts)
+        config.datetime_cache_size = args.cache
+        if not texts:
+            print("{:<6}  no inputs".format(lang))
+            continue
+
+        anchor = ANCHOR + timedelta(seconds=5) if args.cache else ANCHOR
+
+        def call():
+            for text in texts:
+                lingua_franca.parse.extract_datetime(text, anchor, lang=lang)
+
+        misses = ""
+        if args.cache:
+            clear_datetime_cache()
+            misses = "{:>14.1f}".format(
+                timeit.timeit(call, number=1) / len(texts) * 1e6)
+        elapsed = min(timeit.repeat(call, number=args.number,
+                                    repeat=args.repeat)) \
+            / args.number / len(texts) * 1e6
+        if lang == "en":
+            reference = elapsed
+        print("{:<6}{:>8}{:>14.1f}{:>12}{}".format(
+            lang, len(texts), elapsed,
+            "{:.2f}x".format(elapsed / reference) if reference else "-",
+            misses))
+        config.datetime_cache_size = 0
+
+
+if __name__ == "__main__":
+    main()
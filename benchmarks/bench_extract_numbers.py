@@ -0,0 +1,233 @@
+"""Benchmark extract_numbers on long utterances.
+
+For each language, an utterance of ``--tokens`` words is assembled from
+the extract_number(s) test inputs of that language (see
+``benchmarks/corpus.py``, or ``EXTRA_INPUTS`` for languages without
+tests), so that it is dense with number words, and
+``lingua_franca.parse.extract_numbers`` is timed on it. The time per word
+of each language is also given relative to English, as all these
+languages share the number parser of ``lingua_franca.lang.parse_common``.
+
+``extract_number`` is also timed on a short phrase containing a fraction,
+such as "two and three fifths of a cup", in each language which has
+fraction words.
+
+``extract_numbers`` is also timed on phrases whose numbers are written
+with digits, such as "set a timer for 5 minutes", which are read without
+parsing their words, and compared to parsing them with
+``NumberParser.extract_numbers_with_text``.
+
+With ``--scaling``, ``extract_numbers`` is instead timed on utterances of
+growing length, to show how its cost grows with the number of
+words.
+
+With ``--adversarial``, ``extract_numbers`` is timed on utterances of
+growing length built to be hard for the composition of fractions and
+decimals: numbers on both sides of a single decimal marker, many numbers
+before a trailing fraction, and many "and" between numbers.
+
+Usage:
+    python -m benchmarks.bench_extract_numbers [-l LANG ...] [-t TOKENS]
+                                               [-n NUMBER] [-r REPEAT]
+                                               [--scaling [WORDS ...]]
+                                               [--adversarial [REPEATS ...]]
+"""
+import argparse
+import timeit
+import warnings
+from importlib import import_module
+
+import lingua_franca
+import lingua_franca.parse
+from benchmarks.corpus import load_corpus
+from lingua_franca.lang.parse_common import TokenBuffer
+
+LANGS = ("en", "az", "cs", "nl", "pl", "ru", "uk")
+
+# languages without extract_number tests
+EXTRA_INPUTS = {
+    "nl": ["ik heb twee appels en drie peren",
+           "er zijn honderd vijfentwintig mensen",
+           "dat kost een miljoen euro",
+           "de eerste en de tweede keer",
+           "zeventien komma vijf graden",
+           "een half uur en drie kwart",
+           "duizend negenhonderd zevenentachtig"]
+}
+
+FRACTION_PHRASES = {
+    "en": "two and three fifths of a cup",
+    "cs": "dva a tři pětiny hrnku",
+    "de": "zwei und drei fünftel einer tasse",
+    "es": "dos y tres quintos de una taza",
+    "fr": "deux et trois cinquièmes d'une tasse",
+    "nl": "twee en drie vijfde van een kopje",
+    "pl": "dwa i trzy piąte szklanki",
+    "sv": "två och tre femtedelar av en kopp"
+}
+
+# utterances of `repeats` times a phrase around a decimal or fraction marker
+ADVERSARIAL = {
+    "decimal marker between numbers":
+        lambda n: "seven cats " * n + "and nothing point " +
+        "three dogs " * n,
+    "trailing fraction":
+        lambda n: "two eggs " * n + "and a half",
+    "numbers joined by and":
+        lambda n: "bread and two eggs " * n
+}
+
+DIGIT_PHRASES = {
+    "en": "set a timer for 5 minutes and call me at 10.30",
+    "az": "5 dəqiqə sonra saat 10.30 da zəng et",
+    "cs": "nastav časovač na 5 minut a zavolej mi v 10.30",
+    "nl": "zet de timer op 5 minuten en bel me om 10.30",
+    "pl": "ustaw minutnik na 5 minut i zadzwoń o 10.30",
+    "ru": "поставь таймер на 5 минут и позвони в 10.30",
+    "uk": "постав таймер на 5 хвилин і подзвони о 10.30"
+}
+
+
+def build_utterance(corpus, lang, tokens):
+    """Join the test inputs of a language until there are `tokens` words"""
+    words = []
+    inputs = corpus["extract_numbers"].get(lang, []) + \
+        corpus["extract_number"].get(lang, [])
+    texts = [args[0] for args, _ in inputs if isinstance(args[0], str)] + \
+        EXTRA_INPUTS.get(lang, [])
+    if not texts:
+        return None
+    while len(words) < tokens:
+        for text in texts:
+            words.extend(text.split())
+    return " ".join(words[:tokens])
+
+
+def best_per_call(func, number, repeat):
+    """Best observed time for a single call, in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) \
+        / number * 1e6
+
+
+def scaling(corpus, langs, lengths, number, repeat):
+    """Print the time taken by extract_numbers per utterance length"""
+    print("extract_numbers, by utterance length")
+    print("{:<6}{:>8}{:>10}{:>14}{:>16}".format(
+        "lang", "words", "numbers", "time [us]", "per word [us]"))
+    for lang in langs:
+        for length in lengths:
+            text = build_utterance(corpus, lang, length)
+            if text is None:
+                print("{:<6}  no inputs".format(lang))
+                break
+            numbers = lingua_franca.parse.extract_numbers(text, lang=lang)
+            elapsed = best_per_call(
+                lambda: lingua_franca.parse.extract_numbers(text, lang=lang),
+                max(number * lengths[0] // length, 1), repeat)
+            print("{:<6}{:>8}{:>10}{:>14.1f}{:>16.2f}".format(
+                lang, length, len(numbers), elapsed, elapsed / length))
+
+
+def adversarial(repeats, number, repeat):
+    """Print the time taken by extract_numbers on ADVERSARIAL utterances"""
+    print("extract_numbers, adversarial utterances in 'en'")
+    print("{:<34}{:>8}{:>14}{:>16}".format(
+        "utterance", "words", "time [us]", "per word [us]"))
+    for name, build in ADVERSARIAL.items():
+        for count in repeats:
+            text = build(count)
+            words = len(text.split())
+            elapsed = best_per_call(
+                lambda: lingua_franca.parse.extract_numbers(text, lang="en"),
+                max(number * repeats[0] // count, 1), repeat)
+            print("{:<34}{:>8}{:>14.1f}{:>16.2f}".format(
+                name, words, elapsed, elapsed / words))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--langs", nargs="+")
+    parser.add_argument("-t", "--tokens", type=int, default=50,
+                        help="words per utterance")
+    parser.add_argument("-n", "--number", type=int, default=20,
+                        help="calls per timing run")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timing runs, the best one is reported")
+    parser.add_argument("--scaling", nargs="*", type=int,
+                        help="time utterances of these numbers of words "
+                             "(default: 50 to 1600)")
+    parser.add_argument("--adversarial", nargs="*", type=int,
+                        help="time ADVERSARIAL utterances repeating their "
+                             "phrase this many times (default: 50 to 800)")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    lingua_franca.load_languages(list(args.langs or
+                                      set(LANGS) | set(FRACTION_PHRASES)))
+    corpus = load_corpus()
+
+    if args.scaling is not None:
+        scaling(corpus, args.langs or ["en"],
+                sorted(args.scaling or [50, 100, 200, 400, 800, 1600]),
+                args.number, args.repeat)
+        return
+    if args.adversarial is not None:
+        adversarial(sorted(args.adversarial or [50, 100, 200, 400, 800]),
+                    args.number, args.repeat)
+        return
+
+    print("extract_numbers, {} words".format(args.tokens))
+    print("{:<6}{:>10}{:>14}{:>16}{:>8}".format(
+        "lang", "numbers", "time [us]", "per word [us]", "vs en"))
+    reference = None
+    for lang in args.langs or LANGS:
+        text = build_utterance(corpus, lang, args.tokens)
+        if text is None:
+            print("{:<6}  no inputs".format(lang))
+            continue
+        numbers = lingua_franca.parse.extract_numbers(text, lang=lang)
+        elapsed = best_per_call(
+            lambda: lingua_franca.parse.extract_numbers(text, lang=lang),
+            args.number, args.repeat)
+        per_word = elapsed / len(text.split())
+        if lang == "en":
+            reference = per_word
+        print("{:<6}{:>10}{:>14.1f}{:>16.2f}{:>8}".format(
+            lang, len(numbers), elapsed, per_word,
+            "{:.2f}".format(per_word / reference) if reference else "-"))
+
+    print("\nextract_number, fractions")
+    print("{:<6}{:>10}{:>14}  {}".format("lang", "number", "time [us]",
+                                         "text"))
+    for lang, text in FRACTION_PHRASES.items():
+        if args.langs and lang not in args.langs:
+            continue
+        number = lingua_franca.parse.extract_number(text, lang=lang)
+        elapsed = best_per_call(
+            lambda: lingua_franca.parse.extract_number(text, lang=lang),
+            args.number * 10, args.repeat)
+        print("{:<6}{:>10.3g}{:>14.1f}  {}".format(lang, number, elapsed,
+                                                   text))
+
+    print("\nextract_numbers, digits")
+    print("{:<6}{:>10}{:>14}{:>14}  {}".format(
+        "lang", "numbers", "time [us]", "parsed [us]", "text"))
+    for lang, text in DIGIT_PHRASES.items():
+        if args.langs and lang not in args.langs:
+            continue
+        parser = getattr(import_module("lingua_franca.lang.parse_" + lang),
+                         "_NUMBER_PARSER_" + lang.upper())
+        numbers = lingua_franca.parse.extract_numbers(text, lang=lang)
+        elapsed = best_per_call(
+            lambda: lingua_franca.parse.extract_numbers(text, lang=lang),
+            args.number * 10, args.repeat)
+        parsed = best_per_call(
+            lambda: parser.extract_numbers_with_text(
+                TokenBuffer.tokenize(text)),
+            args.number * 10, args.repeat)
+        print("{:<6}{:>10}{:>14.1f}{:>14.1f}  {}".format(
+            lang, len(numbers), elapsed, parsed, text))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark extract_numbers_batch on a large batch of short texts.
+
+The batch is made of the extract_number(s) test inputs of a language (see
+``benchmarks/corpus.py``), repeated until there are ``--texts`` of them,
+which stands for a set of transcripts. It is parsed with a loop calling
+``lingua_franca.parse.extract_numbers`` on each text, then with
+``lingua_franca.parse.extract_numbers_batch`` in this process and with
+pools of growing numbers of worker processes. The pool timings include
+starting the workers and loading the language in each of them.
+
+Usage:
+    python -m benchmarks.bench_extract_numbers_batch [-l LANG] [-t TEXTS]
+                                                     [-w WORKERS ...]
+                                                     [-c CHUNKSIZE]
+"""
+import argparse
+import os
+import time
+import warnings
+
+import lingua_franca
+import lingua_franca.parse
+from benchmarks.corpus import load_corpus
+
+
+def build_batch(corpus, lang, size):
+    """Repeat the test inputs of a language until there are `size`"""
+    inputs = corpus["extract_numbers"].get(lang, []) + \
+        corpus["extract_number"].get(lang, [])
+    texts = [args[0] for args, _ in inputs if isinstance(args[0], str)]
+    if not texts:
+        raise SystemExit("no inputs for '{}'".format(lang))
+    return (texts * (size // len(texts) + 1))[:size]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--lang", default="en")
+    parser.add_argument("-t", "--texts", type=int, default=20000,
+                        help="texts in the batch")
+    parser.add_argument("-w", "--workers", nargs="+", type=int,
+                        help="pool sizes to time (default: 2 up to the "
+                             "number of CPUs)")
+    parser.add_argument("-c", "--chunksize", type=int, default=64)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    lingua_franca.load_language(args.lang)
+    texts = build_batch(load_corpus(), args.lang, args.texts)
+    cpus = os.cpu_count() or 1
+    # a single worker is the same as parsing in this process
+    pools = [workers for workers in args.workers or
+             sorted({2, max(cpus // 2, 2), max(cpus, 2)}) if workers > 1]
+
+    def loop():
+        for text in texts:
+            lingua_franca.parse.extract_numbers(text, lang=args.lang)
+
+    def batch(workers):
+        return lambda: list(lingua_franca.parse.extract_numbers_batch(
+            texts, lang=args.lang, workers=workers,
+            chunksize=args.chunksize))
+
+    print("{} texts in '{}', {} CPUs".format(len(texts), args.lang, cpus))
+    print("{:<24}{:>12}{:>14}{:>10}".format("", "time [s]", "texts/s",
+                                            "speedup"))
+    reference = timed(loop)
+    runs = [("extract_numbers loop", reference),
+            ("batch, 1 process", timed(batch(None)))]
+    runs += [("batch, {} workers".format(workers), timed(batch(workers)))
+             for workers in pools]
+    for name, elapsed in runs:
+        print("{:<24}{:>12.2f}{:>14.0f}{:>9.2f}x".format(
+            name, elapsed, len(texts) / elapsed, reference / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Startup benchmark: how much does loading languages cost at import time?
+
+Runs a fresh interpreter under ``python -X importtime`` which loads every
+supported language, imports ``lingua_franca.parse`` and
+``lingua_franca.format``, and then only serves a couple of languages. The
+import log is summarised per package, along with how many of the
+``lingua_franca.lang`` modules were actually imported.
+
+Usage:
+    python -m benchmarks.bench_import_time [-l LANG [LANG ...]] [-r REPEAT]
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+SCRIPT = """
+import sys
+import lingua_franca
+lingua_franca.load_languages(lingua_franca.get_supported_langs())
+import lingua_franca.parse, lingua_franca.format
+for lang in {langs!r}:
+    lingua_franca.parse.extract_number("1", lang=lang)
+    lingua_franca.format.nice_number(1, lang=lang)
+print(sum(name.startswith("lingua_franca.lang.") for name in sys.modules))
+"""
+
+
+def parse_importtime(log):
+    """Turn a ``-X importtime`` log into {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run(langs):
+    """Run the script once.
+
+    Returns:
+        tuple: wall seconds, number of language modules imported and
+               the parsed importtime log
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                           SCRIPT.format(langs=langs)],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    return (time.perf_counter() - start, int(proc.stdout),
+            parse_importtime(proc.stderr))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--langs", nargs="+", default=["en", "es"],
+                        help="languages actually called after loading all")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run(args.langs) for _ in range(args.repeat)]
+    wall, lang_modules, modules = min(runs, key=lambda r: r[0])
+
+    print("serving: {}".format(", ".join(args.langs)))
+    print("best wall time of {} runs: {:.1f} ms".format(args.repeat,
+                                                        wall * 1000))
+    print("lingua_franca.lang modules imported: {}".format(lang_modules))
+    print("total import time: {:.1f} ms".format(
+        sum(self_us for self_us, _ in modules.values()) / 1000))
+    print("\n{:<40}{:>12}".format("module", "self [ms]"))
+    for name, (self_us, _) in sorted(modules.items(),
+                                     key=lambda m: -m[1][0])[:10]:
+        print("{:<40}{:>12.1f}".format(name, self_us / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Micro-benchmark for the @localized_function dispatch overhead.
+
+Every call to a top-level function such as
+``lingua_franca.parse.extract_number`` goes through the
+``@localized_function`` wrapper before reaching the localized
+implementation (``lingua_franca.lang.parse_en.extract_number_en``).
+This script times both paths for a few cheap calls and reports the
+difference, which is the cost of the wrapper itself. Calls through a
+handle returned by ``lingua_franca.bind()`` are timed as well.
+
+Usage:
+    python -m benchmarks.bench_localized_function [-n NUMBER] [-r REPEAT]
+"""
+import argparse
+import timeit
+
+import lingua_franca
+import lingua_franca.format
+import lingua_franca.parse
+from lingua_franca.lang import format_en, parse_en
+
+lingua_franca.load_language("en")
+lf = lingua_franca.bind("en-us")
+
+CASES = (
+    ("extract_number('one')",
+     lambda: lingua_franca.parse.extract_number("one"),
+     lambda: lf.extract_number("one"),
+     lambda: parse_en.extract_number_en("one")),
+    ("extract_number('one', lang='en-us')",
+     lambda: lingua_franca.parse.extract_number("one", lang="en-us"),
+     lambda: lf.extract_number("one"),
+     lambda: parse_en.extract_number_en("one")),
+    ("normalize('two', 'en', False)",
+     lambda: lingua_franca.parse.normalize("two", "en", False),
+     lambda: lf.normalize("two", False),
+     lambda: parse_en.normalize_en("two", False)),
+    ("nice_number(5)",
+     lambda: lingua_franca.format.nice_number(5),
+     lambda: lf.nice_number(5),
+     lambda: format_en.nice_number_en(5)),
+)
+
+
+def best_per_call(func, number, repeat):
+    """Best observed time for a single call, in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) \
+        / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=20000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("{:<40}{:>12}{:>12}{:>12}{:>12}".format("call", "wrapped", "bound",
+                                                  "direct", "overhead"))
+    for name, wrapped, bound, direct in CASES:
+        wrapped_us = best_per_call(wrapped, args.number, args.repeat)
+        bound_us = best_per_call(bound, args.number, args.repeat)
+        direct_us = best_per_call(direct, args.number, args.repeat)
+        print("{:<40}{:>10.2f}us{:>10.2f}us{:>10.2f}us{:>10.2f}us".format(
+            name, wrapped_us, bound_us, direct_us, wrapped_us - direct_us))
+
+
+if __name__ == "__main__":
+    main()
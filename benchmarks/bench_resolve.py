@@ -0,0 +1,86 @@
+"""Benchmark resolving temporal expressions at many anchors.
+
+Each extract_datetime test input of a language (see
+``benchmarks/corpus.py``) stands for a phrase projected over a calendar,
+one anchor a day for ``--anchors`` days from ``benchmarks.corpus.ANCHOR``.
+The anchors are resolved with a loop calling
+``lingua_franca.parse.extract_datetime`` at each of them, then with
+``lingua_franca.temporal.resolve`` on the expression of the phrase
+(see ``lingua_franca.temporal``), which includes parsing it once.
+Inputs which raise are left out of the timings.
+
+Usage:
+    python -m benchmarks.bench_resolve [-l LANG] [-a ANCHORS]
+"""
+import argparse
+import time
+import warnings
+from datetime import timedelta
+
+import lingua_franca
+import lingua_franca.parse
+from lingua_franca.temporal import resolve
+from benchmarks.corpus import ANCHOR, load_corpus
+
+
+def usable_texts(lang, texts):
+    """The ``texts`` extract_temporal_expression finds an expression in"""
+    usable = []
+    for text in texts:
+        try:
+            if lingua_franca.parse.extract_temporal_expression(
+                    text, ANCHOR, lang=lang) is None:
+                continue
+        except Exception:
+            continue
+        usable.append(text)
+    return usable
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--lang", default="en")
+    parser.add_argument("-a", "--anchors", type=int, default=365,
+                        help="anchors, one a day, each phrase is resolved at")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    lingua_franca.load_language(args.lang)
+    corpus = load_corpus()["extract_datetime"]
+    texts = usable_texts(args.lang, [call_args[0] for call_args, _ in
+                                     corpus.get(args.lang, [])])
+    if not texts:
+        raise SystemExit("no inputs for '{}'".format(args.lang))
+    anchors = [ANCHOR + timedelta(days=day) for day in range(args.anchors)]
+
+    def loop():
+        for text in texts:
+            for anchor in anchors:
+                lingua_franca.parse.extract_datetime(text, anchor,
+                                                     lang=args.lang)
+
+    def batch():
+        for text in texts:
+            resolve(lingua_franca.parse.extract_temporal_expression(
+                text, ANCHOR, lang=args.lang), anchors)
+
+    print("{} phrases in '{}', {} anchors each".format(
+        len(texts), args.lang, len(anchors)))
+    print("{:<24}{:>12}{:>16}{:>10}".format("", "time [s]", "us per anchor",
+                                            "speedup"))
+    reference = timed(loop)
+    for name, elapsed in [("extract_datetime loop", reference),
+                          ("resolve", timed(batch))]:
+        print("{:<24}{:>12.2f}{:>16.1f}{:>9.2f}x".format(
+            name, elapsed, elapsed / len(texts) / len(anchors) * 1e6,
+            reference / elapsed))
+
+
+if __name__ == "__main__":
+    main()
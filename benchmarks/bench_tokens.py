@@ -0,0 +1,95 @@
+"""Benchmark the token representation of the number parser on long inputs.
+
+For utterances of growing length, assembled from the extract_number(s)
+test inputs of a language as in ``benchmarks/bench_extract_numbers.py``,
+reports:
+
+* the memory held by the tokens of the utterance, as a list of ``Token``
+  (``parse_common.tokenize``) and as a ``parse_common.TokenBuffer``
+* the time taken by ``extract_numbers`` and ``normalize``
+* the peak memory allocated during one call (tracemalloc)
+
+Usage:
+    python -m benchmarks.bench_tokens [-l LANG ...] [-n NUMBER]
+                                      [-r REPEAT] [--words WORDS ...]
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+import warnings
+
+import lingua_franca
+import lingua_franca.parse
+from benchmarks.bench_extract_numbers import build_utterance
+from benchmarks.corpus import load_corpus
+from lingua_franca.lang.parse_common import tokenize, TokenBuffer
+
+
+def deep_size(value, seen=None):
+    """Approximate size of an object and of what it holds, in bytes"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif isinstance(value, TokenBuffer):
+        size += sum(deep_size(getattr(value, name), seen)
+                    for name in value.__slots__)
+    return size
+
+
+def peak_kib(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--langs", nargs="+", default=["en", "pl"])
+    parser.add_argument("-n", "--number", type=int, default=5,
+                        help="calls per timing run")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timing runs, the best one is reported")
+    parser.add_argument("--words", nargs="+", type=int,
+                        default=[200, 800, 3200])
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    lingua_franca.load_languages(args.langs)
+    corpus = load_corpus()
+
+    print("{:<6}{:>7}{:>12}{:>12}{:>18}{:>12}{:>10}".format(
+        "lang", "words", "Tokens KiB", "buffer KiB", "function", "time [ms]",
+        "peak KiB"))
+    for lang in args.langs:
+        for length in args.words:
+            text = build_utterance(corpus, lang, length)
+            if text is None:
+                print("{:<6}  no inputs".format(lang))
+                break
+            tokens_kib = deep_size(tokenize(text)) / 1024
+            buffer_kib = deep_size(TokenBuffer.tokenize(text)) / 1024
+            for name in ("extract_numbers", "normalize"):
+                function = getattr(lingua_franca.parse, name)
+
+                def call():
+                    function(text, lang=lang)
+
+                elapsed = min(timeit.repeat(call, number=args.number,
+                                            repeat=args.repeat)) \
+                    / args.number * 1e3
+                print("{:<6}{:>7}{:>12.1f}{:>12.1f}{:>18}{:>12.2f}"
+                      "{:>10.1f}".format(lang, length, tokens_kib,
+                                         buffer_kib, name, elapsed,
+                                         peak_kib(call)))
+
+
+if __name__ == "__main__":
+    main()
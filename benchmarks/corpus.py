@@ -0,0 +1,169 @@
+"""Benchmark inputs harvested from the unit test corpus.
+
+The inputs used by the benchmarks are the same ones the test suite uses,
+so that every supported language is exercised on realistic phrases:
+
+* calls to the benchmarked functions in ``test/unittests/test_parse_*.py``
+  and ``test_format_*.py`` whose arguments are literals (the test helpers
+  wrapping ``extract_datetime``, such as ``testExtract("...", ...)``, count
+  as calls to ``extract_datetime``)
+* the ``datetime_param`` values of ``res/text/<lang>/date_time_test.json``,
+  used as the datetimes for ``nice_time`` and ``nice_date``
+
+The language of a call is its literal ``lang`` argument, or else the
+language the test file is named after.
+"""
+import ast
+import datetime
+import json
+import re
+from collections import defaultdict
+from glob import glob
+from os.path import basename, dirname, join
+
+from lingua_franca.internal import get_supported_langs
+
+ROOT_DIR = dirname(dirname(__file__))
+TEST_DIR = join(ROOT_DIR, "test", "unittests")
+RES_DIR = join(ROOT_DIR, "lingua_franca", "res", "text")
+
+FUNCTIONS = ("extract_number", "extract_numbers", "extract_duration",
+             "extract_datetime", "normalize", "pronounce_number",
+             "nice_time", "nice_date", "nice_duration")
+
+# functions whose inputs are not text, and so may be shared by all languages
+LANGUAGE_AGNOSTIC = ("nice_time", "nice_date", "nice_duration")
+
+# test helpers which call extract_datetime with their first argument
+_DATETIME_HELPERS = re.compile(r"^(testExtract|extractWithFormat)")
+
+_TEST_FILE_LANG = re.compile(r"^test_(?:parse|format)(?:_datetime)?"
+                             r"(?:_([a-z]{2}))?\.py$")
+
+# the anchor used by most extract_datetime tests
+ANCHOR = datetime.datetime(2017, 6, 27, 13, 4)
+
+
+class _NotLiteral(ValueError):
+    pass
+
+
+def _evaluate(node):
+    """Evaluate a literal, also accepting datetime(...) and timedelta(...)
+    calls with literal arguments."""
+    if isinstance(node, ast.Call):
+        name = node.func.attr if isinstance(node.func, ast.Attribute) \
+            else getattr(node.func, "id", None)
+        constructor = {"datetime": datetime.datetime,
+                       "timedelta": datetime.timedelta}.get(name)
+        if constructor is None:
+            raise _NotLiteral(name)
+        args = [_evaluate(arg) for arg in node.args]
+        # drop tzinfo and other non-literal keywords
+        kwargs = {}
+        for keyword in node.keywords:
+            try:
+                kwargs[keyword.arg] = _evaluate(keyword.value)
+            except _NotLiteral:
+                pass
+        return constructor(*args, **kwargs)
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise _NotLiteral(ast.dump(node))
+
+
+def _call_name(node):
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return getattr(node.func, "id", None)
+
+
+def _harvest_file(path, file_lang, corpus):
+    with open(path, encoding="utf8") as f:
+        tree = ast.parse(f.read(), path)
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not node.args:
+            continue
+        name = _call_name(node)
+        if name in FUNCTIONS:
+            function = name
+        elif name and _DATETIME_HELPERS.match(name):
+            function = "extract_datetime"
+            node = ast.Call(func=node.func, args=node.args[:1], keywords=[])
+        else:
+            continue
+        try:
+            args = tuple(_evaluate(arg) for arg in node.args)
+            kwargs = {keyword.arg: _evaluate(keyword.value)
+                      for keyword in node.keywords if keyword.arg}
+        except (_NotLiteral, TypeError, ValueError):
+            continue
+        if function in ("extract_datetime", "nice_time", "nice_date"):
+            # the datetimes come from the anchor/date_time_test.json
+            args = args[:1]
+            kwargs = {}
+        lang = kwargs.pop("lang", None)
+        if not isinstance(lang, str) or \
+                lang.split("-")[0].lower() not in get_supported_langs():
+            lang = file_lang
+        corpus[function][lang.split("-")[0].lower()].append((args, kwargs))
+
+
+def _datetime_params():
+    """Every distinct datetime in the date_time_test.json files"""
+    datetimes = set()
+    for path in glob(join(RES_DIR, "*", "date_time_test.json")):
+        with open(path, encoding="utf8") as f:
+            tests = json.load(f)
+        for cases in tests.values():
+            for case in cases.values():
+                params = [int(param) for param in
+                          case["datetime_param"].split(",")]
+                datetimes.add(datetime.datetime(*params))
+    return sorted(datetimes)
+
+
+def _dedupe(calls):
+    seen = set()
+    unique = []
+    for call in calls:
+        key = repr(call)
+        if key not in seen:
+            seen.add(key)
+            unique.append(call)
+    return unique
+
+
+def load_corpus():
+    """Build the benchmark inputs
+
+    Returns:
+        dict: {function: {lang: [(args, kwargs)]}} with 'lang' excluded
+              from kwargs. Every supported language has inputs for the
+              language agnostic functions, and for the other functions if
+              its tests call them.
+    """
+    corpus = defaultdict(lambda: defaultdict(list))
+    for path in sorted(glob(join(TEST_DIR, "test_*.py"))):
+        match = _TEST_FILE_LANG.match(basename(path))
+        if match:
+            _harvest_file(path, match.group(1) or "en", corpus)
+
+    datetimes = _datetime_params()
+    corpus["nice_time"] = {lang: [((dt,), {}) for dt in datetimes]
+                           for lang in get_supported_langs()}
+    corpus["nice_date"] = {lang: [((dt,), {"now": ANCHOR})
+                                  for dt in datetimes]
+                           for lang in get_supported_langs()}
+
+    durations = _dedupe(call for calls in corpus["nice_duration"].values()
+                        for call in calls)
+    corpus["nice_duration"] = {lang: durations
+                               for lang in get_supported_langs()}
+
+    return {function: {lang: _dedupe(calls)
+                       for lang, calls in sorted(corpus[function].items())
+                       if calls}
+            for function in FUNCTIONS}
@@ -1,7 +1,8 @@
 from .internal import get_default_lang, set_default_lang, get_default_loc, \
     get_active_langs, _set_active_langs, get_primary_lang_code, \
     get_full_lang_code, resolve_resource_file, load_language, \
-    load_languages, unload_language, unload_languages, get_supported_langs
+    load_languages, unload_language, unload_languages, get_supported_langs, \
+    bind, language, refresh_resource_index
 
 from lingua_franca import config
 
@@ -1,3 +1,8 @@
 load_langs_on_demand = False
 inject_timezones = True
 ovos_defaults = True  # use mycroft.conf for default values
+collect_call_stats = False  # see lingua_franca.instrumentation
+check_resource_mtimes = False  # re-index changed resource directories
+word_memo_size = 4096  # see lingua_franca.lang.parse_common.word_memo
+datetime_cache_size = 0  # see lingua_franca.datetime_cache, 0 disables it
+datetime_cache_granularity = 60  # seconds, a divisor of a minute
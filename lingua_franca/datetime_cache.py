@@ -0,0 +1,217 @@
+"""Opt-in cache of `lingua_franca.parse.extract_datetime` results.
+
+Set `lingua_franca.config.datetime_cache_size` to the number of results
+to keep, least recently used first out, to have phrases which come back
+over and over ("tomorrow morning", "in 10 minutes") parsed only once.
+
+Results are keyed on the text, the language, `default_time` and the
+anchor truncated to `config.datetime_cache_granularity` seconds, and
+stored as an offset rather than as a datetime, so that a hit stays
+correct as the anchor moves within that granularity:
+
+- "in 10 minutes" is stored as 10 minutes after the anchor
+- "tomorrow" is stored as an offset from the truncated anchor, so that
+  every anchor between 10:00:00 and 10:00:59 gets the same midnight
+
+To tell one kind from the other every miss parses the text twice, at the
+anchor it was given and at another of the same granularity, which
+differs from it in its microseconds too as many parsers drop them. A
+miss so costs two parses, and the cache only pays off for texts which
+come back. Texts whose result neither moves with the anchor nor stays
+put are parsed on every call. The text is used as it is, since the
+leftover string of several languages keeps its case and spacing.
+
+Two anchors can't tell where within the granularity a result changes,
+as "at 4:30 pm" does at 16:30:00, from today's 16:30 to tomorrow's. The
+parsers only change their results on the minute, so the granularity is
+a divisor of a minute, at most 60 seconds, and an anchor on the minute
+itself, 16:30:00.000000, has entries of its own. It is the only anchor
+of these, and their misses parse the text once.
+
+Calls through a handle returned by `lingua_franca.bind()` skip the
+decorator, and so are not cached. When disabled, the only cost is a
+single check of the config flag.
+
+Example:
+    >>> lingua_franca.config.datetime_cache_size = 1000
+    >>> extract_datetime("in 10 minutes", datetime(2017, 6, 27, 13, 4, 5))
+    [datetime.datetime(2017, 6, 27, 13, 14, 5, tzinfo=...), '']
+    >>> extract_datetime("in 10 minutes", datetime(2017, 6, 27, 13, 4, 35))
+    [datetime.datetime(2017, 6, 27, 13, 14, 35, tzinfo=...), '']
+    >>> get_datetime_cache_stats()["hits"]
+    1
+"""
+from collections import OrderedDict
+from datetime import timedelta
+from functools import wraps
+from threading import Lock
+
+from lingua_franca import config
+from lingua_franca.internal import get_default_lang
+from lingua_franca.time import now_local, to_local
+
+# the parse of a text could not be stored as an offset
+_UNCACHEABLE = object()
+_MISSING = object()
+
+# what the offset of a result is from: the anchor, the anchor without its
+# microseconds or the truncated anchor
+_FROM_ANCHOR, _FROM_SECOND, _FROM_TRUNCATED = range(3)
+
+_cache = OrderedDict()
+_cache_lock = Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _arguments(text, anchorDate=None, lang='', default_time=None):
+    return text, anchorDate, lang, default_time
+
+
+# the granularities the minutes are made of
+_GRANULARITIES = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
+
+
+def _granularity():
+    """`config.datetime_cache_granularity`, rounded down to a divisor of a
+    minute"""
+    granularity = int(config.datetime_cache_granularity)
+    return max([g for g in _GRANULARITIES if g <= granularity] or [1])
+
+
+def _truncate(anchor, granularity):
+    """`anchor` rounded down to `granularity` seconds, within its minute"""
+    return anchor.replace(second=anchor.second - anchor.second % granularity,
+                          microsecond=0)
+
+
+def _naive(dt):
+    return dt.replace(tzinfo=None)
+
+
+def _other_anchor(anchor, truncated, granularity):
+    """An anchor of the same granularity, with other seconds where there
+    are any and other microseconds, never on the minute"""
+    if anchor.replace(microsecond=0) == truncated:
+        other_anchor = truncated + timedelta(seconds=granularity - 1)
+    else:
+        other_anchor = truncated
+    return other_anchor.replace(microsecond=1 if anchor.microsecond == 999999
+                                else 999999)
+
+
+def _base(base, anchor, truncated):
+    if base == _FROM_ANCHOR:
+        return _naive(anchor)
+    if base == _FROM_SECOND:
+        return anchor.replace(microsecond=0, tzinfo=None)
+    return _naive(truncated)
+
+
+def _entry(result, other_result, anchor, other_anchor, truncated):
+    """What to store of the parses of a text at two anchors
+
+    Returns:
+        None if there is no date in the text, (base, offset, tzinfo,
+        leftover, type) where `base` is one of _FROM_ANCHOR, _FROM_SECOND
+        and _FROM_TRUNCATED, or _UNCACHEABLE.
+    """
+    if result is None and other_result is None:
+        return None
+    if result is None or other_result is None or \
+            result[1] != other_result[1] or \
+            result[0].tzinfo != other_result[0].tzinfo:
+        return _UNCACHEABLE
+    date, other_date = _naive(result[0]), _naive(other_result[0])
+    for base in (_FROM_ANCHOR, _FROM_SECOND, _FROM_TRUNCATED):
+        offset = date - _base(base, anchor, truncated)
+        if offset == other_date - _base(base, other_anchor, truncated):
+            return base, offset, result[0].tzinfo, result[1], type(result)
+    return _UNCACHEABLE
+
+
+def _resolve(entry, anchor, truncated):
+    if entry is None:
+        return None
+    base, offset, tzinfo, leftover, result_type = entry
+    date = _base(base, anchor, truncated) + offset
+    return result_type((date.replace(tzinfo=tzinfo), leftover))
+
+
+def cache_datetimes(function):
+    """Cache the results of `function`, which is `extract_datetime`"""
+    @wraps(function)
+    def cached_function(*args, **kwargs):
+        size = config.datetime_cache_size
+        if size <= 0:
+            return function(*args, **kwargs)
+
+        text, anchor, lang, default_time = _arguments(*args, **kwargs)
+        anchor = anchor or now_local()
+        if config.inject_timezones and anchor.tzinfo is None:
+            anchor = to_local(anchor)
+        granularity = _granularity()
+        truncated = _truncate(anchor, granularity)
+        # on the minute, where "at 4:30 pm" is still today
+        on_minute = anchor.second == anchor.microsecond == 0
+        key = (text, (lang or get_default_lang() or "").lower(),
+               _naive(truncated), repr(truncated.tzinfo), default_time,
+               on_minute)
+
+        with _cache_lock:
+            entry = _cache.get(key, _MISSING)
+            if entry is _MISSING or entry is _UNCACHEABLE:
+                _stats["misses"] += 1
+            else:
+                _stats["hits"] += 1
+            if entry is not _MISSING:
+                _cache.move_to_end(key)
+        if entry is not _MISSING and entry is not _UNCACHEABLE:
+            return _resolve(entry, anchor, truncated)
+
+        result = function(text, anchor, lang=lang,
+                          default_time=default_time)
+        if entry is _UNCACHEABLE:
+            return result
+        if on_minute:
+            # the only anchor of its key, parsed once
+            entry = _entry(result, result, anchor, anchor, truncated)
+        else:
+            other_anchor = _other_anchor(anchor, truncated, granularity)
+            try:
+                other_result = function(text, other_anchor, lang=lang,
+                                        default_time=default_time)
+            except Exception:
+                entry = _UNCACHEABLE
+            else:
+                entry = _entry(result, other_result, anchor, other_anchor,
+                               truncated)
+        with _cache_lock:
+            _cache[key] = entry
+            while len(_cache) > size:
+                _cache.popitem(last=False)
+                _stats["evictions"] += 1
+        return result
+
+    return cached_function
+
+
+def get_datetime_cache_stats():
+    """Get the statistics of the cache
+
+    Returns:
+        dict: {"hits": int, "misses": int, "evictions": int,
+               "entries": int, "hit_rate": float}
+    """
+    with _cache_lock:
+        stats = dict(_stats, entries=len(_cache))
+    calls = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / calls if calls else 0.0
+    return stats
+
+
+def clear_datetime_cache():
+    """Empty the cache and reset its statistics"""
+    with _cache_lock:
+        _cache.clear()
+        for name in _stats:
+            _stats[name] = 0
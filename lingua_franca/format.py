@@ -29,7 +29,8 @@ from lingua_franca.internal import localized_function, \
     get_full_lang_code, get_default_lang, get_default_loc, \
     is_supported_full_lang, _raise_unsupported_language, \
     UnsupportedLanguageError, NoneLangWarning, InvalidLangWarning, \
-    FunctionNotLocalizedError, resolve_resource_file
+    FunctionNotLocalizedError
+from lingua_franca.resources import resource_cache
 from lingua_franca.time import now_local
 
 
@@ -58,7 +59,6 @@ def _translate_word(name, lang=''):
     Returns:
         str: translated version of resource name
     """
-    from lingua_franca.internal import resolve_resource_file
     if not lang:
         if lang is None:
             warn(NoneLangWarning)
@@ -67,18 +67,12 @@ def _translate_word(name, lang=''):
     lang_code = lang if is_supported_full_lang(lang) else \
         get_full_lang_code(lang)
 
-    filename = resolve_resource_file(join("text", lang_code, name + ".word"))
-    if filename:
-        # open the file
-        try:
-            with open(filename, 'r', encoding='utf8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word.startswith("#"):
-                        continue  # skip comment lines
-                    return word
-        except Exception:
-            pass
+    try:
+        words = resource_cache.get(join("text", lang_code, name + ".word"))
+    except Exception:
+        words = None
+    if words:
+        return words[0]
     return name  # use resource name as the word
 
 
@@ -258,10 +252,8 @@ date_time_format = DateTimeFormat(os.path.join(os.path.dirname(__file__),
 @localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
 def pronounce_lang(lang_code, lang=""):
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
-                    resolve_resource_file("text/en-us/langs.json")
-    with open(resource_file) as f:
-        LANGUAGES = json.load(f)
+    LANGUAGES = resource_cache.get(f"text/{lang}/langs.json") or \
+        resource_cache.get("text/en-us/langs.json")
     lang_code = lang_code.lower()
     lang2 = lang_code.split("-")[0]
     spoken_lang = LANGUAGES.get(lang_code) or LANGUAGES.get(lang2) or lang_code
@@ -678,10 +670,8 @@ def describe_color(color, lang=""):
         str: localized color description
     """
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = json.load(f)
+    COLORS = resource_cache.get(f"text/{lang}/colors.json") or \
+        resource_cache.get("text/webcolors.json")
 
     if color.hex in COLORS:
         return COLORS.get(color.hex)
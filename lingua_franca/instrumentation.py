@@ -0,0 +1,107 @@
+"""Opt-in statistics about calls to localized functions.
+
+Set `lingua_franca.config.collect_call_stats = True` to record, for every
+call made through `@localized_function` (e.g. `lingua_franca.parse.*` and
+`lingua_franca.format.*`), how long it took, whether the wrapped function's
+own code had to be run as a fallback (see `run_own_code_on`) and whether
+it raised. Calls through a handle returned by `lingua_franca.bind()` skip
+the decorator, and so are not recorded.
+
+When disabled, the only cost is a single check of the config flag.
+
+Example:
+    >>> lingua_franca.config.collect_call_stats = True
+    >>> lingua_franca.parse.extract_number("two", lang="en")
+    2
+    >>> get_call_stats()["extract_number"]["en"]["calls"]
+    1
+"""
+from collections import deque
+from threading import Lock
+
+# number of most recent latencies kept per (function, lang) for percentiles
+MAX_SAMPLES = 1000
+
+_stats = {}
+_stats_lock = Lock()
+
+
+class _CallStats:
+    """Running totals for one (function, lang) pair"""
+    __slots__ = ("calls", "fallbacks", "errors", "total_time", "max_time",
+                 "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.fallbacks = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples = deque(maxlen=MAX_SAMPLES)
+
+    def snapshot(self):
+        samples = sorted(self.samples)
+        return {"calls": self.calls,
+                "fallbacks": self.fallbacks,
+                "errors": self.errors,
+                "total_time": self.total_time,
+                "mean_time": self.total_time / self.calls,
+                "max_time": self.max_time,
+                "p50": _percentile(samples, 50),
+                "p90": _percentile(samples, 90),
+                "p99": _percentile(samples, 99)}
+
+
+def _percentile(samples, percent):
+    """Nearest-rank percentile of a sorted, non-empty list"""
+    rank = max(int(round(percent / 100 * len(samples))), 1)
+    return samples[rank - 1]
+
+
+def record_call(function_name, lang, elapsed, fallback=False, error=False):
+    """Record a single call. Used by `@localized_function`.
+
+    Args:
+        function_name (str): name of the top-level function
+        lang (str): primary language code the call was made in
+        elapsed (float): duration of the call, in seconds
+        fallback (bool): the wrapped function's own code was run
+        error (bool): the call raised an exception
+    """
+    with _stats_lock:
+        by_lang = _stats.setdefault(function_name, {})
+        stats = by_lang.get(lang)
+        if stats is None:
+            stats = by_lang[lang] = _CallStats()
+        stats.calls += 1
+        stats.fallbacks += fallback
+        stats.errors += error
+        stats.total_time += elapsed
+        if elapsed > stats.max_time:
+            stats.max_time = elapsed
+        stats.samples.append(elapsed)
+
+
+def get_call_stats():
+    """Get a snapshot of the statistics recorded so far
+
+    Times are in seconds. Percentiles are computed over the most recent
+    `MAX_SAMPLES` calls.
+
+    Returns:
+        dict: {function_name: {lang: {"calls": int, "fallbacks": int,
+                                      "errors": int, "total_time": float,
+                                      "mean_time": float, "max_time": float,
+                                      "p50": float, "p90": float,
+                                      "p99": float}}}
+    """
+    with _stats_lock:
+        return {function_name: {lang: stats.snapshot()
+                                for lang, stats in by_lang.items()}
+                for function_name, by_lang in _stats.items()}
+
+
+def reset_call_stats():
+    """Discard all statistics recorded so far"""
+    with _stats_lock:
+        _stats.clear()
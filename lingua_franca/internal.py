@@ -1,11 +1,17 @@
 import os.path
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from importlib import import_module
 from inspect import signature
+from threading import RLock
+from time import monotonic, perf_counter
 
 from warnings import warn
 from datetime import datetime
 from lingua_franca import config
+from lingua_franca.instrumentation import record_call
 from lingua_franca.time import to_local
 
 
@@ -44,8 +50,26 @@ __default_lang = None
 __active_lang_code = None
 __loaded_langs = []
 
+# guards the language state above against concurrent (un)loading
+_lang_lock = RLock()
+
+# (primary, full) lang codes set by the `language()` context manager. When
+# set, they take precedence over the global default language
+_scoped_lang = ContextVar("lingua_franca_scoped_lang", default=None)
+
 _localized_functions = {}
 
+# Localized functions resolved by populate_localized_function_dict(), keyed on
+# (module name, function name, primary lang code). Values are either a
+# _ResolvedFunction or the FunctionNotLocalizedError to raise when called.
+_resolved_functions = {}
+
+_ResolvedFunction = namedtuple("_ResolvedFunction", "function kwargs")
+
+# Localized functions of languages that are used without being loaded, see
+# config.load_langs_on_demand. Keyed on (module name, primary lang code)
+_on_demand_functions = {}
+
 # TODO the deprecation of 'lang=None' and 'lang=<invalid>' can refer to
 # commit 35efd0661a178e82f6745ad17e10e607c0d83472 for the "proper" state
 # of affairs, raising the errors below instead of deprecation warnings
@@ -121,21 +145,22 @@ def _set_active_langs(langs=None, override_default=True):
                                     the current default is no longer present
                                     (default: True)
     """
-    if isinstance(langs, str):
-        langs = [langs]
-    if not isinstance(langs, list):
-        raise(TypeError("lingua_franca.internal._set_active_langs expects"
-                        " 'str' or 'list'"))
-    global __loaded_langs, __default_lang
-    __loaded_langs = list(dict.fromkeys(langs))
-    if __default_lang:
-        if override_default or get_primary_lang_code(__default_lang) \
-                not in __loaded_langs:
-            if len(__loaded_langs):
-                set_default_lang(get_full_lang_code(__loaded_langs[0]))
-            else:
-                __default_lang = None
-    _refresh_function_dict()
+    with _lang_lock:
+        if isinstance(langs, str):
+            langs = [langs]
+        if not isinstance(langs, list):
+            raise(TypeError("lingua_franca.internal._set_active_langs expects"
+                            " 'str' or 'list'"))
+        global __loaded_langs, __default_lang
+        __loaded_langs = list(dict.fromkeys(langs))
+        if __default_lang:
+            if override_default or get_primary_lang_code(__default_lang) \
+                    not in __loaded_langs:
+                if len(__loaded_langs):
+                    set_default_lang(get_full_lang_code(__loaded_langs[0]))
+                else:
+                    __default_lang = None
+        _refresh_function_dict()
 
 
 def _refresh_function_dict():
@@ -175,22 +200,26 @@ def load_language(lang):
        `import lingua_franca.parse`, will only import those functions
        which belong to currently-loaded languages.
 
+       Either way, a language's modules are only actually imported the
+       first time one of its functions is called.
+
     Arguments:
         lang (str): the language code to load (any supported lang code,
                     whether 'primary' or 'full')
                     Case-insensitive.
     """
-    if not isinstance(lang, str):
-        raise TypeError("lingua_franca.load_language expects 'str' "
-                        "(got " + type(lang) + ")")
-    if lang not in _SUPPORTED_LANGUAGES:
-        if lang in _SUPPORTED_FULL_LOCALIZATIONS:
-            lang = get_primary_lang_code(lang)
-    if lang not in __loaded_langs:
-        __loaded_langs.append(lang)
-    if not __default_lang:
-        set_default_lang(lang)
-    _set_active_langs(__loaded_langs)
+    with _lang_lock:
+        if not isinstance(lang, str):
+            raise TypeError("lingua_franca.load_language expects 'str' "
+                            "(got " + type(lang) + ")")
+        if lang not in _SUPPORTED_LANGUAGES:
+            if lang in _SUPPORTED_FULL_LOCALIZATIONS:
+                lang = get_primary_lang_code(lang)
+        if lang not in __loaded_langs:
+            __loaded_langs.append(lang)
+        if not __default_lang:
+            set_default_lang(lang)
+        _set_active_langs(__loaded_langs)
 
 
 def load_languages(langs):
@@ -215,9 +244,10 @@ def unload_language(lang):
     Args:
         lang (str): language code to unload
     """
-    if lang in __loaded_langs:
-        __loaded_langs.remove(lang)
-        _set_active_langs(__loaded_langs)
+    with _lang_lock:
+        if lang in __loaded_langs:
+            __loaded_langs.remove(lang)
+            _set_active_langs(__loaded_langs)
 
 
 def unload_languages(langs):
@@ -227,9 +257,10 @@ def unload_languages(langs):
     Args:
         langs (list[str])
     """
-    for lang in langs:
-        __loaded_langs.remove(lang)
-    _set_active_langs(__loaded_langs)
+    with _lang_lock:
+        for lang in langs:
+            __loaded_langs.remove(lang)
+        _set_active_langs(__loaded_langs)
 
 
 def get_default_lang():
@@ -244,6 +275,9 @@ def get_default_lang():
     Returns:
         str: A primary language code, e.g. ("en", or "pt")
     """
+    scoped_lang = _scoped_lang.get()
+    if scoped_lang:
+        return scoped_lang[0]
     return __default_lang
 
 
@@ -255,6 +289,9 @@ def get_default_loc():
         The 'localized' portion conforms to ISO 3166-1 alpha-2
         https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2
     """
+    scoped_lang = _scoped_lang.get()
+    if scoped_lang:
+        return scoped_lang[1]
     return __active_lang_code
 
 
@@ -273,25 +310,26 @@ def set_default_lang(lang_code):
     """
     global __default_lang, __active_lang_code
 
-    lang_code = lang_code.lower()
-    primary_lang_code = get_primary_lang_code(lang_code)
-    if primary_lang_code not in _SUPPORTED_LANGUAGES:
-        _raise_unsupported_language(lang_code)
-    else:
-        __default_lang = primary_lang_code
-
-    # make sure the default language is loaded.
-    # also make sure the default language is at the front.
-    # position doesn't matter here, but it clarifies things while debugging.
-    if __default_lang in __loaded_langs:
-        __loaded_langs.remove(__default_lang)
-    __loaded_langs.insert(0, __default_lang)
-    _refresh_function_dict()
-
-    if is_supported_full_lang(lang_code):
-        __active_lang_code = lang_code
-    else:
-        __active_lang_code = get_full_lang_code(__default_lang)
+    with _lang_lock:
+        lang_code = lang_code.lower()
+        primary_lang_code = get_primary_lang_code(lang_code)
+        if primary_lang_code not in _SUPPORTED_LANGUAGES:
+            _raise_unsupported_language(lang_code)
+        else:
+            __default_lang = primary_lang_code
+
+        # make sure the default language is loaded.
+        # also make sure the default language is at the front.
+        # position doesn't matter here, but it clarifies things while debugging.
+        if __default_lang in __loaded_langs:
+            __loaded_langs.remove(__default_lang)
+        __loaded_langs.insert(0, __default_lang)
+        _refresh_function_dict()
+
+        if is_supported_full_lang(lang_code):
+            __active_lang_code = lang_code
+        else:
+            __active_lang_code = get_full_lang_code(__default_lang)
 
 # TODO remove this when invalid lang codes are removed (currently deprecated)
 
@@ -454,14 +492,16 @@ def localized_function(run_own_code_on=[type(None)]):
 
     # Begin wrapper
     def localized_function_decorator(func):
+        # Everything we need to know about the wrapped function is static,
+        # so work it out once rather than on every call.
+        lang_param_index = list(signature(func).parameters).index('lang')
+        _module_name = func.__module__.split('.')[-1]
+        func_name = func.__name__.split('.')[-1]
+
         # Wrapper's logic
         def _call_localized_function(func, *args, **kwargs):
             lang_code = None
             load_langs_on_demand = config.load_langs_on_demand
-            unload_language_afterward = False
-            func_signature = signature(func)
-            func_params = list(func_signature.parameters)
-            lang_param_index = func_params.index('lang')
             full_lang_code = None
 
             # Check if we need to add timezone awareness to any datetime object
@@ -533,81 +573,88 @@ def localized_function(run_own_code_on=[type(None)]):
             else:
                 full_lang_code = get_full_lang_code(lang_code)
 
-            # Here comes the ugly business.
-            _module_name = func.__module__.split('.')[-1]
-            _module = import_module(".lang." + _module_name +
-                                    "_" + lang_code, "lingua_franca")
-            # The nonsense above gets you from lingua_franca.parse
-            # to lingua_franca.lang.parse_xx
-            if _module_name not in _localized_functions.keys():
-                raise ModuleNotFoundError("Module lingua_franca." +
-                                          _module_name + " not recognized")
-            if lang_code not in _localized_functions[_module_name].keys():
-                if load_langs_on_demand:
-                    load_language(lang_code)
-                    unload_language_afterward = True
+            resolved = _resolved_functions.get((_module_name, func_name,
+                                                lang_code))
+            if resolved is None:
+                if _module_name not in _localized_functions.keys():
+                    raise ModuleNotFoundError("Module lingua_franca." +
+                                              _module_name +
+                                              " not recognized")
+                if lang_code in _localized_functions[_module_name].keys():
+                    resolved = _get_lang_functions(_module_name,
+                                                   lang_code).get(func_name)
+                elif load_langs_on_demand:
+                    resolved = _resolve_on_demand(_module_name,
+                                                  lang_code).get(func_name)
                 else:
                     raise ModuleNotFoundError(_module_name +
                                               " module of language '" +
                                               lang_code +
                                               "' is not currently loaded.")
-            func_name = func.__name__.split('.')[-1]
-            # At some point in the past, both the module and the language
-            # were imported/loaded, respectively.
-            # When that happened, we cached the *signature* of each
-            # localized function.
-            #
-            # This is the crucial element that allows us to import funcs
-            # on the fly.
+            # The first time a language is used, its localized module is
+            # imported and every localized function is resolved, along
+            # with the keyword arguments it accepts (see
+            # _get_lang_functions)
             #
             # If we didn't find a localized function to correspond with
             # the wrapped function, we cached NotImplementedError in its
             # place.
-
-            # first account for the function not being present in any
-            # module, meaning all modules are falling back to a catch all
-            # parser, this usually means the function will need localization
-            # only in future languages not currently supported
-            if func_name not in _localized_functions[_module_name][lang_code]:
-                raise FunctionNotLocalizedError(func_name, lang_code)
-
-            loc_signature = _localized_functions[_module_name][lang_code][func_name]
-            if isinstance(loc_signature, type(NotImplementedError())):
-                raise loc_signature
-
-            # Now we have the appropriate localized module. Let's get
-            # the localized function.
-            try:
-                localized_func = getattr(
-                    _module, func_name + "_" + lang_code)
-            except AttributeError:
+            #
+            # If there is no entry at all, the function is not present in
+            # any module, meaning all modules are falling back to a catch
+            # all parser. This usually means the function will need
+            # localization only in future languages not currently supported
+            if resolved is None:
                 raise FunctionNotLocalizedError(func_name, lang_code)
+            if isinstance(resolved, NotImplementedError):
+                raise resolved
 
             # We now have a localized function, such as
             # lingua_franca.parse.extract_datetime_en
             # Get 'lang' out of its parameters.
             if 'lang' in kwargs:
                 del kwargs['lang']
-            args = tuple(arg for arg in list(args) if
+            args = tuple(arg for arg in args if
                          arg not in (lang_code, full_lang_code))
 
             # Now we call the function, ignoring any kwargs from the
             # wrapped function that aren't in the localized function.
-            r_val = localized_func(*args,
-                                   **{arg: val for arg, val
-                                      in kwargs.items()
-                                      if arg in loc_signature.parameters})
-
-            # Unload all the stuff we just assembled and imported
-            del localized_func
-            del _module
-            if unload_language_afterward:
-                unload_language(lang_code)
-            return r_val
+            if not resolved.kwargs.issuperset(kwargs):
+                kwargs = {arg: val for arg, val in kwargs.items()
+                          if arg in resolved.kwargs}
+            return resolved.function(*args, **kwargs)
+
+        def _call_with_stats(*args, **kwargs):
+            if 'lang' in kwargs:
+                lang = kwargs['lang']
+            elif lang_param_index < len(args):
+                lang = args[lang_param_index]
+            else:
+                lang = None
+            lang = str(lang or get_default_lang()).lower().split("-")[0]
+            fallback = error = False
+            start = perf_counter()
+            try:
+                try:
+                    return _call_localized_function(func, *args, **kwargs)
+                except Exception as e:
+                    if any((isinstance(e, error_type) for error_type
+                            in run_own_code_on)):
+                        fallback = True
+                        return func(*args, **kwargs)
+                    raise
+            except Exception:
+                error = True
+                raise
+            finally:
+                record_call(func_name, lang, perf_counter() - start,
+                            fallback, error)
 
         # Actual wrapper
         @wraps(func)
         def call_localized_function(*args, **kwargs):
+            if config.collect_call_stats:
+                return _call_with_stats(*args, **kwargs)
             if run_own_code_on != [type(None)]:
                 try:
                     return _call_localized_function(func, *args, **kwargs)
@@ -618,6 +665,9 @@ def localized_function(run_own_code_on=[type(None)]):
                         raise e
             else:  # don't intercept any exceptions
                 return _call_localized_function(func, *args, **kwargs)
+        # used by bind() to resolve this function without calling it
+        call_localized_function._run_own_code_on = run_own_code_on
+        call_localized_function._lang_param_index = lang_param_index
         return call_localized_function
     try:
         return localized_function_decorator
@@ -626,16 +676,75 @@ def localized_function(run_own_code_on=[type(None)]):
         return
 
 
+def _resolve_lang_functions(lf_module, lang_code):
+    """Locate the localized versions of a top-level module's functions.
+
+    Arguments:
+        lf_module(str) - - the name of the top-level module
+        lang_code(str) - - a primary language code
+
+    Returns:
+        Dict - - {function_name(str): _ResolvedFunction}, where functions
+                 which have not been localized map to a
+                 FunctionNotLocalizedError instead.
+                 None if the language has no such module.
+    """
+    _FUNCTION_NOT_FOUND = ""
+    try:
+        lang_common_data = import_module(".lang.common_data_" + lang_code,
+                                         "lingua_franca")
+        _FUNCTION_NOT_FOUND = getattr(lang_common_data,
+                                      "_FUNCTION_NOT_IMPLEMENTED_WARNING")
+        del lang_common_data
+    except Exception:
+        _FUNCTION_NOT_FOUND = "This function has not been implemented" \
+            " in the specified language."
+    _FUNCTION_NOT_FOUND = FunctionNotLocalizedError(_FUNCTION_NOT_FOUND)
+
+    try:
+        mod = import_module(".lang." + lf_module + "_" + lang_code,
+                            "lingua_franca")
+    except ModuleNotFoundError:
+        warn(Warning("Language code '{}' is registered with Lingua Franca, "
+                     "but its {} module could not be found."
+                     .format(lang_code, lf_module)))
+        return None
+
+    resolved = {}
+    function_names = getattr(import_module("." + lf_module, "lingua_franca"),
+                             "_REGISTERED_FUNCTIONS")
+    for function_name in function_names:
+        try:
+            function = getattr(mod, function_name + "_" + lang_code)
+            resolved[function_name] = _ResolvedFunction(
+                function, frozenset(signature(function).parameters))
+        except AttributeError:
+            resolved[function_name] = _FUNCTION_NOT_FOUND
+            # TODO log these occurrences: "function 'function_name' not
+            # implemented in language 'lang_code'"
+            #
+            # Perhaps provide this info to autodocs, to help volunteers
+            # identify the functions in need of localization
+    return resolved
+
+
 def populate_localized_function_dict(lf_module, langs=get_active_langs()):
     """Returns a dictionary of dictionaries, containing localized functions.
 
     Used by the top-level modules to locate, cache, and call localized funcs.
 
+    Languages are only registered here: their localized module is not
+    imported until one of its functions is first called (see
+    `_get_lang_functions`). Languages which were already resolved keep
+    their functions.
+
     Arguments:
         lf_module(str) - - the name of the top-level module
 
     Returns:
-        Dict - - {language_code: {function_name(str): function}}
+        Dict - - {language_code: {function_name(str): _ResolvedFunction}}
+                 or {language_code: None} if the language's module has not
+                 been imported yet
 
     Note:
         The dictionary returned can be used directly,
@@ -645,55 +754,384 @@ def populate_localized_function_dict(lf_module, langs=get_active_langs()):
         and its members are invoked via the `@localized_function` decorator.
 
     Example:
-        populate_localized_function_dict("format")["en"]["pronounce_number"](1)
+        populate_localized_function_dict("format")
+        _get_lang_functions("format", "en")["pronounce_number"].function(1)
         "one"
     """
-    bad_lang_code = "Language code '{}' is registered with" \
-        " Lingua Franca, but its " + lf_module + " module" \
-        " could not be found."
-    return_dict = {}
-    for lang_code in langs:
-        primary_lang_code = get_primary_lang_code(lang_code)
-        return_dict[primary_lang_code] = {}
-        _FUNCTION_NOT_FOUND = ""
-        try:
-            lang_common_data = import_module(".lang.common_data_" + primary_lang_code,
-                                             "lingua_franca")
-            _FUNCTION_NOT_FOUND = getattr(lang_common_data,
-                                          "_FUNCTION_NOT_IMPLEMENTED_WARNING")
-            del lang_common_data
-        except Exception:
-            _FUNCTION_NOT_FOUND = "This function has not been implemented" \
-                " in the specified language."
-        _FUNCTION_NOT_FOUND = FunctionNotLocalizedError(_FUNCTION_NOT_FOUND)
+    global _resolved_functions
+    with _lang_lock:
+        previous_dict = _localized_functions.get(lf_module, {})
+        return_dict = {}
+        for lang_code in langs:
+            primary_lang_code = get_primary_lang_code(lang_code)
+            return_dict[primary_lang_code] = \
+                previous_dict.get(primary_lang_code)
+        _localized_functions[lf_module] = return_dict
+        # swap in a new table, rather than mutating the live one, so
+        # concurrent callers never observe a half-built module
+        _resolved_functions = {key: value for key, value
+                               in _resolved_functions.items()
+                               if key[0] != lf_module or
+                               key[2] in return_dict}
+        return _localized_functions[lf_module]
+
+
+def _get_lang_functions(lf_module, lang_code):
+    """Get the localized functions of a loaded language, importing its
+    module the first time they are needed.
 
-        try:
-            mod = import_module(".lang." + lf_module + "_" + primary_lang_code,
-                                "lingua_franca")
-        except ModuleNotFoundError:
-            warn(Warning(bad_lang_code.format(primary_lang_code)))
-            continue
-
-        function_names = getattr(import_module("." + lf_module, "lingua_franca"),
-                                 "_REGISTERED_FUNCTIONS")
-        for function_name in function_names:
+    Arguments:
+        lf_module(str) - - the name of the top-level module
+        lang_code(str) - - a loaded, primary language code
+
+    Returns:
+        Dict - - {function_name(str): _ResolvedFunction}
+    """
+    global _resolved_functions
+    lang_functions = _localized_functions[lf_module].get(lang_code)
+    if lang_functions is None:
+        with _lang_lock:
+            if lang_code not in _localized_functions[lf_module]:
+                raise ModuleNotFoundError(lf_module +
+                                          " module of language '" +
+                                          lang_code +
+                                          "' is not currently loaded.")
+            lang_functions = _localized_functions[lf_module][lang_code]
+            if lang_functions is None:
+                lang_functions = \
+                    _resolve_lang_functions(lf_module, lang_code) or {}
+                _localized_functions[lf_module][lang_code] = lang_functions
+                _resolved_functions = {
+                    **_resolved_functions,
+                    **{(lf_module, function_name, lang_code): function
+                       for function_name, function in lang_functions.items()}
+                }
+    return lang_functions
+
+
+def _resolve_on_demand(lf_module, lang_code):
+    """Resolve a module's localized functions for a language which has not
+    been loaded, for use with `config.load_langs_on_demand`.
+
+    The result is kept for the lifetime of the process, rather than loading
+    and unloading the language around every call, and the set of loaded
+    languages is left untouched.
+
+    Arguments:
+        lf_module(str) - - the name of the top-level module
+        lang_code(str) - - a primary language code
+
+    Returns:
+        Dict - - {function_name(str): _ResolvedFunction}
+    """
+    key = (lf_module, lang_code)
+    if key not in _on_demand_functions:
+        with _lang_lock:
+            if key not in _on_demand_functions:
+                _on_demand_functions[key] = \
+                    _resolve_lang_functions(lf_module, lang_code) or {}
+    return _on_demand_functions[key]
+
+
+# parameters of the top-level functions which take datetime objects, and
+# so are subject to config.inject_timezones
+_DATETIME_PARAMS = ("dt", "anchorDate", "now")
+
+
+class BoundLanguage:
+    """All parsers and formatters of a single language, resolved up front.
+
+    Returned by `bind()`. Every function decorated with
+    `@localized_function` in `lingua_franca.parse` and
+    `lingua_franca.format` is available as an attribute of the same name,
+    taking the same arguments minus 'lang':
+
+        lf = bind("en-us")
+        lf.extract_number("two hundred")
+        lf.nice_duration(90)
+
+    Attributes are, where possible, direct references to the localized
+    functions (e.g. `lingua_franca.lang.parse_en.extract_number_en`), so
+    calling them skips language detection and dispatch entirely.
+    Functions with no localized version fall back on the generic code of
+    the top-level function, exactly as they would through the decorator.
+
+    Attributes:
+        lang (str): the primary language code, such as "en"
+        full_lang (str): the full language code, such as "en-us"
+    """
+
+    def __init__(self, lang, full_lang, functions):
+        self.lang = lang
+        self.full_lang = full_lang
+        self.functions = tuple(sorted(functions))
+        for name, function in functions.items():
+            setattr(self, name, function)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.full_lang)
+
+
+def _bind_function(wrapper, resolved_functions, lang_code, full_lang_code):
+    """Resolve a single @localized_function for `bind()`
+
+    Arguments:
+        wrapper (function): the decorated top-level function
+        resolved_functions (dict): the language's resolved functions for
+                                   the wrapper's module
+        lang_code (str): primary language code
+        full_lang_code (str): full language code
+
+    Returns:
+        function: taking the wrapped function's arguments, minus 'lang'
+    """
+    func = wrapper.__wrapped__
+    func_name = func.__name__
+    run_own_code_on = tuple(error for error in wrapper._run_own_code_on
+                            if error is not type(None))
+    lang_param_index = wrapper._lang_param_index
+    params = [param for param in signature(func).parameters
+              if param != "lang"]
+
+    def own_code(*args, **kwargs):
+        if len(args) >= lang_param_index:
+            args = args[:lang_param_index] + (full_lang_code,) + \
+                args[lang_param_index:]
+        else:
+            kwargs["lang"] = full_lang_code
+        return func(*args, **kwargs)
+
+    resolved = resolved_functions.get(func_name)
+    if resolved is None or isinstance(resolved, NotImplementedError):
+        if FunctionNotLocalizedError in run_own_code_on:
+            function = own_code
+        else:
+            error = resolved or FunctionNotLocalizedError(func_name,
+                                                          lang_code)
+
+            def function(*args, **kwargs):
+                raise error
+        return wraps(func)(function)
+
+    function = resolved.function
+    if not resolved.kwargs.issuperset(params):
+        # drop the arguments the localized function doesn't know about,
+        # just like the decorator does
+        localized = function
+
+        def function(*args, **kwargs):
+            return localized(*args, **{arg: val for arg, val
+                                       in kwargs.items()
+                                       if arg in resolved.kwargs})
+    if run_own_code_on:
+        localized_or_own = function
+
+        def function(*args, **kwargs):
             try:
-                function = getattr(mod, function_name
-                                   + "_" + primary_lang_code)
-                function_signature = signature(function)
-                del function
-            except AttributeError:
-                function_signature = _FUNCTION_NOT_FOUND
-                # TODO log these occurrences: "function 'function_name' not
-                # implemented in language 'primary_lang_code'"
-                #
-                # Perhaps provide this info to autodocs, to help volunteers
-                # identify the functions in need of localization
-            return_dict[primary_lang_code][function_name] = function_signature
-
-        del mod
-    _localized_functions[lf_module] = return_dict
-    return _localized_functions[lf_module]
+                return localized_or_own(*args, **kwargs)
+            except run_own_code_on:
+                return own_code(*args, **kwargs)
+    if config.inject_timezones and \
+            any(param in _DATETIME_PARAMS for param in params):
+        localized_naive = function
+
+        def function(*args, **kwargs):
+            args = tuple(to_local(arg) if isinstance(arg, datetime) and
+                         arg.tzinfo is None else arg for arg in args)
+            for key, value in kwargs.items():
+                if isinstance(value, datetime) and value.tzinfo is None:
+                    kwargs[key] = to_local(value)
+            return localized_naive(*args, **kwargs)
+    return function
+
+
+def bind(lang):
+    """Resolve all parsers and formatters for one language, once.
+
+    Calls through the returned object skip the language detection,
+    lang code validation and lookup performed by `@localized_function`
+    on every call, which makes it the fastest way to call Lingua Franca
+    when the language is known up front.
+
+    The language must be loaded, unless `config.load_langs_on_demand` is
+    set.
+
+    Arguments:
+        lang (str): a supported primary or full language code,
+                    such as "en" or "en-us"
+
+    Returns:
+        BoundLanguage
+
+    Example:
+        >>> lf = bind("en-us")
+        >>> lf.extract_number("twenty two")
+        22
+    """
+    from lingua_franca import format, parse
+
+    lang_code, full_lang_code = _get_lang_codes(lang)
+    functions = {}
+    for module in (parse, format):
+        module_name = module.__name__.split('.')[-1]
+        if lang_code in _localized_functions[module_name]:
+            resolved_functions = _get_lang_functions(module_name, lang_code)
+        elif config.load_langs_on_demand:
+            resolved_functions = _resolve_on_demand(module_name, lang_code)
+        else:
+            raise ModuleNotFoundError("Language '" + lang_code +
+                                      "' is not currently loaded.")
+        for name, wrapper in vars(module).items():
+            if callable(wrapper) and hasattr(wrapper, "_run_own_code_on"):
+                functions[name] = _bind_function(wrapper, resolved_functions,
+                                                 lang_code, full_lang_code)
+    return BoundLanguage(lang_code, full_lang_code, functions)
+
+
+@contextmanager
+def language(lang):
+    """Context manager setting the default language within its scope.
+
+    Inside the `with` block, `get_default_lang()` and `get_default_loc()`
+    return `lang`, so every function called without an explicit 'lang'
+    uses it. The scope is held in a context variable, so it only applies
+    to the current thread or asyncio task, and does not touch the loaded
+    languages or the global default.
+
+        with lingua_franca.language("de"):
+            extract_number("zwei")
+
+    The language must be loaded, unless `config.load_langs_on_demand` is
+    set.
+
+    Arguments:
+        lang (str): a supported primary or full language code,
+                    such as "de" or "de-de"
+    """
+    token = _scoped_lang.set(_get_lang_codes(lang))
+    try:
+        yield
+    finally:
+        _scoped_lang.reset(token)
+
+
+def _get_lang_codes(lang):
+    """Validate a language code, with no deprecated fallbacks.
+
+    Arguments:
+        lang (str): a supported primary or full language code
+
+    Returns:
+        tuple(str, str): the primary and full language codes,
+                         e.g. ("en", "en-us")
+    """
+    if not isinstance(lang, str):
+        raise TypeError("expected a language code of type 'str' "
+                        "(got " + str(type(lang)) + ")")
+    full_lang_code = lang.lower()
+    if full_lang_code in _SUPPORTED_LANGUAGES:
+        return full_lang_code, _DEFAULT_FULL_LANG_CODES[full_lang_code]
+    lang_code = full_lang_code.split("-")[0]
+    if full_lang_code not in _SUPPORTED_FULL_LOCALIZATIONS or \
+            lang_code not in _SUPPORTED_LANGUAGES:
+        _raise_unsupported_language(lang)
+    return lang_code, full_lang_code
+
+
+class _ResourceRoot:
+    """Index of the files below one resource directory
+
+    A directory below `path` is listed the first time a file in it is
+    looked up, rather than the whole tree up front, and its modification
+    time is recorded, which is enough to tell whether a file has been
+    added to or removed from it since. Symbolic links are followed, as
+    they are by any path lookup.
+    """
+    __slots__ = ("path", "dirs", "checked")
+
+    def __init__(self, path):
+        self.path = path
+        # {relative directory: (mtime or None, frozenset of file names)}
+        self.dirs = {}
+        self.checked = monotonic()
+
+    def __contains__(self, rel_path):
+        """If rel_path, a normalized path, is a file below the root"""
+        if _is_outside(rel_path):
+            return False
+        rel_dir, name = os.path.split(rel_path)
+        listing = self.dirs.get(rel_dir)
+        if listing is None:
+            listing = self.dirs[rel_dir] = self._list(rel_dir)
+        return name in listing[1]
+
+    def _list(self, rel_dir):
+        dir_path = os.path.join(self.path, rel_dir)
+        # a directory created later must invalidate the index too
+        mtime = _get_mtime(dir_path)
+        try:
+            with os.scandir(dir_path) as entries:
+                names = frozenset(entry.name for entry in entries
+                                  if entry.is_file())
+        except OSError:
+            names = frozenset()
+        return mtime, names
+
+    def is_stale(self):
+        return any(_get_mtime(os.path.join(self.path, rel_dir)) != mtime
+                   for rel_dir, (mtime, _) in list(self.dirs.items()))
+
+
+def _is_outside(rel_path):
+    """If rel_path, a normalized path, leaves the directory it is in"""
+    return rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep)
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+_PACKAGE_RES_DIR = os.path.join(os.path.dirname(__file__), 'res')
+# {absolute root path: _ResourceRoot}
+_resource_roots = {}
+_resource_lock = RLock()
+# seconds between mtime checks, when config.check_resource_mtimes is set
+RESOURCE_CHECK_INTERVAL = 1.0
+
+
+def _get_resource_root(path):
+    root = _resource_roots.get(path)
+    if root is not None and config.check_resource_mtimes and \
+            monotonic() - root.checked >= RESOURCE_CHECK_INTERVAL:
+        if root.is_stale():
+            root = None
+        else:
+            root.checked = monotonic()
+    if root is None:
+        with _resource_lock:
+            root = _ResourceRoot(path)
+            _resource_roots[path] = root
+    return root
+
+
+def refresh_resource_index():
+    """Forget the indexed resource directories
+
+    `resolve_resource_file` lists each directory the first time a file in
+    it is looked up, so files added to or removed from those directories
+    afterwards are not noticed until this is called, or unless
+    `lingua_franca.config.check_resource_mtimes` is set.
+
+    The resources loaded by `lingua_franca.resources.resource_cache` are
+    forgotten too.
+    """
+    from lingua_franca.resources import resource_cache
+    with _resource_lock:
+        _resource_roots.clear()
+    resource_cache.invalidate()
 
 
 def resolve_resource_file(res_name, data_dir=None):
@@ -702,8 +1140,10 @@ def resolve_resource_file(res_name, data_dir=None):
     Resource names are in the form: 'filename.ext'
     or 'path/filename.ext'
 
-    The system wil look for ~/.mycroft/res_name first, and
-    if not found will look at / opt/mycroft/res_name,
+    A path to an existing file, absolute or relative to the working
+    directory, is returned as it is. Otherwise the system wil look for
+    ~/.mycroft/res_name first, and if not found will look at
+    /opt/mycroft/res_name,
     then finally it will look for res_name in the 'mycroft/res'
     folder of the source code package.
 
@@ -715,31 +1155,34 @@ def resolve_resource_file(res_name, data_dir=None):
     where the '...' is replaced by the path where the package has
     been installed.
 
+    The resource directories are indexed on first use, rather than probed
+    on every call; see `refresh_resource_index`.
+
     Args:
         res_name(str): a resource path/name
     Returns:
         str: path to resource or None if no resource found
     """
-    # First look for fully qualified file (e.g. a user setting)
-    if os.path.isfile(res_name):
+    # First look for fully qualified file (e.g. a user setting), or one
+    # relative to the working directory
+    key = os.path.normpath(res_name)
+    if os.path.isabs(res_name) or _is_outside(key):
+        if os.path.isfile(res_name):
+            return res_name
+    elif key in _get_resource_root(os.getcwd()):
         return res_name
 
-    # Now look for ~/.mycroft/res_name (in user folder)
-    filename = os.path.expanduser("~/.mycroft/" + res_name)
-    if os.path.isfile(filename):
-        return filename
-
-    # Next look for /opt/mycroft/res/res_name
-    data_dir = data_dir or os.path.expanduser("/opt/mycroft/res/")
-    filename = os.path.expanduser(os.path.join(data_dir, res_name))
-    if os.path.isfile(filename):
-        return filename
-
-    # Finally look for it in the source package
-    filename = os.path.join(os.path.dirname(__file__), 'res', res_name)
-    filename = os.path.abspath(os.path.normpath(filename))
-    if os.path.isfile(filename):
-        return filename
+    # Then look for it in ~/.mycroft/, /opt/mycroft/res/ and finally the
+    # source package, in that order
+    if os.path.isabs(res_name):
+        return None
+    data_dir = data_dir or "/opt/mycroft/res/"
+    for path in (os.path.expanduser("~/.mycroft/"),
+                 os.path.expanduser(data_dir),
+                 _PACKAGE_RES_DIR):
+        root = _get_resource_root(os.path.abspath(path))
+        if key in root:
+            return os.path.join(root.path, key)
 
     return None  # Resource cannot be resolved
 
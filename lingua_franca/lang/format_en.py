@@ -14,11 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
 from lingua_franca.lang.format_common import convert_to_mixed_fraction
 from lingua_franca.lang.common_data_en import _NUM_STRING_EN, \
     _FRACTION_STRING_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, _LONG_ORDINAL_EN
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.resources import resource_cache
 
 
 def nice_number_en(number, speech=True, denominators=range(1, 21)):
@@ -389,10 +388,8 @@ def nice_time_en(dt, speech=True, use_24hour=False, use_ampm=False):
 
 def describe_color_en(color):
 
-    resource_file = resolve_resource_file(f"text/en-us/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = json.load(f)
+    COLORS = resource_cache.get("text/en-us/colors.json") or \
+        resource_cache.get("text/webcolors.json")
 
     if color.hex in COLORS:
         return COLORS.get(color.hex)
@@ -13,11 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
 from lingua_franca.lang.format_common import convert_to_mixed_fraction
 from lingua_franca.lang.common_data_pt import _FRACTION_STRING_PT, \
     _NUM_STRING_PT
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.resources import resource_cache
 
 
 def nice_number_pt(number, speech, denominators=range(1, 21)):
@@ -225,9 +224,7 @@ def nice_time_pt(dt, speech=True, use_24hour=False, use_ampm=False):
 
 
 def describe_color_pt(color):
-    resource_file = resolve_resource_file(f"text/pt-pt/colors.json")
-    with open(resource_file) as f:
-        COLORS = json.load(f)
+    COLORS = resource_cache.get("text/pt-pt/colors.json")
 
     if color.hex in COLORS:
         return COLORS.get(color.hex)
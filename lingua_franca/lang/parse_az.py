@@ -19,8 +19,9 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+from lingua_franca.lang.parse_common import is_numeric, \
+    invert_dict, Normalizer, NumberLexer, NumberParser, word_memo, \
+    compile_substitutions, extract_datetime_spans_generic
 from lingua_franca.lang.common_data_az import _LONG_SCALE_AZ, \
     _SHORT_SCALE_AZ, _NEGATIVES_AZ, _SUMS_AZ, _MULTIPLIES_LONG_SCALE_AZ, \
     _MULTIPLIES_SHORT_SCALE_AZ, _FRACTION_MARKER_AZ, _DECIMAL_MARKER_AZ, \
@@ -28,363 +29,106 @@ from lingua_franca.lang.common_data_az import _LONG_SCALE_AZ, \
     _FRACTION_STRING_AZ, _generate_plurals_az, _SPOKEN_EXTRA_NUM_AZ
 
 import re
-import json
-from lingua_franca.internal import resolve_resource_file
+from types import MappingProxyType
+from lingua_franca.resources import resource_cache
 
-def _convert_words_to_numbers_az(text, short_scale=True, ordinals=False):
-    """
-    Convert words in a string into their equivalent numbers.
-    Args:
-        text str:
-        short_scale boolean: True if short scale numbers should be used.
-        ordinals boolean: True if ordinals (e.g. birinci, ikinci, üçüncü) should
-                          be parsed to their number values (1, 2, 3...)
-
-    Returns:
-        str
-        The original text, with numbers subbed in where appropriate.
-
-    """
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_az(tokens, short_scale, ordinals)
-
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
-
-
-def _extract_numbers_with_text_az(tokens, short_scale=True,
-                                  ordinals=False, fractional_numbers=True):
-    """
-    Extract all numbers from a list of Tokens, with the words that
-    represent them.
-
-    Args:
-        [Token]: The tokens to parse.
-        short_scale bool: True if short scale numbers should be used, False for
-                          long scale. True by default.
-        ordinals bool: True if ordinal words (birinci, ikinci, üçüncü, etc) should
-                       be parsed.
-        fractional_numbers bool: True if we should look for fractions and
-                                 decimals.
-
-    Returns:
-        [ReplaceableNumber]: A list of tuples, each containing a number and a
-                         string.
-
-    """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_az(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
-
-
-def _extract_number_with_text_az(tokens, short_scale=True,
-                                 ordinals=False, fractional_numbers=True):
-    """
-    This function extracts a number from a list of Tokens.
-
-    Args:
-        tokens str: the string to normalize
-        short_scale (bool): use short scale if True, long scale if False
-        ordinals (bool): consider ordinal numbers
-        fractional_numbers (bool): True if we should look for fractions and
-                                   decimals.
-    Returns:
-        ReplaceableNumber
-
-    """
-    number, tokens = \
-        _extract_number_with_text_az_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_az_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_az.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
+def _build_number_data_az(short_scale):
+    """Build the dictionaries returned by _initialize_number_data_az"""
+    multiplies = _MULTIPLIES_SHORT_SCALE_AZ if short_scale \
+        else _MULTIPLIES_LONG_SCALE_AZ
 
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
+    string_num_ordinal_az = _STRING_SHORT_ORDINAL_AZ if short_scale \
+        else _STRING_LONG_ORDINAL_AZ
 
-    Returns:
-        int or float, [Tokens]
+    string_num_scale_az = _SHORT_SCALE_AZ if short_scale else _LONG_SCALE_AZ
+    string_num_scale_az = invert_dict(string_num_scale_az)
 
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_az(tokens, short_scale, ordinals)
-        if fraction:
-            # print("fraction")
-            return fraction, fraction_text
+    return (frozenset(multiplies),
+            MappingProxyType(dict(string_num_ordinal_az)),
+            MappingProxyType(string_num_scale_az))
 
-        decimal, decimal_text = \
-            _extract_decimal_with_text_az(tokens, short_scale, ordinals)
-        if decimal:
-            # print("decimal")
-            return decimal, decimal_text
 
-    return _extract_whole_number_with_text_az(tokens, short_scale, ordinals)
+# {short_scale: (multiplies, string_num_ordinal, string_num_scale)}
+_NUMBER_DATA_AZ = {short_scale: _build_number_data_az(short_scale)
+                   for short_scale in (True, False)}
 
 
-def _extract_fraction_with_text_az(tokens, short_scale, ordinals):
+def _initialize_number_data_az(short_scale, speech=True):
     """
-    Extract fraction numbers from a string.
+    Get the dictionaries of words to numbers, based on scale.
 
-    This function handles text such as '2 və dörddə üç'. Note that "yarım" or
-    similar will be parsed by the whole number function.
+    This is a helper function for _extract_whole_number.
 
     Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
+        short_scale (bool):
+        speech (bool): consider extra words (_SPOKEN_EXTRA_NUM_AZ) to be numbers
 
     Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER_AZ:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-        
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_az(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_az(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                    num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
+        (frozenset(str), Mapping(str, number), Mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
 
-def _extract_decimal_with_text_az(tokens, short_scale, ordinals):
     """
-    Extract decimal numbers from a string.
+    return _NUMBER_DATA_AZ[bool(short_scale)]
 
-    This function handles text such as '2 nöqtə 5'.
 
-    Notes:
-        While this is a helper for extractnumber_az, it also depends on
-        extractnumber_az, to parse out the components of the decimal.
+# {fraction word: denominator}
+_FRACTION_DENOMINATORS_AZ = MappingProxyType(dict(
+    {"dörddəbir": 4, "yarım": 2, "üçdəbir": 3},
+    **{word: num for num, word in _FRACTION_STRING_AZ.items() if num > 2}))
 
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER_AZ:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_az(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_az(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                return number.value + float('0.' + str(decimal.value)), \
-                    number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_az(tokens, short_scale, ordinals):
-    """
-    Handle numbers not handled by the decimal or fraction functions. This is
-    generally whole numbers. Note that phrases such as "yarım" will be
-    handled by this function.
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
 
-    """
+def _build_number_lexer_az(short_scale):
+    """Compile the number vocabulary used by _NUMBER_PARSER_AZ"""
     multiplies, string_num_ordinal, string_num_scale = \
-        _initialize_number_data_az(short_scale, speech=ordinals is not None)
-
-    number_words = []  # type: List[Token]
-    val = False
-    prev_val = None
-    next_val = None
-    to_sum = []
-    # print(tokens, ordinals)
-    for idx, token in enumerate(tokens):
-        current_val = None
-        if next_val:
-            next_val = None
-            continue
-
-        word = token.word.lower()
-        if word in _NEGATIVES_AZ:
-            number_words.append(token)
-            continue
-
-        prev_word = tokens[idx - 1].word.lower() if idx > 0 else ""
-        next_word = tokens[idx + 1].word.lower() if idx + 1 < len(tokens) else ""
-        # print(prev_word, word, next_word, number_words)
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_AZ and \
-                word not in _SUMS_AZ and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not is_fractional_az(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
-            # print("a1")
-            words_only = [token.word for token in number_words]
-
-            if number_words and not all([w.lower() in
-                                         _NEGATIVES_AZ for w in words_only]):
-                break
-            else:
-                number_words = []
-                continue
-        elif word not in multiplies \
-                and word not in _SPOKEN_EXTRA_NUM_AZ \
-                and prev_word not in multiplies \
-                and prev_word not in _SUMS_AZ \
-                and not (ordinals and prev_word in string_num_ordinal) \
-                and prev_word not in _NEGATIVES_AZ:
-            number_words = [token]
-            # print("a2")
-        elif prev_word in _SUMS_AZ and word in _SUMS_AZ:
-            number_words = [token]
-            # print("a3")
-        elif ordinals is None and \
-                (word in string_num_ordinal or word in _SPOKEN_EXTRA_NUM_AZ):
-            # print("a4")
-            # flagged to ignore this token
-            continue
-        else:
-            # print("a5")
-            number_words.append(token)
-
-        # is this word already a number ?
-        if is_numeric(word):
-            # print("b")
-            if word.isdigit():  # doesn't work with decimals
-                val = int(word)
-            else:
-                val = float(word)
-            current_val = val
-
-        # is this word the name of a number ?
-        if word in _STRING_NUM_AZ:
-            val = _STRING_NUM_AZ.get(word)
-            current_val = val
-            # print("c1", current_val)
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-            # print("c2")
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
-            current_val = val
-            # print("c3")
-        # is the prev word a number and should we sum it?
-        # twenty two, fifty six
-        if (prev_word in _SUMS_AZ and val and val < 10) or all([prev_word in
-                                                                multiplies,
-                                                                val < prev_val if prev_val else False]):
-            val = prev_val + val
-            # print("d")
-
-        # is the prev word a number and should we multiply it?
-        # twenty hundred, six hundred
-        if word in multiplies:
-            if not prev_val:
-                prev_val = 1
-            val = prev_val * val
-            # print("e")
-
+        _initialize_number_data_az(short_scale)
+    lexer = NumberLexer()
+    lexer.add_all(_STRING_NUM_AZ, NumberLexer.NUMBER)
+    lexer.add_all(string_num_scale, NumberLexer.SCALE)
+    lexer.add_all(_SUMS_AZ, NumberLexer.SUM)
+    lexer.add_all(multiplies, NumberLexer.MULTIPLIER)
+    lexer.add_all(string_num_ordinal, NumberLexer.ORDINAL)
+    lexer.add_all({word: 1.0 / denominator for word, denominator in
+                   _FRACTION_DENOMINATORS_AZ.items()}, NumberLexer.FRACTION)
+    lexer.add_all(_NEGATIVES_AZ, NumberLexer.NEGATIVE)
+    lexer.add_all(_SPOKEN_EXTRA_NUM_AZ, NumberLexer.SPOKEN)
+    return lexer
+
+
+# {short_scale: NumberLexer}
+_NUMBER_LEXER_AZ = {short_scale: _build_number_lexer_az(short_scale)
+                    for short_scale in (True, False)}
+
+
+class _AzerbaijaniNumberParser(NumberParser):
+    lexers = _NUMBER_LEXER_AZ
+    fraction_markers = _FRACTION_MARKER_AZ
+    decimal_markers = _DECIMAL_MARKER_AZ
+    lowercase_text = False
+    lowercase_words = True
+    continuing_kinds = NumberLexer.MULTIPLIER | NumberLexer.SPOKEN
+    speech = True
+    ordinal_one = False
+
+    def read_fractions(self, lexer, tokens, idx, entry, prev, word,
+                       next_word, val, prev_val, current_val, number_words,
+                       ordinals):
         # is this a spoken fraction?
         # 1 yarım fincan - yarım fincan
-        if current_val is None and not (ordinals is None and word in _SPOKEN_EXTRA_NUM_AZ):
-            val = is_fractional_az(word, short_scale=short_scale,
-                                   spoken=ordinals is not None)
+        if current_val is None and \
+                not (ordinals is None and entry.kinds & NumberLexer.SPOKEN):
+            val = entry.values.get(NumberLexer.FRACTION, False) \
+                if ordinals is not None else False
             if val:
                 if prev_val:
                     val += prev_val
                 current_val = val
-                # print("f", current_val, prev_val)
-                if word in _SPOKEN_EXTRA_NUM_AZ:
-                    break
+                if entry.kinds & NumberLexer.SPOKEN:
+                    return val, prev_val, current_val, None, True
 
         # dörddə bir
         if ordinals is False:
             temp = prev_val
-            prev_val = is_fractional_az(prev_word, short_scale=short_scale)
+            prev_val = prev.values.get(NumberLexer.FRACTION, False)
             if prev_val:
                 if not val:
                     val = 1
@@ -393,139 +137,10 @@ def _extract_whole_number_with_text_az(tokens, short_scale, ordinals):
                     number_words.append(tokens[idx + 1])
             else:
                 prev_val = temp
-            # print("g", prev_val)
-
-        # is this a negative number?
-        if val and prev_word and prev_word in _NEGATIVES_AZ:
-            val = 0 - val
-            # print("h")
-
-        # let's make sure it isn't a fraction
-        if not val:
-            # look for fractions like "2/3"
-            aPieces = word.split('/')
-            if look_for_fractions(aPieces):
-                val = float(aPieces[0]) / float(aPieces[1])
-                current_val = val
-            # print("i")
-
-        else:
-            if current_val and all([
-                prev_word in _SUMS_AZ,
-                word not in _SUMS_AZ,
-                word not in multiplies,
-                current_val >= 10]):
-                # Backtrack - we've got numbers we can't sum.
-                # print("j", number_words, prev_val)
-                number_words.pop()
-                val = prev_val
-                break
-            prev_val = val
-
-            if word in multiplies and next_word not in multiplies:
-                # handle long numbers
-                # six hundred sixty six
-                # two million five hundred thousand
-                #
-                # This logic is somewhat complex, and warrants
-                # extensive documentation for the next coder's sake.
-                #
-                # The current word is a power of ten. `current_val` is
-                # its integer value. `val` is our working sum
-                # (above, when `current_val` is 1 million, `val` is
-                # 2 million.)
-                #
-                # We have a dict `string_num_scale` containing [value, word]
-                # pairs for "all" powers of ten: string_num_scale[10] == "ten.
-                #
-                # We need go over the rest of the tokens, looking for other
-                # powers of ten. If we find one, we compare it with the current
-                # value, to see if it's smaller than the current power of ten.
-                #
-                # Numbers which are not powers of ten will be passed over.
-                #
-                # If all the remaining powers of ten are smaller than our
-                # current value, we can set the current value aside for later,
-                # and begin extracting another portion of our final result.
-                # For example, suppose we have the following string.
-                # The current word is "million".`val` is 9000000.
-                # `current_val` is 1000000.
-                #
-                #    "nine **million** nine *hundred* seven **thousand**
-                #     six *hundred* fifty seven"
-                #
-                # Iterating over the rest of the string, the current
-                # value is larger than all remaining powers of ten.
-                #
-                # The if statement passes, and nine million (9000000)
-                # is appended to `to_sum`.
-                #
-                # The main variables are reset, and the main loop begins
-                # assembling another number, which will also be appended
-                # under the same conditions.
-                #
-                # By the end of the main loop, to_sum will be a list of each
-                # "place" from 100 up: [9000000, 907000, 600]
-                #
-                # The final three digits will be added to the sum of that list
-                # at the end of the main loop, to produce the extracted number:
-                #
-                #    sum([9000000, 907000, 600]) + 57
-                # == 9,000,000 + 907,000 + 600 + 57
-                # == 9,907,657
-                #
-                # >>> foo = "nine million nine hundred seven thousand six
-                #            hundred fifty seven"
-                # >>> extract_number(foo)
-                # 9907657
-                # print("k", tokens[idx+1:])
-                time_to_sum = True
-                for other_token in tokens[idx+1:]:
-                    if other_token.word.lower() in multiplies:
-                        if string_num_scale[other_token.word.lower()] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
-                if time_to_sum:
-                    # print("l")
-                    to_sum.append(val)
-                    val = 0
-                    prev_val = 0
-
-    if val is not None and to_sum:
-        # print("m", to_sum)
-        val += sum(to_sum)
-    # print(val, number_words, "end")
-    return val, number_words
-
-
-def _initialize_number_data_az(short_scale, speech=True):
-    """
-    Generate dictionaries of words to numbers, based on scale.
-
-    This is a helper function for _extract_whole_number.
-
-    Args:
-        short_scale (bool):
-        speech (bool): consider extra words (_SPOKEN_EXTRA_NUM_AZ) to be numbers
-
-    Returns:
-        (set(str), dict(str, number), dict(str, number))
-        multiplies, string_num_ordinal, string_num_scale
-
-    """
-    multiplies = _MULTIPLIES_SHORT_SCALE_AZ if short_scale \
-        else _MULTIPLIES_LONG_SCALE_AZ
-
-    string_num_ordinal_az = _STRING_SHORT_ORDINAL_AZ if short_scale \
-        else _STRING_LONG_ORDINAL_AZ
+        return val, prev_val, current_val, None, False
 
-    string_num_scale_az = _SHORT_SCALE_AZ if short_scale else _LONG_SCALE_AZ
-    string_num_scale_az = invert_dict(string_num_scale_az)
 
-    return multiplies, string_num_ordinal_az, string_num_scale_az
+_NUMBER_PARSER_AZ = _AzerbaijaniNumberParser()
 
 
 def extract_number_az(text, short_scale=True, ordinals=False):
@@ -544,8 +159,8 @@ def extract_number_az(text, short_scale=True, ordinals=False):
                                    was found
 
     """
-    return _extract_number_with_text_az(tokenize(text.lower()),
-                                        short_scale, ordinals).value
+    return _NUMBER_PARSER_AZ.extract_number(text.lower(), short_scale,
+                                            ordinals)
 
 
 def extract_duration_az(text):
@@ -598,7 +213,7 @@ def extract_duration_az(text):
     }
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}?(?:yə|a|ə)?(?:(?:\s|,)+)?(?P<half>yarım|0\.5)?(?:a)?"
-    text = _convert_words_to_numbers_az(text)
+    text = _NUMBER_PARSER_AZ.convert_words_to_numbers(text)
     for unit_az in time_units_az:
         unit_pattern = pattern.format(unit=unit_az)
         def repl(match):
@@ -612,6 +227,77 @@ def extract_duration_az(text):
     return (duration, text)
 
 
+# the vocabulary of extract_datetime_az
+_TIME_QUALIFIERS_AM_AZ = frozenset(['səhər', 'gecə'])
+_TIME_QUALIFIERS_PM_AZ = frozenset(['günorta', 'axşam', 'nahar'])
+_TIME_QUALIFIERS_AZ = _TIME_QUALIFIERS_AM_AZ | _TIME_QUALIFIERS_PM_AZ
+_DATETIME_MARKERS_AZ = frozenset(['da', 'də', 'sonra', "ərzində", "günündən",
+                                  "günü", "gündən", "gün"])
+# {day: weekday}, bazar ertəsi is 0
+_DAYS_AZ = {day: weekday for weekday, day in enumerate(
+    ['bazar ertəsi', 'çərşənbə axşamı', 'çərşənbə', 'cümə axşamı', 'cümə',
+     'şənbə', 'bazar'])}
+# {month: index}, yanvar is 0
+_MONTHS_AZ = {month: idx for idx, month in enumerate(
+    ['yanvar', 'fevral', 'mart', 'aprel', 'may', 'iyun', 'iyul', 'avqust',
+     'sentyabr', 'oktyabr', 'moyabr', 'dekabr'])}
+_MONTHS_SHORT_AZ = {month: idx for idx, month in enumerate(
+    ['yan', 'fev', 'mar', 'apr', 'may', 'ıyn', 'ıyl', 'avq', 'sen', 'okt',
+     'noy', 'dek'])}
+_MONTHS_EN_AZ = ('january', 'february', 'march', 'april', 'may', 'june',
+                 'july', 'august', 'september', 'october', 'november',
+                 'december')
+_RECUR_MARKERS_AZ = frozenset(_DAYS_AZ) | \
+    frozenset(_generate_plurals_az(set(_DAYS_AZ))) | \
+    frozenset(['həftə sonu', 'iş günü', 'həftə sonları', 'iş günləri'])
+_YEAR_MULTIPLES_AZ = frozenset(["onillik", "yüzillik", "minillik"])
+# the words _datetime_words_az normalizes the words of the text to, the longest
+# first so that a word is normalized to the longest one it starts with
+_CLEAN_WORDS_AZ = tuple(sorted(
+    ['səhər', 'gecə', 'günorta', 'axşam', 'nahar'] + list(_DAYS_AZ) +
+    list(_MONTHS_AZ) + ["onillik", "yüzillik", "minillik", "həftə", "ay", "il",
+                        'saat', 'dəqiqə', 'saniyə', 'sonra', 'gecə yarısı',
+                        'günortadan sonra', 'gün'], key=len, reverse=True))
+# the cleaning step of extract_datetime_az
+_DATETIME_SUBSTITUTIONS_AZ = compile_substitutions(delete="?.,")
+
+
+def _datetime_words_az(s, word_list=_CLEAN_WORDS_AZ):
+    """The words of s, cleaned for extract_datetime_az"""
+    # normalize and lowercase utt  (replaces words with numbers)
+    s = _NUMBER_PARSER_AZ.convert_words_to_numbers(s, ordinals=None)
+    # clean unneeded punctuation and capitalization among other things.
+    wordList = _DATETIME_SUBSTITUTIONS_AZ(s.lower()).split()
+    skip_next_word = False
+    new_words = []
+    for idx, word in enumerate(wordList):
+        if skip_next_word:
+            skip_next_word = False
+            continue
+        wordNext = wordList[idx + 1] if idx + 1 < len(wordList) else ""
+        ordinals = ["ci", "cü", "cı", "cu"]
+        if word[0].isdigit():
+            for ordinal in ordinals:
+                if ordinal in wordNext:
+                    skip_next_word = True
+        if ((word == "bu" and wordNext == "gün") or
+           (word in ['cümə', 'çərşənbə'] and 'axşamı'in wordNext) or
+            (word == 'bazar' and 'ertəsi' in wordNext) or
+            (word == 'günortadan' and wordNext == 'sonra') or
+            (word == 'gecə' and 'yarısı' in wordNext)):
+            word = word + ' ' + wordNext
+            skip_next_word = True
+
+        for orig_word in word_list:
+            if word.startswith(orig_word):
+                word = word[:len(orig_word)]
+                break
+
+        new_words.append(word)
+
+    return new_words
+
+
 def extract_datetime_az(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -642,42 +328,33 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return _extract_datetime_words_az(_datetime_words_az(text),
+                                      anchorDate, default_time)
 
-    def clean_string(s, word_list):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_az(s, ordinals=None)
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '')
-
-        wordList = s.split()
-        skip_next_word = False
-        new_words = []
-        for idx, word in enumerate(wordList):
-            if skip_next_word:
-                skip_next_word = False
-                continue
-            wordNext = wordList[idx + 1] if idx + 1 < len(wordList) else ""
-            ordinals = ["ci", "cü", "cı", "cu"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    if ordinal in wordNext:
-                        skip_next_word = True
-            if ((word == "bu" and wordNext == "gün") or
-               (word in ['cümə', 'çərşənbə'] and 'axşamı'in wordNext) or
-                (word == 'bazar' and 'ertəsi' in wordNext) or
-                (word == 'günortadan' and wordNext == 'sonra') or
-                (word == 'gecə' and 'yarısı' in wordNext)):
-                word = word + ' ' + wordNext
-                skip_next_word = True
-
-            for orig_word in word_list:
-                if word.startswith(orig_word):
-                    word = orig_word
-                    break
 
-            new_words.append(word)
+def extract_datetimes_az(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_az, which the words of each expression are
+    parsed with.
 
-        return new_words
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_az,
+                                          _extract_datetime_words_az,
+                                          ["və"], anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_az(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_az on the words of a text cleaned by
+    _datetime_words_az, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -692,9 +369,6 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
     if not anchorDate:
         anchorDate = now_local()
 
-    if text == "":
-        return None
-
     found = False
     daySpecified = False
     dayOffset = False
@@ -706,30 +380,6 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
     datestr = ""
     hasYear = False
     timeQualifier = ""
-    word_list = []
-    timeQualifiersAM = ['səhər', 'gecə']
-    timeQualifiersPM = ['günorta', 'axşam', 'nahar']
-    word_list += timeQualifiersAM + timeQualifiersPM
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['da', 'də', 'sonra', "ərzində", "günündən", "günü", "gündən", "gün"]
-    days = ['bazar ertəsi', 'çərşənbə axşamı', 'çərşənbə',
-            'cümə axşamı', 'cümə', 'şənbə', 'bazar']
-    months = ['yanvar', 'fevral', 'mart', 'aprel', 'may', 'iyun',
-              'iyul', 'avqust', 'sentyabr', 'oktyabr', 'moyabr',
-              'dekabr']
-    eng_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                  'july', 'august', 'september', 'october', 'november',
-                  'december']
-    word_list += days + months
-    recur_markers = days + [_generate_plurals_az(d) for d in days] + ['həftə sonu', 'iş günü',
-                                                      'həftə sonları', 'iş günləri']
-    monthsShort = ['yan', 'fev', 'mar', 'apr', 'may', 'ıyn', 'ıyl', 'avq',
-                   'sen', 'okt', 'noy', 'dek']
-    year_multiples = ["onillik", "yüzillik", "minillik"]
-    day_multiples = ["həftə", "ay", "il"]
-    word_list += year_multiples + day_multiples + ['saat', 'dəqiqə', 'saniyə', 'sonra', 'gecə yarısı', 'günortadan sonra', 'gün']
-    word_list.sort(key=lambda x: len(x), reverse=True)
-    words = clean_string(text, word_list)
 
     for idx, word in enumerate(words):
         if word == "":
@@ -744,11 +394,12 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
         used = 0
         # save timequalifier for later
         if word == "indi" and not datestr:
+            words[idx] = ""
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
             extractedDate = anchorDate.replace(microsecond=0)
             return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+        elif wordNext in _YEAR_MULTIPLES_AZ:
             multiplier = None
             if is_numeric(word):
                 multiplier = extract_number_az(word)
@@ -761,7 +412,7 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                 yearOffset = multiplier * 100
             elif "minillik" in wordNext:
                 yearOffset = multiplier * 1000
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_AZ:
             timeQualifier = word
         # parse bu qün, sabah, srağagün, dünən, birigün
         elif word == "bu gün" and not fromFlag:
@@ -832,14 +483,14 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                 yearOffset = -1
                 start -= 1
                 used = 2
-            if wordNext in markers:
+            if wordNext in _DATETIME_MARKERS_AZ:
                 used += 1
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            if wordNext in markers:
+        elif word in _DAYS_AZ and not fromFlag:
+            if wordNext in _DATETIME_MARKERS_AZ:
                 used += 1
-            d = days.index(word)
+            d = _DAYS_AZ[word]
             dayOffset = (d + 1) - int(today)
             used += 1
             if dayOffset < 0:
@@ -854,13 +505,12 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTHS_AZ or word in _MONTHS_SHORT_AZ and not fromFlag:
+            m = _MONTHS_AZ.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_AZ[word]
             used += 1
-            datestr = eng_months[m]
+            datestr = _MONTHS_EN_AZ[m]
             if wordPrev and wordPrev[0].isdigit():
                 datestr += " " + wordPrev
                 start -= 1
@@ -869,10 +519,12 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                     datestr += " " + wordNext
                     used += 1
                     hasYear = True
-                    if (wordNextNext and wordNextNext in markers) or wordNextNext == 'il':
+                    if (wordNextNext and
+                            wordNextNext in _DATETIME_MARKERS_AZ) or \
+                            wordNextNext == 'il':
                         used += 1
                 else:
-                    if wordNext and wordNext in markers:
+                    if wordNext and wordNext in _DATETIME_MARKERS_AZ:
                         used += 1
                     hasYear = False
 
@@ -883,24 +535,25 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                     datestr += " " + wordNextNext
                     used += 1
                     hasYear = True
-                    if wordNextNextNext and wordNextNextNext in markers:
+                    if wordNextNextNext and \
+                            wordNextNextNext in _DATETIME_MARKERS_AZ:
                         used += 1
                 else:
-                    if wordNextNext and wordNextNext in markers:
+                    if wordNextNext and wordNextNext in _DATETIME_MARKERS_AZ:
                         used += 1
                     hasYear = False
 
         elif word == "bu":
             used += 1
             dayOffset = 0
-            if wordNext in markers:
+            if wordNext in _DATETIME_MARKERS_AZ:
                 used += 1
         
         if used > 0:
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_AZ:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -948,7 +601,7 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
         elif word == "saat":
             if wordPrev == "yarım":
                 minOffset = 30
-            if wordNext in markers:
+            if wordNext in _DATETIME_MARKERS_AZ:
                 used +=1
 
             words[idx - 1] = ""
@@ -1019,9 +672,9 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_AZ or
+                        wordNext in _RECUR_MARKERS_AZ or
+                        wordNextNext in _RECUR_MARKERS_AZ):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1048,7 +701,7 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                         isTime = False
                         hrAbs = -1
                         minAbs = -1
-                        if wordNextNext in markers:
+                        if wordNextNext in _DATETIME_MARKERS_AZ:
                             used += 1
                     elif "saniyə" in wordNext or "saniyə" in remainder:
                         # 5 saniyə
@@ -1067,12 +720,12 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                                 wordNextNext == "də" or
                                 remainder == "da" or remainder == "də"):
                             used += 1
-                    elif wordNext in markers:
+                    elif wordNext in _DATETIME_MARKERS_AZ:
                         strHH = strNum
 
             HH = int(strHH) if strHH else 0
             MM = int(strMM) if strMM else 0
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_AZ and HH < 12:
                 HH += 12
             
             if HH > 24 or MM > 59:
@@ -1083,7 +736,8 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
                 minAbs = MM
                 used += 1
             
-            if wordNext in markers or word in markers:
+            if wordNext in _DATETIME_MARKERS_AZ or \
+                    word in _DATETIME_MARKERS_AZ:
                 used += 1
         if used > 0:
             # removed parsed words from the sentence
@@ -1172,6 +826,7 @@ def extract_datetime_az(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+@word_memo("az")
 def is_fractional_az(input_str, short_scale=True, spoken=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1185,13 +840,9 @@ def is_fractional_az(input_str, short_scale=True, spoken=True):
 
     """
 
-    fracts = {"dörddəbir": 4, "yarım": 2, "üçdəbir": 3}
-    for num in _FRACTION_STRING_AZ:
-        if num > 2:
-            fracts[_FRACTION_STRING_AZ[num]] = num
-
-    if input_str.lower() in fracts and spoken:
-        return 1.0 / fracts[input_str.lower()]
+    denominator = _FRACTION_DENOMINATORS_AZ.get(input_str.lower())
+    if denominator and spoken:
+        return 1.0 / denominator
     return False
 
 
@@ -1209,17 +860,16 @@ def extract_numbers_az(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_az(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [float(number) for number in
+            _NUMBER_PARSER_AZ.extract_numbers(text, short_scale, ordinals)]
 
 
 class AzerbaijaniNormalizer(Normalizer):
-    with open(resolve_resource_file("text/az-az/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/az-az/normalize.json")
 
     def numbers_to_digits(self, utterance):
-        return _convert_words_to_numbers_az(utterance, ordinals=None)
+        return _NUMBER_PARSER_AZ.convert_words_to_numbers(utterance,
+                                                          ordinals=None)
 
 
 def normalize_az(text, remove_articles=True):
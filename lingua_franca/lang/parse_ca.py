@@ -22,17 +22,18 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
+    word_memo, extract_datetime_spans_generic
 from lingua_franca.lang.common_data_ca import _NUMBERS_CA, \
     _FEMALE_DETERMINANTS_CA, _FEMALE_ENDINGS_CA, \
     _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA, \
     _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.resources import resource_cache
 from lingua_franca.lang.parse_common import Normalizer
-import json
 import re
 
 
+@word_memo("ca")
 def is_fractional_ca(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -236,8 +237,7 @@ def extract_number_ca(text, short_scale=True, ordinals=False):
 
 
 class CatalanNormalizer(Normalizer):
-    with open(resolve_resource_file("text/ca-es/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/ca-es/normalize.json")
 
     @staticmethod
     def tokenize(utterance):
@@ -260,72 +260,139 @@ def normalize_ca(text, remove_articles=True):
     return CatalanNormalizer().normalize(text, remove_articles)
 
 
-def extract_datetime_ca(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        # cleans the input string of unneeded punctuation and capitalization
-        # among other things
-        symbols = [".", ",", ";", "?", "!", "º", "ª"]
-        hyphens = ["'", "_"]
-        noise_words = ["el", "l", "els", "la", "les", "es", "sa", "ses",
-                       "d", "de", "del", "dels"]
-        # add final space
-        s = s + " "
-
-        s = s.lower()
-
-        for word in symbols:
-            s = s.replace(word, "")
-
-        for word in hyphens:
-            s = s.replace(word, " ")
-
-        for word in noise_words:
-            s = s.replace(" " + word + " ", " ")
+# the vocabulary of extract_datetime_ca
+_TIME_QUALIFIERS_CA = frozenset(['matí', 'tarda', 'nit'])
+_TIME_INDICATORS_CA = frozenset(["em", "a", "a les", "cap a", "vora",
+                                 "després", "estas", "no", "dia", "hora"])
+# {day: weekday}, dilluns is 0
+_DAYS_CA = {day: weekday for weekday, day in enumerate(
+    ['dilluns', 'dimarts', 'dimecres', 'dijous', 'divendres', 'dissabte',
+     'diumenge'])}
+_MONTHS_CA = ('gener', 'febrer', 'març', 'abril', 'maig', 'juny', 'juliol',
+              'agost', 'setembre', 'octubre', 'novembre', 'desembre')
+# {month: index in _MONTHS_CA}
+_MONTH_INDEXES_CA = {month: idx for idx, month in enumerate(_MONTHS_CA)}
+_MONTHS_SHORT_CA = {month: idx for idx, month in enumerate(
+    ['gen', 'feb', 'març', 'abr', 'maig', 'juny', 'jul', 'ag', 'set', 'oct',
+     'nov', 'des'])}
+_NEXTS_CA = frozenset(["pròxim", "pròxima", "vinent"])
+_SUFFIX_NEXTS_CA = frozenset(["següent", "després"])
+_LASTS_CA = frozenset(["últim", "última", "darrer", "darrera", "passat",
+                       "passada"])
+_SUFFIX_LASTS_CA = frozenset(["passada", "passat", "anterior", "abans"])
+_NXTS_CA = frozenset(["passat", "després", "segueix", "seguit", "seguida",
+                      "següent", "pròxim", "pròxima"])
+_PREVS_CA = frozenset(["abans", "prèvia", "previamente", "anterior"])
+_THISES_CA = frozenset(["aquest", "aquesta", "aqueix", "aqueixa", "este",
+                        "esta"])
+_FROMS_CA = frozenset(["partir", "dins", "des", "a", "després", "pròxima",
+                       "pròxim", "del", "de"]) | _THISES_CA
+_DATETIME_MARKERS_CA = _NXTS_CA | _PREVS_CA | _FROMS_CA | \
+    _TIME_INDICATORS_CA
+# the words that may follow one of _FROMS_CA in a date,
+# "5 dies després de demà", "2 mesos a partir de juliol"
+_FROM_FOLLOWUPS_CA = frozenset(_DAYS_CA) | frozenset(_MONTH_INDEXES_CA) | \
+    frozenset(_MONTHS_SHORT_CA) | \
+    frozenset(["avui", "demà", "ahir", "abansahir", "abansabansahir",
+               "demàpassat", "ara", "ja", "abans"])
+
+
+def _datetime_words_ca(s):
+    """The words of s, cleaned for extract_datetime_ca"""
+    # cleans the input string of unneeded punctuation and capitalization
+    # among other things
+    symbols = [".", ",", ";", "?", "!", "º", "ª"]
+    hyphens = ["'", "_"]
+    noise_words = ["el", "l", "els", "la", "les", "es", "sa", "ses",
+                   "d", "de", "del", "dels"]
+    # add final space
+    s = s + " "
+
+    s = s.lower()
+
+    for word in symbols:
+        s = s.replace(word, "")
+
+    for word in hyphens:
+        s = s.replace(word, " ")
+
+    for word in noise_words:
+        s = s.replace(" " + word + " ", " ")
             
 
-        # handle synonims, plurals and equivalents, "demà ben d'hora" = "demà de matí"
-        synonims = {"abans": ["abans-d"],
-                    "vinent": ["que vé", "que ve", "que bé", "que be"],
-                    "migdia": ["mig dia"],
-                    "mitjanit": ["mitja nit"],
-                    "matinada": ["matinades", "ben hora ben hora"],
-                    "matí": ["matins", "dematí", "dematins", "ben hora"],
-                    "tarda": ["tardes", "vesprada", "vesprades", "vespraes"],
-                    "nit": ["nits", "vespre", "vespres", "horabaixa", "capvespre"],
-                    "demà": ["endemà"],
-                    "diàriament": ["diària", "diàries", "cada dia", "tots dies"],
-                    "setmanalment": ["setmanal", "setmanals", "cada setmana", "totes setmanes"],
-                    "quinzenalment": ["quinzenal", "quinzenals", "cada quinzena", "totes quinzenes"],
-                    "mensualment": ["mensual", "mensuals", "cada mes", "tots mesos"],
-                    "anualment": ["anual", "anuals", "cada any", "tots anys"],
-                    "demàpassat": ["demà-passat", "demà passat", "passat demà", "despús-demà", "despús demà"],
-                    "demàpassatpassat": ["demàpassat passat", "passat demàpassat",
-                                         "demàpassat no altre", "demàpassat altre"],
-                    "abansahir": ["abans ahir", "despús ahir", "despús-ahir"],
-                    "abansabansahir": ["abans abansahir", "abansahir no altre", "abansahir altre",
-                                             "abansahir no altre", "abansahir altre"],
-                    "segon": ["segons"],
-                    "minut": ["minuts"],
-                    "quart": ["quarts"],
-                    "hora": ["hores"],
-                    "dia": ["dies"],
-                    "setmana": ["setmanes"],
-                    "quinzena": ["quinzenes"],
-                    "mes": ["mesos"],
-                    "any": ["anys"],
-                    "tocat": ["tocats"],
-                    "a": ["al", "als"]
-                    }
-        for syn in synonims:
-            for word in synonims[syn]:
-                s = s.replace(" " + word + " ", " " + syn + " ")
-
-        # remove final space
-        if s[-1] == " ":
-            s = s[:-1]
-
-
-        return s
+    # handle synonims, plurals and equivalents, "demà ben d'hora" = "demà de matí"
+    synonims = {"abans": ["abans-d"],
+                "vinent": ["que vé", "que ve", "que bé", "que be"],
+                "migdia": ["mig dia"],
+                "mitjanit": ["mitja nit"],
+                "matinada": ["matinades", "ben hora ben hora"],
+                "matí": ["matins", "dematí", "dematins", "ben hora"],
+                "tarda": ["tardes", "vesprada", "vesprades", "vespraes"],
+                "nit": ["nits", "vespre", "vespres", "horabaixa", "capvespre"],
+                "demà": ["endemà"],
+                "diàriament": ["diària", "diàries", "cada dia", "tots dies"],
+                "setmanalment": ["setmanal", "setmanals", "cada setmana", "totes setmanes"],
+                "quinzenalment": ["quinzenal", "quinzenals", "cada quinzena", "totes quinzenes"],
+                "mensualment": ["mensual", "mensuals", "cada mes", "tots mesos"],
+                "anualment": ["anual", "anuals", "cada any", "tots anys"],
+                "demàpassat": ["demà-passat", "demà passat", "passat demà", "despús-demà", "despús demà"],
+                "demàpassatpassat": ["demàpassat passat", "passat demàpassat",
+                                     "demàpassat no altre", "demàpassat altre"],
+                "abansahir": ["abans ahir", "despús ahir", "despús-ahir"],
+                "abansabansahir": ["abans abansahir", "abansahir no altre", "abansahir altre",
+                                         "abansahir no altre", "abansahir altre"],
+                "segon": ["segons"],
+                "minut": ["minuts"],
+                "quart": ["quarts"],
+                "hora": ["hores"],
+                "dia": ["dies"],
+                "setmana": ["setmanes"],
+                "quinzena": ["quinzenes"],
+                "mes": ["mesos"],
+                "any": ["anys"],
+                "tocat": ["tocats"],
+                "a": ["al", "als"]
+                }
+    for syn in synonims:
+        for word in synonims[syn]:
+            s = s.replace(" " + word + " ", " " + syn + " ")
+
+    # remove final space
+    if s[-1] == " ":
+        s = s[:-1]
+
+
+    return s.split(" ")
+
+
+def extract_datetime_ca(text, anchorDate=None, default_time=None):
+    if text == "":
+        return None
+    return _extract_datetime_words_ca(_datetime_words_ca(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_ca(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_ca, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_ca,
+                                          _extract_datetime_words_ca,
+                                          ["i", "a"], anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_ca(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_ca on the words of a text cleaned by
+    _datetime_words_ca, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -337,9 +404,6 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -354,28 +418,6 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    words = clean_string(text).split(" ")
-    timeQualifiersList = ['matí', 'tarda', 'nit']
-    time_indicators = ["em", "a", "a les", "cap a", "vora", "després", "estas",
-                       "no", "dia", "hora"]
-    days = ['dilluns', 'dimarts', 'dimecres',
-            'dijous', 'divendres', 'dissabte', 'diumenge']
-    months = ['gener', 'febrer', 'març', 'abril', 'maig', 'juny',
-              'juliol', 'agost', 'setembre', 'octubre', 'novembre',
-              'desembre']
-    monthsShort = ['gen', 'feb', 'març', 'abr', 'maig', 'juny', 'jul', 'ag',
-                   'set', 'oct', 'nov', 'des']
-    nexts = ["pròxim", "pròxima", "vinent"]
-    suffix_nexts = ["següent", "després"]
-    lasts = ["últim", "última", "darrer", "darrera", "passat", "passada"]
-    suffix_lasts = ["passada", "passat", "anterior", "abans"]
-    nxts = ["passat", "després", "segueix", "seguit", "seguida", "següent", "pròxim", "pròxima"]
-    prevs = ["abans", "prèvia", "previamente", "anterior"]
-    froms = ["partir", "dins", "des", "a",
-             "després", "pròxima", "pròxim", "del", "de"]
-    thises = ["aquest", "aquesta", "aqueix", "aqueixa", "este", "esta"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -388,7 +430,7 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_CA:
             timeQualifier = word
 
         # parse today, tomorrow, yesterday
@@ -424,13 +466,13 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                     start -= 1
                     used += 1
             elif (wordPrev and wordPrev[0].isdigit() and
-                  wordNext not in months and
-                  wordNext not in monthsShort):
+                  wordNext not in _MONTH_INDEXES_CA and
+                  wordNext not in _MONTHS_SHORT_CA):
                 dayOffset += int(wordPrev)
                 start -= 1
                 used += 2
             elif wordNext and wordNext[0].isdigit() and wordNextNext not in \
-                    months and wordNextNext not in monthsShort:
+                    _MONTH_INDEXES_CA and wordNextNext not in _MONTHS_SHORT_CA:
                 dayOffset += int(wordNext)
                 start -= 1
                 used += 2
@@ -440,117 +482,100 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_CA:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_CA:
+                dayOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_CA:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_CA:
+                dayOffset = -7
+                start -= 1
+                used = 2
         # parse 10 months, next month, last month
         elif word == "mes" and not fromFlag:
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_CA:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_CA:
+                monthOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_CA:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_CA:
+                monthOffset = -7
+                start -= 1
+                used = 2
         # parse 5 years, next year, last year
         elif word == "any" and not fromFlag:
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    yearOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    yearOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    yearOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    yearOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_CA:
+                yearOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_CA:
+                yearOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_CA:
+                yearOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_CA:
+                yearOffset = -7
+                start -= 1
+                used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
+        elif word in _DAYS_CA and not fromFlag:
 
-            d = days.index(word)
+            d = _DAYS_CA[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
-            for w in nexts:
-                if wordPrev == w:
-                    dayOffset += 7
-                    used += 1
-                    start -= 1
-            for w in lasts:
-                if wordPrev == w:
-                    dayOffset -= 7
-                    used += 1
-                    start -= 1
-            for w in suffix_nexts:
-                if wordNext == w:
-                    dayOffset += 7
-                    used += 1
-                    start -= 1
-            for w in suffix_lasts:
-                if wordNext == w:
-                    dayOffset -= 7
-                    used += 1
-                    start -= 1
+            if wordPrev in _NEXTS_CA:
+                dayOffset += 7
+                used += 1
+                start -= 1
+            if wordPrev in _LASTS_CA:
+                dayOffset -= 7
+                used += 1
+                start -= 1
+            if wordNext in _SUFFIX_NEXTS_CA:
+                dayOffset += 7
+                used += 1
+                start -= 1
+            if wordNext in _SUFFIX_LASTS_CA:
+                dayOffset -= 7
+                used += 1
+                start -= 1
             if wordNext == "feira":
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_CA or word in _MONTHS_SHORT_CA:
+            m = _MONTH_INDEXES_CA.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_CA[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_CA[m]
             if wordPrev and wordPrev[0].isdigit():
                 # 13 maig
                 datestr += " " + wordPrev
@@ -598,24 +623,14 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                 else:
                     hasYear = False
 
-            if datestr in months:
+            if datestr in _MONTH_INDEXES_CA:
                 datestr = ""
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("avui")
-        validFollowups.append("demà")
-        validFollowups.append("ahir")
-        validFollowups.append("abansahir")
-        validFollowups.append("abansabansahir")
-        validFollowups.append("demàpassat")
-        validFollowups.append("ara")
-        validFollowups.append("ja")
-        validFollowups.append("abans")
 
         # TODO debug word "passat" that one is failing for some reason
-        if word in froms and wordNext in validFollowups:
+        if word in _FROMS_CA and wordNext in _FROM_FOLLOWUPS_CA:
 
             if not (wordNext == "demà" and wordNext == "ahir") and not (
                     word == "passat" or word == "abans" or word == "em"):
@@ -629,8 +644,8 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                 dayOffset -= 2
             elif wordNext == "abansabansahir":
                 dayOffset -= 3
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_CA:
+                d = _DAYS_CA[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if wordNextNext == "dia":
@@ -638,39 +653,39 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                 if tmpOffset < 0:
                     tmpOffset += 7
                 if wordNextNext:
-                    if wordNextNext in nxts:
+                    if wordNextNext in _NXTS_CA:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNext in prevs:
+                    elif wordNextNext in _PREVS_CA:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_CA:
+                d = _DAYS_CA[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNextNextNext:
-                    if wordNextNextNext in nxts:
+                    if wordNextNextNext in _NXTS_CA:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNextNext in prevs:
+                    elif wordNextNextNext in _PREVS_CA:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
                 if wordNextNextNext == "dia":
                     used += 1
-        if wordNext in months:
+        if wordNext in _MONTH_INDEXES_CA:
             used -= 1
         if used > 0:
 
-            if start - 1 > 0 and words[start - 1] in lists:
+            if start - 1 > 0 and words[start - 1] in _DATETIME_MARKERS_CA:
                 start -= 1
                 used += 1
 
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in lists:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_CA:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -735,20 +750,20 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
             used += 1
         # parse half an hour, quarter hour
         elif word == "hora" and \
-                (wordPrev in time_indicators or wordPrevPrev in
-                 time_indicators):
+                (wordPrev in _TIME_INDICATORS_CA or wordPrevPrev in
+                 _TIME_INDICATORS_CA):
             if wordPrev == "mitja":
                 minOffset = 30
             elif wordPrev == "quart":
                 minOffset = 15
             elif wordPrevPrev == "quart":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in time_indicators:
+                if idx > 2 and words[idx - 3] in _TIME_INDICATORS_CA:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             else:
                 hrOffset = 1
-            if wordPrevPrev in time_indicators:
+            if wordPrevPrev in _TIME_INDICATORS_CA:
                 words[idx - 2] = ""
             words[idx - 1] = ""
             used += 1
@@ -800,13 +815,13 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
                         else:
                             remainder = "pm"
                         used += 1
-                    elif wordNext in thises and wordNextNext == "matí":
+                    elif wordNext in _THISES_CA and wordNextNext == "matí":
                         remainder = "am"
                         used = 2
-                    elif wordNext in thises and (wordNextNext == "tarda" or wordNextNext == "vespre"):
+                    elif wordNext in _THISES_CA and (wordNextNext == "tarda" or wordNextNext == "vespre"):
                         remainder = "pm"
                         used = 2
-                    elif wordNext in thises and wordNextNext == "nit":
+                    elif wordNext in _THISES_CA and wordNextNext == "nit":
                         remainder = "pm"
                         used = 2
                     else:
@@ -961,9 +976,9 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
             if wordPrev == "en" or wordPrev == "punt":
                 words[words.index(wordPrev)] = ""
 
-            if idx > 0 and wordPrev in time_indicators:
+            if idx > 0 and wordPrev in _TIME_INDICATORS_CA:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in time_indicators:
+            if idx > 1 and wordPrevPrev in _TIME_INDICATORS_CA:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -990,10 +1005,10 @@ def extract_datetime_ca(text, anchorDate=None, default_time=None):
         en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                           'aug',
                           'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
+        for month, en_month in zip(_MONTHS_CA, en_months):
+            datestr = datestr.replace(month, en_month)
+        for month, en_month in zip(_MONTHS_SHORT_CA, en_monthsShort):
+            datestr = datestr.replace(month, en_month)
 
         temp = datetime.strptime(datestr, "%B %d")
         if extractedDate.tzinfo:
@@ -14,12 +14,17 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from datetime import timedelta
 import re
-import json
 import unicodedata
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, update_wrapper
+from types import MappingProxyType
 
-from quebra_frases import word_tokenize
-from lingua_franca.internal import  resolve_resource_file, FunctionNotLocalizedError
+from lingua_franca import config
+from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.resources import resource_cache
+from lingua_franca.time import now_local
 
 
 class Normalizer:
@@ -35,6 +40,7 @@ class Normalizer:
 
     @staticmethod
     def tokenize(utterance):
+        from quebra_frases import word_tokenize
         return word_tokenize(utterance)
 
     @property
@@ -189,14 +195,16 @@ class Normalizer:
         return utterance
 
 
+def _lowercase_words(words):
+    return MappingProxyType({k: tuple(_.lower() for _ in v)
+                             for k, v in words.items()})
+
+
 def match_yes_or_no(text, lang):
-    resource_file = resolve_resource_file(f"text/{lang}/yesno.json")
-    if not resource_file:
+    words = resource_cache.get(f"text/{lang}/yesno.json", _lowercase_words)
+    if not words:
         raise FunctionNotLocalizedError(f"yesno.json missing for {lang}")
 
-    with open(resource_file) as f:
-        words = json.load(f)
-        words = {k: [_.lower() for _ in v] for k, v in words.items()}
     # after encoding information is lost
     if lang == 'uk-ua':
         text = unicodedata.normalize('NFD', text)
@@ -281,10 +289,12 @@ class ReplaceableNumber:
     In other words, it is the text, and the number that can replace it in
     the string.
     """
+    __slots__ = ("value", "tokens")
 
     def __init__(self, value, tokens: [Token]):
-        self.value = value
-        self.tokens = tokens
+        # set once, past the immutability check of __setattr__
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "tokens", tokens)
 
     def __bool__(self):
         return bool(self.value is not None and self.value is not False)
@@ -331,6 +341,322 @@ def tokenize(text):
             for index, word in enumerate(Normalizer.tokenize(text))]
 
 
+_WORD_SPAN = re.compile(r"\S+")
+
+
+def _lower(word):
+    """word lowercase, the same object if it already is"""
+    lowered = word.lower()
+    return word if lowered == word else lowered
+
+
+class TokenBuffer:
+    """
+    The words of a text, in parallel lists rather than one Token each.
+
+    Reading a position, or iterating, gives Tokens made on demand, so a
+    TokenBuffer can be read wherever a list of Tokens is. Parsers going
+    over every word read the lists directly instead, and `lowered` saves
+    them lowercasing the same word at every look up. Slices are
+    TokenBuffers too.
+
+    Attributes:
+        words [str]: the words
+        lowered [str]: the same words, lowercase
+        indexes [int]: the index of each word, as in Token.index
+        spans [(int, int)]: the span of each word in the text, or None if
+                            not known
+    """
+    __slots__ = ("words", "lowered", "indexes", "spans")
+
+    def __init__(self, words=(), indexes=None, spans=None):
+        self.words = list(words)
+        self.lowered = [_lower(word) for word in self.words]
+        self.indexes = list(range(len(self.words))) if indexes is None \
+            else list(indexes)
+        self.spans = spans
+
+    @classmethod
+    def tokenize(cls, text):
+        """Buffer of the words of a text, split as tokenize() does"""
+        return cls(Normalizer.tokenize(text))
+
+    @classmethod
+    def split(cls, text, strip=",;:!?"):
+        """
+        Buffer of the words of a text separated by whitespace, with their
+        spans.
+
+        Args:
+            text str:
+            strip str: characters removed from the end of each word
+        """
+        words = []
+        spans = []
+        for match in _WORD_SPAN.finditer(text):
+            word = match.group().rstrip(strip)
+            if word:
+                words.append(word)
+                spans.append((match.start(), match.start() + len(word)))
+        return cls(words, spans=spans)
+
+    @classmethod
+    def of(cls, tokens):
+        """tokens as a TokenBuffer, if they aren't one already"""
+        if isinstance(tokens, cls):
+            return tokens
+        return cls([token.word for token in tokens],
+                   [token.index for token in tokens])
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return map(Token, self.words, self.indexes)
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            buffer = TokenBuffer.__new__(TokenBuffer)
+            buffer.words = self.words[pos]
+            buffer.lowered = self.lowered[pos]
+            buffer.indexes = self.indexes[pos]
+            buffer.spans = self.spans[pos] if self.spans is not None \
+                else None
+            return buffer
+        return Token(self.words[pos], self.indexes[pos])
+
+    def __setitem__(self, pos, token):
+        self.words[pos] = token.word
+        self.lowered[pos] = _lower(token.word)
+        self.indexes[pos] = token.index
+
+    def __eq__(self, other):
+        if isinstance(other, TokenBuffer):
+            return self.words == other.words and \
+                self.indexes == other.indexes
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
+
+    def copy(self):
+        return self[:]
+
+    def replace(self, start, end, word):
+        """
+        Replace the words from position start to end, inclusive, keeping
+        their indexes.
+        """
+        count = end + 1 - start
+        self.words[start:end + 1] = [word] * count
+        self.lowered[start:end + 1] = [_lower(word)] * count
+
+    def partition(self, word):
+        """
+        Same as partition_list(tokens, lambda t: t.word == word), with
+        TokenBuffers as the partitions.
+        """
+        if word not in self.words:
+            return [self] if self.words else []
+        partitions = []
+        start = 0
+        for pos, other in enumerate(self.words):
+            if other == word:
+                partitions.append(self[start:pos])
+                partitions.append(self[pos:pos + 1])
+                start = pos + 1
+        partitions.append(self[start:])
+        return [partition for partition in partitions if partition.words]
+
+
+def _origins(text):
+    """The origins of the characters of text, see SourceText"""
+    if isinstance(text, SourceText):
+        return text.origins
+    return [None] * len(text)
+
+
+def _merged(origins):
+    """One origin spanning all of origins, None if none is known"""
+    known = [origin for origin in origins if origin is not None]
+    if not known:
+        return None
+    return min(origin[0] for origin in known), \
+        max(origin[1] for origin in known)
+
+
+class SourceText(str):
+    """
+    A text which knows where its characters come from in the text it was
+    made from, through the cleaning steps of extract_datetime.
+
+    lower(), replace(), split(), strip() and their variants, slicing and
+    concatenation keep the origins of the characters, as do the tables of
+    compile_substitutions and NumberParser.convert_words_to_numbers. The
+    characters a replacement puts in come from the whole text it
+    replaces, those of a plain str come from nowhere. Any other str method
+    gives a plain str.
+
+    Attributes:
+        origins [(int, int)]: the span each character comes from, or None
+    """
+
+    def __new__(cls, text, origins=None):
+        self = super().__new__(cls, text)
+        self.origins = [(i, i + 1) for i in range(len(text))] \
+            if origins is None else origins
+        return self
+
+    @classmethod
+    def spanning(cls, text, pieces):
+        """text, made of pieces it replaces, coming from all of them"""
+        if not any(isinstance(piece, cls) for piece in pieces):
+            return text
+        origin = _merged([_merged(_origins(piece)) for piece in pieces])
+        return cls(text, [origin] * len(text))
+
+    @classmethod
+    def joined(cls, separator, pieces):
+        """separator.join(pieces), keeping the origins of the pieces"""
+        joined = separator.join(pieces)
+        if not any(isinstance(piece, cls) for piece in pieces):
+            return joined
+        origins = []
+        for n, piece in enumerate(pieces):
+            if n:
+                origins += _origins(separator)
+            origins += _origins(piece)
+        return cls(joined, origins)
+
+    def span(self):
+        """The span of the source text the characters come from, or None
+        """
+        return _merged(self.origins)
+
+    def locate(self, words):
+        """
+        words, found one after the other in the text, as slices of it;
+        a word which isn't found is left as it is
+        """
+        located = []
+        position = 0
+        for word in words:
+            start = str.find(self, word, position)
+            if start < 0:
+                located.append(word)
+            else:
+                position = start + len(word)
+                located.append(self[start:position])
+        return located
+
+    def edit(self, edits):
+        """
+        The text with edits made, (start, end, replacement) in order and
+        not overlapping.
+
+        The characters a replacement starts or ends with in common with
+        the text it replaces keep their origins.
+        """
+        parts = []
+        origins = []
+        position = 0
+        for start, end, new in edits:
+            old = str.__getitem__(self, slice(start, end))
+            same = 0
+            while same < min(len(old), len(new)) and \
+                    old[same] == new[same]:
+                same += 1
+            start += same
+            new_origins = _origins(new)[same:]
+            new = new[same:]
+            old = old[same:]
+            same = 0
+            while same < min(len(old), len(new)) and \
+                    old[-1 - same] == new[-1 - same]:
+                same += 1
+            if same:
+                end -= same
+                new = new[:-same]
+                new_origins = new_origins[:-same]
+            parts.append(str.__getitem__(self, slice(position, start)))
+            origins += self.origins[position:start]
+            parts.append(new)
+            if isinstance(new, SourceText):
+                origins += new_origins
+            else:
+                origins += [_merged(self.origins[start:end])] * len(new)
+            position = end
+        parts.append(str.__getitem__(self, slice(position, None)))
+        origins += self.origins[position:]
+        return SourceText("".join(parts), origins)
+
+    def sub(self, pattern, replacement):
+        """pattern.sub(replacement, text), replacement being a function of
+        the match"""
+        return self.edit([(match.start(), match.end(), replacement(match))
+                          for match in pattern.finditer(self)])
+
+    def replace(self, old, new, count=-1):
+        if not old:
+            return str.replace(self, old, new, count)
+        edits = []
+        start = str.find(self, old)
+        while start >= 0 and count != 0:
+            edits.append((start, start + len(old), new))
+            start = str.find(self, old, start + len(old))
+            count -= 1
+        return self.edit(edits) if edits else self
+
+    def lower(self):
+        lowered = str.lower(self)
+        if len(lowered) == len(self):
+            return SourceText(lowered, self.origins)
+        origins = []
+        for char, origin in zip(self, self.origins):
+            origins += [origin] * len(char.lower())
+        return SourceText(lowered, origins)
+
+    def split(self, sep=None, maxsplit=-1):
+        pieces = []
+        position = 0
+        for piece in str.split(self, sep, maxsplit):
+            if sep is None:
+                position = str.find(self, piece, position)
+            pieces.append(self[position:position + len(piece)])
+            position += len(piece) + (len(sep) if sep is not None else 0)
+        return pieces
+
+    def strip(self, chars=None):
+        return self.lstrip(chars).rstrip(chars)
+
+    def lstrip(self, chars=None):
+        return self[len(self) - len(str.lstrip(self, chars)):]
+
+    def rstrip(self, chars=None):
+        return self[:len(str.rstrip(self, chars))]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return SourceText(str.__getitem__(self, key), self.origins[key])
+        return SourceText(str.__getitem__(self, key), [self.origins[key]])
+
+    def __add__(self, other):
+        if not isinstance(other, str):
+            return NotImplemented
+        return SourceText(str.__add__(self, other),
+                          self.origins + _origins(other))
+
+    def __radd__(self, other):
+        if not isinstance(other, str):
+            return NotImplemented
+        return SourceText(str.__add__(other, self),
+                          _origins(other) + self.origins)
+
+
 def partition_list(items, split_on):
     """
     Partition a list of items.
@@ -376,6 +702,151 @@ def invert_dict(original):
     return {value: key for key, value in original.items()}
 
 
+def compile_substitutions(substitutions=None, words=None, delete=""):
+    """
+    Compile a table of text substitutions into a function making them all
+    in a single pass over a string.
+
+    This replaces chains of str.replace with one table per language, such
+    as the cleaning steps of extract_datetime.
+
+    Args:
+        substitutions (dict): {text: replacement}, text is replaced
+                              wherever it occurs, even inside a word
+        words (dict): {word: replacement}, word is only replaced where it
+                      has a space on each side, as with
+                      s.replace(" word ", " replacement ")
+        delete (str): characters to remove, before the substitutions
+
+    Returns:
+        callable: str -> str
+
+    Where several keys match at the same position the longest one wins.
+    The replacements are not searched again, and as the spaces around
+    the words are left in place, a run of words is replaced entirely.
+    """
+    substitutions = dict(substitutions or {})
+    words = dict(words or {})
+    if not substitutions.keys().isdisjoint(words):
+        raise ValueError("texts and words overlap: {}".format(
+            sorted(substitutions.keys() & words.keys())))
+    table = {**substitutions, **words}
+
+    def remove_deletions(s):
+        # a few str.replace are cheaper than str.translate here
+        for char in delete:
+            s = s.replace(char, "")
+        return s
+
+    if not table:
+        return remove_deletions
+
+    # every alternative starts with a literal, the space before a word is
+    # looked behind from its first letter, which lets the regex engine skip
+    # ahead to the positions where one of the keys may start
+    alternatives = [(text, re.escape(text)) for text in substitutions]
+    alternatives += [(word, "{0}(?<= {0}){1}(?= )".format(
+        re.escape(word[0]), re.escape(word[1:]))) for word in words]
+    alternatives.sort(key=lambda alternative: len(alternative[0]),
+                      reverse=True)
+    pattern = re.compile("|".join(regex for _, regex in alternatives))
+
+    def replacement(match):
+        return table[match.group()]
+
+    def substitute(s):
+        if isinstance(s, SourceText):
+            return remove_deletions(s).sub(pattern, replacement)
+        return pattern.sub(replacement, remove_deletions(s))
+
+    return substitute
+
+
+class _WordMemo:
+    """Memo of one function decorated with `word_memo`
+
+    The results live in an unbounded `functools.lru_cache`, so that a hit
+    never leaves C code. The bound is enforced on misses instead: once
+    `config.word_memo_size` results are held, the memo is emptied before
+    the new one is added. Hits and misses of emptied generations are
+    carried over, as `lru_cache` forgets them.
+    """
+    __slots__ = ("function", "cached", "hits", "misses")
+
+    def __init__(self, function):
+        self.function = function
+        self.hits = 0
+        self.misses = 0
+        self.cached = update_wrapper(lru_cache(maxsize=None)(self._compute),
+                                     function)
+
+    def _compute(self, *args, **kwargs):
+        if self.cached.cache_info().currsize >= config.word_memo_size:
+            self.clear()
+        return self.function(*args, **kwargs)
+
+    def clear(self):
+        info = self.cached.cache_info()
+        self.hits += info.hits
+        self.misses += info.misses
+        self.cached.cache_clear()
+
+    def stats(self):
+        info = self.cached.cache_info()
+        return {"hits": self.hits + info.hits,
+                "misses": self.misses + info.misses,
+                "entries": info.currsize}
+
+
+# {lang: {function name: _WordMemo}}
+_WORD_MEMOS = {}
+
+
+def word_memo(lang):
+    """Memoize a classifier of single words, such as `is_numeric`
+
+    The decorated function must be pure, and its arguments hashable. Each
+    memo keeps up to `lingua_franca.config.word_memo_size` results.
+
+    Args:
+        lang (str): language code the memo is reported under, or "common"
+                    for functions shared by all languages
+    """
+    def decorator(function):
+        memo = _WordMemo(function)
+        _WORD_MEMOS.setdefault(lang, {})[function.__name__] = memo
+        return memo.cached
+    return decorator
+
+
+def get_word_memo_stats(lang=None):
+    """Get the statistics of the memos of `word_memo`
+
+    Args:
+        lang (str, optional): only the memos of this language
+
+    Returns:
+        dict: {lang: {function name: {"hits": int, "misses": int,
+                                       "entries": int}}}
+    """
+    return {memo_lang: {name: memo.stats() for name, memo in memos.items()}
+            for memo_lang, memos in _WORD_MEMOS.items()
+            if lang is None or memo_lang == lang}
+
+
+def clear_word_memos(lang=None):
+    """Empty the memos of `word_memo`, keeping their statistics
+
+    Args:
+        lang (str, optional): only the memos of this language
+    """
+    for memo_lang, memos in _WORD_MEMOS.items():
+        if lang is None or memo_lang == lang:
+            for memo in memos.values():
+                memo.clear()
+
+
+@word_memo("common")
 def is_numeric(input_str):
     """
     Takes in a string and tests to see if it is a number.
@@ -411,6 +882,1191 @@ def look_for_fractions(split_list):
     return False
 
 
+class NumberWord:
+    """
+    What a number word, or phrase, is for NumberLexer: its kinds, as
+    NumberLexer flags, and its value as each kind.
+
+    e.g. "second" is an ordinal worth 2 and a fraction worth 1/2
+    """
+    __slots__ = ("kinds", "values")
+
+    def __init__(self, kinds=0, values=None):
+        self.kinds = kinds
+        self.values = values if values is not None else {}
+
+    def __bool__(self):
+        return bool(self.kinds)
+
+    def __repr__(self):
+        return "{n}({k}, {v})".format(n=self.__class__.__name__,
+                                      k=self.kinds, v=self.values)
+
+
+_NOT_A_NUMBER = NumberWord()
+
+
+class NumberLexer:
+    """
+    The number vocabulary of a language, compiled into a trie of words.
+
+    Each entry is a phrase of one or more words, with kind flags and a
+    value for each kind. classify() tells what a single word is with one
+    lookup, instead of a membership test per vocabulary table, and also
+    recognizes digits ("12", "2.5") and fractions like "2/3". match()
+    finds the longest phrase starting at a position in a list of words.
+
+    The entries are shared by every caller, and must not be modified once
+    the lexer is compiled. Words are looked up as they are, except for the
+    kinds given as case_folded, which are also found in words which aren't
+    lowercase.
+
+    Example:
+        >>> lexer = NumberLexer()
+        >>> lexer.add_all({"twenty": 20, "two": 2}, NumberLexer.NUMBER)
+        >>> lexer.add_all(["twenty"], NumberLexer.SUM)
+        >>> lexer.classify("twenty").kinds & NumberLexer.SUM
+        4
+        >>> lexer.classify("twenty").values[NumberLexer.NUMBER]
+        20
+    """
+    DIGITS = 1  # written with digits, "12", "2.5"
+    NUMBER = 2  # number words, "one", "twenty"
+    SUM = 4  # tens, summed with the unit following them, "twenty"
+    SCALE = 8  # words for powers of ten, "hundred", "million"
+    MULTIPLIER = 16  # multiply the number before them, "hundred"
+    ORDINAL = 32  # "third"
+    FRACTION = 64  # "third", "half"
+    DIGIT_FRACTION = 128  # fractions written with digits, "2/3"
+    NEGATIVE = 256  # "minus"
+    ARTICLE = 512  # "a", "the"
+    SPOKEN = 1024  # colloquial amounts, "dozen", "couple"
+
+    def __init__(self, case_folded=0):
+        self._case_folded = case_folded
+        self._words = {}
+        # {kind: {word: NumberWord}}, see words()
+        self._words_by_kind = {}
+        # {word: [NumberWord or None, {next word: [...]}]}
+        self._trie = {}
+
+    def add(self, phrase, kind, value=None):
+        """
+        Add a phrase to the vocabulary, or a kind to a phrase already in it.
+
+        Args:
+            phrase (str): one or more lowercase words
+            kind (int): NumberLexer flag
+            value: value of the phrase as this kind, if any
+        """
+        words = phrase.split()
+        if not words:
+            return
+        node = None
+        children = self._trie
+        for word in words:
+            node = children.setdefault(word, [None, {}])
+            children = node[1]
+        if node[0] is None:
+            node[0] = NumberWord()
+            if len(words) == 1:
+                self._words[words[0]] = node[0]
+                if is_numeric(phrase):
+                    node[0].kinds |= NumberLexer.DIGITS
+                    node[0].values[NumberLexer.DIGITS] = \
+                        int(phrase) if phrase.isdigit() else float(phrase)
+        node[0].kinds |= kind
+        if value is not None:
+            node[0].values[kind] = value
+        self._words_by_kind.clear()
+
+    def add_all(self, phrases, kind):
+        """
+        Add phrases to the vocabulary, see add()
+
+        Args:
+            phrases (dict or iterable): {phrase: value}, or phrases without
+                                        a value
+            kind (int): NumberLexer flag
+        """
+        if isinstance(phrases, (dict, MappingProxyType)):
+            for phrase, value in phrases.items():
+                self.add(phrase, kind, value)
+        else:
+            for phrase in phrases:
+                self.add(phrase, kind)
+
+    def classify(self, word):
+        """
+        Args:
+            word (str): a lowercase word
+
+        Returns:
+            NumberWord: what the word is, falsy for words which aren't
+                        numbers. Digits have their value as DIGITS,
+                        fractions like "2/3" have none.
+        """
+        entry = self._words.get(word)
+        if entry is None:
+            entry = self._classify_digits(word)
+        if self._case_folded:
+            lowercase = word.lower()
+            if lowercase != word:
+                folded = self._words.get(lowercase)
+                kinds = folded.kinds & self._case_folded & ~entry.kinds \
+                    if folded is not None else 0
+                if kinds:
+                    values = dict(entry.values)
+                    values.update((kind, value) for kind, value
+                                  in folded.values.items() if kind & kinds)
+                    entry = NumberWord(entry.kinds | kinds, values)
+        return entry
+
+    def words(self, kind):
+        """
+        Args:
+            kind (int): NumberLexer flag
+
+        Returns:
+            Mapping(str, NumberWord): the single words of this kind in the
+                                      vocabulary
+        """
+        words = self._words_by_kind.get(kind)
+        if words is None:
+            words = MappingProxyType({word: entry for word, entry
+                                      in self._words.items()
+                                      if entry.kinds & kind})
+            self._words_by_kind[kind] = words
+        return words
+
+    def starting_words(self):
+        """
+        Returns:
+            Collection(str): the words the phrases of the vocabulary start
+                             with, single words included
+        """
+        return self._trie.keys()
+
+    @staticmethod
+    def _classify_digits(word):
+        # only digits, signs, points, "inf" and "nan" can start a float
+        if word[:1].isdigit() or word[:1] in "+-.iInN":
+            if is_numeric(word):
+                return NumberWord(NumberLexer.DIGITS, {
+                    NumberLexer.DIGITS:
+                        int(word) if word.isdigit() else float(word)})
+        if "/" in word:
+            pieces = word.split('/')
+            # not "1/0", which is no number
+            if look_for_fractions(pieces) and float(pieces[1]):
+                return NumberWord(NumberLexer.DIGIT_FRACTION)
+        return _NOT_A_NUMBER
+
+    def match(self, words, start=0):
+        """
+        Find the longest phrase of the vocabulary at the start of words.
+
+        Args:
+            words [str]: lowercase words
+            start (int): position in words to match from
+
+        Returns:
+            (NumberWord, int): what the phrase is, and the position after
+                               it. (falsy NumberWord, start) if there is
+                               no number at start.
+        """
+        best = None
+        end = start
+        children = self._trie
+        for idx in range(start, len(words)):
+            node = children.get(words[idx])
+            if node is None:
+                break
+            if node[0] is not None:
+                best = node[0]
+                end = idx + 1
+            children = node[1]
+        if best is None:
+            if start >= len(words):
+                return _NOT_A_NUMBER, start
+            best = self.classify(words[start])
+            end = start + 1 if best else start
+        return best, end
+
+
+class _ScalePositions:
+    """
+    Positions of the multiplier words ("hundred", "thousand"...) in a list
+    of words, by their value.
+
+    Tells whether a multiplier of at least some value follows a position,
+    without going over the rest of the list.
+    """
+
+    def __init__(self, words, lexer):
+        self._positions = {}
+        self._discarded = set()
+        multipliers = lexer.words(NumberLexer.MULTIPLIER)
+        for pos, word in enumerate(words):
+            entry = multipliers.get(word)
+            if entry is not None:
+                scale = entry.values.get(NumberLexer.SCALE)
+                if scale is not None:
+                    self._positions.setdefault(scale, []).append(pos)
+
+    def discard(self, start, end):
+        """Forget the multipliers from position start to end, inclusive"""
+        self._discarded.update(range(start, end + 1))
+
+    def follows(self, pos, value):
+        """True if a multiplier >= value comes after position pos"""
+        for scale, positions in self._positions.items():
+            if scale < value:
+                continue
+            while positions and positions[-1] in self._discarded:
+                positions.pop()
+            if positions and positions[-1] > pos:
+                return True
+        return False
+
+
+# a number written with digits, "12", "2.5", or a fraction, "2/3"
+_DIGIT_WORD = re.compile(r"[0-9]+(?:\.[0-9]+)?|([0-9]+)/([0-9]+)")
+# words float() reads as numbers
+_FLOAT_WORDS = frozenset(["inf", "infinity", "nan"])
+# punctuation which tokenize() splits from the end of a word
+_TRAILING_PUNCTUATION = ".,;:!?"
+
+
+class NumberParser:
+    """
+    Extracts the numbers written with words from a list of Tokens, for a
+    language whose number vocabulary is compiled into NumberLexers.
+
+    Whole numbers are read by the same steps in every such language, and
+    the rules in which languages differ are picked with the class
+    attributes below. A language subclasses NumberParser with its own
+    vocabulary and rules, and overrides the hook methods for the rules
+    only it has.
+
+    The numbers are extracted left to right, each scan for a whole number
+    resuming where the previous one could have started its number, so that
+    utterances are parsed in time linear in their length. Fractions and
+    decimals ("two and a half", "three point five") are looked for before
+    each number, but only while a marker word ("and", "point") occurs
+    exactly once, as they can't be found otherwise.
+    """
+    # {short_scale: NumberLexer}, see lexer()
+    lexers = MappingProxyType({})
+    # words between a whole number and a fraction, "two and three fifths"
+    fraction_markers = frozenset()
+    # words between a whole number and its decimals, "two point five"
+    decimal_markers = frozenset()
+    # words left out of the text of the numbers they start, "a hundred"
+    articles = frozenset()
+    # convert_words_to_numbers() lowercases the text
+    lowercase_text = True
+    # words are looked up lowercase
+    lowercase_words = False
+    # kinds of the words a whole number can be made of
+    numeral_kinds = NumberLexer.DIGITS | NumberLexer.NUMBER | \
+        NumberLexer.SUM | NumberLexer.SCALE | NumberLexer.MULTIPLIER | \
+        NumberLexer.FRACTION | NumberLexer.DIGIT_FRACTION
+    # kinds of the words which may come before a number, "minus"
+    prefix_kinds = NumberLexer.NEGATIVE
+    # kinds of the words which don't start a number, "hundred"
+    continuing_kinds = NumberLexer.MULTIPLIER
+    # kinds of the words after which a number goes on, "twenty"
+    joining_kinds = NumberLexer.MULTIPLIER | NumberLexer.SUM | \
+        NumberLexer.NEGATIVE
+    # suffixes of the ordinals written with digits, "1st"
+    ordinal_suffixes = ()
+    # with ordinals=None the text is normalized for speech: ordinals and
+    # colloquial amounts ("dozen") are left as words, and so are fractions
+    speech = False
+    # "second one" is 2
+    ordinal_one = True
+    # "hundred twenty" is 120 after a sum word, as is "twenty two"
+    sum_hundreds = False
+    # "hundred five" is 105
+    sum_after_multiplier = True
+    # "twentieth first" is 21
+    sum_after_ordinal = False
+    # the number ends before a sum word followed by a multiplier it can't
+    # be summed with, as it does before other numbers >= 10
+    backtrack_multipliers = False
+    # ... and before digits
+    backtrack_digits = True
+    # every multiplier ends a part of the number to sum, "two thousand",
+    # even if a larger multiplier follows
+    sum_each_scale = False
+    # the value is carried over to the next word if it is a number or a
+    # multiplier, "dwa tysiące"
+    carry_to_next = False
+    # prev and next words are normalized as the word itself, see
+    # normalize_neighbour()
+    normalize_neighbours = False
+    # words which switch the text to the long scale, see lexer()
+    long_scale_words = frozenset()
+    # words which aren't in the lexers, but change the numbers next to
+    # them in the hook methods of a language
+    context_words = frozenset()
+    # the words extract_digits() looks for, see _build_vocabulary()
+    _vocabulary = None
+
+    def lexer(self, tokens, short_scale, ordinals):
+        """
+        Args:
+            tokens TokenBuffer: the tokens to parse
+            short_scale bool:
+            ordinals bool:
+
+        Returns:
+            NumberLexer: the vocabulary to parse the tokens with, in the
+                         long scale if they contain long_scale_words
+        """
+        if self.long_scale_words and \
+                not self.long_scale_words.isdisjoint(tokens.lowered):
+            short_scale = False
+        return self.lexers[bool(short_scale)]
+
+    def normalize(self, word, ordinals):
+        """Hook to normalize an inflected word before it is classified"""
+        return word
+
+    def normalize_neighbour(self, word):
+        """Hook to normalize the words before and after the current word"""
+        return word
+
+    def explicit_ordinal(self, tokens, idx, next_word):
+        """
+        Hook called once the suffix of an ordinal written with digits,
+        "4th", is removed from tokens[idx].
+
+        Returns:
+            str: the next word to parse the ordinal with
+        """
+        return next_word
+
+    def compose(self, word, prev_word, val, prev_val, current_val,
+                kinds, prev_kinds, ordinals):
+        """
+        Combine the value of a word with the value read before it.
+
+        Args:
+            word str: the word, normalized
+            prev_word str: the word before it
+            val: its value, or False
+            prev_val: value of the words before it, or None
+            current_val: its own value, or None
+            kinds int: its NumberLexer kinds
+            prev_kinds int: NumberLexer kinds of the word before it
+            ordinals bool:
+
+        Returns:
+            (val, prev_val)
+        """
+        # is the prev word an ordinal number and current word is one?
+        # second one, third one
+        if self.ordinal_one and ordinals and \
+                prev_kinds & NumberLexer.ORDINAL and val == 1:
+            val = prev_val
+
+        if prev_val is not None:
+            # is the prev word a number and should we sum it?
+            # twenty two, fifty six
+            if (prev_kinds & NumberLexer.SUM and val and val < 10) or \
+                    (self.sum_hundreds and prev_kinds & NumberLexer.SUM and
+                     val and val < 100 and prev_val >= 100) or \
+                    (self.sum_after_multiplier and
+                     prev_kinds & NumberLexer.MULTIPLIER and
+                     (val < prev_val if prev_val else False)):
+                val = prev_val + val
+
+            # twentieth first
+            if self.sum_after_ordinal and (
+                    (prev_kinds & NumberLexer.ORDINAL and val and val < 10) or
+                    (prev_kinds & NumberLexer.MULTIPLIER and
+                     (val < prev_val if prev_val else False))):
+                val = prev_val + val
+
+        # is the prev word a number and should we multiply it?
+        # twenty hundred, six hundred
+        if kinds & NumberLexer.MULTIPLIER:
+            if not prev_val:
+                prev_val = 1
+            val = prev_val * val
+        return val, prev_val
+
+    def next_fraction(self, lexer, next_word, word, kinds):
+        """Value of the fraction word after a number, "two fifths" """
+        return lexer.classify(next_word).values.get(NumberLexer.FRACTION,
+                                                    False)
+
+    def read_fractions(self, lexer, tokens, idx, entry, prev, word,
+                       next_word, val, prev_val, current_val, number_words,
+                       ordinals):
+        """
+        Read the fraction a word is, or multiplies the word with.
+
+        Args:
+            lexer NumberLexer:
+            tokens TokenBuffer:
+            idx int: position of the word in tokens
+            entry NumberWord: what the word is
+            prev NumberWord: what the word before it is
+            word str: the word, normalized
+            next_word str: the word after it
+            val, prev_val, current_val: see compose()
+            number_words [Token]: the tokens of the number, updated
+            ordinals bool:
+
+        Returns:
+            (val, prev_val, current_val, next_val, stop)
+            next_val is truthy if the next word was read, stop is True if
+            the number ends with this word.
+        """
+        speech = self.speech and ordinals is None
+        # is this a spoken fraction?
+        # half cup
+        if val is False and \
+                not (speech and entry.kinds & NumberLexer.ORDINAL):
+            val = entry.values.get(NumberLexer.FRACTION, False) \
+                if not speech else False
+            current_val = val
+
+        # 2 fifths
+        next_val = None
+        if (ordinals is False) if self.speech else not ordinals:
+            next_val = self.next_fraction(lexer, next_word, word,
+                                          entry.kinds)
+            if next_val:
+                if not val:
+                    val = 1
+                val = val * next_val
+                number_words.append(tokens[idx + 1])
+        return val, prev_val, current_val, next_val, False
+
+    def convert_words_to_numbers(self, text, short_scale=True,
+                                 ordinals=False):
+        """
+        Convert words in a string into their equivalent numbers.
+        Args:
+            text str:
+            short_scale boolean: True if short scale numbers should be used.
+            ordinals boolean: True if ordinals (e.g. first, second, third)
+                              should be parsed to their number values
+                              (1, 2, 3...)
+
+        Returns:
+            str
+            The original text, with numbers subbed in where appropriate.
+
+        """
+        if self.lowercase_text:
+            text = text.lower()
+        tokens = TokenBuffer.tokenize(text)
+        numbers_to_replace = \
+            self.extract_numbers_with_text(tokens, short_scale, ordinals)
+
+        tracked = isinstance(text, SourceText)
+        words = text.locate(tokens.words) if tracked else tokens.words
+        results = []
+        for word, index in zip(words, tokens.indexes):
+            if not numbers_to_replace or \
+                    index < numbers_to_replace[0].start_index:
+                results.append(word)
+            else:
+                if numbers_to_replace and \
+                        index == numbers_to_replace[0].start_index:
+                    number = numbers_to_replace[0]
+                    results.append(SourceText.spanning(
+                        str(number.value),
+                        words[number.start_index:number.end_index + 1]))
+                if numbers_to_replace and \
+                        index == numbers_to_replace[0].end_index:
+                    numbers_to_replace.pop(0)
+
+        return SourceText.joined(' ', results) if tracked \
+            else ' '.join(results)
+
+    def extract_number(self, text, short_scale=True, ordinals=False):
+        """
+        The first number in a text, see extract_number_with_text()
+
+        Args:
+            text str:
+            short_scale bool:
+            ordinals bool:
+
+        Returns:
+            int or float or False: False if there is no number
+        """
+        numbers = self.extract_digits(text, ordinals)
+        if numbers is None:
+            return self.extract_number_with_text(
+                TokenBuffer.tokenize(text), short_scale, ordinals).value
+        return numbers[0] if numbers else False
+
+    def extract_numbers(self, text, short_scale=True, ordinals=False):
+        """
+        All the numbers in a text, see extract_numbers_with_text()
+
+        Args:
+            text str:
+            short_scale bool:
+            ordinals bool:
+
+        Returns:
+            [int or float]: in the order of the text
+        """
+        numbers = self.extract_digits(text, ordinals)
+        if numbers is None:
+            numbers = [number.value for number in
+                       self.extract_numbers_with_text(
+                           TokenBuffer.tokenize(text), short_scale,
+                           ordinals)]
+        return numbers
+
+    def extract_digits(self, text, ordinals=False):
+        """
+        The numbers of a text which has no number words, found without
+        tokenizing it.
+
+        Most texts given by a speech recognizer write their numbers with
+        digits, "set a timer for 5 minutes". These numbers are read from
+        the words separated by spaces as long as each of them is plain:
+        letters, maybe followed by punctuation, or a number written with
+        digits. No word may be in the vocabulary of the language, once
+        normalized by the hook methods, except for the words which only
+        come before a number ("a", "minus") when they aren't next to one,
+        and for the fraction and decimal markers when they aren't between
+        two numbers. No two numbers may follow each other either.
+        Otherwise the text is left to extract_numbers_with_text(), as is
+        any text in which it could find anything else.
+
+        Args:
+            text str:
+            ordinals bool:
+
+        Returns:
+            [int or float] or None: the numbers, in the order of the text,
+                                    or None if the text has to be parsed
+        """
+        if self._vocabulary is None:
+            self._vocabulary = self._build_vocabulary()
+        numerals, prefixes, markers = self._vocabulary
+        lowered_words = text.lower().split()
+        if not numerals.isdisjoint(lowered_words):
+            return None
+        numbers = []
+        after_number = after_prefix = False
+        # the markers since the last number
+        between = []
+        for word, lowered in zip(text.split(), lowered_words):
+            match = _DIGIT_WORD.fullmatch(word)
+            if match is not None:
+                # numbers next to each other may be read as one
+                if after_number or after_prefix:
+                    return None
+                if match.group(1) is None:
+                    value = int(word) if word.isdigit() else float(word)
+                elif int(match.group(2)):
+                    value = float(match.group(1)) / float(match.group(2))
+                else:
+                    return None
+                if any(self._join(marker, numbers[-1], value, word)
+                       for marker in between):
+                    return None
+                numbers.append(value)
+                after_number = True
+                between = []
+                continue
+            letters = word.rstrip(_TRAILING_PUNCTUATION)
+            # tokenize() splits the punctuation from the letters
+            punctuation = len(letters) < len(word)
+            prefix = False
+            if letters:
+                if not letters.isalpha() or \
+                        self._may_be_numeral(letters, ordinals):
+                    return None
+                if punctuation:
+                    lowered = letters.lower()
+                    if lowered in numerals:
+                        return None
+                prefix = lowered in prefixes
+                if prefix and after_number:
+                    return None
+                if numbers and letters in markers:
+                    between.append(letters)
+            if punctuation and any(self._may_be_numeral(mark, ordinals)
+                                   for mark in word[len(letters):]):
+                return None
+            after_number = False
+            after_prefix = prefix and not punctuation
+        return numbers
+
+    def _build_vocabulary(self):
+        """
+        Returns:
+            (frozenset(str), frozenset(str), frozenset(str)): the words
+                which may be part of a number, those of them which can only
+                come before a number, and the fraction and decimal markers,
+                see extract_digits()
+        """
+        numerals = set(_FLOAT_WORDS)
+        # the articles are only stripped from the numbers they start
+        for words in (self.long_scale_words, self.context_words):
+            numerals.update(words)
+        prefixes = set()
+        for lexer in self.lexers.values():
+            for word in lexer.starting_words():
+                kinds = lexer.classify(word).kinds
+                if kinds and not kinds & ~self.prefix_kinds:
+                    prefixes.add(word)
+                else:
+                    numerals.add(word)
+        return frozenset(numerals), frozenset(prefixes - numerals), \
+            frozenset(self.fraction_markers | self.decimal_markers)
+
+    def _may_be_numeral(self, word, ordinals):
+        """
+        Whether scan() may find a number in a word which isn't in the
+        vocabulary once normalized, or written with digits
+        """
+        numerals = self._vocabulary[0]
+        # the word as scan() reads it
+        form = word.lower() if self.lowercase_words else word
+        suffixes = self.ordinal_suffixes
+        if suffixes and form.endswith(suffixes) and \
+                any(is_numeric(form[:-len(suffix)]) for suffix in suffixes
+                    if form.endswith(suffix)):
+            return True
+        if type(self).normalize is not NumberParser.normalize and \
+                self.normalize(form, ordinals).lower() in numerals:
+            return True
+        return self.normalize_neighbours and \
+            self.normalize_neighbour(form).lower() in numerals
+
+    def extract_numbers_with_text(self, tokens, short_scale=True,
+                                  ordinals=False, fractional_numbers=True):
+        """
+        Extract all numbers from a list of Tokens, with the words that
+        represent them.
+
+        Args:
+            tokens [Token] or TokenBuffer: The tokens to parse.
+            short_scale bool: True if short scale numbers should be used,
+                              False for long scale. True by default.
+            ordinals bool: True if ordinal words (first, second, third, etc)
+                           should be parsed.
+            fractional_numbers bool: True if we should look for fractions
+                                     and decimals.
+
+        Returns:
+            [ReplaceableNumber]: A list of tuples, each containing a number
+                                 and a string, in the order of the text.
+
+        """
+        tokens = TokenBuffer.of(tokens)
+        results = self._extract_whole_numbers(tokens, short_scale, ordinals)
+        if fractional_numbers:
+            results = self._compose(tokens, results)[0]
+        return results
+
+    def extract_number_with_text(self, tokens, short_scale=True,
+                                 ordinals=False, fractional_numbers=True):
+        """
+        This function extracts a number from a list of Tokens.
+
+        Args:
+            tokens [Token] or TokenBuffer: the tokens to parse
+            short_scale (bool): use short scale if True, long scale if False
+            ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+            fractional_numbers (bool): True if we should look for fractions
+                                       and decimals.
+        Returns:
+            ReplaceableNumber
+
+        """
+        tokens = TokenBuffer.of(tokens)
+        if fractional_numbers and self._has_single_marker(tokens):
+            # a fraction or a decimal goes before the numbers preceding it
+            _, fractions, decimals = self._compose(
+                tokens,
+                self._extract_whole_numbers(tokens, short_scale, ordinals))
+            if fractions or decimals:
+                return (fractions or decimals)[0]
+        number, number_words = \
+            self.extract_whole_number_with_text(tokens, short_scale,
+                                                ordinals)
+        return self._strip_articles(number, number_words)
+
+    def extract_fraction_with_text(self, tokens, short_scale, ordinals):
+        """
+        Extract fraction numbers from a string.
+
+        This function handles text such as '2 and 3/4'. Note that "one half"
+        or similar will be parsed by the whole number function.
+
+        Args:
+            tokens [Token] or TokenBuffer: words and their indexes in the
+                                           original string.
+            short_scale boolean:
+            ordinals boolean:
+
+        Returns:
+            (int or float, [Token])
+            The value found, and the list of relevant tokens.
+            (None, None) if no fraction value is found.
+
+        """
+        tokens = TokenBuffer.of(tokens)
+        if self._has_single_marker(tokens):
+            fractions = self._compose(
+                tokens,
+                self._extract_whole_numbers(tokens, short_scale, ordinals))[1]
+            if fractions:
+                return fractions[0].value, fractions[0].tokens
+        return None, None
+
+    def extract_decimal_with_text(self, tokens, short_scale, ordinals):
+        """
+        Extract decimal numbers from a string.
+
+        This function handles text such as '2 point 5'.
+
+        Notes:
+            This does not currently handle things like:
+                number dot number number number
+
+        Args:
+            tokens [Token] or TokenBuffer: The text to parse.
+            short_scale boolean:
+            ordinals boolean:
+
+        Returns:
+            (float, [Token])
+            The value found and relevant tokens.
+            (None, None) if no decimal value is found.
+
+        """
+        tokens = TokenBuffer.of(tokens)
+        if self._has_single_marker(tokens):
+            decimals = self._compose(
+                tokens,
+                self._extract_whole_numbers(tokens, short_scale, ordinals))[2]
+            if decimals:
+                return decimals[0].value, decimals[0].tokens
+        return None, None
+
+    def _extract_whole_numbers(self, tokens, short_scale, ordinals):
+        """
+        All the numbers in tokens, in a single scan, without joining them
+        around fraction and decimal markers.
+
+        Returns:
+            [ReplaceableNumber]: in the order of the text
+        """
+        placeholder = "<placeholder>"  # inserted to maintain correct indices
+        positions = {index: pos for pos, index in enumerate(tokens.indexes)}
+        lexer = self.lexer(tokens, short_scale, ordinals)
+        scales = self._scale_positions(tokens, lexer)
+        resume = 0
+        results = []
+        while True:
+            number, number_words, resume = \
+                self.scan(tokens, lexer, ordinals, resume, scales)
+            to_replace = self._strip_articles(number, number_words)
+
+            if not to_replace:
+                break
+
+            if not results:
+                tokens = tokens.copy()  # the caller's tokens are untouched
+            results.append(to_replace)
+            start = positions[to_replace.start_index]
+            end = positions[to_replace.end_index]
+            replaced = tokens.words[start:end + 1]
+            tokens.replace(start, end, placeholder)
+            if self.long_scale_words and \
+                    any(word.lower() in self.long_scale_words
+                        for word in replaced):
+                # the scale may have changed with these words
+                lexer = self.lexer(tokens, short_scale, ordinals)
+                scales = self._scale_positions(tokens, lexer)
+                resume = 0
+            elif scales is not None:
+                scales.discard(start, end)
+
+        results.sort(key=lambda n: n.start_index)
+        return results
+
+    def _compose(self, tokens, numbers):
+        """
+        Join the numbers on each side of a fraction or decimal marker,
+        "two and a half", "one point five".
+
+        Only the markers occurring once in tokens are read. Each joins the
+        last number before it with the first number after it, so the cost
+        does not depend on how many numbers surround the markers. They are
+        read from the last one to the first, so that the number after a
+        marker is complete once it is joined.
+
+        Args:
+            tokens TokenBuffer:
+            numbers [ReplaceableNumber]: the numbers in tokens, in order
+
+        Returns:
+            ([ReplaceableNumber], [ReplaceableNumber], [ReplaceableNumber])
+            all the numbers, the fractions joined and the decimals joined
+        """
+        fractions = []
+        decimals = []
+        if not numbers:
+            return numbers, fractions, decimals
+        markers = {}
+        for pos, word in enumerate(tokens.words):
+            if word in self.fraction_markers or word in self.decimal_markers:
+                markers[word] = None if word in markers else pos
+        single = sorted(pos for pos in markers.values() if pos is not None)
+        if not single:
+            return numbers, fractions, decimals
+
+        numbers = list(numbers)
+        starts = [number.start_index for number in numbers]
+        for pos in reversed(single):
+            word = tokens.words[pos]
+            index = tokens.indexes[pos]
+            after = bisect_right(starts, index)
+            before = after - 1
+            if before < 0 or after == len(numbers) or \
+                    numbers[before].end_index >= index:
+                continue
+            number = numbers[before]
+            other = numbers[after]
+            joined = self._join(word, number.value, other.value, other.text)
+            if not joined:
+                continue
+            value, fraction = joined
+            number = ReplaceableNumber(value, number.tokens + [tokens[pos]] +
+                                       other.tokens)
+            (fractions if fraction else decimals).insert(0, number)
+            numbers[before:after + 1] = [number]
+            starts[before:after + 1] = [number.start_index]
+        return numbers, fractions, decimals
+
+    def _join(self, marker, value, other, text):
+        """
+        Join a number and the number after a marker word.
+
+        Args:
+            marker str: the word between the numbers
+            value int or float: the first number
+            other int or float: the second number
+            text str: the text of the second number
+
+        Returns:
+            (float, bool) or None: the joined value, and whether it is a
+                                   fraction rather than a decimal. None if
+                                   the numbers aren't joined.
+        """
+        if marker in self.fraction_markers and value >= 1 and 0 < other < 1:
+            return value + other, True
+        if marker in self.decimal_markers and \
+                "." not in text and str(other).isdigit():
+            # TODO handle number dot number number number
+            return value + float('0.' + str(other)), False
+        return None
+
+    def extract_whole_number_with_text(self, tokens, short_scale, ordinals):
+        """
+        Handle numbers not handled by the decimal or fraction functions.
+        This is generally whole numbers. Note that phrases such as
+        "one half" will be handled by this function, while "one and a half"
+        are handled by the fraction function.
+
+        Args:
+            tokens [Token] or TokenBuffer:
+            short_scale boolean:
+            ordinals boolean:
+
+        Returns:
+            int or float, [Tokens]
+            The value parsed, and tokens that it corresponds to.
+
+        """
+        tokens = TokenBuffer.of(tokens)
+        number, number_words, _ = \
+            self.scan(tokens, self.lexer(tokens, short_scale, ordinals),
+                      ordinals)
+        return number, number_words
+
+    def scan(self, tokens, lexer, ordinals, start=0, scales=None):
+        """
+        Scan tokens for the first whole number, see
+        extract_whole_number_with_text.
+
+        Args:
+            tokens [Token] or TokenBuffer:
+            lexer NumberLexer: see lexer()
+            ordinals boolean:
+            start int: position to start scanning from. The tokens before it
+                       must not be part of a number, and must not have been
+                       replaced since the scan which returned this position.
+            scales _ScalePositions: multipliers in tokens, or None to look
+                                    for them in the tokens
+
+        Returns:
+            int or float, [Tokens], int
+            The value parsed, the tokens that it corresponds to, and the
+            position to start the scan for the next number from, once these
+            tokens are replaced.
+
+        """
+        lowercase = self.lowercase_words
+        prefix_kinds = self.prefix_kinds
+        numeral_kinds = self.numeral_kinds
+        continuing_kinds = self.continuing_kinds
+        joining_kinds = self.joining_kinds
+        suffixes = self.ordinal_suffixes
+        neighbours = self.normalize_neighbours
+        carry_to_next = self.carry_to_next
+        normalize = self.normalize \
+            if type(self).normalize is not NumberParser.normalize else None
+        skip_spoken = self.speech and ordinals is None
+        tokens = TokenBuffer.of(tokens)
+        # a Token is only made for the words of the number
+        words = tokens.lowered if lowercase else tokens.words
+        count = len(words)
+
+        number_words = []  # type: [Token]
+        val = False
+        prev_val = None
+        next_val = None
+        to_sum = []
+        resume = start
+        for idx in range(start, count):
+            if val is False and prev_val is None and not next_val and \
+                    not number_words and not to_sum:
+                # nothing read so far is part of a number
+                resume = idx
+            current_val = None
+            if next_val:
+                next_val = None
+                continue
+
+            word = words[idx]
+            entry = lexer.classify(word)
+            kinds = entry.kinds
+            if kinds & prefix_kinds:
+                number_words.append(tokens[idx])
+                continue
+
+            prev_word = words[idx - 1] if idx > 0 else ""
+            next_word = words[idx + 1] if idx + 1 < count else ""
+            if neighbours:
+                prev_word = self.normalize_neighbour(prev_word)
+                next_word = self.normalize_neighbour(next_word)
+            prev = lexer.classify(prev_word)
+            prev_kinds = prev.kinds
+
+            normalized = word
+            if suffixes and word.endswith(suffixes):
+                for suffix in suffixes:
+                    if word.endswith(suffix) and \
+                            is_numeric(word[:-len(suffix)]):
+                        # explicit ordinals, 1st, 2nd, 3rd, 4th.... Nth
+                        normalized = word[:-len(suffix)]
+                        next_word = self.explicit_ordinal(tokens, idx,
+                                                          next_word)
+                        break
+            if normalize is not None:
+                normalized = normalize(normalized, ordinals)
+            if normalized != word:
+                word = normalized
+                entry = lexer.classify(word)
+                kinds = entry.kinds
+
+            if not kinds & numeral_kinds and \
+                    not (ordinals and kinds & NumberLexer.ORDINAL):
+                if number_words and not all(
+                        lexer.classify(t.word.lower() if lowercase
+                                       else t.word).kinds & prefix_kinds
+                        for t in number_words):
+                    break
+                else:
+                    number_words = []
+                    continue
+            elif not kinds & continuing_kinds \
+                    and not prev_kinds & joining_kinds \
+                    and not (ordinals and prev_kinds & NumberLexer.ORDINAL):
+                if val is not False and not kinds & (
+                        NumberLexer.DIGITS | NumberLexer.NUMBER |
+                        NumberLexer.SCALE) and \
+                        not (ordinals and kinds & NumberLexer.ORDINAL):
+                    # a fraction after a number it isn't read with, the
+                    # number ends before it
+                    break
+                number_words = [tokens[idx]]
+            elif prev_kinds & kinds & NumberLexer.SUM:
+                number_words = [tokens[idx]]
+            elif skip_spoken and \
+                    kinds & (NumberLexer.ORDINAL | NumberLexer.SPOKEN):
+                # flagged to ignore this token
+                continue
+            else:
+                number_words.append(tokens[idx])
+
+            # is this word already a number ?
+            if kinds & NumberLexer.DIGITS:
+                val = entry.values[NumberLexer.DIGITS]
+                current_val = val
+
+            # is this word the name of a number ?
+            if kinds & NumberLexer.NUMBER:
+                val = entry.values[NumberLexer.NUMBER]
+                current_val = val
+            elif kinds & NumberLexer.SCALE:
+                val = entry.values[NumberLexer.SCALE]
+                current_val = val
+            elif ordinals and kinds & NumberLexer.ORDINAL:
+                val = entry.values[NumberLexer.ORDINAL]
+                current_val = val
+
+            val, prev_val = self.compose(word, prev_word, val, prev_val,
+                                         current_val, kinds, prev_kinds,
+                                         ordinals)
+            if carry_to_next and lexer.classify(next_word).kinds & \
+                    NumberLexer.MULTIPLIER:
+                prev_val = val
+                continue
+
+            val, prev_val, current_val, next_val, stop = \
+                self.read_fractions(lexer, tokens, idx, entry, prev, word,
+                                    next_word, val, prev_val, current_val,
+                                    number_words, ordinals)
+            if stop:
+                break
+
+            # is this a negative number?
+            if val and prev_kinds & NumberLexer.NEGATIVE:
+                val = 0 - val
+
+            if carry_to_next and \
+                    lexer.classify(next_word).kinds & NumberLexer.NUMBER:
+                prev_val = val
+
+            # let's make sure it isn't a fraction
+            if not val:
+                # look for fractions like "2/3"
+                if kinds & NumberLexer.DIGIT_FRACTION:
+                    pieces = word.split('/')
+                    val = float(pieces[0]) / float(pieces[1])
+                    current_val = val
+
+            else:
+                if current_val and prev_kinds & NumberLexer.SUM and \
+                        not kinds & NumberLexer.SUM and \
+                        (self.backtrack_multipliers or
+                         not kinds & NumberLexer.MULTIPLIER) and \
+                        (self.backtrack_digits or
+                         not word.replace('.', '').isdigit()) and \
+                        current_val >= 10:
+                    # Backtrack - we've got numbers we can't sum.
+                    number_words.pop()
+                    val = prev_val
+                    break
+                prev_val = val
+
+                if kinds & NumberLexer.MULTIPLIER and \
+                        not lexer.classify(next_word).kinds & \
+                        NumberLexer.MULTIPLIER:
+                    # handle long numbers
+                    # six hundred sixty six
+                    # two million five hundred thousand
+                    #
+                    # The current word is a power of ten. `current_val` is
+                    # its integer value. `val` is our working sum
+                    # (above, when `current_val` is 1 million, `val` is
+                    # 2 million.)
+                    #
+                    # If all the powers of ten in the rest of the tokens are
+                    # smaller than our current value, we can set the current
+                    # value aside for later, and begin extracting another
+                    # portion of our final result. For example, suppose we
+                    # have the following string. The current word is
+                    # "million". `val` is 9000000. `current_val` is 1000000.
+                    #
+                    #    "nine **million** nine *hundred* seven **thousand**
+                    #     six *hundred* fifty seven"
+                    #
+                    # The current value is larger than all remaining powers
+                    # of ten, and nine million (9000000) is appended to
+                    # `to_sum`. The main variables are reset, and the main
+                    # loop begins assembling another number, which will also
+                    # be appended under the same conditions.
+                    #
+                    # By the end of the main loop, to_sum will be a list of
+                    # each "place" from 100 up: [9000000, 907000, 600]
+                    #
+                    # The final three digits will be added to the sum of that
+                    # list at the end of the main loop, to produce the
+                    # extracted number:
+                    #
+                    #    sum([9000000, 907000, 600]) + 57
+                    # == 9,000,000 + 907,000 + 600 + 57
+                    # == 9,907,657
+                    if self.sum_each_scale:
+                        time_to_sum = True
+                    elif scales is not None:
+                        time_to_sum = not scales.follows(idx, current_val)
+                    else:
+                        time_to_sum = True
+                        for other_word in words[idx + 1:]:
+                            other = lexer.classify(other_word)
+                            if other.kinds & NumberLexer.MULTIPLIER:
+                                scale = other.values.get(NumberLexer.SCALE)
+                                if scale is not None and \
+                                        scale >= current_val:
+                                    time_to_sum = False
+                                    break
+                    if time_to_sum:
+                        to_sum.append(val)
+                        val = 0
+                        prev_val = 0
+
+        if val is not None and to_sum:
+            val += sum(to_sum)
+
+        return val, number_words, resume
+
+    def _scale_positions(self, tokens, lexer):
+        if self.sum_each_scale:
+            return None
+        return _ScalePositions(tokens.lowered if self.lowercase_words
+                               else tokens.words, lexer)
+
+    def _has_single_marker(self, tokens):
+        """
+        Whether a fraction or decimal marker word occurs exactly once in
+        tokens, the only case where extract_fraction_with_text and
+        extract_decimal_with_text find a number.
+        """
+        counts = {}
+        for word in tokens.words:
+            if word in self.fraction_markers or \
+                    word in self.decimal_markers:
+                counts[word] = counts.get(word, 0) + 1
+        return 1 in counts.values()
+
+    def _strip_articles(self, number, tokens):
+        """ReplaceableNumber of a number, without the leading articles"""
+        while tokens and tokens[0].word in self.articles:
+            tokens.pop(0)
+        return ReplaceableNumber(number, tokens)
+
+
 def extract_numbers_generic(text, pronounce_handler, extract_handler,
                             short_scale=True, ordinals=False):
     """
@@ -461,3 +2117,376 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
             extract = extract_handler(to_parse, short_scale, ordinals)
     numbers.reverse()
     return numbers
+
+
+def extract_number_spans_generic(text, number_handler, fractional_handler,
+                                 fraction_markers=(), decimal_markers=(),
+                                 zeros=(), short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with their spans,
+        in a single pass over its words.
+        Language agnostic, per language parsers need to be provided
+
+    At every word, number_handler parses the number starting there, if
+    any. Digits ("7", "2.5") and fractions like "2/3" it leaves are read
+    here.
+    A number found is completed with the words following it: a fraction
+    ("three quarters"), a fraction marker and a fraction ("two and a half",
+    "one cup and a half") or a decimal marker and a number ("six point zero
+    two"). A word can be both a fraction and a decimal marker.
+
+    Args:
+        text (str): the string to extract numbers from
+        number_handler (function): number_handler(words, i, short_scale,
+            ordinals) parses the number starting at words[i], from a list
+            of lowercase words. Returns (value, index of the word after
+            the number), or None if there is no number at i.
+        fractional_handler (function): value of a fraction word, or False
+        fraction_markers (iterable): words joining a number and a fraction
+        decimal_markers (iterable): words separating the integer and the
+            decimal part of a number
+        zeros (iterable): words for zero, kept as leading decimals
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: list of tuples with each number found and its span in text,
+              [(value, (start_idx, end_idx))], in the order of the text
+    """
+    buffer = TokenBuffer.split(text)
+    words = buffer.lowered
+    spans = buffer.spans
+
+    def parse_number(i):
+        word = words[i]
+        pieces = word.split('/')
+        parsed = number_handler(words, i, short_scale, ordinals)
+        if parsed is not None:
+            value, end = parsed
+        elif is_numeric(word):
+            value = int(word) if word.isdigit() else float(word)
+            end = i + 1
+        elif look_for_fractions(pieces) and float(pieces[1]):
+            value = float(pieces[0]) / float(pieces[1])
+            end = i + 1
+        else:
+            value = fractional_handler(word)
+            if not value:
+                return None
+            end = i + 1
+
+        # two thirds, a sixth of a third
+        while end < len(words):
+            fraction = fractional_handler(words[end])
+            if not fraction:
+                break
+            value *= fraction
+            end += 1
+        return value, end
+
+    def fraction_after(i):
+        if i + 1 < len(words) and words[i] in fraction_markers:
+            fraction = parse_number(i + 1)
+            if fraction and 0 < fraction[0] < 1:
+                return fraction
+        return None
+
+    numbers = []
+    i = 0
+    while i < len(words):
+        parsed = parse_number(i)
+        if parsed is None:
+            i += 1
+            continue
+        value, end = parsed
+
+        # two and a half, one cup and a half
+        fraction = fraction_after(end)
+        if fraction is None and end + 1 < len(words) and \
+                parse_number(end) is None:
+            fraction = fraction_after(end + 1)
+        if fraction is not None:
+            value += fraction[0]
+            end = fraction[1]
+        elif end + 1 < len(words) and words[end] in decimal_markers \
+                and isinstance(value, int):
+            # six point zero two
+            start = end + 1
+            while start < len(words) and words[start] in zeros:
+                start += 1
+            decimal = None
+            if start < len(words):
+                decimal = parse_number(start)
+            if decimal and isinstance(decimal[0], int) and decimal[0] >= 0:
+                value = float("{}.{}{}".format(int(value),
+                                               "0" * (start - end - 1),
+                                               decimal[0]))
+                end = decimal[1]
+            elif start > end + 1:
+                value = float(value)
+                end = start
+
+        numbers.append((value, (spans[i][0], spans[end - 1][1])))
+        i = end
+    return numbers
+
+
+def _word_spans(text, words):
+    """
+    The spans in text of words, the words of a SourceText of it once
+    cleaned, from the first to the last word of text their characters
+    come from.
+
+    The words none of whose characters comes from text, like "22" for
+    "twenty two" in a cleaning which doesn't keep track of them, span
+    the words of text between the words around them, one each if there
+    are as many.
+    """
+    buffer = TokenBuffer.split(text, strip=",;:!?.")
+    starts = [start for start, _ in buffer.spans]
+    ends = [end for _, end in buffer.spans]
+
+    def words_within(start, end):
+        """the span of the words of text from start to end, or None"""
+        first = bisect_right(ends, start)
+        last = bisect_left(starts, end) - 1
+        if first > last:
+            return None
+        return starts[first], ends[last]
+
+    spans = []
+    for word in words:
+        span = word.span() if isinstance(word, SourceText) else None
+        spans.append(span and words_within(*span))
+    i = 0
+    while i < len(spans):
+        if spans[i]:
+            i += 1
+            continue
+        unknown = i
+        while i < len(spans) and not spans[i]:
+            i += 1
+        before = spans[unknown - 1] if unknown else None
+        after = spans[i] if i < len(spans) else None
+        gap = words_within(before[1] if before else 0,
+                           after[0] if after else len(text))
+        first = bisect_left(starts, gap[0]) if gap else 0
+        last = bisect_left(starts, gap[1]) if gap else 0
+        if last - first == i - unknown:
+            # as many words of text as words, one for each
+            spans[unknown:i] = buffer.spans[first:last]
+        else:
+            spans[unknown:i] = [gap or before or after or (0, len(text))] * \
+                (i - unknown)
+    # a word also spans the words of text right before it the cleaning
+    # left out, as "this" in "this friday" where it is dropped
+    covered = set()
+    for start, end in spans:
+        covered.update(range(bisect_right(ends, start),
+                             bisect_left(starts, end)))
+    for i, (start, end) in enumerate(spans):
+        first = bisect_right(ends, start)
+        while first and first - 1 not in covered:
+            first -= 1
+        if first < len(starts) and starts[first] < start:
+            spans[i] = (starts[first], end)
+    return spans
+
+
+def extract_datetime_spans_generic(text, clean_handler, datetime_handler,
+                                   connectors=(), anchorDate=None,
+                                   default_time=None):
+    """
+        Takes in a string and extracts every date and time expression in
+        it, with their spans, from a single cleaning of its words.
+        Language agnostic, per language parsers need to be provided
+
+    The words are parsed for a date over and over, leaving out the words
+    used each time, until none is found. Each run of consecutive words
+    used is then an expression, parsed on its own, with the unused words
+    after it, for its date, so that "from monday to wednesday at 3" gives
+    monday and wednesday at 3 rather than one date made of both. The words
+    of a run its parse leaves out ("now tomorrow") are parsed again. The
+    unused words after it its date depends on ("tomorrow night") are part
+    of its span.
+
+    A run is split at its connectors ("and", or "à" in "de lundi à
+    mercredi"), and around the words its parse leaves out between the
+    ones it uses, into several expressions if each of them is a date,
+    except for the neighbours which make the date of both of them: their
+    offsets from anchorDate add up, as in "in 2 hours and 30 minutes", or
+    they are a day and a time on it, as in "mercredi à 3 heures".
+
+    The words are cleaned as a SourceText, which keeps track of the text
+    each of them comes from, for their spans.
+
+    Args:
+        text (str): the string to extract dates from
+        clean_handler (function): clean_handler(text) is the list of words
+            datetime_handler parses
+        datetime_handler (function): datetime_handler(words, anchorDate,
+            default_time) is extract_datetime of a language on a list of
+            cleaned words, which it replaces with "" as it uses them.
+            Returns [datetime, leftover string] or None.
+        connectors (iterable): words joining two expressions
+        anchorDate (datetime): the date relative dates are from, the
+            current local time if None
+        default_time (time): time of the dates with none in the text
+    Returns:
+        list: list of tuples with each date found and its span in text,
+              [(datetime, (start_idx, end_idx))], in the order of the text
+    """
+    anchorDate = anchorDate or now_local()
+    words = [word for word in clean_handler(SourceText(text)) if word]
+    spans = _word_spans(text, words)
+    words = [str(word) for word in words]
+
+    def parse(run, unread=()):
+        """
+        The date of the words of run and the ones it used, or None, the
+        words of unread being replaced by one which isn't a date
+        """
+        parsed = ["_" if i in unread else words[i] for i in run]
+        extracted = datetime_handler(parsed, anchorDate, default_time)
+        if extracted is None:
+            return None
+        return extracted[0], \
+            [i for i, word in zip(run, parsed) if not word] or run
+
+    def attempt(run, unread=()):
+        """
+        parse(), or None if the parser fails on words it is given apart
+        from the others, which only splitting them may have it do
+        """
+        try:
+            return parse(run, unread)
+        except (ValueError, IndexError, TypeError):
+            return None
+
+    def runs(indexes):
+        """
+        The runs of consecutive indexes of sorted indexes of used words,
+        each with the unused words after it, which may qualify it as
+        "night" does "tuesday" in "tuesday night"
+        """
+        grouped = []
+        for i in indexes:
+            if grouped and grouped[-1][-1] == i - 1:
+                grouped[-1].append(i)
+            else:
+                grouped.append([i])
+        for run in grouped:
+            while run[-1] + 1 < len(words) and run[-1] + 1 not in used:
+                run.append(run[-1] + 1)
+        return grouped
+
+    used = set()
+    remaining = list(range(len(words)))
+    while remaining:
+        parsed = [words[i] for i in remaining]
+        if datetime_handler(parsed, anchorDate, default_time) is None:
+            break
+        left = []
+        for i, word in zip(remaining, parsed):
+            if word:
+                left.append(i)
+            else:
+                used.add(i)
+        if len(left) == len(remaining):
+            break
+        remaining = left
+
+    today = anchorDate.date()
+
+    def time_of_day(date):
+        """If date is the next time of day it has from anchorDate"""
+        return date.date() == today or \
+            date.date() == today + timedelta(days=1) and \
+            date.time() < anchorDate.time()
+
+    def together(first, second, both):
+        """
+        If two dates make the date both of them are parsed to, as the
+        offsets of "in 2 hours" and "30 minutes" add up, the days of "2
+        days" and "from friday" do, or as "wednesday" and "at 3" are a day
+        and a time on it
+        """
+        if (first - anchorDate) + (second - anchorDate) == \
+                both - anchorDate:
+            return True
+        if today not in (first.date(), second.date()) and \
+                (first.date() - today) + (second.date() - today) == \
+                both.date() - today and \
+                both.time() in (first.time(), second.time()):
+            return True
+        return time_of_day(second) and both.date() == first.date() and \
+            both.minute == second.minute and \
+            both.hour % 12 == second.hour % 12
+
+    dates = []
+    pending = runs(sorted(used))
+    while pending:
+        run = pending.pop()
+        whole = parse(run)
+        if whole is None:
+            continue
+        date, consumed = whole
+        # the run is split into pieces at its connectors and around the
+        # words its parse leaves out between the ones it uses, and the
+        # pieces are expressions of their own where they are dates which
+        # don't make one date together
+        inner = {i for i in run if consumed[0] < i < consumed[-1] and
+                 i in used and i not in consumed}
+        pieces = []
+        for i in run:
+            if words[i] in connectors:
+                pieces.append([])
+            elif pieces and pieces[-1] and \
+                    (i in inner) == (pieces[-1][-1] in inner):
+                pieces[-1].append(i)
+            else:
+                pieces.append([i])
+        pieces = [piece for piece in pieces if any(i in used for i in piece)]
+        if len(pieces) > 1:
+            parsed = [attempt(piece) for piece in pieces]
+            if all(parsed):
+                groups = [pieces[0]]
+                last = parsed[0][0]
+                for piece, (piece_date, _) in zip(pieces[1:], parsed[1:]):
+                    joined = list(range(groups[-1][0], piece[-1] + 1))
+                    both = attempt(joined)
+                    if both is not None and \
+                            used.intersection(joined) <= set(both[1]) and \
+                            together(last, piece_date, both[0]):
+                        groups[-1] = joined
+                        last = both[0]
+                    else:
+                        groups.append(piece)
+                        last = piece_date
+                if len(groups) > 1:
+                    pending.extend(groups)
+                    continue
+        # the unused words right after those parsed belong to the
+        # expression up to the last one its date changes without, as
+        # "night" in "tomorrow night"; they are replaced rather than left
+        # out, as some parsers read a last word differently
+        after = []
+        for i in run:
+            if i == consumed[-1] + len(after) + 1 and i not in used:
+                after.append(i)
+        before = [i for i in run if i <= consumed[-1]]
+        needed = 0
+        while needed < len(after):
+            shorter = attempt(before + after, after[needed:])
+            if shorter is not None and shorter[0] == date:
+                break
+            needed += 1
+        expression = consumed + after[:needed]
+        dates.append((date, (min(spans[i][0] for i in expression),
+                             max(spans[i][1] for i in expression))))
+        # the words of the run around those it was parsed from, "now"
+        # being parsed without those after it, may be expressions of
+        # their own
+        left = [i for i in run if i in used and i not in consumed and
+                i not in inner]
+        pending.extend(runs(left))
+    return sorted(dates, key=lambda date: date[1])
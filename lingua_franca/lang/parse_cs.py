@@ -17,16 +17,17 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+from lingua_franca.lang.parse_common import is_numeric, \
+    invert_dict, Normalizer, NumberLexer, NumberParser, \
+    compile_substitutions, extract_datetime_spans_generic
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_CS  # _ARTICLES_CS
 
 import re
-import json
-from lingua_franca import resolve_resource_file
+from types import MappingProxyType
+from lingua_franca.resources import resource_cache
 from lingua_franca.time import now_local
 
 
@@ -82,480 +83,30 @@ _STRING_SHORT_ORDINAL_CS = invert_dict(_SHORT_ORDINAL_CS)
 _STRING_LONG_ORDINAL_CS = invert_dict(_LONG_ORDINAL_CS)
 
 
-def _convert_words_to_numbers_cs(text, short_scale=True, ordinals=False):
-    """
-    Convert words in a string into their equivalent numbers.
-    Args:
-        text str:
-        short_scale boolean: True if short scale numbers should be used.
-        ordinals boolean: True if ordinals (e.g. first, second, third) should
-                          be parsed to their number values (1, 2, 3...)
-
-    Returns:
-        str
-        The original text, with numbers subbed in where appropriate.
-
-    """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_cs(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
-
-
-def _extract_numbers_with_text_cs(tokens, short_scale=True,
-                                  ordinals=False, fractional_numbers=True):
-    """
-    Extract all numbers from a list of Tokens, with the words that
-    represent them.
-
-    Args:
-        [Token]: The tokens to parse.
-        short_scale bool: True if short scale numbers should be used, False for
-                          long scale. True by default.
-        ordinals bool: True if ordinal words (first, second, third, etc) should
-                       be parsed.
-        fractional_numbers bool: True if we should look for fractions and
-                                 decimals.
-
-    Returns:
-        [ReplaceableNumber]: A list of tuples, each containing a number and a
-                         string.
-
-    """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_cs(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
-
-
-def _extract_number_with_text_cs(tokens, short_scale=True,
-                                 ordinals=False, fractional_numbers=True):
-    """
-    This function extracts a number from a list of Tokens.
-
-    Args:
-        tokens str: the string to normalize
-        short_scale (bool): use short scale if True, long scale if False
-        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
-        fractional_numbers (bool): True if we should look for fractions and
-                                   decimals.
-    Returns:
-        ReplaceableNumber
-
-    """
-    number, tokens = \
-        _extract_number_with_text_cs_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    # while tokens and tokens[0].word in _ARTICLES_CS:
-    #    tokens.pop(0)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_cs_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_en.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_cs(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_cs(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_cs(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_cs(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string.
-
-    This function handles text such as '2 and 3/4'. Note that "one half" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_cs(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_cs(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                    num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_cs(tokens, short_scale, ordinals):
-    """
-    Extract decimal numbers from a string.
-
-    This function handles text such as '2 point 5'.
-
-    Notes:
-        While this is a helper for extract_number_xx, it also depends on
-        extract_number_xx, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_cs(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_cs(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                return number.value + float('0.' + str(decimal.value)), \
-                    number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_cs(tokens, short_scale, ordinals):
-    """
-    Handle numbers not handled by the decimal or fraction functions. This is
-    generally whole numbers. Note that phrases such as "one half" will be
-    handled by this function, while "one and a half" are handled by the
-    fraction function.
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
-
-    """
-    multiplies, string_num_ordinal, string_num_scale = \
-        _initialize_number_data(short_scale)
-
-    number_words = []  # type: [Token]
-    val = False
-    prev_val = None
-    next_val = None
-    to_sum = []
-    for idx, token in enumerate(tokens):
-        current_val = None
-        if next_val:
-            next_val = None
-            continue
-
-        word = token.word
-        # if word in _ARTICLES_CS or word in _NEGATIVES:
-        if word in word in _NEGATIVES:
-            number_words.append(token)
-            continue
-
-        prev_word = tokens[idx - 1].word if idx > 0 else ""
-        next_word = tokens[idx + 1].word if idx + 1 < len(tokens) else ""
-
-        # In czech we do no use suffix (1st,2nd,..) but use point instead (1.,2.,..)
-        if is_numeric(word[:-1]) and \
-                (word.endswith(".")):
-
-            # explicit ordinals, 1st, 2nd, 3rd, 4th.... Nth
-            word = word[:-1]
-
-            # handle nth one
-        #    if next_word == "one":
-            # would return 1 instead otherwise
-        #        tokens[idx + 1] = Token("", idx)
-        #        next_word = ""
-
-        # Normalize Czech inflection of numbers(jedna,jeden,jedno,...)
-        if not ordinals:
-            word = _text_cs_inflection_normalize(word, 1)
-
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_CS and \
-                word not in _SUMS and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not isFractional_cs(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
-            # if number_words and not all([w in _ARTICLES_CS |
-            #                             _NEGATIVES for w in words_only]):
-            if number_words and not all([w in _NEGATIVES for w in words_only]):
-                break
-            else:
-                number_words = []
-                continue
-        elif word not in multiplies \
-                and prev_word not in multiplies \
-                and prev_word not in _SUMS \
-                and not (ordinals and prev_word in string_num_ordinal) \
-                and prev_word not in _NEGATIVES:  # \
-            # and prev_word not in _ARTICLES_CS:
-            number_words = [token]
-        elif prev_word in _SUMS and word in _SUMS:
-            number_words = [token]
-        else:
-            number_words.append(token)
+def _build_number_data_cs(short_scale):
+    """Build the dictionaries returned by _initialize_number_data"""
+    multiplies = _MULTIPLIES_SHORT_SCALE_CS if short_scale \
+        else _MULTIPLIES_LONG_SCALE_CS
 
-        # is this word already a number ?
-        if is_numeric(word):
-            if word.isdigit():  # doesn't work with decimals
-                val = int(word)
-            else:
-                val = float(word)
-            current_val = val
-
-        # is this word the name of a number ?
-        if word in _STRING_NUM_CS:
-            val = _STRING_NUM_CS.get(word)
-            current_val = val
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
-            current_val = val
-
-        # is the prev word an ordinal number and current word is one?
-        # second one, third one
-        if ordinals and prev_word in string_num_ordinal and val == 1:
-            val = prev_val
-
-        # is the prev word a number and should we sum it?
-        # twenty two, fifty six
-        if (prev_word in _SUMS and val and val < 10) or all([prev_word in
-                                                             multiplies,
-                                                             val < prev_val if prev_val else False]):
-            val = prev_val + val
-
-        # For Czech only: If Ordinal previous number will be also in ordinal number format
-        # dvacátý první = twentieth first
-        if (prev_word in string_num_ordinal and val and val < 10) or all([prev_word in
-                                                                          multiplies,
-                                                                          val < prev_val if prev_val else False]):
-            val = prev_val + val
-
-        # is the prev word a number and should we multiply it?
-        # twenty hundred, six hundred
-        if word in multiplies:
-            if not prev_val:
-                prev_val = 1
-            val = prev_val * val
-
-        # is this a spoken fraction?
-        # half cup
-        if val is False:
-            val = isFractional_cs(word, short_scale=short_scale)
-            current_val = val
-
-        # 2 fifths
-        if not ordinals:
-            next_val = isFractional_cs(next_word, short_scale=short_scale)
-            if next_val:
-                if not val:
-                    val = 1
-                val = val * next_val
-                number_words.append(tokens[idx + 1])
-
-        # is this a negative number?
-        if val and prev_word and prev_word in _NEGATIVES:
-            val = 0 - val
-
-        # let's make sure it isn't a fraction
-        if not val:
-            # look for fractions like "2/3"
-            aPieces = word.split('/')
-            if look_for_fractions(aPieces):
-                val = float(aPieces[0]) / float(aPieces[1])
-                current_val = val
+    string_num_ordinal_cs = _STRING_SHORT_ORDINAL_CS if short_scale \
+        else _STRING_LONG_ORDINAL_CS
 
-        else:
-            if all([
-                    prev_word in _SUMS,
-                    word not in _SUMS,
-                    word not in multiplies,
-                    current_val >= 10]):
-                # Backtrack - we've got numbers we can't sum.
-                number_words.pop()
-                val = prev_val
-                break
-            prev_val = val
-
-            if word in multiplies and next_word not in multiplies:
-                # handle long numbers
-                # six hundred sixty six
-                # two million five hundred thousand
-                #
-                # This logic is somewhat complex, and warrants
-                # extensive documentation for the next coder's sake.
-                #
-                # The current word is a power of ten. `current_val` is
-                # its integer value. `val` is our working sum
-                # (above, when `current_val` is 1 million, `val` is
-                # 2 million.)
-                #
-                # We have a dict `string_num_scale` containing [value, word]
-                # pairs for "all" powers of ten: string_num_scale[10] == "ten.
-                #
-                # We need go over the rest of the tokens, looking for other
-                # powers of ten. If we find one, we compare it with the current
-                # value, to see if it's smaller than the current power of ten.
-                #
-                # Numbers which are not powers of ten will be passed over.
-                #
-                # If all the remaining powers of ten are smaller than our
-                # current value, we can set the current value aside for later,
-                # and begin extracting another portion of our final result.
-                # For example, suppose we have the following string.
-                # The current word is "million".`val` is 9000000.
-                # `current_val` is 1000000.
-                #
-                #    "nine **million** nine *hundred* seven **thousand**
-                #     six *hundred* fifty seven"
-                #
-                # Iterating over the rest of the string, the current
-                # value is larger than all remaining powers of ten.
-                #
-                # The if statement passes, and nine million (9000000)
-                # is appended to `to_sum`.
-                #
-                # The main variables are reset, and the main loop begins
-                # assembling another number, which will also be appended
-                # under the same conditions.
-                #
-                # By the end of the main loop, to_sum will be a list of each
-                # "place" from 100 up: [9000000, 907000, 600]
-                #
-                # The final three digits will be added to the sum of that list
-                # at the end of the main loop, to produce the extracted number:
-                #
-                #    sum([9000000, 907000, 600]) + 57
-                # == 9,000,000 + 907,000 + 600 + 57
-                # == 9,907,657
-                #
-                # >>> foo = "nine million nine hundred seven thousand six
-                #            hundred fifty seven"
-                # >>> extract_number(foo)
-                # 9907657
-
-                time_to_sum = True
-                for other_token in tokens[idx+1:]:
-                    if other_token.word in multiplies:
-                        if string_num_scale[other_token.word] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
-                if time_to_sum:
-                    to_sum.append(val)
-                    val = 0
-                    prev_val = 0
+    string_num_scale_cs = _SHORT_SCALE_CS if short_scale else _LONG_SCALE_CS
+    string_num_scale_cs = invert_dict(string_num_scale_cs)
+    string_num_scale_cs.update(generate_plurals_cs(string_num_scale_cs))
+    return (frozenset(multiplies),
+            MappingProxyType(dict(string_num_ordinal_cs)),
+            MappingProxyType(string_num_scale_cs))
 
-    if val is not None and to_sum:
-        val += sum(to_sum)
 
-    return val, number_words
+# {short_scale: (multiplies, string_num_ordinal, string_num_scale)}
+_NUMBER_DATA_CS = {short_scale: _build_number_data_cs(short_scale)
+                   for short_scale in (True, False)}
 
 
 def _initialize_number_data(short_scale):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get the dictionaries of words to numbers, based on scale.
 
     This is a helper function for _extract_whole_number.
 
@@ -563,20 +114,11 @@ def _initialize_number_data(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), Mapping(str, number), Mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_CS if short_scale \
-        else _MULTIPLIES_LONG_SCALE_CS
-
-    string_num_ordinal_cs = _STRING_SHORT_ORDINAL_CS if short_scale \
-        else _STRING_LONG_ORDINAL_CS
-
-    string_num_scale_cs = _SHORT_SCALE_CS if short_scale else _LONG_SCALE_CS
-    string_num_scale_cs = invert_dict(string_num_scale_cs)
-    string_num_scale_cs.update(generate_plurals_cs(string_num_scale_cs))
-    return multiplies, string_num_ordinal_cs, string_num_scale_cs
+    return _NUMBER_DATA_CS[bool(short_scale)]
 
 
 def extract_number_cs(text, short_scale=True, ordinals=False):
@@ -595,8 +137,8 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                    was found
 
     """
-    return _extract_number_with_text_cs(tokenize(text.lower()),
-                                        short_scale, ordinals).value
+    return _NUMBER_PARSER_CS.extract_number(text.lower(), short_scale,
+                                            ordinals)
 
 
 def extract_duration_cs(text):
@@ -642,7 +184,7 @@ def extract_duration_cs(text):
     }
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
-    text = _convert_words_to_numbers_cs(text)
+    text = _NUMBER_PARSER_CS.convert_words_to_numbers(text)
 
     for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
         unit_pattern = pattern.format(unit=unit_cs)
@@ -658,6 +200,97 @@ def extract_duration_cs(text):
     return (duration, text)
 
 
+# the vocabulary of extract_datetime_cs
+_TIME_QUALIFIERS_AM_CS = frozenset(['ráno', 'dopoledne'])
+_TIME_QUALIFIERS_PM_CS = frozenset(['odpoledne', 'večer', 'noc', 'noci'])
+_TIME_QUALIFIERS_CS = _TIME_QUALIFIERS_AM_CS | _TIME_QUALIFIERS_PM_CS
+_DATETIME_MARKERS_CS = frozenset(['na', 'v', 'do', 'tento', 'okolo', 'toto',
+                                  'během', 'za', 'této'])
+# {day: weekday}, pondělí is 0
+_DAYS_CS = {day: weekday for weekday, day in enumerate(
+    ['pondělí', 'úterý', 'středa', 'čtvrtek', 'pátek', 'sobota', 'neděle'])}
+# {month: index in _MONTHS_CZECH}
+_MONTH_INDEXES_CS = {month: idx for idx, month in enumerate(_MONTHS_CZECH)}
+_MONTHS_SHORT_CS = {month: idx for idx, month in enumerate(
+    ['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp', 'zář', 'říj',
+     'lis', 'pro'])}
+_RECUR_MARKERS_CS = frozenset(list(_DAYS_CS) + [d + 'ho' for d in _DAYS_CS] +
+                              ['víkend', 'všední'])  # Check this
+_YEAR_MULTIPLES_CS = frozenset(["desetiletí", "století", "tisíciletí"])
+_DAY_MULTIPLES_CS = frozenset(["týden", "měsíc", "rok"])
+# the words that may follow "od", "po" and "do" in a date,
+# "5 dní od zítra", "2 měsíce po červenci"
+_FROM_FOLLOWUPS_CS = frozenset(_DAYS_CS) | frozenset(_MONTH_INDEXES_CS) | \
+    frozenset(_MONTHS_SHORT_CS) | \
+    frozenset(["dnes", "zítra", "včera", "další", "příští", "poslední", "teď",
+               "toto", "této", "tento"])
+# the cleaning step of extract_datetime_cs
+_DATETIME_SUBSTITUTIONS_CS = compile_substitutions(
+    {"dvoje": "2", "dvojice": "2", "dnes večer": "večer",
+     "dnes v noci": "noci"}, delete="?.,")
+
+
+def _datetime_words_cs(s):
+    """The words of s, cleaned for extract_datetime_cs"""
+    # clean unneeded punctuation and capitalization among other things.
+    # Normalize czech inflection
+    s = _DATETIME_SUBSTITUTIONS_CS(s.lower())
+    # .replace("tento večer", "večer")
+    # .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
+    # .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
+    # .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
+    # .replace("decades", "decade") \
+    # .replace("tisíciletí", "milénium")
+    # .replace("oclock", "o'clock")
+    wordList = s.split()
+
+    for idx, word in enumerate(wordList):
+        #word = word.replace("'s", "")
+        ##########
+        # Czech Day Ordinals - we do not use 1st,2nd format
+        #    instead we use full ordinal number names with specific format(suffix)
+        #   Example: třicátého prvního > 31
+        count_ordinals = 0
+        if word == "prvního":
+            count_ordinals = 1   # These two have different format
+        elif word == "třetího":
+            count_ordinals = 3
+        elif word.endswith("ého"):
+            tmp = word[:-3]
+            tmp += ("ý")
+            for nr, name in _ORDINAL_BASE_CS.items():
+                if name == tmp:
+                    count_ordinals = nr
+
+        # If number is bigger than 19 chceck if next word is also ordinal
+        #  and count them together
+        if count_ordinals > 19:
+            if wordList[idx+1] == "prvního":
+                count_ordinals += 1   # These two have different format
+            elif wordList[idx+1] == "třetího":
+                count_ordinals += 3
+            elif wordList[idx+1].endswith("ého"):
+                tmp = wordList[idx+1][:-3]
+                tmp += ("ý")
+                for nr, name in _ORDINAL_BASE_CS.items():
+                    if name == tmp and nr < 10:
+                        # write only if sum makes acceptable count of days in month
+                        if (count_ordinals + nr) <= 31:
+                            count_ordinals += nr
+
+        if count_ordinals > 0:
+            word = str(count_ordinals)  # Write normalized valu into word
+        if count_ordinals > 20:
+            # If counted number is grather than 20, clear next word so it is not used again
+            wordList[idx+1] = ""
+        ##########
+        # Remove inflection from czech months
+
+        wordList[idx] = word
+
+    return wordList
+
+
 def extract_datetime_cs(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -688,67 +321,33 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return _extract_datetime_words_cs(_datetime_words_cs(text),
+                                      anchorDate, default_time)
 
-    def clean_string(s):
-        # clean unneeded punctuation and capitalization among other things.
-        # Normalize czech inflection
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace("dvoje", "2").replace("dvojice", "2") \
-            .replace("dnes večer", "večer").replace("dnes v noci", "noci")  # \
-        # .replace("tento večer", "večer")
-        # .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
-        # .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
-        # .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
-        # .replace("decades", "decade") \
-        # .replace("tisíciletí", "milénium")
-        # .replace("oclock", "o'clock")
-        wordList = s.split()
-
-        for idx, word in enumerate(wordList):
-            #word = word.replace("'s", "")
-            ##########
-            # Czech Day Ordinals - we do not use 1st,2nd format
-            #    instead we use full ordinal number names with specific format(suffix)
-            #   Example: třicátého prvního > 31
-            count_ordinals = 0
-            if word == "prvního":
-                count_ordinals = 1   # These two have different format
-            elif word == "třetího":
-                count_ordinals = 3
-            elif word.endswith("ého"):
-                tmp = word[:-3]
-                tmp += ("ý")
-                for nr, name in _ORDINAL_BASE_CS.items():
-                    if name == tmp:
-                        count_ordinals = nr
-
-            # If number is bigger than 19 chceck if next word is also ordinal
-            #  and count them together
-            if count_ordinals > 19:
-                if wordList[idx+1] == "prvního":
-                    count_ordinals += 1   # These two have different format
-                elif wordList[idx+1] == "třetího":
-                    count_ordinals += 3
-                elif wordList[idx+1].endswith("ého"):
-                    tmp = wordList[idx+1][:-3]
-                    tmp += ("ý")
-                    for nr, name in _ORDINAL_BASE_CS.items():
-                        if name == tmp and nr < 10:
-                            # write only if sum makes acceptable count of days in month
-                            if (count_ordinals + nr) <= 31:
-                                count_ordinals += nr
-
-            if count_ordinals > 0:
-                word = str(count_ordinals)  # Write normalized valu into word
-            if count_ordinals > 20:
-                # If counted number is grather than 20, clear next word so it is not used again
-                wordList[idx+1] = ""
-            ##########
-            # Remove inflection from czech months
-
-            wordList[idx] = word
-
-        return wordList
+
+def extract_datetimes_cs(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_cs, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_cs,
+                                          _extract_datetime_words_cs,
+                                          ["a"], anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_cs(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_cs on the words of a text cleaned by
+    _datetime_words_cs, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -760,9 +359,6 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -776,23 +372,6 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['ráno', 'dopoledne']
-    timeQualifiersPM = ['odpoledne', 'večer', 'noc', 'noci']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['na', 'v', 'do', 'na', 'tento',
-               'okolo', 'toto', 'během', 'za', 'této']
-    days = ['pondělí', 'úterý', 'středa',
-            'čtvrtek', 'pátek', 'sobota', 'neděle']
-    months = _MONTHS_CZECH
-    recur_markers = days + [d + 'ho' for d in days] + \
-        ['víkend', 'všední']  # Check this
-    monthsShort = ['led', 'úno', 'bře', 'dub', 'kvě', 'čvn', 'čvc', 'srp',
-                   'zář', 'říj', 'lis', 'pro']
-    year_multiples = ["desetiletí", "století", "tisíciletí"]
-    day_multiples = ["týden", "měsíc", "rok"]
-
-    words = clean_string(text)
-
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -816,11 +395,12 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
         #    dayOffset = - dayOffset
         #    used += 1
         if word == "nyní" and not datestr:
+            words[idx] = ""
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
             extractedDate = anchorDate.replace(microsecond=0)
             return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+        elif wordNext in _YEAR_MULTIPLES_CS:
             multiplier = None
             if is_numeric(word):
                 multiplier = extract_number_cs(word)
@@ -835,7 +415,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 yearOffset = multiplier * 1000
         # couple of
         elif word == "2" and wordNext == "krát" and \
-                wordNextNext in year_multiples:
+                wordNextNext in _YEAR_MULTIPLES_CS:
             multiplier = 2
             used += 3
             if wordNextNext == "desetiletí":
@@ -845,7 +425,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
             elif wordNextNext == "tisíciletí":
                 yearOffset = multiplier * 1000
         elif word == "2" and wordNext == "krát" and \
-                wordNextNext in day_multiples:
+                wordNextNext in _DAY_MULTIPLES_CS:
             multiplier = 2
             used += 3
             if wordNextNext == "rok":
@@ -854,7 +434,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 monthOffset = multiplier
             elif wordNextNext == "týden":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_CS:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "dnes" and not fromFlag:
@@ -936,8 +516,8 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_CS and not fromFlag:
+            d = _DAYS_CS[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -952,11 +532,11 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_CS or \
+                word in _MONTHS_SHORT_CS and not fromFlag:
+            m = _MONTH_INDEXES_CS.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_CS[word]
             used += 1
             # Convert czech months to english
             datestr = _MONTHS_CONVERSION.get(m)
@@ -995,33 +575,23 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("dnes")
-        validFollowups.append("zítra")
-        validFollowups.append("včera")
-        validFollowups.append("další")
-        validFollowups.append("příští")
-        validFollowups.append("poslední")
-        validFollowups.append("teď")
-        validFollowups.append("toto")
-        validFollowups.append("této")
-        validFollowups.append("tento")
-        if (word == "od" or word == "po" or word == "do") and wordNext in validFollowups:
+        if (word == "od" or word == "po" or word == "do") and \
+                wordNext in _FROM_FOLLOWUPS_CS:
             used = 2
             fromFlag = True
             if wordNext == "zítra":
                 dayOffset += 1
             elif wordNext == "včera":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_CS:
+                d = _DAYS_CS[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_CS:
+                d = _DAYS_CS[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext == "další" or wordPrev == "příští":
@@ -1042,7 +612,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_CS:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -1112,21 +682,22 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 secOffset = 2
         # parse half an hour, quarter hour
         elif word == "hodin" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _DATETIME_MARKERS_CS or
+                 wordPrevPrev in _DATETIME_MARKERS_CS):
             if wordPrev == "půl":
                 minOffset = 30
             elif wordPrev == "čtvrt":
                 minOffset = 15
             elif wordPrevPrev == "třičtvrtě":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in markers:
+                if idx > 2 and words[idx - 3] in _DATETIME_MARKERS_CS:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             elif wordPrev == "během":
                 hrOffset = 1
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_CS:
                 words[idx - 2] = ""
                 if wordPrevPrev == "tato" or wordPrevPrev == "této":
                     daySpecified = True
@@ -1241,7 +812,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _TIME_QUALIFIERS_PM_CS):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1275,9 +846,9 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_CS or
+                        wordNext in _RECUR_MARKERS_CS or
+                        wordNextNext in _RECUR_MARKERS_CS):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1370,21 +941,23 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                if (wordNextNext in _TIME_QUALIFIERS_PM_CS or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_PM_CS):
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if (wordNextNext in _TIME_QUALIFIERS_AM_CS or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_AM_CS):
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _TIME_QUALIFIERS_PM_CS:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _TIME_QUALIFIERS_AM_CS:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1414,7 +987,7 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 else:
                     # has passed, assume the next morning
                     dayOffset += 1
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_CS and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1443,11 +1016,11 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_CS:
                 words[idx - 1] = ""
                 if wordPrev == "toto" or wordPrev == "této":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_CS:
                 words[idx - 2] = ""
                 if wordPrevPrev == "toto" or wordPrev == "této":
                     daySpecified = True
@@ -1534,6 +1107,59 @@ def extract_datetime_cs(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# {fraction word: denominator}
+_FRACTION_DENOMINATORS_CS = MappingProxyType({
+    "celá": 1,  # first four numbers have little different format
+    # Numbers from 2 to 1 hundret, more is not usualy used in common speech
+    **{word: num for num, word in _FRACTION_STRING_CS.items() if num > 1}})
+
+
+def _build_number_lexer_cs(short_scale):
+    """Compile the number vocabulary used by _NUMBER_PARSER_CS"""
+    multiplies, string_num_ordinal, string_num_scale = \
+        _initialize_number_data(short_scale)
+    # isFractional_cs ignores the case of words
+    lexer = NumberLexer(case_folded=NumberLexer.FRACTION)
+    lexer.add_all(_STRING_NUM_CS, NumberLexer.NUMBER)
+    lexer.add_all(string_num_scale, NumberLexer.SCALE)
+    lexer.add_all(_SUMS, NumberLexer.SUM)
+    lexer.add_all(multiplies, NumberLexer.MULTIPLIER)
+    lexer.add_all(string_num_ordinal, NumberLexer.ORDINAL)
+    fractions = {}
+    for word, denominator in _FRACTION_DENOMINATORS_CS.items():
+        fractions[word] = 1.0 / denominator
+        if word.endswith("ina"):
+            # plural, e.g. "dvě třetiny"
+            fractions[word[:-1] + "y"] = 1.0 / denominator
+    lexer.add_all(fractions, NumberLexer.FRACTION)
+    lexer.add_all(_NEGATIVES, NumberLexer.NEGATIVE)
+    return lexer
+
+
+# {short_scale: NumberLexer}
+_NUMBER_LEXER_CS = {short_scale: _build_number_lexer_cs(short_scale)
+                    for short_scale in (True, False)}
+
+
+class _CzechNumberParser(NumberParser):
+    lexers = _NUMBER_LEXER_CS
+    fraction_markers = _FRACTION_MARKER
+    decimal_markers = _DECIMAL_MARKER
+    # In czech we do no use suffix (1st,2nd,..) but use point instead (1.,2.,..)
+    ordinal_suffixes = (".",)
+    # dvacátý první = twentieth first
+    sum_after_ordinal = True
+
+    def normalize(self, word, ordinals):
+        # Normalize Czech inflection of numbers(jedna,jeden,jedno,...)
+        if not ordinals:
+            return _text_cs_inflection_normalize(word, 1)
+        return word
+
+
+_NUMBER_PARSER_CS = _CzechNumberParser()
+
+
 def isFractional_cs(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1549,14 +1175,9 @@ def isFractional_cs(input_str, short_scale=True):
         # Normalize to format of one (třetiny > třetina)
         input_str = input_str[:len(input_str) - 1] + "a"
 
-    fracts = {"celá": 1}  # first four numbers have little different format
-
-    for num in _FRACTION_STRING_CS:  # Numbers from 2 to 1 hundret, more is not usualy used in common speech
-        if num > 1:
-            fracts[_FRACTION_STRING_CS[num]] = num
-
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
+    denominator = _FRACTION_DENOMINATORS_CS.get(input_str.lower())
+    if denominator:
+        return 1.0 / denominator
     return False
 
 
@@ -1574,14 +1195,12 @@ def extract_numbers_cs(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_cs(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [float(number) for number in
+            _NUMBER_PARSER_CS.extract_numbers(text, short_scale, ordinals)]
 
 
 class CzechNormalizer(Normalizer):
-    with open(resolve_resource_file("text/cs-cz/normalize.json"), encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/cs-cz/normalize.json")
 
 
 def normalize_cs(text, remove_articles=True):
@@ -1604,7 +1223,7 @@ def _text_cs_inflection_normalize(word, arg):
         word [Word]
 
     """
-    if arg == 1:  # _extract_whole_number_with_text_cs
+    if arg == 1:  # _NUMBER_PARSER_CS
         # Number one (jedna)
         if len(word) == 5 and word.startswith("jed"):
             suffix = 'en', 'no', 'ny'
@@ -16,9 +16,9 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_number_spans_generic, Normalizer, word_memo, \
+    compile_substitutions, extract_datetime_spans_generic
 from lingua_franca.lang.common_data_da import _DA_NUMBERS
-from lingua_franca.lang.format_da import pronounce_number_da
 from lingua_franca.time import now_local
 
 
@@ -108,29 +108,79 @@ def extract_number_da(text, short_scale=True, ordinals=False):
     return val or False
 
 
+# the vocabulary of extract_datetime_da
+_TIME_QUALIFIERS_DA = frozenset(['tidlig', 'morgen', 'morgenen', 'formidag',
+                                 'formiddagen', 'eftermiddag',
+                                 'eftermiddagen', 'aften', 'aftenen', 'nat',
+                                 'natten'])
+_DATETIME_MARKERS_DA = frozenset(['i', 'om', 'på', 'klokken', 'ved'])
+# {day: weekday}, mandag is 0
+_DAYS_DA = {day: weekday for weekday, day in enumerate(
+    ['mandag', 'tirsdag', 'onsdag', 'torsdag', 'fredag', 'lørdag', 'søndag'])}
+_MONTHS_DA = ('januar', 'februar', 'marts', 'april', 'maj', 'juni', 'juli',
+              'august', 'september', 'oktober', 'november', 'desember')
+# {month: index in _MONTHS_DA}
+_MONTH_INDEXES_DA = {month: idx for idx, month in enumerate(_MONTHS_DA)}
+_MONTHS_SHORT_DA = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'maj', 'juni', 'juli', 'aug', 'sep', 'okt',
+     'nov', 'des'])}
+# the words that may follow "fra", "til" and "om" in a date,
+# "5 dage fra morgen", "2 måneder fra juli"
+_FROM_FOLLOWUPS_DA = frozenset(_DAYS_DA) | frozenset(_MONTH_INDEXES_DA) | \
+    frozenset(_MONTHS_SHORT_DA) | \
+    frozenset(["i dag", "morgen", "næste", "forige", "nu"])
+# the cleaning step of extract_datetime_da
+_DATETIME_SUBSTITUTIONS_DA = compile_substitutions(
+    words={"den": "", "det": "", "om": "", "på": ""}, delete="?.,")
+
+
+def _datetime_words_da(s):
+    """
+        cleans the input string of unneeded punctuation
+        and capitalization among other things.
+
+        'am' is a preposition, so cannot currently be used
+        for 12 hour date format
+    """
+
+    wordList = _DATETIME_SUBSTITUTIONS_DA(s.lower()).split()
+
+    for idx, word in enumerate(wordList):
+        if is_ordinal_da(word) is not False:
+            word = str(is_ordinal_da(word))
+            wordList[idx] = word
+
+    return wordList
+
+
 def extract_datetime_da(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        """
-            cleans the input string of unneeded punctuation
-            and capitalization among other things.
+    if text == "":
+        return None
+    return _extract_datetime_words_da(_datetime_words_da(text),
+                                      anchorDate, default_time)
 
-            'am' is a preposition, so cannot currently be used
-            for 12 hour date format
-        """
 
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace(' den ', ' ').replace(' det ', ' ').replace(' om ',
-                                                                 ' ').replace(
-            ' om ', ' ') \
-            .replace(' på ', ' ').replace(' om ', ' ')
-        wordList = s.split()
+def extract_datetimes_da(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
 
-        for idx, word in enumerate(wordList):
-            if is_ordinal_da(word) is not False:
-                word = str(is_ordinal_da(word))
-                wordList[idx] = word
+    See extract_datetime_da, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_da,
+                                          _extract_datetime_words_da,
+                                          ["og"], anchorDate,
+                                          default_time)
 
-        return wordList
+
+def _extract_datetime_words_da(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_da on the words of a text cleaned by
+    _datetime_words_da, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -142,9 +192,6 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -159,34 +206,6 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['tidlig',
-                          'morgen',
-                          'morgenen',
-                          'formidag',
-                          'formiddagen',
-                          'eftermiddag',
-                          'eftermiddagen',
-                          'aften',
-                          'aftenen',
-                          'nat',
-                          'natten']
-    markers = ['i', 'om', 'på', 'klokken', 'ved']
-    days = ['mandag', 'tirsdag', 'onsdag',
-            'torsdag', 'fredag', 'lørdag', 'søndag']
-    months = ['januar', 'februar', 'marts', 'april', 'maj', 'juni',
-              'juli', 'august', 'september', 'oktober', 'november',
-              'desember']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'maj', 'juni', 'juli', 'aug',
-                   'sep', 'okt', 'nov', 'des']
-
-    validFollowups = days + months + monthsShort
-    validFollowups.append("i dag")
-    validFollowups.append("morgen")
-    validFollowups.append("næste")
-    validFollowups.append("forige")
-    validFollowups.append("nu")
-
-    words = clean_string(text)
 
     for idx, word in enumerate(words):
         if word == "":
@@ -199,15 +218,16 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_DA:
             timeQualifier = word
             # parse today, tomorrow, day after tomorrow
         elif word == "dag" and not fromFlag:
             dayOffset = 0
             used += 1
         elif word == "morgen" and not fromFlag and wordPrev != "om" and \
-                wordPrev not in days:  # morgen means tomorrow if not "am
-            # Morgen" and not [day of the week] morgen
+                wordPrev not in _DAYS_DA:
+            # morgen means tomorrow if not "am Morgen" and not
+            # [day of the week] morgen
             dayOffset = 1
             used += 1
         elif word == "overmorgen" and not fromFlag:
@@ -262,8 +282,8 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
                 used = 2
                 # parse Monday, Tuesday, etc., and next Monday,
                 # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_DA and not fromFlag:
+            d = _DAYS_DA[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -281,13 +301,13 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_DA or \
+                word in _MONTHS_SHORT_DA and not fromFlag:
+            m = _MONTH_INDEXES_DA.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_DA[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_DA[m]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -319,24 +339,24 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
 
         if (
                 word == "fra" or word == "til" or word == "om") and wordNext \
-                in validFollowups:
+                in _FROM_FOLLOWUPS_DA:
             used = 2
             fromFlag = True
             if wordNext == "morgenen" and \
                     wordPrev != "om" and \
-                    wordPrev not in days:
+                    wordPrev not in _DAYS_DA:
                 # morgen means tomorrow if not "am Morgen" and not
                 # [day of the week] morgen:
                 dayOffset += 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_DA:
+                d = _DAYS_DA[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_DA:
+                d = _DAYS_DA[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext[:6] == "næste":
@@ -356,7 +376,7 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_DA:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -403,7 +423,8 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
             used += 1
             # parse half an hour, quarter hour
         elif word == "time" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _DATETIME_MARKERS_DA or
+                 wordPrevPrev in _DATETIME_MARKERS_DA):
             if wordPrev[:4] == "halv":
                 minOffset = 30
             elif wordPrev == "kvarter":
@@ -412,7 +433,7 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
                 minOffset = 45
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_DA:
                 words[idx - 2] = ""
             words[idx - 1] = ""
             used += 1
@@ -674,9 +695,9 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_DA:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_DA:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -703,10 +724,10 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
         en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                           'aug',
                           'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
+        for month, en_month in zip(_MONTHS_DA, en_months):
+            datestr = datestr.replace(month, en_month)
+        for month, en_month in zip(_MONTHS_SHORT_DA, en_monthsShort):
+            datestr = datestr.replace(month, en_month)
 
         temp = datetime.strptime(datestr, "%B %d")
         if extractedDate.tzinfo:
@@ -773,6 +794,7 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+@word_memo("da")
 def is_fractional_da(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -796,6 +818,7 @@ def is_fractional_da(input_str, short_scale=True):
     return False
 
 
+@word_memo("da")
 def is_ordinal_da(input_str):
     """
     This function takes the given text and checks if it is an ordinal number.
@@ -869,6 +892,42 @@ def normalize_da(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
+def _number_span_da(words, i, short_scale, ordinals):
+    """Number starting at words[i], see extract_number_spans_generic"""
+    word = words[i]
+    if word in _DA_NUMBERS:
+        value = _DA_NUMBERS[word]
+        # fem og tyve
+        if value < 10 and i + 2 < len(words) and words[i + 1] == "og":
+            tens = _DA_NUMBERS.get(words[i + 2])
+            if tens and tens % 10 == 0 and 20 <= tens < 100:
+                return value + tens, i + 3
+        return value, i + 1
+    value = is_ordinal_da(word)
+    if value is not False:
+        return value, i + 1
+    return None
+
+
+def _extract_number_spans_da(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with their spans.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: [(value, (start_idx, end_idx))] for each number in text
+    """
+    return extract_number_spans_generic(text, _number_span_da,
+                                        is_fractional_da,
+                                        fraction_markers=("og",),
+                                        zeros=("nul", "0"),
+                                        short_scale=short_scale,
+                                        ordinals=ordinals)
+
+
 def extract_numbers_da(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -883,8 +942,8 @@ def extract_numbers_da(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_da, extract_number_da,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _ in
+            _extract_number_spans_da(text, short_scale, ordinals)]
 
 
 class DanishNormalizer(Normalizer):
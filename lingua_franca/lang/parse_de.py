@@ -15,16 +15,19 @@
 #
 
 import re
-import json
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import (
     ReplaceableNumber,
     Normalizer,
+    SourceText,
     Token,
     look_for_fractions,
     tokenize,
+    word_memo,
+    compile_substitutions,
+    extract_datetime_spans_generic,
 )
 from lingua_franca.lang.common_data_de import (
     _STRING_NUM,
@@ -38,7 +41,7 @@ from lingua_franca.lang.common_data_de import (
     _ARTICLES
 )
 from lingua_franca.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.resources import resource_cache
 
 
 
@@ -60,20 +63,27 @@ def _convert_words_to_numbers_de(text, short_scale=False,
         _extract_numbers_with_text_de(tokens, short_scale, ordinals, fractions)
     numbers_to_replace.sort(key=lambda number: number.start_index)
 
+    tracked = isinstance(text, SourceText)
+    words = [token.word for token in tokens]
+    if tracked:
+        words = text.locate(words)
     results = []
-    for token in tokens:
+    for token, word in zip(tokens, words):
         if not numbers_to_replace or \
                 token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
+            results.append(word)
         else:
             if numbers_to_replace and \
                     token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
+                number = numbers_to_replace[0]
+                results.append(SourceText.spanning(
+                    str(number.value),
+                    words[number.start_index:number.end_index + 1]))
             if numbers_to_replace and \
                     token.index == numbers_to_replace[0].end_index:
                 numbers_to_replace.pop(0)
 
-    return ' '.join(results)
+    return SourceText.joined(' ', results) if tracked else ' '.join(results)
 
 
 def _extract_numbers_with_text_de(tokens, short_scale=True,
@@ -368,28 +378,86 @@ def extract_duration_de(text):
     return (duration, text)
 
 
+# the vocabulary of extract_datetime_de
+_TIME_QUALIFIERS_DE = frozenset(['früh', 'morgens', 'vormittag', 'vormittags',
+                                 'mittag', 'mittags', 'nachmittag',
+                                 'nachmittags', 'abend', 'abends', 'nacht',
+                                 'nachts', 'pm', 'p.m.'])
+_EVENING_QUALIFIERS_DE = frozenset(['nachmittag', 'nachmittags', 'abend',
+                                    'abends', 'nacht', 'nachts', 'pm',
+                                    'p.m.'])
+_DATETIME_MARKERS_DE = frozenset(['in', 'am', 'gegen', 'bis', 'für'])
+# {day: weekday}, montag is 0
+_DAYS_DE = {day: weekday for weekday, day in enumerate(
+    ['montag', 'dienstag', 'mittwoch', 'donnerstag', 'freitag', 'samstag',
+     'sonntag'])}
+_MONTHS_DE = ('januar', 'februar', 'märz', 'april', 'mai', 'juni', 'juli',
+              'august', 'september', 'oktober', 'november', 'dezember')
+# {month: index in _MONTHS_DE}
+_MONTH_INDEXES_DE = {month: idx for idx, month in enumerate(_MONTHS_DE)}
+_MONTHS_SHORT_DE = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mär', 'apr', 'mai', 'juni', 'juli', 'aug', 'sept', 'oct',
+     'nov', 'dez'])}
+# the words that may follow "von", "nach" and "ab" in a date,
+# "5 tage nach morgen", "2 monate ab juli"
+_FROM_FOLLOWUPS_DE = frozenset(_DAYS_DE) | frozenset(_MONTH_INDEXES_DE) | \
+    frozenset(_MONTHS_SHORT_DE) | \
+    frozenset(["heute", "morgen", "nächste", "nächster", "nächstes",
+               "nächsten", "nächstem", "letzte", "letzter", "letztes",
+               "letzten", "letztem", "jetzt"])
+# the cleaning step of extract_datetime_de, after the numbers are read
+_DATETIME_SUBSTITUTIONS_DE = compile_substitutions(
+    words={"der": "", "den": "", "an": "", "am": "", "auf": "", "um": ""},
+    delete="?")
+
+
+def _datetime_words_de(s):
+    """
+        cleans the input string of unneeded punctuation
+        and capitalization among other things.
+
+        'am' is a preposition, so cannot currently be used
+        for 12 hour date format
+    """
+
+    s = _convert_words_to_numbers_de(s)
+    wordList = _DATETIME_SUBSTITUTIONS_DE(s.lower()).split()
+
+    for idx, word in enumerate(wordList):
+        ordinal = _get_ordinal_index(word)
+        if ordinal:
+            wordList[idx] = ordinal
+
+    return wordList
+
+
 def extract_datetime_de(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        """
-            cleans the input string of unneeded punctuation
-            and capitalization among other things.
-
-            'am' is a preposition, so cannot currently be used
-            for 12 hour date format
-        """
-
-        s = _convert_words_to_numbers_de(s)
-        s = s.lower().replace('?', '').replace(' der ', ' ').replace(' den ', ' ')\
-            .replace(' an ', ' ').replace(' am ', ' ').replace(' auf ', ' ')\
-            .replace(' um ', ' ')
-        wordList = s.split()
-
-        for idx, word in enumerate(wordList):
-            ordinal = _get_ordinal_index(word)
-            if ordinal:
-                wordList[idx] = ordinal
+    if text == "":
+        return None
+    return _extract_datetime_words_de(_datetime_words_de(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_de(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
 
-        return wordList
+    See extract_datetime_de, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_de,
+                                          _extract_datetime_words_de,
+                                          ["und"], anchorDate, default_time)
+
+
+def _extract_datetime_words_de(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_de on the words of a text cleaned by
+    _datetime_words_de, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -401,9 +469,6 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -418,36 +483,6 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['früh', 'morgens', 'vormittag', 'vormittags',
-                          'mittag', 'mittags', 'nachmittag', 'nachmittags',
-                          'abend', 'abends', 'nacht', 'nachts', 'pm', 'p.m.']
-    eveningQualifiers = ['nachmittag', 'nachmittags', 'abend', 'abends', 'nacht',
-                        'nachts', 'pm', 'p.m.']
-    markers = ['in', 'am', 'gegen', 'bis', 'für']
-    days = ['montag', 'dienstag', 'mittwoch',
-            'donnerstag', 'freitag', 'samstag', 'sonntag']
-    months = ['januar', 'februar', 'märz', 'april', 'mai', 'juni',
-              'juli', 'august', 'september', 'oktober', 'november',
-              'dezember']
-    monthsShort = ['jan', 'feb', 'mär', 'apr', 'mai', 'juni', 'juli', 'aug',
-                   'sept', 'oct', 'nov', 'dez']
-
-    validFollowups = days + months + monthsShort
-    validFollowups.append("heute")
-    validFollowups.append("morgen")
-    validFollowups.append("nächste")
-    validFollowups.append("nächster")
-    validFollowups.append("nächstes")
-    validFollowups.append("nächsten")
-    validFollowups.append("nächstem")
-    validFollowups.append("letzte")
-    validFollowups.append("letzter")
-    validFollowups.append("letztes")
-    validFollowups.append("letzten")
-    validFollowups.append("letztem")
-    validFollowups.append("jetzt")
-
-    words = clean_string(text)
 
     for idx, word in enumerate(words):
         if word == "":
@@ -460,15 +495,16 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_DE:
             timeQualifier = word
             # parse today, tomorrow, day after tomorrow
         elif word == "heute" and not fromFlag:
             dayOffset = 0
             used += 1
         elif word == "morgen" and not fromFlag and wordPrev != "am" and \
-                wordPrev not in days:  # morgen means tomorrow if not "am
-            # Morgen" and not [day of the week] morgen
+                wordPrev not in _DAYS_DE:
+            # morgen means tomorrow if not "am Morgen" and not
+            # [day of the week] morgen
             dayOffset = 1
             used += 1
         elif word == "übermorgen" and not fromFlag:
@@ -527,8 +563,8 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 used = 2
                 # parse Monday, Tuesday, etc., and next Monday,
                 # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_DE and not fromFlag:
+            d = _DAYS_DE[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -545,13 +581,13 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_DE or \
+                word in _MONTHS_SHORT_DE and not fromFlag:
+            m = _MONTH_INDEXES_DE.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_DE[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_DE[m]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -583,22 +619,23 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
 
         if (
                 word == "von" or word == "nach" or word == "ab") and wordNext \
-                in validFollowups:
+                in _FROM_FOLLOWUPS_DE:
             used = 2
             fromFlag = True
             if wordNext == "morgen" and wordPrev != "am" and \
-                    wordPrev not in days:  # morgen means tomorrow if not "am
-                #  Morgen" and not [day of the week] morgen:
+                    wordPrev not in _DAYS_DE:
+                # morgen means tomorrow if not "am Morgen" and not
+                # [day of the week] morgen:
                 dayOffset += 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_DE:
+                d = _DAYS_DE[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_DE:
+                d = _DAYS_DE[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext[:6] == "nächst":
@@ -618,7 +655,7 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_DE:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -670,10 +707,11 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 hrAbs = 23
             used += 1
         elif word[:6] == "stunde" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _DATETIME_MARKERS_DE or
+                 wordPrevPrev in _DATETIME_MARKERS_DE):
             factor = is_number_de(word) or 1
             minOffset = 60 * factor
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_DE:
                 words[idx - 2] = ""
             words[idx - 1] = ""
             used += 1
@@ -711,18 +749,18 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                         break
                 if remainder == "":
                     nextWord = wordNext.replace(".", "")
-                    if nextWord in eveningQualifiers:
+                    if nextWord in _EVENING_QUALIFIERS_DE:
                         used += 1
                         timeQualifier = "pm"
-                    elif nextWord in timeQualifiersList:
+                    elif nextWord in _TIME_QUALIFIERS_DE:
                         used += 1
                         timeQualifier = "am"
                     elif nextWord == "uhr":
                         used += 1
-                        if wordNextNext in eveningQualifiers:
+                        if wordNextNext in _EVENING_QUALIFIERS_DE:
                             used += 1
                             timeQualifier = "pm"
-                        elif wordNextNext in timeQualifiersList:
+                        elif wordNextNext in _TIME_QUALIFIERS_DE:
                             used += 1
                             timeQualifier = "am"
                         elif strHH.isdigit():
@@ -785,8 +823,8 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                         strHH = word
                         used += 1
                         isTime = True
-                        if wordNextNext in timeQualifiersList or \
-                                wordNextNextNext in timeQualifiersList \
+                        if wordNextNext in _TIME_QUALIFIERS_DE or \
+                                wordNextNextNext in _TIME_QUALIFIERS_DE \
                                 and not is_number_de(wordNextNext):
                             strMM = ""
                             if wordNextNext[:10] == "nachmittag":
@@ -832,8 +870,9 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                                 used += 1
                                 wordNextNextNext = wordNextNextNextNext
                                 wordNextNextNextNext = wordNextNextNextNextNext
-                            if wordNextNextNext in timeQualifiersList or \
-                                    wordNextNextNextNext in timeQualifiersList:
+                            if wordNextNextNext in _TIME_QUALIFIERS_DE or \
+                                    wordNextNextNextNext in \
+                                    _TIME_QUALIFIERS_DE:
                                 if wordNextNextNext[:10] == "nachmittag":
                                     used += 1
                                     timeQualifier = "pm"
@@ -879,8 +918,8 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                             else:
                                 timeQualifier = "am"
 
-                    elif wordNext in timeQualifiersList or \
-                            wordNextNext in timeQualifiersList:
+                    elif wordNext in _TIME_QUALIFIERS_DE or \
+                            wordNextNext in _TIME_QUALIFIERS_DE:
                         strHH = word
                         strMM = 00
                         isTime = True
@@ -952,9 +991,9 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_DE:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_DE:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -981,10 +1020,10 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
         en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                           'aug',
                           'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
+        for month, en_month in zip(_MONTHS_DE, en_months):
+            datestr = datestr.replace(month, en_month)
+        for month, en_month in zip(_MONTHS_SHORT_DE, en_monthsShort):
+            datestr = datestr.replace(month, en_month)
 
         if hasYear:
             temp = datetime.strptime(datestr, "%B %d %Y")
@@ -1055,6 +1094,11 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# fraction words, longest first, to find them inside compounds
+_FRACTION_WORDS_DE = tuple(sorted(_STRING_FRACTION, key=len, reverse=True))
+
+
+@word_memo("de")
 def is_fractional_de(input_str, short_scale=False):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1079,10 +1123,11 @@ def is_fractional_de(input_str, short_scale=False):
         denominator = float(_bucket[1])
 
     if not denominator:
-        for fraction in sorted(_STRING_FRACTION.keys(),
-                               key=lambda x: len(x),
-                               reverse=True):
-            if fraction in input_str and not denominator:
+        denominator = _STRING_FRACTION.get(input_str)
+        if denominator:
+            return 1.0 / denominator
+        for fraction in _FRACTION_WORDS_DE:
+            if fraction in input_str:
                 denominator = _STRING_FRACTION.get(fraction)
                 remainder = input_str.replace(fraction, "")
                 break
@@ -1107,6 +1152,7 @@ def is_fractional_de(input_str, short_scale=False):
         return False
 
 
+@word_memo("de")
 def is_ordinal_de(input_str):
     """
     This function takes the given text and checks if it is an ordinal number.
@@ -1143,6 +1189,7 @@ def is_number_de(word: str):
         
         return None
 
+@word_memo("de")
 def is_numeric_de(input_str):
     """
     Takes in a string and tests to see if it is a number.
@@ -1220,8 +1267,7 @@ def extract_number_de(text, short_scale=True, ordinals=False):
 
 
 class GermanNormalizer(Normalizer):
-    with open(resolve_resource_file("text/de-de/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/de-de/normalize.json")
 
     def remove_symbols(self, utterance):
         utterance = re.sub(r"\b(\w*)-([A-Za-z]+)\b", r"\1 \2", utterance)
@@ -13,22 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
 import re
 from datetime import datetime, timedelta, time
-from dateutil.relativedelta import relativedelta
+from types import MappingProxyType
 
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.resources import resource_cache, lowercase_inverse
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, \
     _SHORT_ORDINAL_EN, \
     _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
     _MULTIPLIES_SHORT_SCALE_EN, _FRACTION_MARKER_EN, _DECIMAL_MARKER_EN, \
     _STRING_NUM_EN, _STRING_SHORT_ORDINAL_EN, _STRING_LONG_ORDINAL_EN, \
     _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+from lingua_franca.lang.parse_common import is_numeric, \
+    invert_dict, Token, Normalizer, NumberLexer, NumberParser, \
+    word_memo, compile_substitutions, extract_datetime_spans_generic
+from lingua_franca.temporal import TemporalExpression
 from lingua_franca.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
-from lingua_franca.util.colors import Color, ColorOutOfSpace
 
 
 def get_color_en(text):
@@ -41,10 +41,11 @@ def get_color_en(text):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
-    resource_file = resolve_resource_file(f"text/en-us/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    from lingua_franca.util.colors import Color, ColorOutOfSpace
+
+    COLORS = resource_cache.get("text/en-us/colors.json",
+                                lowercase_inverse) or \
+        resource_cache.get("text/webcolors.json", lowercase_inverse)
 
     text = text.lower()
     if text in COLORS:
@@ -95,477 +96,34 @@ def get_color_en(text):
     return color
 
 
-def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
-    """
-    Convert words in a string into their equivalent numbers.
-    Args:
-        text str:
-        short_scale boolean: True if short scale numbers should be used.
-        ordinals boolean: True if ordinals (e.g. first, second, third) should
-                          be parsed to their number values (1, 2, 3...)
-
-    Returns:
-        str
-        The original text, with numbers subbed in where appropriate.
-
-    """
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_en(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
-
-
-def _extract_numbers_with_text_en(tokens, short_scale=True,
-                                  ordinals=False, fractional_numbers=True):
-    """
-    Extract all numbers from a list of Tokens, with the words that
-    represent them.
-
-    Args:
-        [Token]: The tokens to parse.
-        short_scale bool: True if short scale numbers should be used, False for
-                          long scale. True by default.
-        ordinals bool: True if ordinal words (first, second, third, etc) should
-                       be parsed.
-        fractional_numbers bool: True if we should look for fractions and
-                                 decimals.
-
-    Returns:
-        [ReplaceableNumber]: A list of tuples, each containing a number and a
-                         string.
-
-    """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
-
-
-def _extract_number_with_text_en(tokens, short_scale=True,
-                                 ordinals=False, fractional_numbers=True):
-    """
-    This function extracts a number from a list of Tokens.
-
-    Args:
-        tokens str: the string to normalize
-        short_scale (bool): use short scale if True, long scale if False
-        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
-        fractional_numbers (bool): True if we should look for fractions and
-                                   decimals.
-    Returns:
-        ReplaceableNumber
-
-    """
-    number, tokens = \
-        _extract_number_with_text_en_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    while tokens and tokens[0].word in _ARTICLES_EN:
-        tokens.pop(0)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_en_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_en.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_en(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_en(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_en(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_en(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string.
-
-    This function handles text such as '2 and 3/4'. Note that "one half" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER_EN:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_en(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_en(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                       num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_en(tokens, short_scale, ordinals):
-    """
-    Extract decimal numbers from a string.
-
-    This function handles text such as '2 point 5'.
-
-    Notes:
-        While this is a helper for extractnumber_en, it also depends on
-        extractnumber_en, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER_EN:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_en(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_en(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                return number.value + float('0.' + str(decimal.value)), \
-                       number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
-    """
-    Handle numbers not handled by the decimal or fraction functions. This is
-    generally whole numbers. Note that phrases such as "one half" will be
-    handled by this function, while "one and a half" are handled by the
-    fraction function.
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
-
-    """
-    multiplies, string_num_ordinal, string_num_scale = \
-        _initialize_number_data_en(short_scale, speech=ordinals is not None)
-
-    number_words = []  # type: [Token]
-    val = False
-    prev_val = None
-    next_val = None
-    to_sum = []
-    for idx, token in enumerate(tokens):
-        current_val = None
-        if next_val:
-            next_val = None
-            continue
-
-        word = token.word.lower()
-        if word in _ARTICLES_EN or word in _NEGATIVES_EN:
-            number_words.append(token)
-            continue
+def _build_number_data_en(short_scale, speech):
+    """Build the dictionaries returned by _initialize_number_data_en"""
+    multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
+        else _MULTIPLIES_LONG_SCALE_EN
 
-        prev_word = tokens[idx - 1].word.lower() if idx > 0 else ""
-        next_word = tokens[idx + 1].word.lower() if idx + 1 < len(tokens) else ""
-
-        if is_numeric(word[:-2]) and \
-                (word.endswith("st") or word.endswith("nd") or
-                 word.endswith("rd") or word.endswith("th")):
-
-            # explicit ordinals, 1st, 2nd, 3rd, 4th.... Nth
-            word = word[:-2]
-
-            # handle nth one
-            if next_word == "one":
-                # would return 1 instead otherwise
-                tokens[idx + 1] = Token("", idx)
-                next_word = ""
-
-        # TODO replaces the wall of "and" and "or" with all() or any() as
-        #  appropriate, the whole codebase should be checked for this pattern
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_EN and \
-                word not in _SUMS_EN and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not is_fractional_en(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
-
-            if number_words and not all([w.lower() in _ARTICLES_EN |
-                                         _NEGATIVES_EN for w in words_only]):
-                break
-            else:
-                number_words = []
-                continue
-        elif word not in multiplies \
-                and prev_word not in multiplies \
-                and prev_word not in _SUMS_EN \
-                and not (ordinals and prev_word in string_num_ordinal) \
-                and prev_word not in _NEGATIVES_EN \
-                and prev_word not in _ARTICLES_EN:
-            number_words = [token]
-
-        elif prev_word in _SUMS_EN and word in _SUMS_EN:
-            number_words = [token]
-        elif ordinals is None and \
-                (word in string_num_ordinal or word in _SPOKEN_EXTRA_NUM_EN):
-            # flagged to ignore this token
-            continue
-        else:
-            number_words.append(token)
+    string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
+        else _STRING_LONG_ORDINAL_EN
 
-        # is this word already a number ?
-        if is_numeric(word):
-            if word.isdigit():  # doesn't work with decimals
-                val = int(word)
-            else:
-                val = float(word)
-            current_val = val
-
-        # is this word the name of a number ?
-        if word in _STRING_NUM_EN:
-            val = _STRING_NUM_EN.get(word)
-            current_val = val
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
-            current_val = val
-
-        # is the prev word an ordinal number and current word is one?
-        # second one, third one
-        if ordinals and prev_word in string_num_ordinal and val == 1:
-            val = prev_val
-
-        # is the prev word a number and should we sum it?
-        # twenty two, fifty six
-        if (prev_word in _SUMS_EN and val and val < 10) or all([prev_word in
-                                                                multiplies,
-                                                                val < prev_val if prev_val else False]):
-            val = prev_val + val
-
-        # is the prev word a number and should we multiply it?
-        # twenty hundred, six hundred
-        if word in multiplies:
-            if not prev_val:
-                prev_val = 1
-            val = prev_val * val
-
-        # is this a spoken fraction?
-        # half cup
-        if val is False and \
-                not (ordinals is None and word in string_num_ordinal):
-            val = is_fractional_en(word, short_scale=short_scale,
-                                   spoken=ordinals is not None)
-
-            current_val = val
-
-        # 2 fifths
-        if ordinals is False:
-            next_val = is_fractional_en(next_word, short_scale=short_scale)
-            if next_val:
-                if not val:
-                    val = 1
-                val = val * next_val
-                number_words.append(tokens[idx + 1])
-
-        # is this a negative number?
-        if val and prev_word and prev_word in _NEGATIVES_EN:
-            val = 0 - val
-
-        # let's make sure it isn't a fraction
-        if not val:
-            # look for fractions like "2/3"
-            aPieces = word.split('/')
-            if look_for_fractions(aPieces):
-                val = float(aPieces[0]) / float(aPieces[1])
-                current_val = val
+    string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
+    string_num_scale_en = invert_dict(string_num_scale_en)
+    string_num_scale_en.update(_generate_plurals_en(string_num_scale_en))
 
-        else:
-            if current_val and all([
-                prev_word in _SUMS_EN,
-                word not in _SUMS_EN,
-                word not in multiplies,
-                current_val >= 10]):
-                # Backtrack - we've got numbers we can't sum.
-                number_words.pop()
-                val = prev_val
-                break
-            prev_val = val
-
-            if word in multiplies and next_word not in multiplies:
-                # handle long numbers
-                # six hundred sixty six
-                # two million five hundred thousand
-                #
-                # This logic is somewhat complex, and warrants
-                # extensive documentation for the next coder's sake.
-                #
-                # The current word is a power of ten. `current_val` is
-                # its integer value. `val` is our working sum
-                # (above, when `current_val` is 1 million, `val` is
-                # 2 million.)
-                #
-                # We have a dict `string_num_scale` containing [value, word]
-                # pairs for "all" powers of ten: string_num_scale[10] == "ten.
-                #
-                # We need go over the rest of the tokens, looking for other
-                # powers of ten. If we find one, we compare it with the current
-                # value, to see if it's smaller than the current power of ten.
-                #
-                # Numbers which are not powers of ten will be passed over.
-                #
-                # If all the remaining powers of ten are smaller than our
-                # current value, we can set the current value aside for later,
-                # and begin extracting another portion of our final result.
-                # For example, suppose we have the following string.
-                # The current word is "million".`val` is 9000000.
-                # `current_val` is 1000000.
-                #
-                #    "nine **million** nine *hundred* seven **thousand**
-                #     six *hundred* fifty seven"
-                #
-                # Iterating over the rest of the string, the current
-                # value is larger than all remaining powers of ten.
-                #
-                # The if statement passes, and nine million (9000000)
-                # is appended to `to_sum`.
-                #
-                # The main variables are reset, and the main loop begins
-                # assembling another number, which will also be appended
-                # under the same conditions.
-                #
-                # By the end of the main loop, to_sum will be a list of each
-                # "place" from 100 up: [9000000, 907000, 600]
-                #
-                # The final three digits will be added to the sum of that list
-                # at the end of the main loop, to produce the extracted number:
-                #
-                #    sum([9000000, 907000, 600]) + 57
-                # == 9,000,000 + 907,000 + 600 + 57
-                # == 9,907,657
-                #
-                # >>> foo = "nine million nine hundred seven thousand six
-                #            hundred fifty seven"
-                # >>> extract_number(foo)
-                # 9907657
-
-                time_to_sum = True
-                for other_token in tokens[idx + 1:]:
-                    if other_token.word.lower() in multiplies:
-                        if string_num_scale[other_token.word.lower()] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
-                if time_to_sum:
-                    to_sum.append(val)
-                    val = 0
-                    prev_val = 0
+    if speech:
+        string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
+    return (frozenset(multiplies),
+            MappingProxyType(dict(string_num_ordinal_en)),
+            MappingProxyType(string_num_scale_en))
 
-    if val is not None and to_sum:
-        val += sum(to_sum)
 
-    return val, number_words
+# {(short_scale, speech): (multiplies, string_num_ordinal, string_num_scale)}
+_NUMBER_DATA_EN = {(short_scale, speech):
+                       _build_number_data_en(short_scale, speech)
+                   for short_scale in (True, False) for speech in (True, False)}
 
 
 def _initialize_number_data_en(short_scale, speech=True):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get the dictionaries of words to numbers, based on scale.
 
     This is a helper function for _extract_whole_number.
 
@@ -574,23 +132,11 @@ def _initialize_number_data_en(short_scale, speech=True):
         speech (bool): consider extra words (_SPOKEN_EXTRA_NUM_EN) to be numbers
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), Mapping(str, number), Mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
-        else _MULTIPLIES_LONG_SCALE_EN
-
-    string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
-        else _STRING_LONG_ORDINAL_EN
-
-    string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
-    string_num_scale_en = invert_dict(string_num_scale_en)
-    string_num_scale_en.update(_generate_plurals_en(string_num_scale_en))
-
-    if speech:
-        string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    return _NUMBER_DATA_EN[bool(short_scale), bool(speech)]
 
 
 def extract_number_en(text, short_scale=True, ordinals=False):
@@ -609,8 +155,8 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                    was found
 
     """
-    return _extract_number_with_text_en(tokenize(text.lower()),
-                                        short_scale, ordinals).value
+    return _NUMBER_PARSER_EN.extract_number(text.lower(), short_scale,
+                                            ordinals)
 
 
 def extract_duration_en(text):
@@ -656,7 +202,7 @@ def extract_duration_en(text):
             list(time_units.keys())
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
-    text = _convert_words_to_numbers_en(text)
+    text = _NUMBER_PARSER_EN.convert_words_to_numbers(text)
     text = text.replace("centuries", "century").replace("millenia", "millennium")
     for word in ('day', 'month', 'year', 'decade', 'century', 'millennium'):
         text = text.replace(f'a {word}', f'1 {word}')
@@ -694,6 +240,68 @@ def extract_duration_en(text):
     return (duration, text)
 
 
+# the vocabulary of extract_datetime_en
+_TIME_QUALIFIERS_AM_EN = frozenset(['morning'])
+_TIME_QUALIFIERS_PM_EN = frozenset(['afternoon', 'evening', 'night',
+                                    'tonight'])
+_TIME_QUALIFIERS_EN = _TIME_QUALIFIERS_AM_EN | _TIME_QUALIFIERS_PM_EN
+_YEAR_MARKERS_EN = frozenset(['in', 'on', 'of'])
+_PAST_MARKERS_EN = frozenset(["was", "last", "past"])
+_EARLIER_MARKERS_EN = frozenset(["ago", "earlier"])
+# in a month -> + 1 month timedelta
+_FUTURE_MARKERS_EN = frozenset(["in", "within"])
+# next month -> day 1 of next month
+_FUTURE_1ST_MARKERS_EN = frozenset(["next"])
+_NEXT_MARKERS_EN = _FUTURE_MARKERS_EN | _FUTURE_1ST_MARKERS_EN
+_DATETIME_MARKERS_EN = _YEAR_MARKERS_EN | \
+    frozenset(['at', 'by', 'this', 'around', 'for', "within"])
+# {day: weekday}, monday is 0
+_DAYS_EN = {day: weekday for weekday, day in enumerate(
+    ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday',
+     'sunday'])}
+_MONTHS_EN = ('january', 'february', 'march', 'april', 'may', 'june',
+              'july', 'august', 'september', 'october', 'november',
+              'december')
+# {month: index in _MONTHS_EN}
+_MONTH_INDEXES_EN = {month: idx for idx, month in enumerate(_MONTHS_EN)}
+_MONTHS_SHORT_EN = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug', 'sept', 'oct',
+     'nov', 'dec'])}
+_RECUR_MARKERS_EN = frozenset(list(_DAYS_EN) + [d + 's' for d in _DAYS_EN] +
+                              ['weekend', 'weekday', 'weekends', 'weekdays'])
+# the cleaning step of extract_datetime_en, after the numbers are read
+_DATETIME_SUBSTITUTIONS_EN = compile_substitutions(
+    {"o' clock": "o'clock", "o clock": "o'clock", "o ' clock": "o'clock",
+     "o 'clock": "o'clock", "oclock": "o'clock", "couple": "2",
+     "centuries": "century", "decades": "decade",
+     "millenniums": "millennium", "'s": ""},
+    words={"the": "", "a": "", "an": ""}, delete="?,")
+_ORDINAL_SUFFIXES_EN = compile_substitutions(
+    {"rd": "", "st": "", "nd": "", "th": ""})
+_YEAR_MULTIPLES_EN = frozenset(["decade", "century", "millennium"])
+_DAY_MULTIPLES_EN = frozenset(["weeks", "months", "years"])
+# the words that may follow "from" and "after" in a date,
+# "5 days from tomorrow", "2 months from July"
+_FROM_FOLLOWUPS_EN = frozenset(_DAYS_EN) | frozenset(_MONTH_INDEXES_EN) | \
+    frozenset(_MONTHS_SHORT_EN) | \
+    frozenset(["today", "tomorrow", "yesterday", "next", "last", "past",
+               "now", "this"])
+
+
+def _datetime_words_en(s):
+    """The words of s, cleaned for extract_datetime_en"""
+    # normalize and lowercase utt  (replaces words with numbers)
+    s = _NUMBER_PARSER_EN.convert_words_to_numbers(s, ordinals=None)
+    # clean unneeded punctuation and capitalization among other things.
+    wordList = _DATETIME_SUBSTITUTIONS_EN(s.lower()).split()
+    for idx, word in enumerate(wordList):
+        # "second" is the only case we should not do this
+        if word[0].isdigit() and "second" not in word:
+            wordList[idx] = _ORDINAL_SUFFIXES_EN(word)
+
+    return wordList
+
+
 def extract_datetime_en(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -724,32 +332,72 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return _extract_datetime_words_en(_datetime_words_en(text), anchorDate,
+                                      default_time)
+
+
+def extract_datetimes_en(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_en, which the words of each expression are
+    parsed with.
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in text, in
+                                  the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_en,
+                                          _extract_datetime_words_en,
+                                          ["and"], anchorDate, default_time)
+
+
+def extract_temporal_expression_en(text, anchorDate=None, default_time=None):
+    """ Extract a date and time expression apart from its anchor
+
+    See extract_datetime_en, and lingua_franca.temporal.resolve for the
+    datetimes of the expression at many anchors.
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): the date/time the text is read against, for
+                               "next monday" or "at 5"
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        TemporalExpression: or None if no date or time related text was
+                            found.
+    """
+    if text == "":
+        return None
+    return _temporal_expression_words_en(_datetime_words_en(text),
+                                         anchorDate, default_time)
+
+
+def _extract_datetime_words_en(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_en on the words of a text cleaned by
+    _datetime_words_en, replacing the words it uses with "".
+    """
+    anchorDate = anchorDate or now_local()
+    expression = _temporal_expression_words_en(words, anchorDate,
+                                               default_time)
+    if expression is None:
+        return None
+    return [expression.at(anchorDate), expression.leftover]
+
 
-    def clean_string(s):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_en(s, ordinals=None)
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace(',', '') \
-            .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
-            .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
-            .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
-            .replace("oclock", "o'clock").replace("couple", "2") \
-            .replace("centuries", "century").replace("decades", "decade") \
-            .replace("millenniums", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            word = word.replace("'s", "")
-
-            ordinals = ["rd", "st", "nd", "th"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
+def _temporal_expression_words_en(words, anchorDate=None, default_time=None):
+    """
+    extract_temporal_expression_en on the words of a text cleaned by
+    _datetime_words_en, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -764,9 +412,10 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     if not anchorDate:
         anchorDate = now_local()
 
-    if text == "":
-        return None
     default_time = default_time or time(0, 0, 0)
+    unread = tuple(words)
+    # the fields of anchorDate read, see lingua_franca.temporal
+    anchored = set()
     found = False
     daySpecified = False
     dayOffset = False
@@ -780,31 +429,6 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    year_markers = ['in', 'on', 'of']
-    past_markers = ["last", "past"]
-    earlier_markers = ["ago", "earlier"]
-    later_markers = ["after", "later"]
-    future_markers = ["in", "within"]  # in a month -> + 1 month timedelta
-    future_1st_markers = ["next"]  # next month -> day 1 of next month
-    markers = year_markers + ['at', 'by', 'this', 'around', 'for', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
-    past_markers = ["was", "last", "past"]
-
-    words = clean_string(text)
-
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -818,15 +442,15 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in earlier_markers and dayOffset:
+        if word in _EARLIER_MARKERS_EN and dayOffset:
             dayOffset = - dayOffset
             used += 1
         elif word == "now" and not datestr:
+            words[idx] = ""
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
-            extractedDate = anchorDate.replace(microsecond=0)
-            return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+            return TemporalExpression(now=True, leftover=resultStr)
+        elif wordNext in _YEAR_MULTIPLES_EN:
             multiplier = None
             if is_numeric(word):
                 try:
@@ -847,23 +471,24 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNext == "millennium":
                 yearOffset = multiplier * 1000 + int(_leftover[:3]) * 100
 
-            if wordNextNext in earlier_markers:
+            if wordNextNext in _EARLIER_MARKERS_EN:
                 yearOffset = yearOffset * -1
                 used += 1
-            elif word in past_markers:
+            elif word in _PAST_MARKERS_EN:
                 yearOffset = yearOffset * -1
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 yearOffset = yearOffset * -1
                 start -= 1
                 used += 1
 
-        elif word in year_markers and wordNext.isdigit() and len(wordNext) == 4:
+        elif word in _YEAR_MARKERS_EN and wordNext.isdigit() and len(wordNext) == 4:
             yearOffset = int(wordNext) - int(currentYear)
+            anchored.add("year")
             used += 2
             hasYear = True
         # couple of
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in year_multiples:
+                wordNextNext in _YEAR_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "decade":
@@ -873,7 +498,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNextNext == "millennium":
                 yearOffset = multiplier * 1000
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in day_multiples:
+                wordNextNext in _DAY_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "years":
@@ -882,7 +507,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset = multiplier
             elif wordNextNext == "weeks":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_EN:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "today" and not fromFlag:
@@ -911,28 +536,28 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used += 1
         # parse 5 days, 10 weeks, last week, next week
-        elif word == "day" and wordNext not in earlier_markers:
+        elif word == "day" and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 dayOffset += int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
 
             # next day
             # normalize step makes "in a day" -> "in day"
-            elif wordPrev and wordPrev in future_markers + future_1st_markers:
+            elif wordPrev and wordPrev in _NEXT_MARKERS_EN:
                 dayOffset += 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset = -1
                 start -= 1
                 used = 2
         # parse X days ago
-        elif word == "day" and wordNext in earlier_markers:
+        elif word == "day" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 dayOffset -= int(wordPrev)
                 start -= 1
@@ -941,31 +566,33 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 1
                 used = 2
         # parse last/past/next week and in/after X weeks
-        elif word == "week" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "week" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
             # next week -> next monday
-            elif wordPrev in future_1st_markers:
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
                 dayOffset = 7 - wkday
+                anchored.add("weekday")
                 start -= 1
                 used = 2
             # normalize step makes "in a week" -> "in week"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 dayOffset = 7
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset = -7
                 start -= 1
                 used = 2
         # parse X weeks ago
-        elif word == "week" and not fromFlag and wordNext in earlier_markers:
+        elif word == "week" and not fromFlag and \
+                wordNext in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 dayOffset -= int(wordPrev) * 7
                 start -= 1
@@ -974,21 +601,23 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 7
                 used = 2
         # parse last/past/next weekend and in/after X weekends
-        elif word == "weekend" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "weekend" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             # in/after X weekends
             if wordPrev[0].isdigit():
                 n = int(wordPrev)
                 dayOffset += 7 - wkday  # next monday -> 1 weekend
+                anchored.add("weekday")
                 n -= 1
                 dayOffset += n * 7
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
             # next weekend -> next saturday
-            elif wordPrev in future_1st_markers:
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
+                anchored.add("weekday")
                 if wkday < 5:
                     dayOffset = 5 - wkday
                 elif wkday == 5:
@@ -998,18 +627,21 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used = 2
             # normalize step makes "in a weekend" -> "in weekend" (next monday)
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 dayOffset += 7 - wkday  # next monday
+                anchored.add("weekday")
                 start -= 1
                 used = 2
             # last/past weekend -> last/past saturday
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset -= wkday + 2
+                anchored.add("weekday")
                 start -= 1
                 used = 2
         # parse X weekends ago
-        elif word == "weekend" and not fromFlag and wordNext in earlier_markers:
+        elif word == "weekend" and not fromFlag and wordNext in _EARLIER_MARKERS_EN:
             dayOffset -= wkday + 3  # past friday "one weekend ago"
+            anchored.add("weekday")
             used = 2
             # X weekends ago
             if wordPrev and wordPrev[0].isdigit():
@@ -1018,31 +650,32 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used = 3
         # parse 10 months, next month, last month
-        elif word == "month" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "month" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     monthOffset = monthOffset * -1
                     start -= 1
                     used += 1
             # next month -> day 1
-            elif wordPrev in future_1st_markers:
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
                 next_dt = (anchorDate.replace(day=1) + timedelta(days=32)).replace(day=1)
                 dayOffset = (next_dt - anchorDate).days
+                anchored.add("date")
                 start -= 1
                 used = 2
             # normalize step makes "in a month" -> "in month"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 monthOffset = 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 monthOffset = -1
                 start -= 1
                 used = 2
-        elif word == "month" and wordNext in earlier_markers:
+        elif word == "month" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 monthOffset -= int(wordPrev)
                 start -= 1
@@ -1051,31 +684,32 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset -= 1
                 used = 2
         # parse 5 years, next year, last year
-        elif word == "year" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif word == "year" and not fromFlag and wordPrev and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     yearOffset = yearOffset * -1
                     start -= 1
                     used += 1
             # next year -> day 1
-            elif wordPrev in future_1st_markers:
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
                 next_dt = anchorDate.replace(day=1, month=1, year=anchorDate.year + 1)
                 dayOffset = (next_dt - anchorDate).days
+                anchored.add("date")
                 start -= 1
                 used = 2
             # normalize step makes "in a year" -> "in year"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 yearOffset = 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 yearOffset = -1
                 start -= 1
                 used = 2
-        elif word == "year" and wordNext in earlier_markers:
+        elif word == "year" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 yearOffset -= int(wordPrev)
                 start -= 1
@@ -1086,9 +720,10 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_EN and not fromFlag:
+            d = _DAYS_EN[word]
             dayOffset = (d + 1) - int(today)
+            anchored.add("weekday")
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -1097,18 +732,18 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     dayOffset += 7
                 used += 1
                 start -= 1
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset -= 7
                 used += 1
                 start -= 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_EN or \
+                word in _MONTHS_SHORT_EN and not fromFlag:
+            m = _MONTH_INDEXES_EN.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_EN[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_EN[m]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -1141,7 +776,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif word == 'may' and wordNext in ['i', 'we', 'be']:
                 datestr = ""
             # when was MONTH
-            elif not hasYear and wordPrev in past_markers:
+            elif not hasYear and wordPrev in _PAST_MARKERS_EN:
+                anchored.add("month")
                 if anchorDate.month > m:
                     datestr += f" {anchorDate.year}"
                 else:
@@ -1149,6 +785,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hasYear = True
             # when is MONTH
             elif not hasYear:
+                anchored.add("month")
                 if anchorDate.month > m:
                     datestr += f" {anchorDate.year + 1}"
                 else:
@@ -1156,39 +793,33 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hasYear = True
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("past")
-        validFollowups.append("now")
-        validFollowups.append("this")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
+        if (word == "from" or word == "after") and \
+                wordNext in _FROM_FOLLOWUPS_EN:
             used = 2
             fromFlag = True
             if wordNext == "tomorrow":
                 dayOffset += 1
             elif wordNext == "yesterday":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_EN:
+                d = _DAYS_EN[wordNext]
                 tmpOffset = (d + 1) - int(today)
+                anchored.add("weekday")
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_EN:
+                d = _DAYS_EN[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
+                anchored.add("weekday")
                 used = 3
-                if wordNext in future_1st_markers:
+                if wordNext in _FUTURE_1ST_MARKERS_EN:
                     if dayOffset <= 2:
                         tmpOffset += 7
                     used += 1
                     start -= 1
-                elif wordNext in past_markers:
+                elif wordNext in _PAST_MARKERS_EN:
                     tmpOffset -= 7
                     used += 1
                     start -= 1
@@ -1201,7 +832,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_EN:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -1258,42 +889,43 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNextNext == "seconds":
                 secOffset = 2
         # parse in a/next second/minute/hour
-        elif wordNext == "hour" and word in future_markers + future_1st_markers:
+        elif wordNext == "hour" and word in _NEXT_MARKERS_EN:
             used += 2
             hrOffset = 1
-        elif wordNext == "minute" and word in future_markers + future_1st_markers:
+        elif wordNext == "minute" and word in _NEXT_MARKERS_EN:
             used += 2
             minOffset = 1
-        elif wordNext == "second" and word in future_markers + future_1st_markers:
+        elif wordNext == "second" and word in _NEXT_MARKERS_EN:
             used += 2
             secOffset = 1
         # parse last/past  second/minute/hour
-        elif wordNext == "hour" and word in past_markers:
+        elif wordNext == "hour" and word in _PAST_MARKERS_EN:
             used += 2
             hrOffset = - 1
-        elif wordNext == "minute" and word in past_markers:
+        elif wordNext == "minute" and word in _PAST_MARKERS_EN:
             used += 2
             minOffset = - 1
-        elif wordNext == "second" and word in past_markers:
+        elif wordNext == "second" and word in _PAST_MARKERS_EN:
             used += 2
             secOffset = - 1
         # parse half an hour, quarter hour
         elif word == "hour" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _DATETIME_MARKERS_EN or
+                 wordPrevPrev in _DATETIME_MARKERS_EN):
             if wordPrev == "half":
                 minOffset = 30
             elif wordPrev == "quarter":
                 minOffset = 15
             elif wordPrevPrev == "quarter":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in markers:
+                if idx > 2 and words[idx - 3] in _DATETIME_MARKERS_EN:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             elif wordPrev == "within":
                 hrOffset = 1
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1396,7 +1028,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _TIME_QUALIFIERS_PM_EN):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1430,9 +1062,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_EN or
+                        wordNext in _RECUR_MARKERS_EN or
+                        wordNextNext in _RECUR_MARKERS_EN):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1455,7 +1087,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             (wordNext == "hours" or wordNext == "hour" or
                              remainder == "hours" or remainder == "hour") and
                             word[0] != '0' and
-                            (int(strNum) < 100 or int(strNum) > 2400 or wordPrev in past_markers)):
+                            (int(strNum) < 100 or int(strNum) > 2400 or wordPrev in _PAST_MARKERS_EN)):
                         # ignores military time
                         # "in 3 hours"
                         hrOffset = int(strNum)
@@ -1464,7 +1096,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N hours
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             hrOffset = hrOffset * -1
@@ -1478,7 +1110,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N minutes
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             minOffset = minOffset * -1
@@ -1491,7 +1123,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N seconds
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             secOffset = secOffset * -1
@@ -1531,21 +1163,23 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                if (wordNextNext in _TIME_QUALIFIERS_PM_EN or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_PM_EN):
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if (wordNextNext in _TIME_QUALIFIERS_AM_EN or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_AM_EN):
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _TIME_QUALIFIERS_PM_EN:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _TIME_QUALIFIERS_AM_EN:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1568,6 +1202,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
                 # ambiguous time, detect whether they mean this evening or
                 # the next morning based on whether it has already passed
+                anchored.add("time")
                 if anchorDate.hour < HH or (anchorDate.hour == HH and
                                             anchorDate.minute < MM):
                     pass  # No modification needed
@@ -1577,7 +1212,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     # has passed, assume the next morning
                     dayOffset += 1
 
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_EN and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1606,11 +1241,11 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_EN:
                 words[idx - 1] = ""
                 if wordPrev == "this":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1625,10 +1260,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     if dayOffset is False:
         dayOffset = 0
 
-    # perform date manipulation
-
-    extractedDate = anchorDate.replace(microsecond=0)
-
+    explicitDate = None
     if datestr != "":
         # date included an explicit date, e.g. "june 5" or "june 2, 2017"
         try:
@@ -1644,48 +1276,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 except ValueError:
                     # Try again, with only month
                     temp = datetime.strptime(datestr, "%B")
-        extractedDate = extractedDate.replace(hour=0, minute=0, second=0)
-        if not hasYear:
-            temp = temp.replace(year=extractedDate.year,
-                                tzinfo=extractedDate.tzinfo)
-            if extractedDate < temp:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear),
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-            else:
-                extractedDate = extractedDate.replace(
-                    year=int(currentYear) + 1,
-                    month=int(temp.strftime("%m")),
-                    day=int(temp.strftime("%d")),
-                    tzinfo=extractedDate.tzinfo)
-        else:
-            extractedDate = extractedDate.replace(
-                year=int(temp.strftime("%Y")),
-                month=int(temp.strftime("%m")),
-                day=int(temp.strftime("%d")),
-                tzinfo=extractedDate.tzinfo)
-    else:
-        # ignore the current HH:MM:SS if relative using days or greater
-        if hrOffset == 0 and minOffset == 0 and secOffset == 0:
-            extractedDate = extractedDate.replace(hour=default_time.hour,
-                                                  minute=default_time.minute,
-                                                  second=default_time.second)
-
-    if yearOffset != 0:
-        extractedDate = extractedDate + relativedelta(years=yearOffset)
-    if monthOffset != 0:
-        extractedDate = extractedDate + relativedelta(months=monthOffset)
-    if dayOffset != 0:
-        extractedDate = extractedDate + relativedelta(days=dayOffset)
-    if hrOffset != 0:
-        extractedDate = extractedDate + relativedelta(hours=hrOffset)
-    if minOffset != 0:
-        extractedDate = extractedDate + relativedelta(minutes=minOffset)
-    if secOffset != 0:
-        extractedDate = extractedDate + relativedelta(seconds=secOffset)
-
+        explicitDate = (temp.year, temp.month, temp.day)
 
     if hrAbs != -1 and minAbs != -1 and not hrOffset and not minOffset and not secOffset:
         # If no time was supplied in the string set the time to default
@@ -1695,13 +1286,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         else:
             hrAbs = hrAbs or 0
             minAbs = minAbs or 0
-
-        extractedDate = extractedDate.replace(hour=hrAbs,
-                                              minute=minAbs)
-
-        if (hrAbs != 0 or minAbs != 0) and datestr == "":
-            if not daySpecified and anchorDate > extractedDate:
-                extractedDate = extractedDate + relativedelta(days=1)
+    else:
+        hrAbs = minAbs = None
 
     for idx, word in enumerate(words):
         if words[idx] == "and" and \
@@ -1710,9 +1296,86 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
     resultStr = " ".join(words)
     resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+    return TemporalExpression(
+        years=yearOffset, months=monthOffset, days=dayOffset,
+        hours=hrOffset, minutes=minOffset, seconds=secOffset,
+        date=explicitDate, has_year=hasYear, hour=hrAbs, minute=minAbs,
+        day_specified=daySpecified, default_time=default_time,
+        leftover=resultStr, anchored=anchored, anchor=anchorDate,
+        reparse=lambda anchor: _temporal_expression_words_en(
+            list(unread), anchor, default_time))
 
 
+def _build_fraction_denominators_en(ordinals):
+    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    fracts.update(_generate_plurals_en(fracts))  # e.g. "fifths"
+    return MappingProxyType(fracts)
+
+
+# {short_scale: {fraction word: denominator}}
+_FRACTION_DENOMINATORS_EN = {
+    True: _build_fraction_denominators_en(_SHORT_ORDINAL_EN),
+    False: _build_fraction_denominators_en(_LONG_ORDINAL_EN)
+}
+
+
+def _build_number_lexer_en(short_scale, speech):
+    """Compile the number vocabulary used by _NUMBER_PARSER_EN"""
+    multiplies, string_num_ordinal, string_num_scale = \
+        _initialize_number_data_en(short_scale, speech)
+    lexer = NumberLexer()
+    lexer.add_all(_STRING_NUM_EN, NumberLexer.NUMBER)
+    lexer.add_all(string_num_scale, NumberLexer.SCALE)
+    lexer.add_all(_SUMS_EN, NumberLexer.SUM)
+    lexer.add_all(multiplies, NumberLexer.MULTIPLIER)
+    lexer.add_all(string_num_ordinal, NumberLexer.ORDINAL)
+    lexer.add_all({word: 1.0 / denominator for word, denominator in
+                   _FRACTION_DENOMINATORS_EN[short_scale].items()},
+                  NumberLexer.FRACTION)
+    lexer.add_all(_NEGATIVES_EN, NumberLexer.NEGATIVE)
+    lexer.add_all(_ARTICLES_EN, NumberLexer.ARTICLE)
+    lexer.add_all(_SPOKEN_EXTRA_NUM_EN, NumberLexer.SPOKEN)
+    return lexer
+
+
+# {(short_scale, speech): NumberLexer}
+_NUMBER_LEXER_EN = {(short_scale, speech):
+                        _build_number_lexer_en(short_scale, speech)
+                    for short_scale in (True, False)
+                    for speech in (True, False)}
+
+
+class _EnglishNumberParser(NumberParser):
+    lexers = MappingProxyType(_NUMBER_LEXER_EN)
+    fraction_markers = _FRACTION_MARKER_EN
+    decimal_markers = _DECIMAL_MARKER_EN
+    articles = _ARTICLES_EN
+    lowercase_text = False
+    lowercase_words = True
+    prefix_kinds = NumberLexer.ARTICLE | NumberLexer.NEGATIVE
+    joining_kinds = NumberParser.joining_kinds | NumberLexer.ARTICLE
+    ordinal_suffixes = ("st", "nd", "rd", "th")
+    speech = True
+
+    def lexer(self, tokens, short_scale, ordinals):
+        return self.lexers[bool(short_scale), ordinals is not None]
+
+    def explicit_ordinal(self, tokens, idx, next_word):
+        # handle nth one
+        if next_word == "one":
+            # would return 1 instead otherwise
+            tokens[idx + 1] = Token("", idx)
+            return ""
+        return next_word
+
+
+_NUMBER_PARSER_EN = _EnglishNumberParser()
+
+
+@word_memo("en")
 def is_fractional_en(input_str, short_scale=True, spoken=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1725,21 +1388,10 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
         (bool) or (float): False if not a fraction, otherwise the fraction
 
     """
-    if input_str.endswith('s', -1):
-        input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
-
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
-    if input_str.lower() in fracts and spoken:
-        return 1.0 / fracts[input_str.lower()]
+    denominator = _FRACTION_DENOMINATORS_EN[bool(short_scale)].get(
+        input_str.lower())
+    if denominator and spoken:
+        return 1.0 / denominator
     return False
 
 
@@ -1757,17 +1409,16 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_en(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [float(number) for number in
+            _NUMBER_PARSER_EN.extract_numbers(text, short_scale, ordinals)]
 
 
 class EnglishNormalizer(Normalizer):
-    with open(resolve_resource_file("text/en-us/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/en-us/normalize.json")
 
     def numbers_to_digits(self, utterance):
-        return _convert_words_to_numbers_en(utterance, ordinals=None)
+        return _NUMBER_PARSER_EN.convert_words_to_numbers(utterance,
+                                                          ordinals=None)
 
 
 def normalize_en(text, remove_articles=True):
@@ -14,14 +14,26 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local, DAYS_IN_1_MONTH, DAYS_IN_1_YEAR
-from lingua_franca.lang.format_es import pronounce_number_es
 from lingua_franca.lang.parse_common import *
 from lingua_franca.lang.common_data_es import _ARTICLES_ES, _STRING_NUM_ES
 
 
+# {fraction word: denominator}, without the plural "s"
+_FRACTION_DENOMINATORS_ES = MappingProxyType({
+    "medio": 2, "media": 2, "tercio": 3, "cuarto": 4, "cuarta": 4,
+    "quinto": 5, "quinta": 5, "sexto": 6, "sexta": 6, "séptimo": 7,
+    "séptima": 7, "octavo": 8, "octava": 8, "noveno": 9, "novena": 9,
+    "décimo": 10, "décima": 10, "onceavo": 11, "onceava": 11,
+    "doceavo": 12, "doceava": 12, "vigésimo": 20, "vigésima": 20,
+    "trigésimo": 30, "trigésima": 30, "centésimo": 100, "centésima": 100,
+    "milésimo": 1000, "milésima": 1000})
+
+
+@word_memo("es")
 def is_fractional_es(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -37,22 +49,9 @@ def is_fractional_es(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    aFrac = {"medio": 2, "media": 2, "tercio": 3, "cuarto": 4,
-             "cuarta": 4, "quinto": 5, "quinta": 5, "sexto": 6, "sexta": 6,
-             "séptimo": 7, "séptima": 7, "octavo": 8, "octava": 8,
-             "noveno": 9, "novena": 9, "décimo": 10, "décima": 10,
-             "onceavo": 11, "onceava": 11, "doceavo": 12, "doceava": 12}
-
-    if input_str.lower() in aFrac:
-        return 1.0 / aFrac[input_str]
-    if (input_str == "vigésimo" or input_str == "vigésima"):
-        return 1.0 / 20
-    if (input_str == "trigésimo" or input_str == "trigésima"):
-        return 1.0 / 30
-    if (input_str == "centésimo" or input_str == "centésima"):
-        return 1.0 / 100
-    if (input_str == "milésimo" or input_str == "milésima"):
-        return 1.0 / 1000
+    denominator = _FRACTION_DENOMINATORS_ES.get(input_str.lower())
+    if denominator:
+        return 1.0 / denominator
     return False
 
 
@@ -268,6 +267,35 @@ def _es_number_parse(words, i):
     return es_number(i)
 
 
+def _number_span_es(words, i, short_scale, ordinals):
+    """Number starting at words[i], see extract_number_spans_generic"""
+    parsed = _es_number_parse(words, i)
+    if parsed is None and _STRING_NUM_ES.get(words[i]):
+        # "mil" on its own
+        parsed = _STRING_NUM_ES[words[i]], i + 1
+    return parsed
+
+
+def _extract_number_spans_es(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with their spans.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: [(value, (start_idx, end_idx))] for each number in text
+    """
+    return extract_number_spans_generic(text, _number_span_es,
+                                        is_fractional_es,
+                                        fraction_markers=("y",),
+                                        decimal_markers=("punto", "coma"),
+                                        zeros=("cero", "0"),
+                                        short_scale=short_scale,
+                                        ordinals=ordinals)
+
+
 def extract_numbers_es(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -282,9 +310,8 @@ def extract_numbers_es(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_es,
-                                   extract_number_es, short_scale=short_scale,
-                                   ordinals=ordinals)
+    return [number for number, _ in
+            _extract_number_spans_es(text, short_scale, ordinals)]
 
 
 def normalize_es(text, remove_articles=True):
@@ -314,46 +341,109 @@ def normalize_es(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
+# the vocabulary of extract_datetime_es
+_TIME_QUALIFIERS_ES = frozenset(['mañana', 'tarde', 'noche'])
+_TIME_INDICATORS_ES = frozenset(["en", "la", "al", "por", "pasados", "pasadas",
+                                 "día", "hora"])
+# {day: weekday}, lunes is 0
+_DAYS_ES = {day: weekday for weekday, day in enumerate(
+    ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado',
+     'domingo'])}
+_MONTHS_ES = ('enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio', 'julio',
+              'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre')
+# {month: index in _MONTHS_ES}
+_MONTH_INDEXES_ES = {month: idx for idx, month in enumerate(_MONTHS_ES)}
+_MONTHS_SHORT_ES = {month: idx for idx, month in enumerate(
+    ['ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago', 'sep', 'oct',
+     'nov', 'dic'])}
+_NEXTS_ES = frozenset(["siguiente", "próximo", "próxima"])
+_SUFFIX_NEXTS_ES = frozenset(["siguientes", "subsecuentes"])
+_LASTS_ES = frozenset(["último", "última"])
+_SUFFIX_LASTS_ES = frozenset(["pasada", "pasado", "anterior", "antes"])
+_NXTS_ES = frozenset(["después", "siguiente", "próximo", "próxima"])
+_PREVS_ES = frozenset(["antes", "previa", "previo", "anterior"])
+_THISES_ES = frozenset(["este", "esta"])
+_FROMS_ES = frozenset(["desde", "en", "para", "después de", "por", "próximo",
+                       "próxima", "de"]) | _THISES_ES
+_DATETIME_MARKERS_ES = _NXTS_ES | _PREVS_ES | _FROMS_ES | \
+    _TIME_INDICATORS_ES
+# the words that may follow one of _FROMS_ES in a date,
+# "5 días desde mañana", "2 meses desde julio"
+_FROM_FOLLOWUPS_ES = frozenset(_DAYS_ES) | frozenset(_MONTH_INDEXES_ES) | \
+    frozenset(_MONTHS_SHORT_ES) | \
+    frozenset(["hoy", "mañana", "ayer", "anteayer", "ahora", "ya", "ante"])
+
+
+def _datetime_words_es(s):
+    """The words of s, cleaned for extract_datetime_es"""
+    # cleans the input string of unneeded punctuation and capitalization
+    # among other things
+    symbols = [".", ",", ";", "?", "!", "º", "ª"]
+    noise_words = ["entre", "la", "del", "al", "el", "de",
+                   "para", "una", "cualquier", "a",
+                   "e'", "esta", "este"]
+
+    for word in symbols:
+        s = s.replace(word, "")
+    for word in noise_words:
+        s = s.replace(" " + word + " ", " ")
+    s = s.lower().replace(
+        "á",
+        "a").replace(
+        "é",
+        "e").replace(
+        "ó",
+        "o").replace(
+        "-",
+        " ").replace(
+        "_",
+        "")
+    # handle synonyms and equivalents, "tomorrow early = tomorrow morning
+    synonyms = {"mañana": ["amanecer", "temprano", "muy temprano"],
+                "tarde": ["media tarde", "atardecer"],
+                "noche": ["anochecer", "tarde"]}
+    for syn in synonyms:
+        for word in synonyms[syn]:
+            s = s.replace(" " + word + " ", " " + syn + " ")
+    # relevant plurals, cant just extract all s in pt
+    wordlist = ["mañanas", "tardes", "noches", "días", "semanas",
+                "años", "minutos", "segundos", "las", "los", "siguientes",
+                "próximas", "próximos", "horas"]
+    for _, word in enumerate(wordlist):
+        s = s.replace(word, word.rstrip('s'))
+    s = s.replace("meses", "mes").replace("anteriores", "anterior")
+    return s.split(" ")
+
+
 # TODO MycroftAI/mycroft-core#2348
 def extract_datetime_es(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        # cleans the input string of unneeded punctuation and capitalization
-        # among other things
-        symbols = [".", ",", ";", "?", "!", "º", "ª"]
-        noise_words = ["entre", "la", "del", "al", "el", "de",
-                       "para", "una", "cualquier", "a",
-                       "e'", "esta", "este"]
-
-        for word in symbols:
-            s = s.replace(word, "")
-        for word in noise_words:
-            s = s.replace(" " + word + " ", " ")
-        s = s.lower().replace(
-            "á",
-            "a").replace(
-            "é",
-            "e").replace(
-            "ó",
-            "o").replace(
-            "-",
-            " ").replace(
-            "_",
-            "")
-        # handle synonyms and equivalents, "tomorrow early = tomorrow morning
-        synonyms = {"mañana": ["amanecer", "temprano", "muy temprano"],
-                    "tarde": ["media tarde", "atardecer"],
-                    "noche": ["anochecer", "tarde"]}
-        for syn in synonyms:
-            for word in synonyms[syn]:
-                s = s.replace(" " + word + " ", " " + syn + " ")
-        # relevant plurals, cant just extract all s in pt
-        wordlist = ["mañanas", "tardes", "noches", "días", "semanas",
-                    "años", "minutos", "segundos", "las", "los", "siguientes",
-                    "próximas", "próximos", "horas"]
-        for _, word in enumerate(wordlist):
-            s = s.replace(word, word.rstrip('s'))
-        s = s.replace("meses", "mes").replace("anteriores", "anterior")
-        return s
+    if text == "":
+        return None
+    return _extract_datetime_words_es(_datetime_words_es(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_es(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_es, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_es,
+                                          _extract_datetime_words_es,
+                                          (), anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_es(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_es on the words of a text cleaned by
+    _datetime_words_es, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -365,8 +455,6 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
     if anchorDate is None:
         anchorDate = now_local()
 
@@ -383,28 +471,6 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    words = clean_string(text).split(" ")
-    timeQualifiersList = ['mañana', 'tarde', 'noche']
-    time_indicators = ["en", "la", "al", "por", "pasados",
-                       "pasadas", "día", "hora"]
-    days = ['lunes', 'martes', 'miércoles',
-            'jueves', 'viernes', 'sábado', 'domingo']
-    months = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
-              'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
-              'diciembre']
-    monthsShort = ['ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago',
-                   'sep', 'oct', 'nov', 'dic']
-    nexts = ["siguiente", "próximo", "próxima"]
-    suffix_nexts = ["siguientes", "subsecuentes"]
-    lasts = ["último", "última"]
-    suffix_lasts = ["pasada", "pasado", "anterior", "antes"]
-    nxts = ["después", "siguiente", "próximo", "próxima"]
-    prevs = ["antes", "previa", "previo", "anterior"]
-    froms = ["desde", "en", "para", "después de", "por", "próximo",
-             "próxima", "de"]
-    thises = ["este", "esta"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -417,7 +483,7 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_ES:
             timeQualifier = word
 
         # parse today, tomorrow, yesterday
@@ -461,13 +527,13 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                     start -= 1
                     used += 1
             elif (wordPrev and wordPrev[0].isdigit() and
-                  wordNext not in months and
-                  wordNext not in monthsShort):
+                  wordNext not in _MONTH_INDEXES_ES and
+                  wordNext not in _MONTHS_SHORT_ES):
                 dayOffset += int(wordPrev)
                 start -= 1
                 used += 2
             elif wordNext and wordNext[0].isdigit() and wordNextNext not in \
-                    months and wordNextNext not in monthsShort:
+                    _MONTH_INDEXES_ES and wordNextNext not in _MONTHS_SHORT_ES:
                 dayOffset += int(wordNext)
                 start -= 1
                 used += 2
@@ -477,82 +543,70 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_ES:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_ES:
+                dayOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_ES:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_ES:
+                dayOffset = -7
+                start -= 1
+                used = 2
         # parse 10 months, next month, last month
         elif word == "mes" and not fromFlag:
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_ES:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_ES:
+                monthOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_ES:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_ES:
+                monthOffset = -7
+                start -= 1
+                used = 2
         # parse 5 years, next year, last year
         elif word == "año" and not fromFlag:
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    yearOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    yearOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    yearOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    yearOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_ES:
+                yearOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_ES:
+                yearOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_ES:
+                yearOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_ES:
+                yearOffset = -7
+                start -= 1
+                used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_ES and not fromFlag:
+            d = _DAYS_ES[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -572,13 +626,12 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                 # dayOffset -= 7
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_ES or word in _MONTHS_SHORT_ES:
+            m = _MONTH_INDEXES_ES.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_ES[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_ES[m]
             if wordPrev and wordPrev[0].isdigit():
                 # 13 mayo
                 datestr += " " + wordPrev
@@ -626,22 +679,14 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                 else:
                     hasYear = False
 
-            if datestr in months:
+            if datestr in _MONTH_INDEXES_ES:
                 datestr = ""
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("hoy")
-        validFollowups.append("mañana")
-        validFollowups.append("ayer")
-        validFollowups.append("anteayer")
-        validFollowups.append("ahora")
-        validFollowups.append("ya")
-        validFollowups.append("ante")
 
         # TODO debug word "depois" that one is failing for some reason
-        if word in froms and wordNext in validFollowups:
+        if word in _FROMS_ES and wordNext in _FROM_FOLLOWUPS_ES:
 
             if not (wordNext == "mañana" and wordNext == "ayer") and not (
                     word == "pasado" or word == "antes"):
@@ -658,8 +703,8 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
             elif (wordNext == "ante" and wordNext == "ante" and
                   wordNextNextNext == "ayer"):
                 dayOffset -= 3
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_ES:
+                d = _DAYS_ES[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 # if wordNextNext == "feira":
@@ -667,38 +712,38 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                 if tmpOffset < 0:
                     tmpOffset += 7
                 if wordNextNext:
-                    if wordNextNext in nxts:
+                    if wordNextNext in _NXTS_ES:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNext in prevs:
+                    elif wordNextNext in _PREVS_ES:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_ES:
+                d = _DAYS_ES[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNextNextNext:
-                    if wordNextNextNext in nxts:
+                    if wordNextNextNext in _NXTS_ES:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNextNext in prevs:
+                    elif wordNextNextNext in _PREVS_ES:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
                 # if wordNextNextNext == "feira":
                 #     used += 1
-        if wordNext in months:
+        if wordNext in _MONTH_INDEXES_ES:
             used -= 1
         if used > 0:
-            if start - 1 > 0 and words[start - 1] in lists:
+            if start - 1 > 0 and words[start - 1] in _DATETIME_MARKERS_ES:
                 start -= 1
                 used += 1
 
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in lists:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_ES:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -765,20 +810,20 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
             used += 1
         # parse half an hour, quarter hour
         elif (word == "hora" and
-                (wordPrev in time_indicators or wordPrevPrev in
-                 time_indicators)):
+                (wordPrev in _TIME_INDICATORS_ES or wordPrevPrev in
+                 _TIME_INDICATORS_ES)):
             if wordPrev == "media":
                 minOffset = 30
             elif wordPrev == "cuarto":
                 minOffset = 15
             elif wordPrevPrev == "cuarto":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in time_indicators:
+                if idx > 2 and words[idx - 3] in _TIME_INDICATORS_ES:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             else:
                 hrOffset = 1
-            if wordPrevPrev in time_indicators:
+            if wordPrevPrev in _TIME_INDICATORS_ES:
                 words[idx - 2] = ""
             words[idx - 1] = ""
             used += 1
@@ -830,13 +875,13 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
                         else:
                             remainder = "pm"
                         used += 1
-                    elif wordNext in thises and wordNextNext == "mañana":
+                    elif wordNext in _THISES_ES and wordNextNext == "mañana":
                         remainder = "am"
                         used = 2
-                    elif wordNext in thises and wordNextNext == "tarde":
+                    elif wordNext in _THISES_ES and wordNextNext == "tarde":
                         remainder = "pm"
                         used = 2
-                    elif wordNext in thises and wordNextNext == "noche":
+                    elif wordNext in _THISES_ES and wordNextNext == "noche":
                         remainder = "pm"
                         used = 2
                     else:
@@ -986,9 +1031,9 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
             if wordPrev == "en" or wordPrev == "punto":
                 words[words.index(wordPrev)] = ""
 
-            if idx > 0 and wordPrev in time_indicators:
+            if idx > 0 and wordPrev in _TIME_INDICATORS_ES:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in time_indicators:
+            if idx > 1 and wordPrevPrev in _TIME_INDICATORS_ES:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -1015,10 +1060,10 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
         en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                           'aug',
                           'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
+        for month, en_month in zip(_MONTHS_ES, en_months):
+            datestr = datestr.replace(month, en_month)
+        for month, en_month in zip(_MONTHS_SHORT_ES, en_monthsShort):
+            datestr = datestr.replace(month, en_month)
 
         temp = datetime.strptime(datestr, "%B %d")
         if extractedDate.tzinfo:
@@ -20,7 +20,6 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import gettz
-from lingua_franca.lang.format_eu import pronounce_number_eu
 from lingua_franca.lang.parse_common import *
 from lingua_franca.lang.common_data_eu import _NUM_STRING_EU
 
@@ -57,143 +56,21 @@ def isFractional_eu(input_str):
     return False
 
 
-# TODO: short_scale and ordinals don't do anything here.
-# The parameters are present in the function signature for API compatibility
-# reasons.
-#
-# Returns incorrect output on certain fractional phrases like, "cuarto de dos"
 def extract_number_eu(text, short_scale=True, ordinals=False):
     """
-    This function prepares the given text for parsing by making
-    numbers consistent, getting rid of contractions, etc.
+    This function extracts the first number of the given text, the one
+    extract_numbers_eu finds first, so that compound tens like "hogeita
+    hamar" are read whole.
     Args:
-        text (str): the string to normalize
+        text (str): the string to extract a number from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
     Returns:
-        (int) or (float): The value of extracted number
+        (int) or (float): The value of extracted number, or False
 
     """
-    aWords = text.lower().split()
-    count = 0
-    result = None
-    while count < len(aWords):
-        val = 0
-        word = aWords[count]
-        next_next_word = None
-        if count + 1 < len(aWords):
-            next_word = aWords[count + 1]
-            if count + 2 < len(aWords):
-                next_next_word = aWords[count + 2]
-        else:
-            next_word = None
-
-        # is current word a number?
-        if word in _NUM_STRING_EU:
-            val = _NUM_STRING_EU[word]
-        elif word.isdigit():  # doesn't work with decimals
-            val = int(word)
-        elif is_numeric(word):
-            val = float(word)
-        elif isFractional_eu(word):
-            if next_word in _NUM_STRING_EU:
-                # erdi bat, heren bat, etab
-                result = _NUM_STRING_EU[next_word]
-                # hurrengo hitza (bat, bi, ...) salto egin 
-                next_word = None
-                count += 2
-            elif not result:
-                result = 1
-                count += 1
-            result = result * isFractional_eu(word)
-            continue
-
-        if not val:
-            # look for fractions like "2/3"
-            aPieces = word.split('/')
-            # if (len(aPieces) == 2 and is_numeric(aPieces[0])
-            #   and is_numeric(aPieces[1])):
-            if look_for_fractions(aPieces):
-                val = float(aPieces[0]) / float(aPieces[1])
-
-        if val:
-            if result is None:
-                result = 0
-            # handle fractions
-            if next_word == "en" or next_word == "ren":
-                result = float(result) / float(val)
-            else:
-                result = val
-
-        if next_word is None:
-            break
-
-        # number word and fraction
-        ands = ["eta"]
-        if next_word in ands:
-            zeros = 0
-            if result is None:
-                count += 1
-                continue
-            newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
-
-            afterAndVal = extract_number_eu(newText[:-1])
-            if afterAndVal:
-                if result < afterAndVal or result < 20:
-                    while afterAndVal > 1:
-                        afterAndVal = afterAndVal / 10.0
-                    for word in newWords:
-                        if word == "zero" or word == "0":
-                            zeros += 1
-                        else:
-                            break
-                for _ in range(0, zeros):
-                    afterAndVal = afterAndVal / 10.0
-                result += afterAndVal
-                break
-        elif next_next_word is not None:
-            if next_next_word in ands:
-                newWords = aWords[count + 3:]
-                newText = ""
-                for word in newWords:
-                    newText += word + " "
-                afterAndVal = extract_number_eu(newText[:-1])
-                if afterAndVal:
-                    if result is None:
-                        result = 0
-                    result += afterAndVal
-                    break
-
-        decimals = ["puntu", "koma", ".", ","]
-        if next_word in decimals:
-            zeros = 0
-            newWords = aWords[count + 2:]
-            newText = ""
-            for word in newWords:
-                newText += word + " "
-            for word in newWords:
-                if word == "zero" or word == "0":
-                    zeros += 1
-                else:
-                    break
-            afterDotVal = str(extract_number_eu(newText[:-1]))
-            afterDotVal = zeros * "0" + afterDotVal
-            result = float(str(result) + "." + afterDotVal)
-            break
-        count += 1
-
-    # Return the $str with the number related words removed
-    # (now empty strings, so strlen == 0)
-    # aWords = [word for word in aWords if len(word) > 0]
-    # text = ' '.join(aWords)
-    if "." in str(result):
-        integer, dec = str(result).split(".")
-        # cast float to int
-        if dec == "0":
-            result = int(integer)
-
-    return result or False
+    numbers = _extract_number_spans_eu(text, short_scale, ordinals)
+    return numbers[0][0] if numbers else False
 
 
 # TODO Not parsing 'cero'
@@ -283,6 +160,80 @@ def eu_number_parse(words, i):
     return eu_number(i)
 
 
+def _number_span_eu(words, i, short_scale, ordinals):
+    """Number starting at words[i], see extract_number_spans_generic"""
+    # hogeita hamarrena, the compound tens before the fraction
+    if i + 1 < len(words) and \
+            isFractional_eu(words[i] + " " + words[i + 1]):
+        return isFractional_eu(words[i] + " " + words[i + 1]), i + 2
+    fraction = isFractional_eu(words[i])
+    if fraction:
+        # erdi bat, heren bi
+        parsed = _number_span_eu(words, i + 1, short_scale, ordinals) \
+            if i + 1 < len(words) else None
+        if parsed:
+            return parsed[0] * fraction, parsed[1]
+        return None
+    parsed = _eu_number_at(words, i)
+    if parsed is None and words[i] == "mila":
+        # mila, mila ehun, eu_number_parse only reads "mila" after a number
+        parsed = 1000, i + 1
+        rest = _eu_number_at(words, i + 1)
+        if rest and rest[0] < 1000:
+            parsed = 1000 + rest[0], rest[1]
+    if parsed is None:
+        return None
+
+    # bat eta bi, hogei eta bost, mila eta bat, as extract_number_eu has
+    # always read them
+    value, end = parsed
+    if end + 1 < len(words) and words[end] == "eta":
+        start = end + 1
+        while start < len(words) and words[start] in ("zero", "0"):
+            start += 1
+        after = _number_span_eu(words, start, short_scale, ordinals) \
+            if start < len(words) else None
+        if after:
+            after_value, end = after
+            if value < after_value or value < 20:
+                while after_value > 1:
+                    after_value = after_value / 10.0
+                after_value = after_value / 10 ** (start - parsed[1] - 1)
+            value += after_value
+    return value, end
+
+
+def _eu_number_at(words, i):
+    """eu_number_parse(words, i), leaving words as they are"""
+    if i >= len(words):
+        return None
+    # eu_number_parse cuts the "ta" of compound tens off the word
+    word = words[i]
+    parsed = eu_number_parse(words, i)
+    words[i] = word
+    return parsed
+
+
+def _extract_number_spans_eu(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with their spans.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: [(value, (start_idx, end_idx))] for each number in text
+    """
+    return extract_number_spans_generic(text, _number_span_eu,
+                                        isFractional_eu,
+                                        fraction_markers=("eta",),
+                                        decimal_markers=("puntu", "koma"),
+                                        zeros=("zero", "0"),
+                                        short_scale=short_scale,
+                                        ordinals=ordinals)
+
+
 def extract_numbers_eu(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -297,8 +248,8 @@ def extract_numbers_eu(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_eu, extract_number_eu,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _ in
+            _extract_number_spans_eu(text, short_scale, ordinals)]
 
 
 def normalize_eu(text, remove_articles=True):
@@ -323,44 +274,109 @@ def normalize_eu(text, remove_articles=True):
     return text
 
 
+# the vocabulary of extract_datetime_eu
+_TIME_QUALIFIERS_EU = frozenset(['goiza', 'arratsaldea', 'gaua'])
+_TIME_INDICATORS_EU = frozenset(["en", "la", "al", "por", "pasados", "pasadas",
+                                 "día", "hora"])
+# {day: weekday}, astelehena is 0
+_DAYS_EU = {day: weekday for weekday, day in enumerate(
+    ['astelehena', 'asteartea', 'asteazkena', 'osteguna', 'ostirala',
+     'larunbata', 'igandea'])}
+_MONTHS_EU = ('urtarrila', 'otsaila', 'martxoa', 'apirila', 'maiatza',
+              'ekaina', 'uztaila', 'abuztua', 'iraila', 'urria', 'azaroa',
+              'abendua')
+# {month: index in _MONTHS_EU}
+_MONTH_INDEXES_EU = {month: idx for idx, month in enumerate(_MONTHS_EU)}
+_MONTHS_SHORT_EU = {month: idx for idx, month in enumerate(
+    ['urt', 'ots', 'mar', 'api', 'mai', 'eka', 'uzt', 'abu', 'ira', 'urr',
+     'aza', 'abe'])}
+_NEXTS_EU = frozenset(["hurrengo", "datorren", "ondorengo"])
+_SUFFIX_NEXTS_EU = frozenset(["barru"])
+_LASTS_EU = frozenset(["azken", "duela"])
+_SUFFIX_LASTS_EU = frozenset(["aurreko"])
+_NXTS_EU = frozenset(["ondorengo", "hurrengo", "datorren"])
+_PREVS_EU = frozenset(["aurreko", "duela", "previo", "anterior"])
+_THISES_EU = frozenset(["hau"])
+# TODO
+_FROMS_EU = frozenset(["desde", "en", "para", "después de", "por", "próximo",
+                       "próxima", "de"]) | _THISES_EU
+_DATETIME_MARKERS_EU = _NXTS_EU | _PREVS_EU | _FROMS_EU | \
+    _TIME_INDICATORS_EU
+# the words that may follow one of _FROMS_EU in a date,
+# "5 days from tomorrow", "2 months from July"
+_FROM_FOLLOWUPS_EU = frozenset(_DAYS_EU) | frozenset(_MONTH_INDEXES_EU) | \
+    frozenset(_MONTHS_SHORT_EU) | \
+    frozenset(["gaur", "bihar", "atzo", "herenegun", "orain", "oraintxe"])
+
+
+def _datetime_words_eu(s):
+    """The words of s, cleaned for extract_datetime_eu"""
+    # cleans the input string of unneeded punctuation and capitalization
+    # among other things
+    symbols = [".", ",", ";", "?", "!", "."]
+    # noise_words = ["entre", "la", "del", "al", "el", "de",
+    #                "para", "una", "cualquier", "a",
+    #                "e'", "esta", "este"]
+    # TODO
+    noise_words = ["artean", "tartean", "edozein", "hau", "hontan", "honetan",
+                   "para", "una", "cualquier", "a",
+                   "e'", "esta", "este"]
+
+    for word in symbols:
+        s = s.replace(word, "")
+    for word in noise_words:
+        s = s.replace(" " + word + " ", " ")
+    s = s.lower().replace(
+        "-",
+        " ").replace(
+        "_",
+        "")
+    # handle synonyms and equivalents, "tomorrow early = tomorrow morning
+    synonyms = {"goiza": ["egunsentia", "goiz", "oso goiz"],
+                "arratsaldea": ["arratsa", "bazkalostea", "arratsalde", "arrats"],
+                "gaua": ["iluntzea", "berandu", "gau", "gaba"]}
+    for syn in synonyms:
+        for word in synonyms[syn]:
+            s = s.replace(" " + word + " ", " " + syn + " ")
+    # relevant plurals
+    wordlist = ["goizak", "arratsaldeak", "gauak", "egunak", "asteak",
+                "urteak", "minutuak", "segunduak", "hurrengoak",
+                "datozenak", "orduak", "hilabeteak"]
+    for _, word in enumerate(wordlist):
+        s = s.replace(word, word.rstrip('ak'))
+    # s = s.replace("meses", "mes").replace("anteriores", "anterior")
+    return s.split(" ")
+
+
 # TODO MycroftAI/mycroft-core#2348
 def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
-    def clean_string(s):
-        # cleans the input string of unneeded punctuation and capitalization
-        # among other things
-        symbols = [".", ",", ";", "?", "!", "."]
-        # noise_words = ["entre", "la", "del", "al", "el", "de",
-        #                "para", "una", "cualquier", "a",
-        #                "e'", "esta", "este"]
-        # TODO
-        noise_words = ["artean", "tartean", "edozein", "hau", "hontan", "honetan",
-                       "para", "una", "cualquier", "a",
-                       "e'", "esta", "este"]
-
-        for word in symbols:
-            s = s.replace(word, "")
-        for word in noise_words:
-            s = s.replace(" " + word + " ", " ")
-        s = s.lower().replace(
-            "-",
-            " ").replace(
-            "_",
-            "")
-        # handle synonyms and equivalents, "tomorrow early = tomorrow morning
-        synonyms = {"goiza": ["egunsentia", "goiz", "oso goiz"],
-                    "arratsaldea": ["arratsa", "bazkalostea", "arratsalde", "arrats"],
-                    "gaua": ["iluntzea", "berandu", "gau", "gaba"]}
-        for syn in synonyms:
-            for word in synonyms[syn]:
-                s = s.replace(" " + word + " ", " " + syn + " ")
-        # relevant plurals
-        wordlist = ["goizak", "arratsaldeak", "gauak", "egunak", "asteak",
-                    "urteak", "minutuak", "segunduak", "hurrengoak",
-                    "datozenak", "orduak", "hilabeteak"]
-        for _, word in enumerate(wordlist):
-            s = s.replace(word, word.rstrip('ak'))
-        # s = s.replace("meses", "mes").replace("anteriores", "anterior")
-        return s
+    if input_str == "":
+        return None
+    return _extract_datetime_words_eu(_datetime_words_eu(input_str),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_eu(input_str, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_eu, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(input_str, _datetime_words_eu,
+                                          _extract_datetime_words_eu,
+                                          (), anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_eu(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_eu on the words of a text cleaned by
+    _datetime_words_eu, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -372,8 +388,6 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if input_str == "":
-        return None
     if anchorDate is None:
         anchorDate = datetime.now()
 
@@ -390,29 +404,6 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    words = clean_string(input_str).split(" ")
-    timeQualifiersList = ['goiza', 'arratsaldea', 'gaua']
-    time_indicators = ["en", "la", "al", "por", "pasados",
-                       "pasadas", "día", "hora"]
-    days = ['astelehena', 'asteartea', 'asteazkena',
-            'osteguna', 'ostirala', 'larunbata', 'igandea']
-    months = ['urtarrila', 'otsaila', 'martxoa', 'apirila', 'maiatza', 'ekaina',
-              'uztaila', 'abuztua', 'iraila', 'urria', 'azaroa',
-              'abendua']
-    monthsShort = ['urt', 'ots', 'mar', 'api', 'mai', 'eka', 'uzt', 'abu',
-                   'ira', 'urr', 'aza', 'abe']
-    nexts = ["hurrengo", "datorren", "ondorengo"]
-    suffix_nexts = ["barru"]
-    lasts = ["azken", "duela"]
-    suffix_lasts = ["aurreko"]
-    nxts = ["ondorengo", "hurrengo", "datorren"]
-    prevs = ["aurreko", "duela", "previo", "anterior"]
-    #  TODO
-    froms = ["desde", "en", "para", "después de", "por", "próximo",
-             "próxima", "de"]
-    thises = ["hau"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -425,7 +416,7 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_EU:
             timeQualifier = word
 
         # parse today, tomorrow, yesterday
@@ -467,13 +458,13 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                     start -= 1
                     used += 1
             elif (wordPrev and wordPrev[0].isdigit() and
-                  wordNext not in months and
-                  wordNext not in monthsShort):
+                  wordNext not in _MONTH_INDEXES_EU and
+                  wordNext not in _MONTHS_SHORT_EU):
                 dayOffset += int(wordPrev)
                 start -= 1
                 used += 2
             elif wordNext and wordNext[0].isdigit() and wordNextNext not in \
-                    months and wordNextNext not in monthsShort:
+                    _MONTH_INDEXES_EU and wordNextNext not in _MONTHS_SHORT_EU:
                 dayOffset += int(wordNext)
                 start -= 1
                 used += 2
@@ -483,82 +474,70 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_EU:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_EU:
+                dayOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_EU:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_EU:
+                dayOffset = -7
+                start -= 1
+                used = 2
         # parse 10 months, next month, last month
         elif word == "hilabete" or word == "hilabetea" or word == "hilabeteko" and not fromFlag:
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_EU:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_EU:
+                monthOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_EU:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_EU:
+                monthOffset = -7
+                start -= 1
+                used = 2
         # parse 5 years, next year, last year
         elif word == "urte" or word == "urtea" or word == "urteko" and not fromFlag:
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    yearOffset = 1
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    yearOffset = -1
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    yearOffset = 1
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    yearOffset = -1
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_EU:
+                yearOffset = 1
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_EU:
+                yearOffset = -1
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_EU:
+                yearOffset = 1
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_EU:
+                yearOffset = -1
+                start -= 1
+                used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_EU and not fromFlag:
+            d = _DAYS_EU[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -578,13 +557,12 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                 # dayOffset -= 7
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_EU or word in _MONTHS_SHORT_EU:
+            m = _MONTH_INDEXES_EU.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_EU[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_EU[m]
             if wordPrev and wordPrev[0].isdigit():
                 # 13 mayo
                 datestr += " " + wordPrev
@@ -632,23 +610,14 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                 else:
                     hasYear = False
 
-            if datestr in months:
+            if datestr in _MONTH_INDEXES_EU:
                 datestr = ""
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("gaur")
-        validFollowups.append("bihar")
-        validFollowups.append("atzo")
-        # validFollowups.append("atzoko")
-        validFollowups.append("herenegun")
-        validFollowups.append("orain")
-        validFollowups.append("oraintxe")
-        # validFollowups.append("ante")
 
         # TODO
-        if word in froms and wordNext in validFollowups:
+        if word in _FROMS_EU and wordNext in _FROM_FOLLOWUPS_EU:
 
             if not (word == "bihar" or word == "herenegun" or word == "atzo"):
                 used = 1
@@ -662,8 +631,8 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
             # elif (wordNext == "ante" and wordNext == "ante" and
             #       wordNextNextNext == "ayer"):
             #     dayOffset -= 3
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_EU:
+                d = _DAYS_EU[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 # if wordNextNext == "feira":
@@ -671,38 +640,38 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                 if tmpOffset < 0:
                     tmpOffset += 7
                 if wordNextNext:
-                    if wordNextNext in nxts:
+                    if wordNextNext in _NXTS_EU:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNext in prevs:
+                    elif wordNextNext in _PREVS_EU:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_EU:
+                d = _DAYS_EU[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNextNextNext:
-                    if wordNextNextNext in nxts:
+                    if wordNextNextNext in _NXTS_EU:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNextNext in prevs:
+                    elif wordNextNextNext in _PREVS_EU:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
                 # if wordNextNextNext == "feira":
                 #     used += 1
-        if wordNext in months:
+        if wordNext in _MONTH_INDEXES_EU:
             used -= 1
         if used > 0:
-            if start - 1 > 0 and words[start - 1] in lists:
+            if start - 1 > 0 and words[start - 1] in _DATETIME_MARKERS_EU:
                 start -= 1
                 used += 1
 
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in lists:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_EU:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -772,20 +741,20 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
         # parse half an hour, quarter hour
         # TODO
         elif (word == "hora" and
-                (wordPrev in time_indicators or wordPrevPrev in
-                 time_indicators)):
+                (wordPrev in _TIME_INDICATORS_EU or wordPrevPrev in
+                 _TIME_INDICATORS_EU)):
             if wordPrev == "media":
                 minOffset = 30
             elif wordPrev == "cuarto":
                 minOffset = 15
             elif wordPrevPrev == "cuarto":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in time_indicators:
+                if idx > 2 and words[idx - 3] in _TIME_INDICATORS_EU:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             else:
                 hrOffset = 1
-            if wordPrevPrev in time_indicators:
+            if wordPrevPrev in _TIME_INDICATORS_EU:
                 words[idx - 2] = ""
             words[idx - 1] = ""
             used += 1
@@ -837,14 +806,14 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
                         else:
                             remainder = "pm"
                         used += 1
-                    elif wordNext in thises and (wordNextNext == "goiza" or wordNextNext == "goizean" or wordNextNext == "goizeko"):
+                    elif wordNext in _THISES_EU and (wordNextNext == "goiza" or wordNextNext == "goizean" or wordNextNext == "goizeko"):
                         remainder = "am"
                         used = 2
-                    elif wordNext in thises and \
+                    elif wordNext in _THISES_EU and \
                         (wordNextNext == "arratsaldea" or wordNextNext == "arratsaldean" or wordNextNext == "arratsaldeko"):
                         remainder = "pm"
                         used = 2
-                    elif wordNext in thises and (wordNextNext == "gaua" or wordNextNext == "gauean" or wordNextNext == "gaueko"):
+                    elif wordNext in _THISES_EU and (wordNextNext == "gaua" or wordNextNext == "gauean" or wordNextNext == "gaueko"):
                         remainder = "pm"
                         used = 2
                     else:
@@ -994,9 +963,9 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
             if wordPrev == "puntuan":
                 words[words.index(wordPrev)] = ""
 
-            if idx > 0 and wordPrev in time_indicators:
+            if idx > 0 and wordPrev in _TIME_INDICATORS_EU:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in time_indicators:
+            if idx > 1 and wordPrevPrev in _TIME_INDICATORS_EU:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -1023,10 +992,10 @@ def extract_datetime_eu(input_str, anchorDate=None, default_time=None):
         en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                           'aug',
                           'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
+        for month, en_month in zip(_MONTHS_EU, en_months):
+            datestr = datestr.replace(month, en_month)
+        for month, en_month in zip(_MONTHS_SHORT_EU, en_monthsShort):
+            datestr = datestr.replace(month, en_month)
 
         temp = datetime.strptime(datestr, "%B %d")
         temp = temp.replace(tzinfo=None)
@@ -14,12 +14,13 @@
 # limitations under the License.
 #
 import re
+from types import MappingProxyType
 from dateutil.tz import gettz
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
-from lingua_franca.lang.format_fr import pronounce_number_fr
+    extract_number_spans_generic, Normalizer, word_memo, \
+    extract_datetime_spans_generic
 from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
     _ORDINAL_ENDINGS_FR
 from lingua_franca.time import now_local
@@ -274,6 +275,7 @@ def _number_parse_fr(words, i):
     return number_1_999999_fr(i)
 
 
+@word_memo("fr")
 def _get_ordinal_fr(word):
     """ Get the ordinal number
     Takes in a word (string without whitespace) and
@@ -469,21 +471,79 @@ def extract_number_fr(text, short_scale=True, ordinals=False):
     return result or False
 
 
+# the vocabulary of extract_datetime_fr
+_TIME_QUALIFIERS_FR = frozenset(["matin", "après-midi", "soir", "nuit"])
+_WORDS_IN_FR = frozenset(["dans", "après"])
+_DATETIME_MARKERS_FR = frozenset(["à", "dès", "autour", "vers", "environs",
+                                  "ce", "cette"]) | _WORDS_IN_FR
+# {day: weekday}, lundi is 0
+_DAYS_FR = {day: weekday for weekday, day in enumerate(
+    ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi",
+     "dimanche"])}
+# {month: index}, janvier is 0
+_MONTHS_FR = {month: idx for idx, month in enumerate(
+    ["janvier", "février", "mars", "avril", "mai", "juin", "juillet", "août",
+     "septembre", "octobre", "novembre", "décembre"])}
+_MONTHS_SHORT_FR = {month: idx for idx, month in enumerate(
+    ["jan", "fév", "mar", "avr", "mai", "juin", "juil", "aoû", "sept", "oct",
+     "nov", "déc"])}
+# needed for format functions
+_MONTHS_EN_FR = ('january', 'february', 'march', 'april', 'may', 'june',
+                 'july', 'august', 'september', 'october', 'november',
+                 'december')
+# the words that may follow "après" and "depuis" in a date,
+# "5 jours après demain", "2 mois après juillet"
+_FROM_FOLLOWUPS_FR = frozenset(_DAYS_FR) | frozenset(_MONTHS_FR) | \
+    frozenset(_MONTHS_SHORT_FR) | \
+    frozenset(["aujourd'hui", "demain", "prochain", "prochaine", "suivant",
+               "suivante", "dernier", "dernière", "précédent", "précédente",
+               "maintenant"])
+
+
+def _datetime_words_fr(s):
+    """
+        cleans the input string of unneeded punctuation and capitalization
+        among other things.
+    """
+    s = normalize_fr(s, True)
+    wordList = s.split()
+    for idx, word in enumerate(wordList):
+        # remove comma and dot if it's not a number
+        if word[-1] in [",", "."]:
+            word = word[:-1]
+        wordList[idx] = word
+
+    return wordList
+
+
 def extract_datetime_fr(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        """
-            cleans the input string of unneeded punctuation and capitalization
-            among other things.
-        """
-        s = normalize_fr(s, True)
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            # remove comma and dot if it's not a number
-            if word[-1] in [",", "."]:
-                word = word[:-1]
-            wordList[idx] = word
+    if text == "":
+        return None
+    return _extract_datetime_words_fr(_datetime_words_fr(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_fr(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_fr, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_fr,
+                                          _extract_datetime_words_fr,
+                                          ["et", "à"], anchorDate,
+                                          default_time)
+
 
-        return wordList
+def _extract_datetime_words_fr(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_fr on the words of a text cleaned by
+    _datetime_words_fr, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -494,9 +554,6 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 hrOffset != 0 or minOffset != 0 or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -511,23 +568,6 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ["matin", "après-midi", "soir", "nuit"]
-    words_in = ["dans", "après"]
-    markers = ["à", "dès", "autour", "vers", "environs", "ce",
-               "cette"] + words_in
-    days = ["lundi", "mardi", "mercredi",
-            "jeudi", "vendredi", "samedi", "dimanche"]
-    months = ["janvier", "février", "mars", "avril", "mai", "juin",
-              "juillet", "août", "septembre", "octobre", "novembre",
-              "décembre"]
-    monthsShort = ["jan", "fév", "mar", "avr", "mai", "juin", "juil", "aoû",
-                   "sept", "oct", "nov", "déc"]
-    # needed for format functions
-    months_en = ['january', 'february', 'march', 'april', 'may', 'june',
-                 'july', 'august', 'september', 'october', 'november',
-                 'december']
-
-    words = clean_string(text)
 
     for idx, word in enumerate(words):
         if word == "":
@@ -541,7 +581,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_FR:
             timeQualifier = word
             used = 1
             if wordPrev in ["ce", "cet", "cette"]:
@@ -569,7 +609,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 start -= 1
                 used = 2
         elif word in ["semaine", "semaines"] and not fromFlag:
-            if wordPrev[0].isdigit():
+            if wordPrev and wordPrev[0].isdigit():
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
@@ -581,7 +621,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 used = 2
         # parse 10 mois, mois prochain, mois dernier
         elif word == "mois" and not fromFlag:
-            if wordPrev[0].isdigit():
+            if wordPrev and wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
@@ -593,7 +633,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 used = 2
         # parse 5 ans, an prochain, année dernière
         elif word in ["an", "ans", "année", "années"] and not fromFlag:
-            if wordPrev[0].isdigit():
+            if wordPrev and wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
@@ -605,8 +645,8 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 yearOffset = -1
                 used = 2
         # parse lundi, mardi etc., and lundi prochain, mardi dernier, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_FR and not fromFlag:
+            d = _DAYS_FR[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -618,13 +658,12 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 dayOffset -= 7
                 used += 1
         # parse 15 juillet, 15 juil
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTHS_FR or word in _MONTHS_SHORT_FR and not fromFlag:
+            m = _MONTHS_FR.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_FR[word]
             used += 1
-            datestr = months_en[m]
+            datestr = _MONTHS_EN_FR[m]
             if wordPrev and (wordPrev[0].isdigit()):
                 datestr += " " + wordPrev
                 start -= 1
@@ -639,25 +678,13 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                 hasYear = False
         # parse 5 jours après demain, 10 semaines après jeudi prochain,
         # 2 mois après juillet
-        validFollowups = days + months + monthsShort
-        validFollowups.append("aujourd'hui")
-        validFollowups.append("demain")
-        validFollowups.append("prochain")
-        validFollowups.append("prochaine")
-        validFollowups.append("suivant")
-        validFollowups.append("suivante")
-        validFollowups.append("dernier")
-        validFollowups.append("dernière")
-        validFollowups.append("précédent")
-        validFollowups.append("précédente")
-        validFollowups.append("maintenant")
-        if word in ["après", "depuis"] and wordNext in validFollowups:
+        if word in ["après", "depuis"] and wordNext in _FROM_FOLLOWUPS_FR:
             used = 2
             fromFlag = True
             if wordNext == "demain":
                 dayOffset += 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_FR:
+                d = _DAYS_FR[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if wordNextNext == "prochain":
@@ -677,7 +704,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_FR:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -738,7 +765,8 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                     used += 2
         # parse une demi-heure, un quart d'heure
         elif word == "demi-heure" or word == "heure" and \
-                (wordPrevPrev in markers or wordPrevPrevPrev in markers):
+                (wordPrevPrev in _DATETIME_MARKERS_FR or
+                 wordPrevPrevPrev in _DATETIME_MARKERS_FR):
             used = 1
             isTime = True
             if word == "demi-heure":
@@ -784,7 +812,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                                 i += 1
                     elif stage == 2:
                         break
-                if wordPrev in words_in:
+                if wordPrev in _WORDS_IN_FR:
                     hrOffset = int(strHH) if strHH else 0
                     minOffset = int(strMM) if strMM else 0
                 else:
@@ -803,7 +831,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                             int(word) > 2400
                         )):
                     # "dans 3 heures", "à 3 heures"
-                    if wordPrev in words_in:
+                    if wordPrev in _WORDS_IN_FR:
                         hrOffset = int(word)
                     else:
                         hrAbs = int(word)
@@ -813,7 +841,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                     if idxHr < len(words):
                         # "3 heures 45"
                         if words[idxHr].isdigit():
-                            if wordPrev in words_in:
+                            if wordPrev in _WORDS_IN_FR:
                                 minOffset = int(words[idxHr])
                             else:
                                 minAbs = int(words[idxHr])
@@ -822,14 +850,14 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                         # "3 heures et quart", "4 heures et demi"
                         elif words[idxHr] == "et" and idxHr + 1 < len(words):
                             if words[idxHr + 1] == "quart":
-                                if wordPrev in words_in:
+                                if wordPrev in _WORDS_IN_FR:
                                     minOffset = 15
                                 else:
                                     minAbs = 15
                                 used += 2
                                 idxHr += 2
                             elif words[idxHr + 1] == "demi":
-                                if wordPrev in words_in:
+                                if wordPrev in _WORDS_IN_FR:
                                     minOffset = 30
                                 else:
                                     minAbs = 30
@@ -839,7 +867,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                         elif words[idxHr] == "moins" and \
                                 idxHr + 1 < len(words):
                             if words[idxHr + 1].isdigit():
-                                if wordPrev in words_in:
+                                if wordPrev in _WORDS_IN_FR:
                                     hrOffset -= 1
                                     minOffset = 60 - int(words[idxHr + 1])
                                 else:
@@ -848,7 +876,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                                 used += 2
                                 idxHr += 2
                             elif words[idxHr + 1] == "quart":
-                                if wordPrev in words_in:
+                                if wordPrev in _WORDS_IN_FR:
                                     hrOffset -= 1
                                     minOffset = 45
                                 else:
@@ -863,7 +891,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
                             idxHr += 1
                 elif wordNext == "minutes":
                     # "dans 10 minutes"
-                    if wordPrev in words_in:
+                    if wordPrev in _WORDS_IN_FR:
                         minOffset = int(word)
                     else:
                         minAbs = int(word)
@@ -900,7 +928,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
             if (hrAbs or 0) > 24 or ((minAbs or 0) > 59):
                 isTime = False
                 used = 0
-            elif wordPrev in words_in:
+            elif wordPrev in _WORDS_IN_FR:
                 isTime = False
             else:
                 isTime = True
@@ -921,7 +949,7 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_FR:
                 words[start - 1] = ""
 
             idx += used - 1
@@ -997,6 +1025,17 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# {fraction word: denominator}, without the plural "s"
+_FRACTION_DENOMINATORS_FR = MappingProxyType({
+    "entier": 1, "demi": 2, "tiers": 3, "quart": 4, "cinquième": 5,
+    "sixième": 6, "septième": 7, "huitième": 8, "neuvième": 9,
+    "dixième": 10, "onzième": 11, "douzième": 12, "treizième": 13,
+    "quatorzième": 14, "quinzième": 15, "seizième": 16, "dix-septième": 17,
+    "dix-huitième": 18, "dix-neuvième": 19, "vingtième": 20,
+    "trentième": 30, "centième": 100, "millième": 1000})
+
+
+@word_memo("fr")
 def is_fractional_fr(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1011,21 +1050,10 @@ def is_fractional_fr(input_str, short_scale=True):
     if input_str != "tiers" and input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "quarts"
 
-    aFrac = ["entier", "demi", "tiers", "quart", "cinquième", "sixième",
-             "septième", "huitième", "neuvième", "dixième", "onzième",
-             "douzième", "treizième", "quatorzième", "quinzième", "seizième",
-             "dix-septième", "dix-huitième", "dix-neuvième", "vingtième"]
-
-    if input_str in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
-    if _get_ordinal_fr(input_str):
-        return 1.0 / _get_ordinal_fr(input_str)
-    if input_str == "trentième":
-        return 1.0 / 30
-    if input_str == "centième":
-        return 1.0 / 100
-    if input_str == "millième":
-        return 1.0 / 1000
+    denominator = _FRACTION_DENOMINATORS_FR.get(input_str) or \
+        _get_ordinal_fr(input_str)
+    if denominator:
+        return 1.0 / denominator
 
     return False
 
@@ -1067,6 +1095,45 @@ def normalize_fr(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
+def _number_span_fr(words, i, short_scale, ordinals):
+    """Number starting at words[i], see extract_number_spans_generic"""
+    if words[i] == "virgule" and i > 0:
+        # "ça fait virgule 2", a decimal without its integer part
+        zeros = i + 1
+        while zeros < len(words) and words[zeros] in ("zéro", "0"):
+            zeros += 1
+        if zeros < len(words) and words[zeros].isdigit():
+            return float("0.{}{}".format("0" * (zeros - i - 1),
+                                         words[zeros])), zeros + 1
+        return None
+    if i > 0 and words[i - 1] in _ARTICLES_FR:
+        # "le cinquième", "la 2e"
+        result = _number_ordinal_fr(words, i)
+        if result:
+            return _get_ordinal_fr(result[0]), result[1]
+    return _number_parse_fr(words, i)
+
+
+def _extract_number_spans_fr(text, short_scale=True, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with their spans.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: [(value, (start_idx, end_idx))] for each number in text
+    """
+    return extract_number_spans_generic(text, _number_span_fr,
+                                        is_fractional_fr,
+                                        fraction_markers=("et",),
+                                        decimal_markers=("virgule",),
+                                        zeros=("zéro", "0"),
+                                        short_scale=short_scale,
+                                        ordinals=ordinals)
+
+
 def extract_numbers_fr(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1081,8 +1148,8 @@ def extract_numbers_fr(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_fr, extract_number_fr,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _ in
+            _extract_number_spans_fr(text, short_scale, ordinals)]
 
 
 class FrenchNormalizer(Normalizer):
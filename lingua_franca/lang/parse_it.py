@@ -23,13 +23,14 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
-from lingua_franca.lang.format_it import _LONG_SCALE_IT, _SHORT_SCALE_IT, \
-    pronounce_number_it
+    extract_number_spans_generic, Normalizer, word_memo, \
+    extract_datetime_spans_generic
+from lingua_franca.lang.format_it import _LONG_SCALE_IT, _SHORT_SCALE_IT
 from lingua_franca.lang.common_data_it import _SHORT_ORDINAL_STRING_IT, \
     _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT
 
 
+@word_memo("it")
 def is_fractional_it(input_str, short_scale=False):
     """
     This function takes the given text and checks if it is a fraction.
@@ -440,53 +441,114 @@ def normalize_it(text, remove_articles=True):
     return normalized[1:]
 
 
+# the vocabulary of extract_datetime_it
+_TIME_QUALIFIERS_AM_IT = frozenset(['mattina', 'stamani', 'stamane'])
+_TIME_QUALIFIERS_PM_IT = frozenset(['pomeriggio', 'sera', 'stasera',
+                                    'stanotte'])
+_TIME_QUALIFIERS_IT = _TIME_QUALIFIERS_AM_IT | _TIME_QUALIFIERS_PM_IT
+_DATETIME_MARKERS_IT = frozenset(['alle', 'in', 'questo', 'per', 'di', 'tra',
+                                  'fra', 'entro'])
+# {day: weekday}, lunedi is 0
+_DAYS_IT = {day: weekday for weekday, day in enumerate(
+    ['lunedi', 'martedi', 'mercoledi', 'giovedi', 'venerdi', 'sabato',
+     'domenica'])}
+_MONTHS_IT = ('gennaio', 'febbraio', 'marzo', 'aprile', 'maggio', 'giugno',
+              'luglio', 'agosto', 'settembre', 'ottobre', 'novembre',
+              'dicembre')
+# {month: index in _MONTHS_IT}
+_MONTH_INDEXES_IT = {month: idx for idx, month in enumerate(_MONTHS_IT)}
+_MONTHS_SHORT_IT = {month: idx for idx, month in enumerate(
+    ['gen', 'feb', 'mar', 'apr', 'mag', 'giu', 'lug', 'ago', 'set', 'ott',
+     'nov', 'dic'])}
+# decennio <- decenni
+_YEAR_MULTIPLES_IT = frozenset(['decenni', 'secolo', 'millenni'])
+_TIME_MULTIPLES_IT = frozenset(['ora', 'minuto', 'secondo'])
+_DAY_MULTIPLES_IT = frozenset(['settimana', 'mese', 'anno'])
+_NOISE_WORDS_IT = frozenset(['tra', 'di', 'per', 'fra', 'un ', 'uno', 'lo',
+                             'del', 'l', 'in_punto', ' ', 'nella', 'dell'])
+# the words that may follow "da" and "dopo" in a date,
+# "5 giorni dopo domani", "2 mesi da luglio"
+_FROM_FOLLOWUPS_IT = frozenset(_DAYS_IT) | frozenset(_MONTH_INDEXES_IT) | \
+    frozenset(_MONTHS_SHORT_IT) | \
+    frozenset(['oggi', 'domani', 'prossimo', 'passato', 'adesso'])
+
+
+def _datetime_words_it(s):
+    """
+        cleans the input string of unneeded punctuation and capitalization
+        among other things.
+        Normalize italian plurals
+    """
+    symbols = ['.', ',', ';', '?', '!', 'º', 'ª', '°', 'l\'']
+
+    for word in symbols:
+        s = s.replace(word, '')
+
+    s = s.lower().replace('á', 'a').replace('à', 'a').replace('è', "e'") \
+        .replace('é', "e'").replace('ì', 'i').replace('ù', 'u') \
+        .replace('ò', 'o').replace('-', ' ').replace('_', '')
+
+    # normalizza plurali per semplificare analisi
+    s = s.replace('secondi', 'secondo').replace('minuti', 'minuto') \
+        .replace('ore', 'ora').replace('giorni', 'giorno') \
+        .replace('settimane', 'settimana').replace('mesi', 'mese') \
+        .replace('anni', 'anno').replace('mattino', 'mattina') \
+        .replace('prossima', 'prossimo').replace('questa', 'questo') \
+        .replace('quarti', 'quarto').replace('in punto', 'in_punto') \
+        .replace('decennio', 'decenni').replace('secoli', 'secolo') \
+        .replace('millennio', 'millenni').replace(' un ', ' uno ') \
+        .replace('scorsa', 'scorso').replace('passata', 'passato') \
+        .replace('uno paio', 'due')
+
+    noise_words = ['dello', 'la', 'del', 'al', 'il', 'di', 'tra', 'lo',
+                   'le', 'alle', 'alla', 'dai', 'delle', 'della',
+                   'a', 'e\'', 'era', 'questa', 'questo', 'e', 'nel',
+                   'nello', 'dallo', '  ']
+
+    word_list = s.split()
+    word_list = [x for x in word_list if x not in noise_words]
+    # normalizza alcuni formati orari
+    for idx in range(0, len(word_list) - 1):
+        if word_list[idx][0].isdigit() and word_list[idx + 1][0].isdigit():
+            num0 = int(word_list[idx])
+            num1 = int(word_list[idx + 1])
+            if 0 <= num0 <= 23 and 10 <= num1 <= 59:
+                word_list[idx] = str(num0) + ':' + str(num1)
+                word_list[idx + 1] = ''
+
+    word_list = [x for x in word_list if x]
+
+    return word_list
+
+
 def extract_datetime_it(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        """
-            cleans the input string of unneeded punctuation and capitalization
-            among other things.
-            Normalize italian plurals
-        """
-        symbols = ['.', ',', ';', '?', '!', 'º', 'ª', '°', 'l\'']
-
-        for word in symbols:
-            s = s.replace(word, '')
-
-        s = s.lower().replace('á', 'a').replace('à', 'a').replace('è', "e'") \
-            .replace('é', "e'").replace('ì', 'i').replace('ù', 'u') \
-            .replace('ò', 'o').replace('-', ' ').replace('_', '')
-
-        # normalizza plurali per semplificare analisi
-        s = s.replace('secondi', 'secondo').replace('minuti', 'minuto') \
-            .replace('ore', 'ora').replace('giorni', 'giorno') \
-            .replace('settimane', 'settimana').replace('mesi', 'mese') \
-            .replace('anni', 'anno').replace('mattino', 'mattina') \
-            .replace('prossima', 'prossimo').replace('questa', 'questo') \
-            .replace('quarti', 'quarto').replace('in punto', 'in_punto') \
-            .replace('decennio', 'decenni').replace('secoli', 'secolo') \
-            .replace('millennio', 'millenni').replace(' un ', ' uno ') \
-            .replace('scorsa', 'scorso').replace('passata', 'passato') \
-            .replace('uno paio', 'due')
-
-        noise_words = ['dello', 'la', 'del', 'al', 'il', 'di', 'tra', 'lo',
-                       'le', 'alle', 'alla', 'dai', 'delle', 'della',
-                       'a', 'e\'', 'era', 'questa', 'questo', 'e', 'nel',
-                       'nello', 'dallo', '  ']
-
-        word_list = s.split()
-        word_list = [x for x in word_list if x not in noise_words]
-        # normalizza alcuni formati orari
-        for idx in range(0, len(word_list) - 1):
-            if word_list[idx][0].isdigit() and word_list[idx + 1][0].isdigit():
-                num0 = int(word_list[idx])
-                num1 = int(word_list[idx + 1])
-                if 0 <= num0 <= 23 and 10 <= num1 <= 59:
-                    word_list[idx] = str(num0) + ':' + str(num1)
-                    word_list[idx + 1] = ''
-
-        word_list = [x for x in word_list if x]
-
-        return word_list
+    if text == "":
+        return None
+    return _extract_datetime_words_it(_datetime_words_it(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_it(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_it, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_it,
+                                          _extract_datetime_words_it,
+                                          (), anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_it(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_it on the words of a text cleaned by
+    _datetime_words_it, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -494,8 +556,6 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                 month_offset != 0 or day_offset is True or hr_offset != 0 or
                 hr_abs or min_offset != 0 or min_abs or sec_offset != 0)
 
-    if text == '':
-        return None
     anchorDate = anchorDate or now_local()
     found = False
     day_specified = False
@@ -508,24 +568,6 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
     datestr = ''
     has_year = False
     time_qualifier = ''
-    time_qualifiers_am = ['mattina', 'stamani', 'stamane']
-    time_qualifiers_pm = ['pomeriggio', 'sera', 'stasera', 'stanotte']
-    time_qualifiers_list = set(time_qualifiers_am + time_qualifiers_pm)
-    markers = ['alle', 'in', 'questo', 'per', 'di', 'tra', 'fra', 'entro']
-    days = ['lunedi', 'martedi', 'mercoledi',
-            'giovedi', 'venerdi', 'sabato', 'domenica']
-    months = ['gennaio', 'febbraio', 'marzo', 'aprile', 'maggio', 'giugno',
-              'luglio', 'agosto', 'settembre', 'ottobre', 'novembre',
-              'dicembre']
-    months_short = ['gen', 'feb', 'mar', 'apr', 'mag', 'giu', 'lug', 'ago',
-                    'set', 'ott', 'nov', 'dic']
-    year_multiples = ['decenni', 'secolo', 'millenni']  # decennio <- decenni
-    time_multiples = ['ora', 'minuto', 'secondo']
-    day_multiples = ['settimana', 'mese', 'anno']
-    noise_words_2 = ['tra', 'di', 'per', 'fra', 'un ', 'uno', 'lo', 'del',
-                     'l', 'in_punto', ' ', 'nella', 'dell']
-
-    words = clean_string(text)
 
     for idx, word in enumerate(words):
         if word == '':
@@ -539,6 +581,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
         # save timequalifier for later
         if word == 'adesso' and not datestr:
             # word == 'ora' va in conflitto con 'tra un ora'
+            words[idx] = ''
             words = [x for x in words if x != 'adesso']
             words = [x for x in words if x]
             result_str = ' '.join(words)
@@ -546,8 +589,8 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
             return [extracted_date, result_str]
 
         # un paio di  o  tra tre settimane --> secoli
-        elif extract_number_it(word) and (word_next in year_multiples or
-                                          word_next in day_multiples):
+        elif extract_number_it(word) and (word_next in _YEAR_MULTIPLES_IT or
+                                          word_next in _DAY_MULTIPLES_IT):
             multiplier = int(extract_number_it(word))
             used += 2
             if word_next == 'decenni':
@@ -562,7 +605,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                 month_offset = multiplier
             elif word_next == 'settimana':
                 day_offset = multiplier * 7
-        elif word in time_qualifiers_list:
+        elif word in _TIME_QUALIFIERS_IT:
             time_qualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == 'oggi' and not from_flag:
@@ -652,8 +695,8 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not from_flag:
-            ddd = days.index(word)
+        elif word in _DAYS_IT and not from_flag:
+            ddd = _DAYS_IT[word]
             day_offset = (ddd + 1) - int(today)
             used = 1
             if day_offset < 0:
@@ -673,13 +716,13 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                 day_offset -= 7
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in months_short and not from_flag:
-            try:
-                mmm = months.index(word)
-            except ValueError:
-                mmm = months_short.index(word)
+        elif word in _MONTH_INDEXES_IT or \
+                word in _MONTHS_SHORT_IT and not from_flag:
+            mmm = _MONTH_INDEXES_IT.get(word)
+            if mmm is None:
+                mmm = _MONTHS_SHORT_IT[word]
             used += 1
-            datestr = months[mmm]
+            datestr = _MONTHS_IT[mmm]
             if word_prev and extract_number_it(word_prev):
                 datestr += ' ' + str(int(extract_number_it(word_prev)))
                 start -= 1
@@ -701,14 +744,9 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                     has_year = False
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + months_short
-        validFollowups.append('oggi')
-        validFollowups.append('domani')
-        validFollowups.append('prossimo')
-        validFollowups.append('passato')
-        validFollowups.append('adesso')
-
-        if (word == 'da' or word == 'dopo') and word_next in validFollowups:
+
+        if (word == 'da' or word == 'dopo') and \
+                word_next in _FROM_FOLLOWUPS_IT:
             used = 0
             from_flag = True
             if word_next == 'domani':
@@ -716,8 +754,8 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                 used += 2
             elif word_next == 'oggi' or word_next == 'adesso':
                 used += 2
-            elif word_next in days:
-                ddd = days.index(word_next)
+            elif word_next in _DAYS_IT:
+                ddd = _DAYS_IT[word_next]
                 tmp_offset = (ddd + 1) - int(today)
                 used += 2
                 if tmp_offset < 0:
@@ -729,8 +767,8 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                     tmp_offset = (ddd + 1) - int(today)
                     used += 1
                 day_offset += tmp_offset
-            elif word_next_next and word_next_next in days:
-                ddd = days.index(word_next_next)
+            elif word_next_next and word_next_next in _DAYS_IT:
+                ddd = _DAYS_IT[word_next_next]
                 tmp_offset = (ddd + 1) - int(today)
                 if word_next == 'prossimo':
                     tmp_offset += 7
@@ -747,7 +785,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ''
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_IT:
                 words[start - 1] = ''
             found = True
             day_specified = True
@@ -816,7 +854,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
             hr_abs += 1
             used += 1
         # un paio di minuti  tra cinque minuti tra 5 ore
-        elif extract_number_it(word) and (word_next in time_multiples):
+        elif extract_number_it(word) and (word_next in _TIME_MULTIPLES_IT):
             d_time = int(extract_number_it(word))
             used += 2
             if word_next == 'ora':
@@ -974,7 +1012,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
             if time_qualifier != '':
                 # military = True
                 if str_hh and int(str_hh) <= 12 and \
-                        (time_qualifier in time_qualifiers_pm):
+                        (time_qualifier in _TIME_QUALIFIERS_PM_IT):
                     str_hh = str(int(str_hh) + 12)
             else:
                 isTime = False
@@ -1002,7 +1040,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
                     # has passed, assume the next morning
                     day_offset += 1
 
-            if time_qualifier in time_qualifiers_pm and str_hh < 12:
+            if time_qualifier in _TIME_QUALIFIERS_PM_IT and str_hh < 12:
                 str_hh += 12
 
             if str_hh > 24 or str_mm > 59:
@@ -1025,9 +1063,9 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
             if word_prev == 'o' or word_prev == 'oh':
                 words[words.index(word_prev)] = ''
 
-            if idx > 0 and word_prev in markers:
+            if idx > 0 and word_prev in _DATETIME_MARKERS_IT:
                 words[idx - 1] = ''
-            if idx > 1 and word_prev_prev in markers:
+            if idx > 1 and word_prev_prev in _DATETIME_MARKERS_IT:
                 words[idx - 2] = ''
 
             idx += used - 1
@@ -1051,11 +1089,11 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
         en_months_short = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                            'aug', 'sept', 'oct', 'nov', 'dec']
 
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
+        for month, en_month in zip(_MONTHS_IT, en_months):
+            datestr = datestr.replace(month, en_month)
 
-        for idx, en_month in enumerate(en_months_short):
-            datestr = datestr.replace(months_short[idx], en_month)
+        for month, en_month in zip(_MONTHS_SHORT_IT, en_months_short):
+            datestr = datestr.replace(month, en_month)
 
         try:
             temp = datetime.strptime(datestr, '%B %d')
@@ -1116,7 +1154,7 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
     if sec_offset != 0:
         extracted_date = extracted_date + relativedelta(seconds=sec_offset)
 
-    words = [x for x in words if x not in noise_words_2]
+    words = [x for x in words if x not in _NOISE_WORDS_IT]
     words = [x for x in words if x]
     result_str = ' '.join(words)
 
@@ -1148,6 +1186,103 @@ def get_gender_it(word, context=""):
     return gender
 
 
+def _build_number_words_it(short_scale, ordinals):
+    """Number words and multiplier words, as used by extract_number_it"""
+    numbers = dict(_STRING_NUM_IT)
+    if ordinals:
+        numbers.update((word, num) for num, word in
+                       (_SHORT_ORDINAL_STRING_IT if short_scale
+                        else _LONG_ORDINAL_STRING_IT).items())
+    multiplies = {'decina', 'decine', 'dozzina', 'dozzine', 'centinaia',
+                  'centinaio', 'migliaia', 'migliaio', 'mila', 'paio',
+                  'milione', 'miliardo'}
+    for num, word in (_SHORT_SCALE_IT if short_scale
+                      else _LONG_SCALE_IT).items():
+        if num != float("inf"):
+            numbers[word] = int(num)
+            multiplies.add(word)
+    return numbers, frozenset(multiplies)
+
+
+_NUMBER_WORDS_IT = {(short_scale, ordinals):
+                    _build_number_words_it(short_scale, ordinals)
+                    for short_scale in (True, False)
+                    for ordinals in (True, False)}
+
+
+def _number_span_it(words, i, short_scale, ordinals):
+    """Number starting at words[i], see extract_number_spans_generic"""
+    numbers, multiplies = _NUMBER_WORDS_IT[bool(short_scale), bool(ordinals)]
+
+    def word_value(i):
+        if i >= len(words):
+            return False
+        word = words[i]
+        if word in numbers:
+            return numbers[word]
+        if is_numeric(word):
+            return int(word) if word.isdigit() else float(word)
+        return _extract_number_long_it(word)
+
+    def number(i):
+        value = word_value(i)
+        if value is False:
+            return None
+        # sei miliardi, due centinaia, un paio di migliaia
+        scale = value
+        i += 1
+        while i < len(words) and words[i] in multiplies:
+            if words[i] == 'paio' and i + 2 < len(words) and \
+                    words[i + 1] == 'di' and words[i + 2] in multiplies:
+                value *= numbers['paio']
+                i += 2
+            scale = numbers[words[i]]
+            value *= scale
+            i += 1
+        # duecento venti, tre milioni cinquecentomila
+        if value >= 100 and isinstance(value, int):
+            rest = number(i)
+            if rest and isinstance(rest[0], int) and 0 < rest[0] < scale:
+                return value + rest[0], rest[1]
+        return value, i
+
+    if words[i] == 'meno':
+        # meno due
+        result = number(i + 1) if i + 1 < len(words) else None
+        if result:
+            return -result[0], result[1]
+        return None
+    return number(i)
+
+
+def _extract_number_spans_it(text, short_scale=False, ordinals=False):
+    """
+        Takes in a string and extracts a list of numbers, with their spans.
+
+    Args:
+        text (str): the string to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+    Returns:
+        list: [(value, (start_idx, end_idx))] for each number in text
+    """
+    numbers = _NUMBER_WORDS_IT[bool(short_scale), bool(ordinals)][0]
+
+    def fractional(word):
+        if ordinals and word in numbers:
+            return False
+        return is_fractional_it(word, short_scale=short_scale)
+
+    return extract_number_spans_generic(text, _number_span_it, fractional,
+                                        fraction_markers=("e",),
+                                        # sette e quaranta
+                                        decimal_markers=("punto", "virgola",
+                                                         "e"),
+                                        zeros=("zero", "0"),
+                                        short_scale=short_scale,
+                                        ordinals=ordinals)
+
+
 def extract_numbers_it(text, short_scale=False, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1162,9 +1297,8 @@ def extract_numbers_it(text, short_scale=False, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    return extract_numbers_generic(text, pronounce_number_it,
-                                   extract_number_it,
-                                   short_scale=short_scale, ordinals=ordinals)
+    return [number for number, _ in
+            _extract_number_spans_it(text, short_scale, ordinals)]
 
 
 class ItalianNormalizer(Normalizer):
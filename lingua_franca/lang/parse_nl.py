@@ -17,8 +17,9 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from .parse_common import is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict
+from .parse_common import is_numeric, \
+    Normalizer, invert_dict, NumberLexer, NumberParser, word_memo, \
+    compile_substitutions, extract_datetime_spans_generic
 from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
     _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, _LONG_ORDINAL_STRING_NL,\
     _LONG_SCALE_NL, _MULTIPLIES_LONG_SCALE_NL, _MULTIPLIES_SHORT_SCALE_NL,\
@@ -26,372 +27,32 @@ from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
     _STRING_SHORT_ORDINAL_NL, _SUMS_NL
 from lingua_franca.time import now_local
 import re
+from types import MappingProxyType
 
 
-def _convert_words_to_numbers_nl(text, short_scale=True, ordinals=False):
-    """Convert words in a string into their equivalent numbers.
-    Args:
-        text str:
-        short_scale boolean: True if short scale numbers should be used.
-        ordinals boolean: True if ordinals (e.g. first, second, third) should
-                          be parsed to their number values (1, 2, 3...)
-
-    Returns:
-        str
-        The original text, with numbers subbed in where appropriate.
-    """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_nl(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
-
-
-def _extract_numbers_with_text_nl(tokens, short_scale=True,
-                                  ordinals=False, fractional_numbers=True):
-    """Extract all numbers from a list of _Tokens, with the representing words.
-
-    Args:
-        [Token]: The tokens to parse.
-        short_scale bool: True if short scale numbers should be used, False for
-                          long scale. True by default.
-        ordinals bool: True if ordinal words (first, second, third, etc) should
-                       be parsed.
-        fractional_numbers bool: True if we should look for fractions and
-                                 decimals.
-
-    Returns:
-        [_ReplaceableNumber]: A list of tuples, each containing a number and a
-                         string.
-    """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_nl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
-
-
-def _extract_number_with_text_nl(tokens, short_scale=True,
-                                 ordinals=False, fractional_numbers=True):
-    """This function extracts a number from a list of _Tokens.
-
-    Args:
-        tokens str: the string to normalize
-        short_scale (bool): use short scale if True, long scale if False
-        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
-        fractional_numbers (bool): True if we should look for fractions and
-                                   decimals.
-    Returns:
-        _ReplaceableNumber
-    """
-    number, tokens = \
-        _extract_number_with_text_nl_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    while tokens and tokens[0].word in _ARTICLES_NL:
-        tokens.pop(0)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_nl_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """Helper for _extract_number_with_text_nl.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [_Tokens]
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_nl(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_nl(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_nl(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_nl(tokens, short_scale, ordinals):
-    """Extract fraction numbers from a string.
-
-    This function handles text such as '2 and 3/4'. Note that "one half" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-    """
-    for c in _FRACTION_MARKER_NL:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_nl(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_nl(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                    num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_nl(tokens, short_scale, ordinals):
-    """Extract decimal numbers from a string.
-
-    This function handles text such as '2 point 5'.
-
-    Notes:
-        While this is a helper for extractnumber_nl, it also depends on
-        extractnumber_nl, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-    """
-    for c in _DECIMAL_MARKER_NL:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_nl(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_nl(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                return number.value + float('0.' + str(decimal.value)), \
-                    number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_nl(tokens, short_scale, ordinals):
-    """Handle numbers not handled by the decimal or fraction functions.
-
-    This is generally whole numbers. Note that phrases such as "one half" will
-    be handled by this function, while "one and a half" are handled by the
-    fraction function.
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        int or float, [_Tokens]
-        The value parsed, and tokens that it corresponds to.
-    """
-    multiplies, string_num_ordinal, string_num_scale = \
-        _initialize_number_data_nl(short_scale)
-
-    number_words = []  # type: [Token]
-    val = False
-    prev_val = None
-    next_val = None
-    to_sum = []
-    for idx, token in enumerate(tokens):
-        current_val = None
-        if next_val:
-            next_val = None
-            continue
-
-        word = token.word
-        if word in _ARTICLES_NL or word in _NEGATIVES_NL:
-            number_words.append(token)
-            continue
-
-        prev_word = tokens[idx - 1].word if idx > 0 else ""
-        next_word = tokens[idx + 1].word if idx + 1 < len(tokens) else ""
-
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_NL and \
-                word not in _SUMS_NL and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not is_fractional_nl(word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
-            if number_words and not all([w in _ARTICLES_NL |
-                                         _NEGATIVES_NL for w in words_only]):
-                break
-            else:
-                number_words = []
-                continue
-        elif word not in multiplies \
-                and prev_word not in multiplies \
-                and prev_word not in _SUMS_NL \
-                and not (ordinals and prev_word in string_num_ordinal) \
-                and prev_word not in _NEGATIVES_NL \
-                and prev_word not in _ARTICLES_NL:
-            number_words = [token]
-        elif prev_word in _SUMS_NL and word in _SUMS_NL:
-            number_words = [token]
-        else:
-            number_words.append(token)
+def _build_number_data_nl(short_scale):
+    """Build the dictionaries returned by _initialize_number_data_nl"""
+    multiplies = _MULTIPLIES_SHORT_SCALE_NL if short_scale \
+        else _MULTIPLIES_LONG_SCALE_NL
 
-        # is this word already a number ?
-        if is_numeric(word):
-            if word.isdigit():            # doesn't work with decimals
-                val = int(word)
-            else:
-                val = float(word)
-            current_val = val
-
-        # is this word the name of a number ?
-        if word in _STRING_NUM_NL:
-            val = _STRING_NUM_NL.get(word)
-            current_val = val
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
-            current_val = val
-
-        # is the prev word an ordinal number and current word is one?
-        # second one, third one
-        if ordinals and prev_word in string_num_ordinal and val == 1:
-            val = prev_val
-
-        # is the prev word a number and should we sum it?
-        # twenty two, fifty six
-        if prev_word in _SUMS_NL and val and val < 10:
-            val = prev_val + val
-
-        # is the prev word a number and should we multiply it?
-        # twenty hundred, six hundred
-        if word in multiplies:
-            if not prev_val:
-                prev_val = 1
-            val = prev_val * val
-
-        # is this a spoken fraction?
-        # half cup
-        if val is False:
-            val = is_fractional_nl(word, short_scale=short_scale)
-            current_val = val
-
-        # 2 fifths
-        if not ordinals:
-            next_val = is_fractional_nl(next_word, short_scale=short_scale)
-            if next_val:
-                if not val:
-                    val = 1
-                val = val * next_val
-                number_words.append(tokens[idx + 1])
-
-        # is this a negative number?
-        if val and prev_word and prev_word in _NEGATIVES_NL:
-            val = 0 - val
-
-        # let's make sure it isn't a fraction
-        if not val:
-            # look for fractions like "2/3"
-            aPieces = word.split('/')
-            if look_for_fractions(aPieces):
-                val = float(aPieces[0]) / float(aPieces[1])
-                current_val = val
+    string_num_ordinal_nl = _STRING_SHORT_ORDINAL_NL if short_scale \
+        else _STRING_LONG_ORDINAL_NL
 
-        else:
-            if prev_word in _SUMS_NL and word not in _SUMS_NL and current_val >= 10:
-                # Backtrack - we've got numbers we can't sum.
-                number_words.pop()
-                val = prev_val
-                break
-            prev_val = val
+    string_num_scale_nl = _SHORT_SCALE_NL if short_scale else _LONG_SCALE_NL
+    string_num_scale_nl = invert_dict(string_num_scale_nl)
 
-            # handle long numbers
-            # six hundred sixty six
-            # two million five hundred thousand
-            if word in multiplies and next_word not in multiplies:
-                to_sum.append(val)
-                val = 0
-                prev_val = 0
+    return (frozenset(multiplies),
+            MappingProxyType(dict(string_num_ordinal_nl)),
+            MappingProxyType(string_num_scale_nl))
 
-    if val is not None and to_sum:
-        val += sum(to_sum)
 
-    return val, number_words
+# {short_scale: (multiplies, string_num_ordinal, string_num_scale)}
+_NUMBER_DATA_NL = {short_scale: _build_number_data_nl(short_scale)
+                   for short_scale in (True, False)}
 
 
 def _initialize_number_data_nl(short_scale):
-    """Generate dictionaries of words to numbers, based on scale.
+    """Get the dictionaries of words to numbers, based on scale.
 
     This is a helper function for _extract_whole_number.
 
@@ -399,19 +60,10 @@ def _initialize_number_data_nl(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), Mapping(str, number), Mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_NL if short_scale \
-        else _MULTIPLIES_LONG_SCALE_NL
-
-    string_num_ordinal_nl = _STRING_SHORT_ORDINAL_NL if short_scale \
-        else _STRING_LONG_ORDINAL_NL
-
-    string_num_scale_nl = _SHORT_SCALE_NL if short_scale else _LONG_SCALE_NL
-    string_num_scale_nl = invert_dict(string_num_scale_nl)
-
-    return multiplies, string_num_ordinal_nl, string_num_scale_nl
+    return _NUMBER_DATA_NL[bool(short_scale)]
 
 
 def extract_number_nl(text, short_scale=True, ordinals=False):
@@ -429,8 +81,8 @@ def extract_number_nl(text, short_scale=True, ordinals=False):
         (int) or (float) or False: The extracted number or False if no number
                                    was found
     """
-    return _extract_number_with_text_nl(tokenize(text.lower()),
-                                        short_scale, ordinals).value
+    return _NUMBER_PARSER_NL.extract_number(text.lower(), short_scale,
+                                            ordinals)
 
 
 def extract_duration_nl(text):
@@ -482,7 +134,7 @@ def extract_duration_nl(text):
     }
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
-    text = _convert_words_to_numbers_nl(text)
+    text = _NUMBER_PARSER_NL.convert_words_to_numbers(text)
 
     for unit in time_units:
         unit_nl_words = nl_translations[unit]
@@ -500,6 +152,57 @@ def extract_duration_nl(text):
     return (duration, text)
 
 
+# the vocabulary of extract_datetime_nl
+_TIME_QUALIFIERS_AM_NL = frozenset(['ochtend'])
+_TIME_QUALIFIERS_PM_NL = frozenset(['middag', 'avond', 'nacht'])
+_TIME_QUALIFIERS_NL = _TIME_QUALIFIERS_AM_NL | _TIME_QUALIFIERS_PM_NL
+_DATETIME_MARKERS_NL = frozenset(['op', 'in', 'om', 'tegen', 'over', 'deze',
+                                  'rond', 'voor', 'van', "binnen"])
+# {day: weekday}, maandag is 0
+_DAYS_NL = {day: weekday for weekday, day in enumerate(
+    ["maandag", "dinsdag", "woensdag", "donderdag", "vrijdag", "zaterdag",
+     "zondag"])}
+# {day and part of the day, "maandagochtend": index}
+_DAY_PARTS_NL = {day + part: idx for idx, (day, part) in enumerate(
+    (day, part) for day in _DAYS_NL
+    for part in ['ochtend', 'middag', 'avond', 'nacht'])}
+_MONTHS_NL = ('januari', 'februari', 'maart', 'april', 'mei', 'juni', 'juli',
+              'augustus', 'september', 'oktober', 'november', 'december')
+# {month: index in _MONTHS_NL}
+_MONTH_INDEXES_NL = {month: idx for idx, month in enumerate(_MONTHS_NL)}
+_MONTHS_SHORT_NL = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug', 'sep', 'okt',
+     'nov', 'dec'])}
+_RECUR_MARKERS_NL = frozenset(list(_DAYS_NL) + [d + 'en' for d in _DAYS_NL] +
+                              ['weekeinde', 'werkdag', 'weekeinden',
+                               'werkdagen'])
+_YEAR_MULTIPLES_NL = frozenset(["decennium", "eeuw", "millennium"])
+_DAY_MULTIPLES_NL = frozenset(["dagen", "weken", "maanden", "jaren"])
+# the words that may follow "van" and "na" in a date,
+# "5 dagen na morgen", "2 maanden van juli"
+_FROM_FOLLOWUPS_NL = frozenset(_DAYS_NL) | frozenset(_MONTH_INDEXES_NL) | \
+    frozenset(_MONTHS_SHORT_NL) | \
+    frozenset(["vandaag", "morgen", "volgende", "vorige", "nu"])
+# the cleaning step of extract_datetime_nl
+_DATETIME_SUBSTITUTIONS_NL = compile_substitutions(
+    {"paar": "2", "eeuwen": "eeuw", "decennia": "decennium",
+     "millennia": "millennium"},
+    words={"de": "", "het": ""}, delete="?.,")
+_ORDINAL_SUFFIXES_NL = compile_substitutions({"ste": "", "de": ""})
+
+
+def _datetime_words_nl(s):
+    """The words of s, cleaned for extract_datetime_nl"""
+    # clean unneeded punctuation and capitalization among other things.
+    wordList = _DATETIME_SUBSTITUTIONS_NL(s.lower()).split()
+    for idx, word in enumerate(wordList):
+        # "second" is the only case we should not do this
+        if word[0].isdigit() and "second" not in word:
+            wordList[idx] = _ORDINAL_SUFFIXES_NL(word)
+
+    return wordList
+
+
 def extract_datetime_nl(text, anchorDate=None, default_time=None):
     """Convert a human date reference into an exact datetime
 
@@ -530,26 +233,32 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return _extract_datetime_words_nl(_datetime_words_nl(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_nl(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_nl, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_nl,
+                                          _extract_datetime_words_nl,
+                                          ["en"], anchorDate, default_time)
+
 
-    def clean_string(s):
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace(' de ', ' ').replace(' het ', ' ').replace(' het ', ' ') \
-            .replace("paar", "2").replace("eeuwen", "eeuw") \
-            .replace("decennia", "decennium") \
-            .replace("millennia", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            ordinals = ["ste", "de"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
+def _extract_datetime_words_nl(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_nl on the words of a text cleaned by
+    _datetime_words_nl, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -561,9 +270,6 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -577,27 +283,6 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['ochtend']
-    timeQualifiersPM = ['middag', 'avond', 'nacht']
-    timeQualifiersList = timeQualifiersAM + timeQualifiersPM
-    timeQualifierOffsets = [8, 15, 19, 0]
-    markers = ['op', 'in', 'om', 'tegen', 'over',
-               'deze', 'rond', 'voor', 'van', "binnen"]
-    days = ["maandag", "dinsdag", "woensdag", "donderdag", "vrijdag",
-            "zaterdag", "zondag"]
-    day_parts = [a + b for a in days for b in timeQualifiersList]
-    months = ['januari', 'februari', 'maart', 'april', 'mei', 'juni',
-              'juli', 'augustus', 'september', 'oktober', 'november',
-              'december']
-    recur_markers = days + [d+'en' for d in days] + ['weekeinde', 'werkdag',
-                                                     'weekeinden', 'werkdagen']
-    months_short = ['jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug',
-                    'sep', 'okt', 'nov', 'dec']
-    year_multiples = ["decennium", "eeuw", "millennium"]
-    day_multiples = ["dagen", "weken", "maanden", "jaren"]
-
-    words = clean_string(text)
-
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -611,11 +296,12 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
         # save timequalifier for later
 
         if word == "nu" and not datestr:
+            words[idx] = ""
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
             extractedDate = anchorDate.replace(microsecond=0)
             return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+        elif wordNext in _YEAR_MULTIPLES_NL:
             multiplier = None
             if is_numeric(word):
                 multiplier = extract_number_nl(word)
@@ -630,7 +316,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 yearOffset = multiplier * 1000
         # paar
         elif word == "2" and \
-                wordNextNext in year_multiples:
+                wordNextNext in _YEAR_MULTIPLES_NL:
             multiplier = 2
             used += 2
             if wordNextNext == "decennia":
@@ -640,7 +326,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
             elif wordNextNext == "millennia":
                 yearOffset = multiplier * 1000
         elif word == "2" and \
-                wordNextNext in day_multiples:
+                wordNextNext in _DAY_MULTIPLES_NL:
             multiplier = 2
             used += 2
             if wordNextNext == "jaren":
@@ -649,7 +335,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 monthOffset = multiplier
             elif wordNextNext == "weken":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_NL:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "vandaag" and not fromFlag:
@@ -710,8 +396,8 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_NL and not fromFlag:
+            d = _DAYS_NL[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -725,19 +411,19 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 dayOffset -= 7
                 used += 1
                 start -= 1
-        elif word in day_parts and not fromFlag:
-            d = day_parts.index(word) / len(timeQualifiersList)
+        elif word in _DAY_PARTS_NL and not fromFlag:
+            d = _DAY_PARTS_NL[word] / len(_TIME_QUALIFIERS_NL)
             dayOffset = (d + 1) - int(today)
             if dayOffset < 0:
                 dayOffset += 7
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in months_short and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = months_short.index(word)
+        elif word in _MONTH_INDEXES_NL or \
+                word in _MONTHS_SHORT_NL and not fromFlag:
+            m = _MONTH_INDEXES_NL.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_NL[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_NL[m]
             if wordPrev and \
                     (wordPrev[0].isdigit() or (wordPrev == "van" and
                                                wordPrevPrev[0].isdigit())):
@@ -768,28 +454,23 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + months_short
-        validFollowups.append("vandaag")
-        validFollowups.append("morgen")
-        validFollowups.append("volgende")
-        validFollowups.append("vorige")
-        validFollowups.append("nu")
-        if (word == "van" or word == "na") and wordNext in validFollowups:
+        if (word == "van" or word == "na") and \
+                wordNext in _FROM_FOLLOWUPS_NL:
             used = 2
             fromFlag = True
             if wordNext == "morgen":
                 dayOffset += 1
             elif wordNext == "overmorgen":
                 dayOffset += 2
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_NL:
+                d = _DAYS_NL[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_NL:
+                d = _DAYS_NL[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext == "volgende":
@@ -810,7 +491,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_NL:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -867,14 +548,15 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 secOffset = 2
         # parse half an hour, quarter hour
         elif word == "uur" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _DATETIME_MARKERS_NL or
+                 wordPrevPrev in _DATETIME_MARKERS_NL):
             if wordPrev == "half":
                 minOffset = 30
             elif wordPrev == "kwartier":
                 minOffset = 15
             elif wordPrevPrev == "kwartier":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in markers:
+                if idx > 2 and words[idx - 3] in _DATETIME_MARKERS_NL:
                     words[idx - 3] = ""
                     if words[idx - 3] == "deze":
                         daySpecified = True
@@ -883,7 +565,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 hrOffset = 1
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_NL:
                 words[idx - 2] = ""
                 if wordPrevPrev == "deze":
                     daySpecified = True
@@ -993,7 +675,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _TIME_QUALIFIERS_PM_NL):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1027,9 +709,9 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_NL or
+                        wordNext in _RECUR_MARKERS_NL or
+                        wordNextNext in _RECUR_MARKERS_NL):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1108,21 +790,23 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                if (wordNextNext in _TIME_QUALIFIERS_PM_NL or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_PM_NL):
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if (wordNextNext in _TIME_QUALIFIERS_AM_NL or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_AM_NL):
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _TIME_QUALIFIERS_PM_NL:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _TIME_QUALIFIERS_AM_NL:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1152,7 +836,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                     # has passed, assume the next morning
                     dayOffset += 1
 
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_NL and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1178,11 +862,11 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_NL:
                 words[idx - 1] = ""
                 if wordPrev == "deze":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_NL:
                 words[idx - 2] = ""
                 if wordPrevPrev == "deze":
                     daySpecified = True
@@ -1270,6 +954,61 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+def _build_fraction_denominators_nl(ordinals):
+    fracts = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    return MappingProxyType(fracts)
+
+
+# {short_scale: {fraction word: denominator}}
+_FRACTION_DENOMINATORS_NL = {
+    True: _build_fraction_denominators_nl(_SHORT_ORDINAL_STRING_NL),
+    False: _build_fraction_denominators_nl(_LONG_ORDINAL_STRING_NL)
+}
+
+
+def _build_number_lexer_nl(short_scale):
+    """Compile the number vocabulary used by _NUMBER_PARSER_NL"""
+    multiplies, string_num_ordinal, string_num_scale = \
+        _initialize_number_data_nl(short_scale)
+    # is_fractional_nl ignores the case of words
+    lexer = NumberLexer(case_folded=NumberLexer.FRACTION)
+    lexer.add_all(_STRING_NUM_NL, NumberLexer.NUMBER)
+    lexer.add_all(string_num_scale, NumberLexer.SCALE)
+    lexer.add_all(_SUMS_NL, NumberLexer.SUM)
+    lexer.add_all(multiplies, NumberLexer.MULTIPLIER)
+    lexer.add_all(string_num_ordinal, NumberLexer.ORDINAL)
+    lexer.add_all({word: 1.0 / denominator for word, denominator in
+                   _FRACTION_DENOMINATORS_NL[short_scale].items()},
+                  NumberLexer.FRACTION)
+    lexer.add_all(_NEGATIVES_NL, NumberLexer.NEGATIVE)
+    lexer.add_all(_ARTICLES_NL, NumberLexer.ARTICLE)
+    return lexer
+
+
+# {short_scale: NumberLexer}
+_NUMBER_LEXER_NL = {short_scale: _build_number_lexer_nl(short_scale)
+                    for short_scale in (True, False)}
+
+
+class _DutchNumberParser(NumberParser):
+    lexers = _NUMBER_LEXER_NL
+    fraction_markers = _FRACTION_MARKER_NL
+    decimal_markers = _DECIMAL_MARKER_NL
+    articles = _ARTICLES_NL
+    prefix_kinds = NumberLexer.ARTICLE | NumberLexer.NEGATIVE
+    joining_kinds = NumberParser.joining_kinds | NumberLexer.ARTICLE
+    sum_after_multiplier = False
+    backtrack_multipliers = True
+    sum_each_scale = True
+
+
+_NUMBER_PARSER_NL = _DutchNumberParser()
+
+
+@word_memo("nl")
 def is_fractional_nl(input_str, short_scale=True):
     """This function takes the given text and checks if it is a fraction.
 
@@ -1279,18 +1018,10 @@ def is_fractional_nl(input_str, short_scale=True):
     Returns:
         (bool) or (float): False if not a fraction, otherwise the fraction
     """
-    fracts = {"heel": 1, "half": 2, "halve": 2, "kwart": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_STRING_NL[num]] = num
-    else:
-        for num in _LONG_ORDINAL_STRING_NL:
-            if num > 2:
-                fracts[_LONG_ORDINAL_STRING_NL[num]] = num
-
-    if input_str.lower() in fracts:
-        return 1.0 / fracts[input_str.lower()]
+    denominator = _FRACTION_DENOMINATORS_NL[bool(short_scale)].get(
+        input_str.lower())
+    if denominator:
+        return 1.0 / denominator
     return False
 
 
@@ -1307,9 +1038,8 @@ def extract_numbers_nl(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_nl(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [float(number) for number in
+            _NUMBER_PARSER_NL.extract_numbers(text, short_scale, ordinals)]
 
 
 def normalize_nl(text, remove_articles=True):
@@ -17,14 +17,16 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+from lingua_franca.lang.parse_common import is_numeric, \
+    invert_dict, NumberLexer, NumberParser, word_memo, compile_substitutions, \
+    extract_datetime_spans_generic
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _FRACTION_STRING_PL, _TIME_UNITS_CONVERSION, \
     _TIME_UNITS_NORMALIZATION, _MONTHS_TO_EN, _DAYS_TO_EN, _ORDINAL_BASE_PL, \
     _ALT_ORDINALS_PL
 from lingua_franca.time import now_local
 import re
+from types import MappingProxyType
 
 
 def generate_plurals_pl(originals):
@@ -106,320 +108,83 @@ _STRING_NUM_PL.update({
 
 _STRING_SHORT_ORDINAL_PL = invert_dict(_SHORT_ORDINAL_PL)
 
-_REV_FRACTITONS = generate_fractions_pl(invert_dict(_FRACTION_STRING_PL))
+# {fraction word: denominator}
+_REV_FRACTITONS = MappingProxyType(
+    generate_fractions_pl(invert_dict(_FRACTION_STRING_PL)))
 
 
-def _convert_words_to_numbers_pl(text, short_scale=True, ordinals=False):
-    """
-    Convert words in a string into their equivalent numbers.
-    Args:
-        text str:
-        short_scale boolean: True if short scale numbers should be used.
-        ordinals boolean: True if ordinals (e.g. first, second, third) should
-                          be parsed to their number values (1, 2, 3...)
-
-    Returns:
-        str
-        The original text, with numbers subbed in where appropriate.
-
-    """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_pl(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
-
-
-def _extract_numbers_with_text_pl(tokens, short_scale=True,
-                                  ordinals=False, fractional_numbers=True):
-    """
-    Extract all numbers from a list of Tokens, with the words that
-    represent them.
-
-    Args:
-        [Token]: The tokens to parse.
-        short_scale bool: True if short scale numbers should be used, False for
-                          long scale. True by default.
-        ordinals bool: True if ordinal words (first, second, third, etc) should
-                       be parsed.
-        fractional_numbers bool: True if we should look for fractions and
-                                 decimals.
-
-    Returns:
-        [ReplaceableNumber]: A list of tuples, each containing a number and a
-                         string.
-
-    """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_pl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
-
-
-def _extract_number_with_text_pl(tokens, short_scale=True,
-                                 ordinals=False, fractional_numbers=True):
-    """
-    This function extracts a number from a list of Tokens.
-
-    Args:
-        tokens str: the string to normalize
-        short_scale (bool): use short scale if True, long scale if False
-        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
-        fractional_numbers (bool): True if we should look for fractions and
-                                   decimals.
-    Returns:
-        ReplaceableNumber
-
-    """
-    number, tokens = \
-        _extract_number_with_text_pl_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_pl_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_en.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_pl(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_pl(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-
-    return _extract_whole_number_with_text_pl(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_pl(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string.
-
-    This function handles text such as '2 and 3/4'. Note that "one half" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_pl(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_pl(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
+def _build_number_data_pl(short_scale):
+    """Build the dictionaries returned by _initialize_number_data"""
+    multiplies = _MULTIPLIES_SHORT_SCALE_PL
 
-            if not numbers1 or not numbers2:
-                return None, None
+    string_num_scale = invert_dict(_SHORT_SCALE_PL)
+    string_num_scale.update(generate_plurals_pl(string_num_scale))
+    return (frozenset(multiplies),
+            MappingProxyType(dict(_STRING_SHORT_ORDINAL_PL)),
+            MappingProxyType(string_num_scale))
 
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                    num1.tokens + partitions[1] + num2.tokens
 
-    return None, None
+# {short_scale: (multiplies, string_num_ordinal, string_num_scale)}
+_NUMBER_DATA_PL = {short_scale: _build_number_data_pl(short_scale)
+                   for short_scale in (True, False)}
 
 
-def _extract_decimal_with_text_pl(tokens, short_scale, ordinals):
+def _initialize_number_data(short_scale):
     """
-    Extract decimal numbers from a string.
+    Get the dictionaries of words to numbers, based on scale.
 
-    This function handles text such as '2 point 5'.
-
-    Notes:
-        While this is a helper for extractnumber_en, it also depends on
-        extractnumber_en, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
+    This is a helper function for _extract_whole_number.
 
     Args:
-        tokens [Token]: The text to parse.
         short_scale boolean:
-        ordinals boolean:
 
     Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_pl(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_pl(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                return number.value + float('0.' + str(decimal.value)), \
-                    number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
+        (frozenset(str), Mapping(str, number), Mapping(str, number))
+        multiplies, string_num_ordinal, string_num_scale
 
-def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
     """
-    Handle numbers not handled by the decimal or fraction functions. This is
-    generally whole numbers. Note that phrases such as "one half" will be
-    handled by this function, while "one and a half" are handled by the
-    fraction function.
+    return _NUMBER_DATA_PL[bool(short_scale)]
 
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
 
-    """
+def _build_number_lexer_pl(short_scale):
+    """Compile the number vocabulary used by _NUMBER_PARSER_PL"""
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data(short_scale)
-
-    number_words = []  # type: [Token]
-    val = False
-    prev_val = None
-    next_val = None
-    to_sum = []
-    for idx, token in enumerate(tokens):
-        current_val = None
-        if next_val:
-            next_val = None
-            continue
-
-        word = token.word
-
-        prev_word = tokens[idx - 1].word if idx > 0 else ""
-        next_word = tokens[idx + 1].word if idx + 1 < len(tokens) else ""
-
-        if is_numeric(word[:-1]) and word.endswith('.'):
-            # explicit ordinals, 1., 2., 3., 4.... N.
-            word = word[:-1]
-
-        word = normalize_word_pl(word)
-
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_PL and \
-                word not in _SUMS and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not isFractional_pl(word) and \
-                not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
-            if number_words and not all([w in _NEGATIVES for w in words_only]):
-                break
-            else:
-                number_words = []
-                continue
-        elif word not in multiplies \
-                and prev_word not in multiplies \
-                and prev_word not in _SHORT_SCALE_PL.values() \
-                and prev_word not in _SUMS \
-                and not (ordinals and prev_word in string_num_ordinal) \
-                and prev_word not in _NEGATIVES:
-            number_words = [token]
-        elif prev_word in _SUMS and word in _SUMS:
-            number_words = [token]
-        else:
-            number_words.append(token)
-
-        # is this word already a number ?
-        if is_numeric(word):
-            if word.isdigit():  # doesn't work with decimals
-                val = int(word)
-            else:
-                val = float(word)
-            current_val = val
-
-        # is this word the name of a number ?
-        if word in _STRING_NUM_PL:
-            val = _STRING_NUM_PL.get(word)
-            current_val = val
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
-            current_val = val
-
-        if word in multiplies:
+    # isFractional_pl ignores the case of words
+    lexer = NumberLexer(case_folded=NumberLexer.FRACTION)
+    lexer.add_all(_STRING_NUM_PL, NumberLexer.NUMBER)
+    lexer.add_all(string_num_scale, NumberLexer.SCALE)
+    lexer.add_all(_SUMS, NumberLexer.SUM)
+    lexer.add_all(multiplies, NumberLexer.MULTIPLIER)
+    lexer.add_all(string_num_ordinal, NumberLexer.ORDINAL)
+    lexer.add_all({word: 1.0 / denominator for word, denominator in
+                   _REV_FRACTITONS.items()}, NumberLexer.FRACTION)
+    lexer.add_all(_NEGATIVES, NumberLexer.NEGATIVE)
+    return lexer
+
+
+# {short_scale: NumberLexer}
+_NUMBER_LEXER_PL = {short_scale: _build_number_lexer_pl(short_scale)
+                    for short_scale in (True, False)}
+
+
+class _PolishNumberParser(NumberParser):
+    lexers = _NUMBER_LEXER_PL
+    fraction_markers = _FRACTION_MARKER
+    decimal_markers = _DECIMAL_MARKER
+    prefix_kinds = 0
+    joining_kinds = NumberParser.joining_kinds | NumberLexer.SCALE
+    ordinal_suffixes = (".",)
+    carry_to_next = True
+
+    def normalize(self, word, ordinals):
+        return normalize_word_pl(word)
+
+    def compose(self, word, prev_word, val, prev_val, current_val,
+                kinds, prev_kinds, ordinals):
+        # is the prev word a number and should we multiply it?
+        # twenty hundred, six hundred
+        if kinds & NumberLexer.MULTIPLIER:
             if not prev_val:
                 prev_val = 1
             val = prev_val * val
@@ -428,152 +193,16 @@ def _extract_whole_number_with_text_pl(tokens, short_scale, ordinals):
         # is the prev word a number and should we sum it?
         # twenty two, fifty six
         if prev_val:
-            if (prev_word in string_num_ordinal and val and val < prev_val) or \
-                    (prev_word in _STRING_NUM_PL and val and val < prev_val and val // 10 != prev_val // 10) or \
-                    all([prev_word in multiplies, val < prev_val if prev_val else False]):
+            if (prev_kinds & NumberLexer.ORDINAL and val and
+                    val < prev_val) or \
+                    (prev_kinds & NumberLexer.NUMBER and val and
+                     val < prev_val and val // 10 != prev_val // 10) or \
+                    (prev_kinds & NumberLexer.MULTIPLIER and val < prev_val):
                 val += prev_val
+        return val, prev_val
 
-        if next_word in multiplies:
-            prev_val = val
-            continue
 
-        # is this a spoken fraction?
-        # half cup
-        if val is False:
-            val = isFractional_pl(word)
-            current_val = val
-
-        # 2 fifths
-        if not ordinals:
-            next_val = isFractional_pl(next_word)
-            if next_val:
-                if not val:
-                    val = 1
-                val *= next_val
-                number_words.append(tokens[idx + 1])
-
-        # is this a negative number?
-        if val and prev_word and prev_word in _NEGATIVES:
-            val = 0 - val
-
-        if next_word in _STRING_NUM_PL:
-            prev_val = val
-
-        # let's make sure it isn't a fraction
-        if not val:
-            # look for fractions like "2/3"
-            aPieces = word.split('/')
-            if look_for_fractions(aPieces):
-                val = float(aPieces[0]) / float(aPieces[1])
-                number_words.append(tokens[idx + 1])
-        else:
-            if all([
-                    prev_word in _SUMS,
-                    word not in _SUMS,
-                    word not in multiplies,
-                    current_val >= 10]):
-                # Backtrack - we've got numbers we can't sum.
-                number_words.pop()
-                val = prev_val
-                break
-            prev_val = val
-
-            if word in multiplies and next_word not in multiplies:
-                # handle long numbers
-                # six hundred sixty six
-                # two million five hundred thousand
-                #
-                # This logic is somewhat complex, and warrants
-                # extensive documentation for the next coder's sake.
-                #
-                # The current word is a power of ten. `current_val` is
-                # its integer value. `val` is our working sum
-                # (above, when `current_val` is 1 million, `val` is
-                # 2 million.)
-                #
-                # We have a dict `string_num_scale` containing [value, word]
-                # pairs for "all" powers of ten: string_num_scale[10] == "ten.
-                #
-                # We need go over the rest of the tokens, looking for other
-                # powers of ten. If we find one, we compare it with the current
-                # value, to see if it's smaller than the current power of ten.
-                #
-                # Numbers which are not powers of ten will be passed over.
-                #
-                # If all the remaining powers of ten are smaller than our
-                # current value, we can set the current value aside for later,
-                # and begin extracting another portion of our final result.
-                # For example, suppose we have the following string.
-                # The current word is "million".`val` is 9000000.
-                # `current_val` is 1000000.
-                #
-                #    "nine **million** nine *hundred* seven **thousand**
-                #     six *hundred* fifty seven"
-                #
-                # Iterating over the rest of the string, the current
-                # value is larger than all remaining powers of ten.
-                #
-                # The if statement passes, and nine million (9000000)
-                # is appended to `to_sum`.
-                #
-                # The main variables are reset, and the main loop begins
-                # assembling another number, which will also be appended
-                # under the same conditions.
-                #
-                # By the end of the main loop, to_sum will be a list of each
-                # "place" from 100 up: [9000000, 907000, 600]
-                #
-                # The final three digits will be added to the sum of that list
-                # at the end of the main loop, to produce the extracted number:
-                #
-                #    sum([9000000, 907000, 600]) + 57
-                # == 9,000,000 + 907,000 + 600 + 57
-                # == 9,907,657
-                #
-                # >>> foo = "nine million nine hundred seven thousand six
-                #            hundred fifty seven"
-                # >>> extract_number(foo)
-                # 9907657
-
-                time_to_sum = True
-                for other_token in tokens[idx+1:]:
-                    if other_token.word in multiplies:
-                        if string_num_scale[other_token.word] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
-                if time_to_sum:
-                    to_sum.append(val)
-                    val = 0
-                    prev_val = 0
-
-    if val is not None and to_sum:
-        val += sum(to_sum)
-
-    return val, number_words
-
-
-def _initialize_number_data(short_scale):
-    """
-    Generate dictionaries of words to numbers, based on scale.
-
-    This is a helper function for _extract_whole_number.
-
-    Args:
-        short_scale boolean:
-
-    Returns:
-        (set(str), dict(str, number), dict(str, number))
-        multiplies, string_num_ordinal, string_num_scale
-
-    """
-    multiplies = _MULTIPLIES_SHORT_SCALE_PL
-
-    string_num_scale = invert_dict(_SHORT_SCALE_PL)
-    string_num_scale.update(generate_plurals_pl(string_num_scale))
-    return multiplies, _STRING_SHORT_ORDINAL_PL, string_num_scale
+_NUMBER_PARSER_PL = _PolishNumberParser()
 
 
 def extract_number_pl(text, short_scale=True, ordinals=False):
@@ -592,8 +221,7 @@ def extract_number_pl(text, short_scale=True, ordinals=False):
                                    was found
 
     """
-    return _extract_number_with_text_pl(tokenize(text.lower()),
-                                        True, ordinals).value
+    return _NUMBER_PARSER_PL.extract_number(text.lower(), True, ordinals)
 
 
 def extract_duration_pl(text):
@@ -636,7 +264,7 @@ def extract_duration_pl(text):
     }
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
-    text = _convert_words_to_numbers_pl(text)
+    text = _NUMBER_PARSER_PL.convert_words_to_numbers(text)
 
     for unit in _TIME_UNITS_CONVERSION:
         unit_pattern = pattern.format(unit=unit)
@@ -653,6 +281,40 @@ def extract_duration_pl(text):
     return (duration, text)
 
 
+# the vocabulary of extract_datetime_pl
+_TIME_QUALIFIERS_AM_PL = frozenset(['rano'])
+_TIME_QUALIFIERS_PM_PL = frozenset(['wieczór', 'w nocy'])
+_TIME_QUALIFIERS_PL = _TIME_QUALIFIERS_AM_PL | _TIME_QUALIFIERS_PM_PL
+_DATETIME_MARKERS_PL = frozenset(['na', 'w', 'we', 'przez', 'ten', 'około',
+                                  'dla', 'o', "pomiędzy", 'za', 'do'])
+_RECUR_MARKERS_PL = frozenset(_DAYS_TO_EN) | frozenset(['weekend',
+                                                        'weekendy'])
+_MONTHS_SHORT_PL = frozenset(['sty', 'lut', 'mar', 'kwi', 'maj', 'cze', 'lip',
+                              'sie', 'wrz', 'paź', 'lis', 'gru'])
+_YEAR_MULTIPLES_PL = frozenset(['dekada', 'wiek', 'milenia'])
+# the words that may follow "od" and "po" in a date,
+# "5 dni od jutra", "2 miesiące po lipcu"
+_FROM_FOLLOWUPS_PL = frozenset(_DAYS_TO_EN) | frozenset(_MONTHS_TO_EN) | \
+    _MONTHS_SHORT_PL | \
+    frozenset(["dzisiaj", "jutro", "wczoraj", "następny", "poprzedni",
+               'ostatni', "teraz", "tego"])
+# the cleaning step of extract_datetime_pl
+_DATETIME_SUBSTITUTIONS_PL = compile_substitutions({"para": "2"},
+                                                   delete="?.,")
+_ORDINAL_SUFFIXES_PL = compile_substitutions({"ci": "", "szy": "", "gi": ""})
+
+
+def _datetime_words_pl(s):
+    """The words of s, cleaned for extract_datetime_pl"""
+    # clean unneeded punctuation and capitalization among other things.
+    wordList = _DATETIME_SUBSTITUTIONS_PL(s.lower()).split()
+    for idx, word in enumerate(wordList):
+        if word[0].isdigit():
+            wordList[idx] = _ORDINAL_SUFFIXES_PL(word)
+
+    return wordList
+
+
 def extract_datetime_pl(string, dateNow=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -683,22 +345,33 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if string == "":
+        return None
+    return _extract_datetime_words_pl(_datetime_words_pl(string),
+                                      dateNow, default_time)
+
+
+def extract_datetimes_pl(string, dateNow=None, default_time=None):
+    """ Extract every date and time expression of a text
 
-    def clean_string(s):
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace("para", "2")
+    See extract_datetime_pl, which the words of each expression are
+    parsed with.
 
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            ordinals = ["ci", "szy", "gi"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    if ordinal in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(string, _datetime_words_pl,
+                                          _extract_datetime_words_pl,
+                                          ["i"], dateNow,
+                                          default_time)
 
-        return wordList
+
+def _extract_datetime_words_pl(words, dateNow=None, default_time=None):
+    """
+    extract_datetime_pl on the words of a text cleaned by
+    _datetime_words_pl, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -710,9 +383,6 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if string == "":
-        return None
-
     dateNow = dateNow or now_local()
     found = False
     daySpecified = False
@@ -726,18 +396,6 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['rano']
-    timeQualifiersPM = ['wieczór', 'w nocy']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    markers = ['na', 'w', 'we', 'na', 'przez', 'ten', 'około', 'dla', 'o', "pomiędzy", 'za', 'do']
-    days = list(_DAYS_TO_EN.keys())
-    recur_markers = days + ['weekend', 'weekendy']
-    monthsShort = ['sty', 'lut', 'mar', 'kwi', 'maj', 'cze', 'lip', 'sie',
-                   'wrz', 'paź', 'lis', 'gru']
-    year_multiples = ['dekada', 'wiek', 'milenia']
-
-    words = clean_string(string)
-
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -755,11 +413,12 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
             dayOffset = - dayOffset
             used += 1
         if word == "teraz" and not datestr:
+            words[idx] = ""
             resultStr = " ".join(words[idx + 1:])
             resultStr = ' '.join(resultStr.split())
             extractedDate = dateNow.replace(microsecond=0)
             return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+        elif wordNext in _YEAR_MULTIPLES_PL:
             multiplier = None
             if is_numeric(word):
                 multiplier = extract_number_pl(word)
@@ -772,7 +431,7 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                 yearOffset = multiplier * 100
             elif _TIME_UNITS_NORMALIZATION.get(wordNext) == "milenia":
                 yearOffset = multiplier * 1000
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_PL:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "dzisiaj" and not fromFlag:
@@ -838,7 +497,7 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                 used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
+        elif word in _DAYS_TO_EN and not fromFlag:
             d = _DAYS_TO_EN.get(word)
             dayOffset = (d + 1) - int(today)
             used = 1
@@ -854,7 +513,8 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                 used += 1
                 start -= 1
                 # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in _MONTHS_TO_EN or word in monthsShort and not fromFlag:
+        elif word in _MONTHS_TO_EN or \
+                word in _MONTHS_SHORT_PL and not fromFlag:
             used += 1
             datestr = _MONTHS_TO_EN[word]
             if wordPrev and wordPrev[0].isdigit():
@@ -880,30 +540,21 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + list(_MONTHS_TO_EN.keys()) + monthsShort
-        validFollowups.append("dzisiaj")
-        validFollowups.append("jutro")
-        validFollowups.append("wczoraj")
-        validFollowups.append("następny")
-        validFollowups.append("poprzedni")
-        validFollowups.append('ostatni')
-        validFollowups.append("teraz")
-        validFollowups.append("tego")
-        if (word == "od" or word == "po") and wordNext in validFollowups:
+        if (word == "od" or word == "po") and wordNext in _FROM_FOLLOWUPS_PL:
             used = 2
             fromFlag = True
             if wordNext == "jutro":
                 dayOffset += 1
             elif wordNext == "wczoraj":
                 dayOffset -= 1
-            elif wordNext in days:
+            elif wordNext in _DAYS_TO_EN:
                 d = _DAYS_TO_EN.get(wordNext)
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
+            elif wordNextNext and wordNextNext in _DAYS_TO_EN:
                 d = _DAYS_TO_EN.get(wordNextNext)
                 tmpOffset = (d + 1) - int(today)
                 used = 3
@@ -925,7 +576,7 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_PL:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -971,12 +622,14 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                 hrAbs = 22
             used += 1
         # parse half an hour, quarter hour
-        elif word == "godzina" and (wordPrev.isdigit() or wordPrev in markers or wordPrevPrev in markers):
+        elif word == "godzina" and (wordPrev.isdigit() or
+                                    wordPrev in _DATETIME_MARKERS_PL or
+                                    wordPrevPrev in _DATETIME_MARKERS_PL):
             if wordPrev == "pół":
                 minOffset = 30
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _DATETIME_MARKERS_PL:
                 words[idx - 2] = ""
                 if wordPrevPrev == "dzisiaj":
                     daySpecified = True
@@ -986,12 +639,14 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
             minAbs = -1
             # parse 5:00 am, 12:00 p.m., etc
         # parse in a minute
-        elif word == "minuta" and (wordPrev.isdigit() or wordPrev in markers):
+        elif word == "minuta" and (wordPrev.isdigit() or
+                                   wordPrev in _DATETIME_MARKERS_PL):
             minOffset = 1
             words[idx - 1] = ""
             used += 1
         # parse in a second
-        elif word == "sekunda" and (wordPrev.isdigit() or wordPrev in markers):
+        elif word == "sekunda" and (wordPrev.isdigit() or
+                                    wordPrev in _DATETIME_MARKERS_PL):
             secOffset = 1
             words[idx - 1] = ""
             used += 1
@@ -1055,7 +710,7 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _TIME_QUALIFIERS_PM_PL):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1089,9 +744,9 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers or (
+                        remainder in _RECUR_MARKERS_PL or
+                        wordNext in _RECUR_MARKERS_PL or
+                        wordNextNext in _RECUR_MARKERS_PL or (
                             wordNext == 'w' and wordNextNext == 'dzień' and
                             wordNextNextNext == 'robocze'
                         )):
@@ -1153,21 +808,23 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                if (wordNextNext in _TIME_QUALIFIERS_PM_PL or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_PM_PL):
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if (wordNextNext in _TIME_QUALIFIERS_AM_PL or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_AM_PL):
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _TIME_QUALIFIERS_PM_PL:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _TIME_QUALIFIERS_AM_PL:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1197,7 +854,7 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                     # has passed, assume the next morning
                     dayOffset += 1
 
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_PL and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1223,11 +880,11 @@ def extract_datetime_pl(string, dateNow=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_PL:
                 words[idx - 1] = ""
                 if wordPrev == "najbliższą":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_PL:
                 words[idx - 2] = ""
                 if wordPrevPrev == "najbliższą":
                     daySpecified = True
@@ -1347,11 +1004,12 @@ def extract_numbers_pl(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_pl(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return [float(number) for number in
+            _NUMBER_PARSER_PL.extract_numbers(text.lower(), short_scale,
+                                              ordinals)]
 
 
+@word_memo("pl")
 def normalize_word_pl(word):
     if word.startswith('jedn'):
         suffix = 'ą', 'ej', 'ym'
@@ -22,18 +22,32 @@
 
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, match_yes_or_no
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, match_yes_or_no, \
+    word_memo, extract_datetime_spans_generic
 from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.resources import resource_cache
 from lingua_franca.lang.parse_common import Normalizer
 from lingua_franca.time import now_local, DAYS_IN_1_MONTH, DAYS_IN_1_YEAR
-from lingua_franca.util.colors import Color, ColorOutOfSpace
-import json
 import re
-from quebra_frases import span_indexed_word_tokenize
 import unicodedata
+from types import MappingProxyType
+
+
+def _color_names_pt(colors):
+    """Map lowercased color names, and their stems, to hex codes"""
+    names = {v.lower(): k for k, v in colors.items()}
+
+    # this hack makes plural match most of the time
+    for k in list(names.keys()):
+        if k.endswith("s"):
+            names[k[:-1]] = names[k]
+    # this hack makes male/female match most of the time
+    for k in list(names.keys()):
+        if k.endswith("a") or k.endswith("o"):
+            names[k[:-1]] = names[k]
+    return MappingProxyType(names)
 
 
 def get_color_pt(text):
@@ -46,18 +60,9 @@ def get_color_pt(text):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
-    resource_file = resolve_resource_file(f"text/pt-pt/colors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    from lingua_franca.util.colors import Color, ColorOutOfSpace
 
-    # this hack makes plural match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("s"):
-            COLORS[k[:-1]] = COLORS[k]
-    # this hack makes male/female match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("a") or k.endswith("o"):
-            COLORS[k[:-1]] = COLORS[k]
+    COLORS = resource_cache.get("text/pt-pt/colors.json", _color_names_pt)
 
     text = text.lower()
     if text in COLORS:
@@ -123,18 +128,10 @@ def extract_color_spans_pt(text):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
-    resource_file = resolve_resource_file(f"text/pt-pt/colors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    from quebra_frases import span_indexed_word_tokenize
+    from lingua_franca.util.colors import Color
 
-    # this hack makes plural match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("s"):
-            COLORS[k[:-1]] = COLORS[k]
-    # this hack makes male/female match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("a") or k.endswith("o"):
-            COLORS[k[:-1]] = COLORS[k]
+    COLORS = resource_cache.get("text/pt-pt/colors.json", _color_names_pt)
 
     color_spans = []
     text = text.lower()
@@ -191,6 +188,7 @@ def yes_or_no_pt(text):
     return match_yes_or_no(text, "pt-pt")
 
 
+@word_memo("pt")
 def is_fractional_pt(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -358,8 +356,7 @@ def extract_number_pt(text, short_scale=True, ordinals=False):
 
 
 class PortugueseNormalizer(Normalizer):
-    with open(resolve_resource_file("text/pt-pt/normalize.json")) as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/pt-pt/normalize.json")
 
     @staticmethod
     def tokenize(utterance):
@@ -382,58 +379,123 @@ def normalize_pt(text, remove_articles=True):
     return PortugueseNormalizer().normalize(text, remove_articles)
 
 
+# the vocabulary of extract_datetime_pt
+_TIME_QUALIFIERS_PT = frozenset(['manha', 'tarde', 'noite'])
+_TIME_INDICATORS_PT = frozenset(["em", "as", "nas", "pelas", "volta", "depois",
+                                 "estas", "no", "dia", "hora"])
+# {day: weekday}, segunda is 0
+_DAYS_PT = {day: weekday for weekday, day in enumerate(
+    ['segunda', 'terca', 'quarta', 'quinta', 'sexta', 'sabado', 'domingo'])}
+_MONTHS_PT = ('janeiro', 'febreiro', 'marco', 'abril', 'maio', 'junho',
+              'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro')
+# {month: index in _MONTHS_PT}
+_MONTH_INDEXES_PT = {month: idx for idx, month in enumerate(_MONTHS_PT)}
+_MONTHS_SHORT_PT = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'abr', 'mai', 'jun', 'jul', 'ag', 'set', 'out',
+     'nov', 'dec'])}
+_NEXTS_PT = frozenset(["proximo", "proxima"])
+_SUFFIX_NEXTS_PT = frozenset(["seguinte", "subsequente", "seguir"])
+_LASTS_PT = frozenset(["ultimo", "ultima"])
+_SUFFIX_LASTS_PT = frozenset(["passada", "passado", "anterior", "antes"])
+_NXTS_PT = frozenset(["depois", "seguir", "seguida", "seguinte", "proxima",
+                      "proximo"])
+_PREVS_PT = frozenset(["antes", "ante", "previa", "previamente", "anterior"])
+_THISES_PT = frozenset(["este", "esta", "deste", "desta", "neste", "nesta",
+                        "nesse", "nessa"])
+_FROMS_PT = frozenset(["partir", "em", "para", "na", "no", "daqui", "seguir",
+                       "depois", "por", "proxima", "proximo", "da", "do",
+                       "de"]) | _THISES_PT
+_DATETIME_MARKERS_PT = _NXTS_PT | _PREVS_PT | _FROMS_PT | \
+    _TIME_INDICATORS_PT
+# the words that may follow one of _FROMS_PT in a date,
+# "5 dias depois de amanha", "2 meses a partir de julho"
+_FROM_FOLLOWUPS_PT = frozenset(_DAYS_PT) | frozenset(_MONTH_INDEXES_PT) | \
+    frozenset(_MONTHS_SHORT_PT) | \
+    frozenset(["hoje", "amanha", "ontem", "anteontem", "agora", "ja", "ante"])
+
+
+def _datetime_words_pt(s):
+    """The words of s, cleaned for extract_datetime_pt"""
+    # cleans the input string of unneeded punctuation and capitalization
+    # among other things
+    symbols = [".", ",", ";", "?", "!", "º", "ª"]
+    noise_words = ["o", "os", "a", "as", "do", "da", "dos", "das", "de",
+                   "ao", "aos"]
+
+    for word in symbols:
+        s = s.replace(word, "")
+    for word in noise_words:
+        s = s.replace(" " + word + " ", " ")
+    s = s.lower().replace(
+        "á",
+        "a").replace(
+        "ç",
+        "c").replace(
+        "à",
+        "a").replace(
+        "ã",
+        "a").replace(
+        "é",
+        "e").replace(
+        "è",
+        "e").replace(
+        "ê",
+        "e").replace(
+        "ó",
+        "o").replace(
+        "ò",
+        "o").replace(
+        "-",
+        " ").replace(
+        "_",
+        "")
+    # handle synonims and equivalents, "tomorrow early = tomorrow morning
+    synonims = {"manha": ["manhazinha", "cedo", "cedinho"],
+                "tarde": ["tardinha", "tarde"],
+                "noite": ["noitinha", "anoitecer"],
+                "todos": ["ao", "aos"],
+                "em": ["do", "da", "dos", "das", "de"]}
+    for syn in synonims:
+        for word in synonims[syn]:
+            s = s.replace(" " + word + " ", " " + syn + " ")
+    # relevant plurals, cant just extract all s in pt
+    wordlist = ["manhas", "noites", "tardes", "dias", "semanas", "anos",
+                "minutos", "segundos", "nas", "nos", "proximas",
+                "seguintes", "horas"]
+    for _, word in enumerate(wordlist):
+        s = s.replace(word, word.rstrip('s'))
+    s = s.replace("meses", "mes").replace("anteriores", "anterior")
+    return s.split(" ")
+
+
 def extract_datetime_pt(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        # cleans the input string of unneeded punctuation and capitalization
-        # among other things
-        symbols = [".", ",", ";", "?", "!", "º", "ª"]
-        noise_words = ["o", "os", "a", "as", "do", "da", "dos", "das", "de",
-                       "ao", "aos"]
-
-        for word in symbols:
-            s = s.replace(word, "")
-        for word in noise_words:
-            s = s.replace(" " + word + " ", " ")
-        s = s.lower().replace(
-            "á",
-            "a").replace(
-            "ç",
-            "c").replace(
-            "à",
-            "a").replace(
-            "ã",
-            "a").replace(
-            "é",
-            "e").replace(
-            "è",
-            "e").replace(
-            "ê",
-            "e").replace(
-            "ó",
-            "o").replace(
-            "ò",
-            "o").replace(
-            "-",
-            " ").replace(
-            "_",
-            "")
-        # handle synonims and equivalents, "tomorrow early = tomorrow morning
-        synonims = {"manha": ["manhazinha", "cedo", "cedinho"],
-                    "tarde": ["tardinha", "tarde"],
-                    "noite": ["noitinha", "anoitecer"],
-                    "todos": ["ao", "aos"],
-                    "em": ["do", "da", "dos", "das", "de"]}
-        for syn in synonims:
-            for word in synonims[syn]:
-                s = s.replace(" " + word + " ", " " + syn + " ")
-        # relevant plurals, cant just extract all s in pt
-        wordlist = ["manhas", "noites", "tardes", "dias", "semanas", "anos",
-                    "minutos", "segundos", "nas", "nos", "proximas",
-                    "seguintes", "horas"]
-        for _, word in enumerate(wordlist):
-            s = s.replace(word, word.rstrip('s'))
-        s = s.replace("meses", "mes").replace("anteriores", "anterior")
-        return s
+    if text == "":
+        return None
+    return _extract_datetime_words_pt(_datetime_words_pt(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_pt(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_pt, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_pt,
+                                          _extract_datetime_words_pt,
+                                          ["e", "até"], anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_pt(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_pt on the words of a text cleaned by
+    _datetime_words_pt, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -445,9 +507,6 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -462,29 +521,6 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    words = clean_string(text).split(" ")
-    timeQualifiersList = ['manha', 'tarde', 'noite']
-    time_indicators = ["em", "as", "nas", "pelas", "volta", "depois", "estas",
-                       "no", "dia", "hora"]
-    days = ['segunda', 'terca', 'quarta',
-            'quinta', 'sexta', 'sabado', 'domingo']
-    months = ['janeiro', 'febreiro', 'marco', 'abril', 'maio', 'junho',
-              'julho', 'agosto', 'setembro', 'outubro', 'novembro',
-              'dezembro']
-    monthsShort = ['jan', 'feb', 'mar', 'abr', 'mai', 'jun', 'jul', 'ag',
-                   'set', 'out', 'nov', 'dec']
-    nexts = ["proximo", "proxima"]
-    suffix_nexts = ["seguinte", "subsequente", "seguir"]
-    lasts = ["ultimo", "ultima"]
-    suffix_lasts = ["passada", "passado", "anterior", "antes"]
-    nxts = ["depois", "seguir", "seguida", "seguinte", "proxima", "proximo"]
-    prevs = ["antes", "ante", "previa", "previamente", "anterior"]
-    froms = ["partir", "em", "para", "na", "no", "daqui", "seguir",
-             "depois", "por", "proxima", "proximo", "da", "do", "de"]
-    thises = ["este", "esta", "deste", "desta", "neste", "nesta", "nesse",
-              "nessa"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -497,7 +533,7 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_PT:
             timeQualifier = word
 
         # parse today, tomorrow, yesterday
@@ -541,13 +577,13 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
                     start -= 1
                     used += 1
             elif (wordPrev and wordPrev[0].isdigit() and
-                  wordNext not in months and
-                  wordNext not in monthsShort):
+                  wordNext not in _MONTH_INDEXES_PT and
+                  wordNext not in _MONTHS_SHORT_PT):
                 dayOffset += int(wordPrev)
                 start -= 1
                 used += 2
             elif wordNext and wordNext[0].isdigit() and wordNextNext not in \
-                    months and wordNextNext not in monthsShort:
+                    _MONTH_INDEXES_PT and wordNextNext not in _MONTHS_SHORT_PT:
                 dayOffset += int(wordNext)
                 start -= 1
                 used += 2
@@ -557,117 +593,100 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    dayOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    dayOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_PT:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_PT:
+                dayOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_PT:
+                dayOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_PT:
+                dayOffset = -7
+                start -= 1
+                used = 2
         # parse 10 months, next month, last month
         elif word == "mes" and not fromFlag:
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    monthOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    monthOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_PT:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_PT:
+                monthOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_PT:
+                monthOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_PT:
+                monthOffset = -7
+                start -= 1
+                used = 2
         # parse 5 years, next year, last year
         elif word == "ano" and not fromFlag:
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-            for w in nexts:
-                if wordPrev == w:
-                    yearOffset = 7
-                    start -= 1
-                    used = 2
-            for w in lasts:
-                if wordPrev == w:
-                    yearOffset = -7
-                    start -= 1
-                    used = 2
-            for w in suffix_nexts:
-                if wordNext == w:
-                    yearOffset = 7
-                    start -= 1
-                    used = 2
-            for w in suffix_lasts:
-                if wordNext == w:
-                    yearOffset = -7
-                    start -= 1
-                    used = 2
+            if wordPrev in _NEXTS_PT:
+                yearOffset = 7
+                start -= 1
+                used = 2
+            if wordPrev in _LASTS_PT:
+                yearOffset = -7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_NEXTS_PT:
+                yearOffset = 7
+                start -= 1
+                used = 2
+            if wordNext in _SUFFIX_LASTS_PT:
+                yearOffset = -7
+                start -= 1
+                used = 2
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
+        elif word in _DAYS_PT and not fromFlag:
 
-            d = days.index(word)
+            d = _DAYS_PT[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
-            for w in nexts:
-                if wordPrev == w:
-                    dayOffset += 7
-                    used += 1
-                    start -= 1
-            for w in lasts:
-                if wordPrev == w:
-                    dayOffset -= 7
-                    used += 1
-                    start -= 1
-            for w in suffix_nexts:
-                if wordNext == w:
-                    dayOffset += 7
-                    used += 1
-                    start -= 1
-            for w in suffix_lasts:
-                if wordNext == w:
-                    dayOffset -= 7
-                    used += 1
-                    start -= 1
+            if wordPrev in _NEXTS_PT:
+                dayOffset += 7
+                used += 1
+                start -= 1
+            if wordPrev in _LASTS_PT:
+                dayOffset -= 7
+                used += 1
+                start -= 1
+            if wordNext in _SUFFIX_NEXTS_PT:
+                dayOffset += 7
+                used += 1
+                start -= 1
+            if wordNext in _SUFFIX_LASTS_PT:
+                dayOffset -= 7
+                used += 1
+                start -= 1
             if wordNext == "feira":
                 used += 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_PT or word in _MONTHS_SHORT_PT:
+            m = _MONTH_INDEXES_PT.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_PT[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_PT[m]
             if wordPrev and wordPrev[0].isdigit():
                 # 13 maio
                 datestr += " " + wordPrev
@@ -715,22 +734,14 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
                 else:
                     hasYear = False
 
-            if datestr in months:
+            if datestr in _MONTH_INDEXES_PT:
                 datestr = ""
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("hoje")
-        validFollowups.append("amanha")
-        validFollowups.append("ontem")
-        validFollowups.append("anteontem")
-        validFollowups.append("agora")
-        validFollowups.append("ja")
-        validFollowups.append("ante")
 
         # TODO debug word "depois" that one is failing for some reason
-        if word in froms and wordNext in validFollowups:
+        if word in _FROMS_PT and wordNext in _FROM_FOLLOWUPS_PT:
 
             if not (wordNext == "amanha" and wordNext == "ontem") and not (
                     word == "depois" or word == "antes" or word == "em"):
@@ -747,8 +758,8 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
             elif (wordNext == "ante" and wordNextNext == "ante" and
                   wordNextNextNext == "ontem"):
                 dayOffset -= 3
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_PT:
+                d = _DAYS_PT[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if wordNextNext == "feira":
@@ -756,39 +767,39 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
                 if tmpOffset < 0:
                     tmpOffset += 7
                 if wordNextNext:
-                    if wordNextNext in nxts:
+                    if wordNextNext in _NXTS_PT:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNext in prevs:
+                    elif wordNextNext in _PREVS_PT:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_PT:
+                d = _DAYS_PT[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNextNextNext:
-                    if wordNextNextNext in nxts:
+                    if wordNextNextNext in _NXTS_PT:
                         tmpOffset += 7
                         used += 1
-                    elif wordNextNextNext in prevs:
+                    elif wordNextNextNext in _PREVS_PT:
                         tmpOffset -= 7
                         used += 1
                 dayOffset += tmpOffset
                 if wordNextNextNext == "feira":
                     used += 1
-        if wordNext in months:
+        if wordNext in _MONTH_INDEXES_PT:
             used -= 1
         if used > 0:
 
-            if start - 1 > 0 and words[start - 1] in lists:
+            if start - 1 > 0 and words[start - 1] in _DATETIME_MARKERS_PT:
                 start -= 1
                 used += 1
 
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in lists:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_PT:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -853,20 +864,20 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
             used += 1
         # parse half an hour, quarter hour
         elif word == "hora" and \
-                (wordPrev in time_indicators or wordPrevPrev in
-                 time_indicators):
+                (wordPrev in _TIME_INDICATORS_PT or wordPrevPrev in
+                 _TIME_INDICATORS_PT):
             if wordPrev == "meia":
                 minOffset = 30
             elif wordPrev == "quarto":
                 minOffset = 15
             elif wordPrevPrev == "quarto":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in time_indicators:
+                if idx > 2 and words[idx - 3] in _TIME_INDICATORS_PT:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             else:
                 hrOffset = 1
-            if wordPrevPrev in time_indicators:
+            if wordPrevPrev in _TIME_INDICATORS_PT:
                 words[idx - 2] = ""
             words[idx - 1] = ""
             used += 1
@@ -918,13 +929,13 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
                         else:
                             remainder = "pm"
                         used += 1
-                    elif wordNext in thises and wordNextNext == "manha":
+                    elif wordNext in _THISES_PT and wordNextNext == "manha":
                         remainder = "am"
                         used = 2
-                    elif wordNext in thises and wordNextNext == "tarde":
+                    elif wordNext in _THISES_PT and wordNextNext == "tarde":
                         remainder = "pm"
                         used = 2
-                    elif wordNext in thises and wordNextNext == "noite":
+                    elif wordNext in _THISES_PT and wordNextNext == "noite":
                         remainder = "pm"
                         used = 2
                     else:
@@ -1078,9 +1089,9 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
             if wordPrev == "em" or wordPrev == "ponto":
                 words[words.index(wordPrev)] = ""
 
-            if idx > 0 and wordPrev in time_indicators:
+            if idx > 0 and wordPrev in _TIME_INDICATORS_PT:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in time_indicators:
+            if idx > 1 and wordPrevPrev in _TIME_INDICATORS_PT:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -1107,10 +1118,10 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
         en_monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july',
                           'aug',
                           'sept', 'oct', 'nov', 'dec']
-        for idx, en_month in enumerate(en_months):
-            datestr = datestr.replace(months[idx], en_month)
-        for idx, en_month in enumerate(en_monthsShort):
-            datestr = datestr.replace(monthsShort[idx], en_month)
+        for month, en_month in zip(_MONTHS_PT, en_months):
+            datestr = datestr.replace(month, en_month)
+        for month, en_month in zip(_MONTHS_SHORT_PT, en_monthsShort):
+            datestr = datestr.replace(month, en_month)
 
         temp = datetime.strptime(datestr, "%B %d")
         if extractedDate.tzinfo:
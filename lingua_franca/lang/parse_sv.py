@@ -14,12 +14,15 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
 
 from .parse_common import (is_numeric, look_for_fractions, Normalizer,
-                           tokenize, Token)
+                           tokenize, Token, word_memo,
+                           compile_substitutions,
+                           extract_datetime_spans_generic)
 
 
 def _find_numbers_in_text(tokens):
@@ -262,26 +265,73 @@ def extract_number_sv(text, short_scale=True, ordinals=False):
     return val or False
 
 
+# the vocabulary of extract_datetime_sv
+_TIME_QUALIFIERS_SV = frozenset(['morgon', 'förmiddag', 'eftermiddag',
+                                 'kväll'])
+_DATETIME_MARKERS_SV = frozenset(['på', 'i', 'den här', 'kring', 'efter'])
+# {day: weekday}, måndag is 0
+_DAYS_SV = {day: weekday for weekday, day in enumerate(
+    ['måndag', 'tisdag', 'onsdag', 'torsdag', 'fredag', 'lördag', 'söndag'])}
+_MONTHS_SV = ('januari', 'februari', 'mars', 'april', 'maj', 'juni', 'juli',
+              'augusti', 'september', 'oktober', 'november', 'december')
+# {month: index in _MONTHS_SV}
+_MONTH_INDEXES_SV = {month: idx for idx, month in enumerate(_MONTHS_SV)}
+_MONTHS_SHORT_SV = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug', 'sept', 'oct',
+     'nov', 'dec'])}
+# the words that may follow "från" and "efter" in a date,
+# "5 dagar från imorgon", "2 månader efter juli"
+_FROM_FOLLOWUPS_SV = frozenset(_DAYS_SV) | frozenset(_MONTH_INDEXES_SV) | \
+    frozenset(_MONTHS_SHORT_SV) | \
+    frozenset(["idag", "imorgon", "nästa", "förra", "nu"])
+# the cleaning step of extract_datetime_sv
+_DATETIME_SUBSTITUTIONS_SV = compile_substitutions(
+    {"'s": ""}, words={"den": "", "en": ""}, delete="?.,")
+_ORDINAL_SUFFIXES_SV = compile_substitutions(
+    {"rd": "", "st": "", "nd": "", "th": ""})
+
+
+def _datetime_words_sv(s):
+    """
+        cleans the input string of unneeded punctuation and capitalization
+        among other things.
+    """
+    wordList = _DATETIME_SUBSTITUTIONS_SV(s.lower()).split()
+    for idx, word in enumerate(wordList):
+        if word[0].isdigit():
+            wordList[idx] = _ORDINAL_SUFFIXES_SV(word)
+
+    return wordList
+
+
 def extract_datetime_sv(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        """
-            cleans the input string of unneeded punctuation and capitalization
-            among other things.
-        """
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace(' den ', ' ').replace(' en ', ' ')
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            word = word.replace("'s", "")
-
-            ordinals = ["rd", "st", "nd", "th"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    if ordinal in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
+    if text == "":
+        return None
+    return _extract_datetime_words_sv(_datetime_words_sv(text),
+                                      anchorDate, default_time)
+
+
+def extract_datetimes_sv(text, anchorDate=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_sv, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_sv,
+                                          _extract_datetime_words_sv,
+                                          ["och"], anchorDate,
+                                          default_time)
+
+
+def _extract_datetime_words_sv(words, anchorDate=None, default_time=None):
+    """
+    extract_datetime_sv on the words of a text cleaned by
+    _datetime_words_sv, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -293,9 +343,6 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if text == "":
-        return None
-
     anchorDate = anchorDate or now_local()
     found = False
     daySpecified = False
@@ -310,18 +357,6 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['morgon', 'förmiddag', 'eftermiddag', 'kväll']
-    markers = ['på', 'i', 'den här', 'kring', 'efter']
-    days = ['måndag', 'tisdag', 'onsdag', 'torsdag',
-            'fredag', 'lördag', 'söndag']
-    months = ['januari', 'februari', 'mars', 'april', 'maj', 'juni',
-              'juli', 'augusti', 'september', 'oktober', 'november',
-              'december']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-
-    words = clean_string(text)
-
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -335,7 +370,7 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
         start = idx
         used = 0
         # save timequalifier for later
-        if word in timeQualifiersList:
+        if word in _TIME_QUALIFIERS_SV:
             timeQualifier = word
             # parse today, tomorrow, day after tomorrow
         elif word == "idag" and not fromFlag:
@@ -399,8 +434,8 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
                 used = 2
                 # parse Monday, Tuesday, etc., and next Monday,
                 # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
+        elif word in _DAYS_SV and not fromFlag:
+            d = _DAYS_SV[word]
             dayOffset = (d + 1) - int(today)
             used = 1
             if dayOffset < 0:
@@ -414,13 +449,13 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
                 used += 1
                 start -= 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEXES_SV or \
+                word in _MONTHS_SHORT_SV and not fromFlag:
+            m = _MONTH_INDEXES_SV.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_SV[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_SV[m]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -449,26 +484,21 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
                     hasYear = False
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("idag")
-        validFollowups.append("imorgon")
-        validFollowups.append("nästa")
-        validFollowups.append("förra")
-        validFollowups.append("nu")
-        if (word == "från" or word == "efter") and wordNext in validFollowups:
+        if (word == "från" or word == "efter") and \
+                wordNext in _FROM_FOLLOWUPS_SV:
             used = 2
             fromFlag = True
             if wordNext == "imorgon":
                 dayOffset += 1
-            elif wordNext in days:
-                d = days.index(wordNext)
+            elif wordNext in _DAYS_SV:
+                d = _DAYS_SV[wordNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
+            elif wordNextNext and wordNextNext in _DAYS_SV:
+                d = _DAYS_SV[wordNextNext]
                 tmpOffset = (d + 1) - int(today)
                 used = 3
                 if wordNext == "nästa":
@@ -488,7 +518,7 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_SV:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -534,7 +564,8 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
                 hrAbs = 19
             used += 1
             # parse half an hour, quarter hour
-        elif wordPrev in markers or wordPrevPrev in markers:
+        elif wordPrev in _DATETIME_MARKERS_SV or \
+                wordPrevPrev in _DATETIME_MARKERS_SV:
             if word == "halvtimme" or word == "halvtimma":
                 minOffset = 30
             elif word == "kvart":
@@ -782,9 +813,9 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _DATETIME_MARKERS_SV:
                 words[idx - 1] = ""
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _DATETIME_MARKERS_SV:
                 words[idx - 2] = ""
 
             idx += used - 1
@@ -864,6 +895,14 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# {fraction word: denominator}, without plural endings
+_FRACTION_DENOMINATORS_SV = MappingProxyType({
+    "hel": 1, "halv": 2, "tredjedel": 3, "fjärdedel": 4, "kvart": 4,
+    "femtedel": 5, "sjättedel": 6, "sjundedel": 7, "åttondel": 8,
+    "niondel": 9, "tiondel": 10, "elftedel": 11, "tolftedel": 12})
+
+
+@word_memo("sv")
 def is_fractional_sv(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -884,13 +923,9 @@ def is_fractional_sv(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "halva"
 
-    aFrac = ["hel", "halv", "tredjedel", "fjärdedel", "femtedel", "sjättedel",
-             "sjundedel", "åttondel", "niondel", "tiondel", "elftedel",
-             "tolftedel"]
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
-    if input_str == "kvart":
-        return 1.0 / 4
+    denominator = _FRACTION_DENOMINATORS_SV.get(input_str.lower())
+    if denominator:
+        return 1.0 / denominator
     if input_str == "trekvart":
         return 3.0 / 4
 
@@ -16,16 +16,17 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+from lingua_franca.lang.parse_common import is_numeric, \
+    invert_dict, Normalizer, NumberLexer, NumberParser, word_memo, \
+    compile_substitutions, extract_datetime_spans_generic
 from lingua_franca.lang.common_data_uk import _NUM_STRING_UK, \
     _LONG_ORDINAL_UK, _LONG_SCALE_UK, _SHORT_SCALE_UK, _SHORT_ORDINAL_UK, \
     _FRACTION_STRING_UK, _MONTHS_CONVERSION, _MONTHS_UK, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_UK, _PLURALS
 
 import re
-import json
-from lingua_franca import resolve_resource_file
+from types import MappingProxyType
+from lingua_franca.resources import resource_cache
 from lingua_franca.time import now_local
 
 
@@ -128,471 +129,32 @@ _STRING_SHORT_ORDINAL_UK = invert_dict(_SHORT_ORDINAL_UK)
 _STRING_LONG_ORDINAL_UK = invert_dict(_LONG_ORDINAL_UK)
 
 
-def _convert_words_to_numbers_uk(text, short_scale=True, ordinals=False):
-    """
-    Convert words in a string into their equivalent numbers.
-    Args:
-        text str:
-        short_scale boolean: True if short scale numbers should be used.
-        ordinals boolean: True if ordinals (e.g. first, second, third) should
-                          be parsed to their number values (1, 2, 3...)
-
-    Returns:
-        str
-        The original text, with numbers subbed in where appropriate.
-
-    """
-    text = text.lower()
-
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_uk(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-    return ' '.join(results)
-
-
-def _extract_numbers_with_text_uk(tokens, short_scale=True,
-                                  ordinals=False, fractional_numbers=True):
-    """
-    Extract all numbers from a list of Tokens, with the words that
-    represent them.
-
-    Args:
-        [Token]: The tokens to parse.
-        short_scale bool: True if short scale numbers should be used, False for
-                          long scale. True by default.
-        ordinals bool: True if ordinal words (first, second, third, etc) should
-                       be parsed.
-        fractional_numbers bool: True if we should look for fractions and
-                                 decimals.
-
-    Returns:
-        [ReplaceableNumber]: A list of tuples, each containing a number and a
-                         string.
-
-    """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_uk(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-        results.append(to_replace)
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
-
-
-def _extract_number_with_text_uk(tokens, short_scale=True,
-                                 ordinals=False, fractional_numbers=True):
-    """
-    This function extracts a number from a list of Tokens.
-
-    Args:
-        tokens str: the string to normalize
-        short_scale (bool): use short scale if True, long scale if False
-        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
-        fractional_numbers (bool): True if we should look for fractions and
-                                   decimals.
-    Returns:
-        ReplaceableNumber
-
-    """
-    number, tokens = \
-        _extract_number_with_text_uk_helper(tokens, short_scale,
-                                            ordinals, fractional_numbers)
-    return ReplaceableNumber(number, tokens)
-
-
-def _extract_number_with_text_uk_helper(tokens,
-                                        short_scale=True, ordinals=False,
-                                        fractional_numbers=True):
-    """
-    Helper for _extract_number_with_text_uk.
-
-    This contains the real logic for parsing, but produces
-    a result that needs a little cleaning (specific, it may
-    contain leading articles that can be trimmed off).
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-        fractional_numbers boolean:
-
-    Returns:
-        int or float, [Tokens]
-
-    """
-    if fractional_numbers:
-        fraction, fraction_text = \
-            _extract_fraction_with_text_uk(tokens, short_scale, ordinals)
-        if fraction:
-            return fraction, fraction_text
-
-        decimal, decimal_text = \
-            _extract_decimal_with_text_uk(tokens, short_scale, ordinals)
-        if decimal:
-            return decimal, decimal_text
-    # special_number = [word for word in tokens if word ]
-    # short_scale == False
-    return _extract_whole_number_with_text_uk(tokens, short_scale, ordinals)
-
-
-def _extract_fraction_with_text_uk(tokens, short_scale, ordinals):
-    """
-    Extract fraction numbers from a string.
-
-    This function handles text such as '2 and 3/4'. Note that "one half" or
-    similar will be parsed by the whole number function.
-
-    Args:
-        tokens [Token]: words and their indexes in the original string.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (int or float, [Token])
-        The value found, and the list of relevant tokens.
-        (None, None) if no fraction value is found.
-
-    """
-    for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_uk(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_uk(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=True)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            # ensure first is not a fraction and second is a fraction
-            num1 = numbers1[-1]
-            num2 = numbers2[0]
-            if num1.value >= 1 and 0 < num2.value < 1:
-                return num1.value + num2.value, \
-                       num1.tokens + partitions[1] + num2.tokens
-
-    return None, None
-
-
-def _extract_decimal_with_text_uk(tokens, short_scale, ordinals):
-    """
-    Extract decimal numbers from a string.
-
-    This function handles text such as '2 point 5'.
-
-    Notes:
-        While this is a helper for extract_number_xx, it also depends on
-        extract_number_xx, to parse out the components of the decimal.
-
-        This does not currently handle things like:
-            number dot number number number
-
-    Args:
-        tokens [Token]: The text to parse.
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        (float, [Token])
-        The value found and relevant tokens.
-        (None, None) if no decimal value is found.
-
-    """
-    for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
-
-        if len(partitions) == 3:
-            numbers1 = \
-                _extract_numbers_with_text_uk(partitions[0], short_scale,
-                                              ordinals, fractional_numbers=False)
-            numbers2 = \
-                _extract_numbers_with_text_uk(partitions[2], short_scale,
-                                              ordinals, fractional_numbers=False)
-
-            if not numbers1 or not numbers2:
-                return None, None
-
-            number = numbers1[-1]
-            decimal = numbers2[0]
-
-            # TODO handle number dot number number number
-            if "." not in str(decimal.text):
-                return number.value + float('0.' + str(decimal.value)), \
-                       number.tokens + partitions[1] + decimal.tokens
-    return None, None
-
-
-def _extract_whole_number_with_text_uk(tokens, short_scale, ordinals):
-    """
-    Handle numbers not handled by the decimal or fraction functions. This is
-    generally whole numbers. Note that phrases such as "one half" will be
-    handled by this function, while "one and a half" are handled by the
-    fraction function.
-
-    Args:
-        tokens [Token]:
-        short_scale boolean:
-        ordinals boolean:
-
-    Returns:
-        int or float, [Tokens]
-        The value parsed, and tokens that it corresponds to.
-
-    """
-    number_token = [token for token in tokens if token.word.lower() in _MULTIPLIES_LONG_SCALE_UK]
-    if number_token:
-        short_scale = False
-    multiplies, string_num_ordinal, string_num_scale = \
-        _initialize_number_data(short_scale)
-    number_words = []  # type: [Token]
-    val = False
-    prev_val = None
-    next_val = None
-    to_sum = []
-    for idx, token in enumerate(tokens):
-        current_val = None
-        if next_val:
-            next_val = None
-            continue
-
-        word = token.word
-        if word in word in _NEGATIVES:
-            number_words.append(token)
-            continue
-
-        prev_word = tokens[idx - 1].word if idx > 0 else ""
-        prev_word = _text_uk_inflection_normalize(prev_word, 1)
-        next_word = tokens[idx + 1].word if idx + 1 < len(tokens) else ""
-        next_word = _text_uk_inflection_normalize(next_word, 1)
-
-        # In Ukrainian (?) we do not use suffix (1st,2nd,..) but use point instead (1.,2.,..)
-        if is_numeric(word[:-1]) and \
-                (word.endswith(".")):
-            # explicit ordinals, 1st, 2nd, 3rd, 4th.... Nth
-            word = word[:-1]
-
-        # Normalize Ukrainian inflection of numbers (один, одна, одно,...)
-        if not ordinals:
-            if word not in _STRING_NUM_UK:
-                word = _text_uk_inflection_normalize(word, 1)
-
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_UK and \
-                word not in _SUMS and \
-                word not in multiplies and \
-                not (ordinals and word in string_num_ordinal) and \
-                not is_numeric(word) and \
-                not is_fractional_uk(word, word, short_scale=short_scale) and \
-                not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
-            if number_words and not all([w in _NEGATIVES for w in words_only]):
-                break
-            else:
-                number_words = []
-                continue
-        elif word not in multiplies \
-                and prev_word not in multiplies \
-                and prev_word not in _SUMS \
-                and not (ordinals and prev_word in string_num_ordinal) \
-                and prev_word not in _NEGATIVES:
-
-            number_words = [token]
-        elif prev_word in _SUMS and word in _SUMS :
-            number_words = [token]
-        else:
-            number_words.append(token)
-        # is this word already a number ?
-        if is_numeric(word):
-            if word.isdigit():  # doesn't work with decimals
-                val = int(word)
-            else:
-                val = float(word)
-            current_val = val
+def _build_number_data_uk(short_scale):
+    """Build the dictionaries returned by _initialize_number_data"""
+    multiplies = _MULTIPLIES_SHORT_SCALE_UK if short_scale \
+        else _MULTIPLIES_LONG_SCALE_UK
+    multiplies = multiplies | {"тисячa", "тисячі", "тисячу", "тисячах",
+                               "тисячaми", "тисячею", "тисяч"}
 
-        # is this word the name of a number ?
-        if word in _STRING_NUM_UK:
-            val = _STRING_NUM_UK.get(word)
-            current_val = val
-        elif word in string_num_scale:
-            val = string_num_scale.get(word)
-            current_val = val
-        elif ordinals and word in string_num_ordinal:
-            val = string_num_ordinal[word]
-            current_val = val
-        # is the prev word an ordinal number and current word is one?
-        # second one, third one
-        if ordinals and prev_word in string_num_ordinal and val == 1:
-            val = prev_val
-        # is the prev word a number and should we sum it?
-        # twenty two, fifty six
-        if (prev_word in _SUMS and val and val < 10) \
-                or (prev_word in _SUMS and val and val < 100 and prev_val >= 100) \
-                or all([prev_word in multiplies, val < prev_val if prev_val else False]):
-            val = prev_val + val
-
-        # is the prev word a number and should we multiply it?
-        multiplies.update({"тисячa", "тисячі", "тисячу", "тисячах", "тисячaми", "тисячею", "тисяч"})
-        if word in multiplies:
-            if not prev_val:
-                prev_val = 1
-            val = prev_val * val
+    string_num_ordinal_uk = _STRING_SHORT_ORDINAL_UK if short_scale \
+        else _STRING_LONG_ORDINAL_UK
 
-        # пара сотень, три пари пива
-        if prev_word in ['пара', 'пари', 'парою', 'парами'] and current_val != 1000.0:
-            val = val * 2
-        if prev_val in _STRING_NUM_UK.values() and current_val == 100:
-            val = prev_val * current_val
+    string_num_scale_uk = _SHORT_SCALE_UK if short_scale else _LONG_SCALE_UK
+    string_num_scale_uk = invert_dict(string_num_scale_uk)
+    string_num_scale_uk.update(generate_plurals_uk(string_num_scale_uk))
+    return (frozenset(multiplies),
+            MappingProxyType(dict(string_num_ordinal_uk)),
+            MappingProxyType(string_num_scale_uk))
 
-        # half cup
-        if val is False:
-            val = is_fractional_uk(word, word, short_scale=short_scale)
-            current_val = val
-
-        # 2 fifths
-        if not ordinals:
-            next_val = is_fractional_uk(next_word, word, short_scale=short_scale)
-            if next_val:
-                if not val:
-                    val = 1
-                val = val * next_val
-                number_words.append(tokens[idx + 1])
-        if word in ['пара', 'пари', 'парою', 'парами']:
-            if prev_val:
-                val = val * prev_val
-            else:
-                val = 2
-        # is this a negative number?
-        if val and prev_word and prev_word in _NEGATIVES:
-            val = 0 - val
-
-        # let's make sure it isn't a fraction
-        if not val:
-            # look for fractions like "2/3"
-            a_pieces = word.split('/')
-            if look_for_fractions(a_pieces):
-                val = float(a_pieces[0]) / float(a_pieces[1])
-        else:
-            # checking if word is digit in order not to substitute
-            # existing calculated value
-            new_word = re.sub(r'\.', '', word)
-            if all([
-                prev_word in _SUMS,
-                word not in _SUMS,
-                new_word.isdigit() is False,
-                word not in multiplies,
-                current_val >= 10
-            ]):
-                # Backtrack - we've got numbers we can't sum.
-                number_words.pop()
-                val = prev_val
-                break
-            prev_val = val
-            if word in multiplies and next_word not in multiplies:
-                # handle long numbers
-                # six hundred sixty six
-                # two million five hundred thousand
-                #
-                # This logic is somewhat complex, and warrants
-                # extensive documentation for the next coder's sake.
-                #
-                # The current word is a power of ten. `current_val` is
-                # its integer value. `val` is our working sum
-                # (above, when `current_val` is 1 million, `val` is
-                # 2 million.)
-                #
-                # We have a dict `string_num_scale` containing [value, word]
-                # pairs for "all" powers of ten: string_num_scale[10] == "ten.
-                #
-                # We need go over the rest of the tokens, looking for other
-                # powers of ten. If we find one, we compare it with the current
-                # value, to see if it's smaller than the current power of ten.
-                #
-                # Numbers which are not powers of ten will be passed over.
-                #
-                # If all the remaining powers of ten are smaller than our
-                # current value, we can set the current value aside for later,
-                # and begin extracting another portion of our final result.
-                # For example, suppose we have the following string.
-                # The current word is "million".`val` is 9000000.
-                # `current_val` is 1000000.
-                #
-                #    "nine **million** nine *hundred* seven **thousand**
-                #     six *hundred* fifty seven"
-                #
-                # Iterating over the rest of the string, the current
-                # value is larger than all remaining powers of ten.
-                #
-                # The if statement passes, and nine million (9000000)
-                # is appended to `to_sum`.
-                #
-                # The main variables are reset, and the main loop begins
-                # assembling another number, which will also be appended
-                # under the same conditions.
-                #
-                # By the end of the main loop, to_sum will be a list of each
-                # "place" from 100 up: [9000000, 907000, 600]
-                #
-                # The final three digits will be added to the sum of that list
-                # at the end of the main loop, to produce the extracted number:
-                #
-                #    sum([9000000, 907000, 600]) + 57
-                # == 9,000,000 + 907,000 + 600 + 57
-                # == 9,907,657
-                #
-                # >>> foo = "nine million nine hundred seven thousand six
-                #            hundred fifty seven"
-                # >>> extract_number(foo)
-                # 9907657
-                time_to_sum = True
-                for other_token in tokens[idx + 1:]:
-                    if other_token.word in multiplies:
-                        if string_num_scale[other_token.word] >= current_val:
-                            time_to_sum = False
-                        else:
-                            continue
-                    if not time_to_sum:
-                        break
-                if time_to_sum:
-                    to_sum.append(val)
-                    val = 0
-                    prev_val = 0
 
-    if val is not None and to_sum:
-        val += sum(to_sum)
-    return val, number_words
+# {short_scale: (multiplies, string_num_ordinal, string_num_scale)}
+_NUMBER_DATA_UK = {short_scale: _build_number_data_uk(short_scale)
+                   for short_scale in (True, False)}
 
 
 def _initialize_number_data(short_scale):
     """
-    Generate dictionaries of words to numbers, based on scale.
+    Get the dictionaries of words to numbers, based on scale.
 
     This is a helper function for _extract_whole_number.
 
@@ -600,20 +162,11 @@ def _initialize_number_data(short_scale):
         short_scale boolean:
 
     Returns:
-        (set(str), dict(str, number), dict(str, number))
+        (frozenset(str), Mapping(str, number), Mapping(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
     """
-    multiplies = _MULTIPLIES_SHORT_SCALE_UK if short_scale \
-        else _MULTIPLIES_LONG_SCALE_UK
-
-    string_num_ordinal_uk = _STRING_SHORT_ORDINAL_UK if short_scale \
-        else _STRING_LONG_ORDINAL_UK
-
-    string_num_scale_uk = _SHORT_SCALE_UK if short_scale else _LONG_SCALE_UK
-    string_num_scale_uk = invert_dict(string_num_scale_uk)
-    string_num_scale_uk.update(generate_plurals_uk(string_num_scale_uk))
-    return multiplies, string_num_ordinal_uk, string_num_scale_uk
+    return _NUMBER_DATA_UK[bool(short_scale)]
 
 
 def extract_number_uk(text, short_scale=True, ordinals=False):
@@ -632,8 +185,8 @@ def extract_number_uk(text, short_scale=True, ordinals=False):
                                    was found
 
     """
-    return _extract_number_with_text_uk(tokenize(text.lower()),
-                                        short_scale, ordinals).value
+    return _NUMBER_PARSER_UK.extract_number(text.lower(), short_scale,
+                                            ordinals)
 
 
 def extract_duration_uk(text):
@@ -679,7 +232,7 @@ def extract_duration_uk(text):
     }
 
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?"
-    text = _convert_words_to_numbers_uk(text)
+    text = _NUMBER_PARSER_UK.convert_words_to_numbers(text)
 
     for (unit_uk, unit_en) in _TIME_UNITS_CONVERSION.items():
         unit_pattern = pattern.format(unit=unit_uk)
@@ -700,6 +253,92 @@ def extract_duration_uk(text):
     return duration, text
 
 
+# the vocabulary of extract_datetime_uk
+_TIME_QUALIFIERS_AM_UK = frozenset(_WORDS_MORNING_UK)
+_TIME_QUALIFIERS_PM_UK = frozenset(['дня', 'вечора'] + _WORDS_DAY_UK +
+                                   _WORDS_EVENING_UK + _WORDS_NIGHT_UK)
+_TIME_QUALIFIERS_UK = _TIME_QUALIFIERS_AM_UK | _TIME_QUALIFIERS_PM_UK
+_DATETIME_MARKERS_UK = frozenset(['на', 'у', 'в', 'о', 'до', 'це', 'біля',
+                                  'цей', 'через', 'після', 'за', 'той'])
+# {day: weekday}, понеділок is 0
+_DAYS_UK = {day: weekday for weekday, day in enumerate(
+    ["понеділок", "вівторок", "середа", "четвер", "п'ятниця", "субота",
+     "неділя"])}
+# {month: index in _MONTHS_UK}
+_MONTH_INDEXES_UK = {month: idx for idx, month in enumerate(_MONTHS_UK)}
+_MONTHS_SHORT_UK = {month: idx for idx, month in enumerate(
+    ["січ", "лют", "бер", "квіт", "трав", "червень", "лип", "серп", "верес",
+     "жовт", "листоп", "груд"])}
+_RECUR_MARKERS_UK = frozenset(_DAYS_UK) | frozenset(['вихідні', 'вікенд'])
+_YEAR_MULTIPLES_UK = frozenset(["десятиліття", "століття", "тисячоліття",
+                                "тисячоліть", "століть", "сторіччя",
+                                "сторіч"])
+# the words that may follow "до", "по" and "з" in a date,
+# "через 5 днів з завтра", "2 місяці з липня"
+_FROM_FOLLOWUPS_UK = frozenset(_DAYS_UK) | frozenset(_MONTH_INDEXES_UK) | \
+    frozenset(_MONTHS_SHORT_UK) | \
+    frozenset(["сьогодні", "завтра", "післязавтра", "вчора", "позавчора"]) | \
+    frozenset(_WORDS_NEXT_UK + _WORDS_PREV_UK + _WORDS_CURRENT_UK +
+              _WORDS_NOW_UK)
+# the cleaning step of extract_datetime_uk
+_DATETIME_SUBSTITUTIONS_UK = compile_substitutions(
+    {"сьогодні вечером": "ввечері", "сьогодні ввечері": "ввечері",
+     "вечором": "ввечері", "сьогодні вночі": "вночі"}, delete="?.,")
+
+
+def _datetime_words_uk(s):
+    """The words of s, cleaned for extract_datetime_uk"""
+    # clean unneeded punctuation and capitalization among other things.
+    # Normalize Ukrainian inflection
+    word_list = _DATETIME_SUBSTITUTIONS_UK(s.lower()).split()
+
+    for idx, word in enumerate(word_list):
+        ##########
+        # Ukrainian Day Ordinals - we do not use 1st,2nd format
+        #   instead we use full ordinal number names with specific format(suffix)
+        #   Example: двадцять третього - 23
+        count_ordinals = 0
+        if word == "третього":
+            count_ordinals = 3
+        #   Example: тридцять першого - 31
+        elif word.endswith("ого"):
+            tmp = word[:-3]
+            tmp += "ий"
+            for nr, name in _ORDINAL_BASE_UK.items():
+                if name == tmp:
+                    count_ordinals = nr
+        #   Example: тридцять перше > 31
+        elif word.endswith("є") or word.endswith("е"):
+            tmp = word[:-1]
+            tmp += "ий"
+            for nr, name in _ORDINAL_BASE_UK.items():
+                if name == tmp:
+                    count_ordinals = nr
+        # If number is bigger than 19 check if next word is also ordinal
+        #  and count them together
+        if count_ordinals > 19:
+            if word_list[idx + 1] == "третього":
+                count_ordinals += 3
+            elif word_list[idx + 1].endswith("ого"):
+                tmp = word_list[idx + 1][:-3]
+                tmp += "ий"
+                for nr, name in _ORDINAL_BASE_UK.items():
+                    if name == tmp and nr < 10:
+                        # write only if sum makes acceptable count of days in month
+                        if (count_ordinals + nr) <= 31:
+                            count_ordinals += nr
+
+        if count_ordinals > 0:
+            word = str(count_ordinals)  # Write normalized value into word
+        if count_ordinals > 20:
+            # If counted number is greater than 20, clear next word so it is not used again
+            word_list[idx + 1] = ""
+        ##########
+        # Remove inflection from Ukrainian months
+        word_list[idx] = word
+    return word_list
+
+
 def extract_datetime_uk(text, anchor_date=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -730,60 +369,33 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if text == "":
+        return None
+    return _extract_datetime_words_uk(_datetime_words_uk(text),
+                                      anchor_date, default_time)
 
-    def clean_string(s):
-        # clean unneeded punctuation and capitalization among other things.
-        # Normalize Ukrainian inflection
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '')
-        s = s.replace("сьогодні вечером|сьогодні ввечері|вечором", "ввечері")
-        s = s.replace("сьогодні вночі", "вночі")
-        word_list = s.split()
-
-        for idx, word in enumerate(word_list):
-            ##########
-            # Ukrainian Day Ordinals - we do not use 1st,2nd format
-            #   instead we use full ordinal number names with specific format(suffix)
-            #   Example: двадцять третього - 23
-            count_ordinals = 0
-            if word == "третього":
-                count_ordinals = 3
-            #   Example: тридцять першого - 31
-            elif word.endswith("ого"):
-                tmp = word[:-3]
-                tmp += "ий"
-                for nr, name in _ORDINAL_BASE_UK.items():
-                    if name == tmp:
-                        count_ordinals = nr
-            #   Example: тридцять перше > 31
-            elif word.endswith("є") or word.endswith("е"):
-                tmp = word[:-1]
-                tmp += "ий"
-                for nr, name in _ORDINAL_BASE_UK.items():
-                    if name == tmp:
-                        count_ordinals = nr
-            # If number is bigger than 19 check if next word is also ordinal
-            #  and count them together
-            if count_ordinals > 19:
-                if word_list[idx + 1] == "третього":
-                    count_ordinals += 3
-                elif word_list[idx + 1].endswith("ого"):
-                    tmp = word_list[idx + 1][:-3]
-                    tmp += "ий"
-                    for nr, name in _ORDINAL_BASE_UK.items():
-                        if name == tmp and nr < 10:
-                            # write only if sum makes acceptable count of days in month
-                            if (count_ordinals + nr) <= 31:
-                                count_ordinals += nr
-
-            if count_ordinals > 0:
-                word = str(count_ordinals)  # Write normalized value into word
-            if count_ordinals > 20:
-                # If counted number is greater than 20, clear next word so it is not used again
-                word_list[idx + 1] = ""
-            ##########
-            # Remove inflection from Ukrainian months
-            word_list[idx] = word
-        return word_list
+
+def extract_datetimes_uk(text, anchor_date=None, default_time=None):
+    """ Extract every date and time expression of a text
+
+    See extract_datetime_uk, which the words of each expression are
+    parsed with.
+
+    Returns:
+        [(datetime, (int, int))]: each date found with its span in the
+                                  text, in the order of the text
+    """
+    return extract_datetime_spans_generic(text, _datetime_words_uk,
+                                          _extract_datetime_words_uk,
+                                          ["і"], anchor_date,
+                                          default_time)
+
+
+def _extract_datetime_words_uk(words, anchor_date=None, default_time=None):
+    """
+    extract_datetime_uk on the words of a text cleaned by
+    _datetime_words_uk, replacing the words it uses with "".
+    """
 
     def date_found():
         return found or \
@@ -795,9 +407,6 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                        min_abs or sec_offset != 0
                )
 
-    if text == "":
-        return None
-
     anchor_date = anchor_date or now_local()
     found = False
     day_specified = False
@@ -811,31 +420,13 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
     has_year = False
     time_qualifier = ""
 
-    time_qualifiers_am = _WORDS_MORNING_UK
-    time_qualifiers_pm = ['дня', 'вечора']
-    time_qualifiers_pm.extend(_WORDS_DAY_UK)
-    time_qualifiers_pm.extend(_WORDS_EVENING_UK)
-    time_qualifiers_pm.extend(_WORDS_NIGHT_UK)
-    time_qualifiers_list = set(time_qualifiers_am + time_qualifiers_pm)
-    markers = ['на', 'у', 'в', 'о', 'до', 'це',
-               'біля', 'цей', 'через', 'після', 'за', 'той']
-    days = ["понеділок", "вівторок", "середа",
-            "четвер", "п'ятниця", "субота", "неділя"]
-    months = _MONTHS_UK
-    recur_markers = days + ['вихідні', 'вікенд']
-    months_short = ["січ", "лют", "бер", "квіт", "трав", "червень", "лип", "серп",
-    "верес", "жовт", "листоп", "груд"]
-    year_multiples = ["десятиліття", "століття", "тисячоліття", "тисячоліть", "століть",
-                        "сторіччя", "сторіч"]
-
-    words = clean_string(text)
     preposition = ""
 
     for idx, word in enumerate(words):
         if word == "":
             continue
 
-        if word in markers:
+        if word in _DATETIME_MARKERS_UK:
             preposition = word
 
         word = _text_uk_inflection_normalize(word, 2)
@@ -852,11 +443,12 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
         start = idx
         used = 0
         if word in _WORDS_NOW_UK and not date_string:
+            words[idx] = ""
             result_str = " ".join(words[idx + 1:])
             result_str = ' '.join(result_str.split())
             extracted_date = anchor_date.replace(microsecond=0)
             return [extracted_date, result_str]
-        elif word_next in year_multiples:
+        elif word_next in _YEAR_MULTIPLES_UK:
             multiplier = None
             if is_numeric(word):
                 multiplier = extract_number_uk(word)
@@ -871,7 +463,8 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 year_offset = multiplier * 1000
             elif word_next in ["тисяча", "тисячі", "тисяч"]:
                 year_offset = multiplier * 1000
-        elif word in time_qualifiers_list and preposition != "через" and word_next != "тому":
+        elif word in _TIME_QUALIFIERS_UK and preposition != "через" and \
+                word_next != "тому":
             time_qualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "сьогодні" and not from_flag:
@@ -976,8 +569,8 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 used = 1
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not from_flag:
-            d = days.index(word)
+        elif word in _DAYS_UK and not from_flag:
+            d = _DAYS_UK[word]
             day_offset = (d + 1) - int(today)
             used = 1
             if day_offset < 0:
@@ -991,11 +584,11 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 day_offset -= 7
                 used += 1
                 start -= 1
-        elif word in months or word in months_short and not from_flag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = months_short.index(word)
+        elif word in _MONTH_INDEXES_UK or \
+                word in _MONTHS_SHORT_UK and not from_flag:
+            m = _MONTH_INDEXES_UK.get(word)
+            if m is None:
+                m = _MONTHS_SHORT_UK[word]
             used += 1
             # Convert Ukrainian months to english
             date_string = _MONTHS_CONVERSION.get(m)
@@ -1028,21 +621,8 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        valid_followups = days + months + months_short
-        valid_followups.append("сьогодні")
-        valid_followups.append("завтра")
-        valid_followups.append("післязавтра")
-        valid_followups.append("вчора")
-        valid_followups.append("позавчора")
-        for followup in _WORDS_NEXT_UK:
-            valid_followups.append(followup)
-        for followup in _WORDS_PREV_UK:
-            valid_followups.append(followup)
-        for followup in _WORDS_CURRENT_UK:
-            valid_followups.append(followup)
-        for followup in _WORDS_NOW_UK:
-            valid_followups.append(followup)
-        if (word in ["до", "по", "з"]) and word_next in valid_followups:
+        if (word in ["до", "по", "з"]) and \
+                word_next in _FROM_FOLLOWUPS_UK:
             used = 2
             from_flag = True
             if word_next == "завтра":
@@ -1053,15 +633,15 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 day_offset -= 1
             elif word_next == "позавчора":
                 day_offset -= 2
-            elif word_next in days:
-                d = days.index(word_next)
+            elif word_next in _DAYS_UK:
+                d = _DAYS_UK[word_next]
                 tmp_offset = (d + 1) - int(today)
                 used = 2
                 if tmp_offset < 0:
                     tmp_offset += 7
                 day_offset += tmp_offset
-            elif word_next_next and word_next_next in days:
-                d = days.index(word_next_next)
+            elif word_next_next and word_next_next in _DAYS_UK:
+                d = _DAYS_UK[word_next_next]
                 tmp_offset = (d + 1) - int(today)
                 used = 3
                 if word_next in _WORDS_NEXT_UK:
@@ -1082,7 +662,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _DATETIME_MARKERS_UK:
                 words[start - 1] = ""
             found = True
             day_specified = True
@@ -1100,7 +680,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
         if word == "":
             continue
 
-        if word in markers:
+        if word in _DATETIME_MARKERS_UK:
             preposition = word
         word = _text_uk_inflection_normalize(word, 1)
         word_prev_prev = _text_uk_inflection_normalize(
@@ -1142,7 +722,8 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
         # parse half an hour, quarter hour
         #  should be added different variations oh "hour forms"
         elif word in ["година", "годину", "години"] and \
-                (word_prev in markers or word_prev_prev in markers):
+                (word_prev in _DATETIME_MARKERS_UK or
+                 word_prev_prev in _DATETIME_MARKERS_UK):
             if word_prev in ["пів", "половина", "опів на", "опів"]:
                 min_offset = 30
             elif word_prev == "чверть":
@@ -1152,7 +733,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 hr_offset = 1
             else:
                 hr_offset = 1
-            if word_prev_prev in markers:
+            if word_prev_prev in _DATETIME_MARKERS_UK:
                 words[idx - 2] = ""
                 if word_prev_prev in _WORDS_CURRENT_UK:
                     day_specified = True
@@ -1270,7 +851,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                         if time_qualifier != "":
                             military = True
                             if str_hh and int(str_hh) <= 12 and \
-                                    (time_qualifier in time_qualifiers_pm):
+                                    (time_qualifier in _TIME_QUALIFIERS_PM_UK):
                                 str_hh += str(int(str_hh) + 12)
 
             else:
@@ -1324,9 +905,9 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        word_next in recur_markers or
-                        word_next_next in recur_markers):
+                        remainder in _RECUR_MARKERS_UK or
+                        word_next in _RECUR_MARKERS_UK or
+                        word_next_next in _RECUR_MARKERS_UK):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set str_hh so that is_time == True
                     # when am or pm is not specified
@@ -1414,21 +995,23 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                             if (word_next_next and
                                     (word_next_next in time_qualifier or
                                      word_next_next_next in time_qualifier)):
-                                if (word_next_next in time_qualifiers_pm or
-                                        word_next_next_next in time_qualifiers_pm):
+                                if (word_next_next in _TIME_QUALIFIERS_PM_UK or
+                                        word_next_next_next in
+                                        _TIME_QUALIFIERS_PM_UK):
                                     remainder = "pm"
                                     used += 1
-                                if (word_next_next in time_qualifiers_am or
-                                        word_next_next_next in time_qualifiers_am):
+                                if (word_next_next in _TIME_QUALIFIERS_AM_UK or
+                                        word_next_next_next in
+                                        _TIME_QUALIFIERS_AM_UK):
                                     remainder = "am"
                                     used += 1
 
                         if time_qualifier != "":
-                            if time_qualifier in time_qualifiers_pm:
+                            if time_qualifier in _TIME_QUALIFIERS_PM_UK:
                                 remainder = "pm"
                                 used += 1
 
-                            elif time_qualifier in time_qualifiers_am:
+                            elif time_qualifier in _TIME_QUALIFIERS_AM_UK:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1465,7 +1048,7 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 else:
                     # has passed, assume the next morning
                     day_offset += 1
-            if time_qualifier in time_qualifiers_pm and hh < 12:
+            if time_qualifier in _TIME_QUALIFIERS_PM_UK and hh < 12:
                 hh += 12
 
             if hh > 24 or mm > 59:
@@ -1494,11 +1077,11 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
                 hr_offset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and word_prev in markers:
+            if idx > 0 and word_prev in _DATETIME_MARKERS_UK:
                 words[idx - 1] = ""
                 if word_prev in _WORDS_CURRENT_UK:
                     day_specified = True
-            if idx > 1 and word_prev_prev in markers:
+            if idx > 1 and word_prev_prev in _DATETIME_MARKERS_UK:
                 words[idx - 2] = ""
                 if word_prev_prev in _WORDS_CURRENT_UK:
                     day_specified = True
@@ -1585,17 +1168,8 @@ def extract_datetime_uk(text, anchor_date=None, default_time=None):
     return [extracted_date, result_str]
 
 # change logic here
-def is_fractional_uk(input_str, word, short_scale=True):
-    """
-    This function takes the given text and checks if it is a fraction.
-
-    Args:
-        input_str (str): the string to check if fractional
-        short_scale (bool): use short scale if True, long scale if False
-    Returns:
-        (bool) or (float): False if not a fraction, otherwise the fraction
-
-    """
+def _build_fractions_uk():
+    """Build _FRACTIONS_UK"""
     fractions = {"ціла": 1}
     # endings for creation different cases and plurals in different cases
     ending = ['ої', 'е', 'их', 'ою', 'і', 'ими', 'ій']
@@ -1611,13 +1185,114 @@ def is_fractional_uk(input_str, word, short_scale=True):
         "третина": 1 / 3, "треть": 1 / 3, "треті": 3, "третьої": 3,
         "чверті": 4, "чверть": 0.25, "чвертю": 0.25
     })
-    if input_str.lower() in fractions.keys():
+    return MappingProxyType(fractions)
+
+
+# {fraction word: value returned by is_fractional_uk}
+_FRACTIONS_UK = _build_fractions_uk()
+
+# values of the number words, to test membership in constant time
+_NUMBER_VALUES_UK = frozenset(_STRING_NUM_UK.values())
+
+
+def _build_number_lexer_uk(short_scale):
+    """Compile the number vocabulary used by _NUMBER_PARSER_UK"""
+    multiplies, string_num_ordinal, string_num_scale = \
+        _initialize_number_data(short_scale)
+    # is_fractional_uk ignores the case of words
+    lexer = NumberLexer(case_folded=NumberLexer.FRACTION)
+    lexer.add_all(_STRING_NUM_UK, NumberLexer.NUMBER)
+    lexer.add_all(string_num_scale, NumberLexer.SCALE)
+    lexer.add_all(_SUMS, NumberLexer.SUM)
+    lexer.add_all(multiplies, NumberLexer.MULTIPLIER)
+    lexer.add_all(string_num_ordinal, NumberLexer.ORDINAL)
+    lexer.add_all(_FRACTIONS_UK, NumberLexer.FRACTION)
+    lexer.add_all(_NEGATIVES, NumberLexer.NEGATIVE)
+    return lexer
+
+
+# {short_scale: NumberLexer}
+_NUMBER_LEXER_UK = {short_scale: _build_number_lexer_uk(short_scale)
+                    for short_scale in (True, False)}
+
+
+class _UkrainianNumberParser(NumberParser):
+    lexers = _NUMBER_LEXER_UK
+    fraction_markers = _FRACTION_MARKER
+    decimal_markers = _DECIMAL_MARKER
+    ordinal_suffixes = (".",)
+    # сто двадцять
+    sum_hundreds = True
+    backtrack_digits = False
+    normalize_neighbours = True
+    long_scale_words = _MULTIPLIES_LONG_SCALE_UK
+    # a pair of, multiplies the number around it by 2
+    pairs = frozenset(['пара', 'пари', 'парою', 'парами'])
+    context_words = pairs
+
+    def normalize(self, word, ordinals):
+        if not ordinals and word not in _STRING_NUM_UK:
+            return _text_uk_inflection_normalize(word, 1)
+        return word
+
+    def normalize_neighbour(self, word):
+        return _text_uk_inflection_normalize(word, 1)
+
+    def compose(self, word, prev_word, val, prev_val, current_val,
+                kinds, prev_kinds, ordinals):
+        val, prev_val = super().compose(word, prev_word, val, prev_val,
+                                        current_val, kinds, prev_kinds,
+                                        ordinals)
+        # пара сотень, три пари пива
+        if prev_word in self.pairs and current_val != 1000.0:
+            val = val * 2
+        if prev_val in _NUMBER_VALUES_UK and current_val == 100:
+            val = prev_val * current_val
+        return val, prev_val
+
+    def next_fraction(self, lexer, next_word, word, kinds):
+        next_val = super().next_fraction(lexer, next_word, word, kinds)
+        if next_val and next_word != word and kinds & NumberLexer.NUMBER:
+            next_val = 1.0 / next_val
+        return next_val
+
+    def read_fractions(self, lexer, tokens, idx, entry, prev, word,
+                       next_word, val, prev_val, current_val, number_words,
+                       ordinals):
+        val, prev_val, current_val, next_val, stop = super().read_fractions(
+            lexer, tokens, idx, entry, prev, word, next_word, val,
+            prev_val, current_val, number_words, ordinals)
+        if word in self.pairs:
+            if prev_val:
+                val = val * prev_val
+            else:
+                val = 2
+        return val, prev_val, current_val, next_val, stop
+
+
+_NUMBER_PARSER_UK = _UkrainianNumberParser()
+
+
+@word_memo("uk")
+def is_fractional_uk(input_str, word, short_scale=True):
+    """
+    This function takes the given text and checks if it is a fraction.
+
+    Args:
+        input_str (str): the string to check if fractional
+        short_scale (bool): use short scale if True, long scale if False
+    Returns:
+        (bool) or (float): False if not a fraction, otherwise the fraction
+
+    """
+    fraction = _FRACTIONS_UK.get(input_str.lower())
+    if fraction:
         if word == input_str:
-            return fractions[input_str.lower()]
+            return fraction
         elif word not in _STRING_NUM_UK:
-            return fractions[input_str.lower()]
+            return fraction
         else:
-            return 1.0 / fractions[input_str.lower()]
+            return 1.0 / fraction
     return False
 
 
@@ -1635,16 +1310,12 @@ def extract_numbers_uk(text, short_scale=True, ordinals=False):
     Returns:
         list: list of extracted numbers as floats
     """
-    results = _extract_numbers_with_text_uk(tokenize(text),
-                                            short_scale, ordinals)
-    #numbers_sum = sum([float(result.value) for result in results])
-    return [float(result.value) for result in results]
+    return [float(number) for number in
+            _NUMBER_PARSER_UK.extract_numbers(text, short_scale, ordinals)]
 
 
 class UkrainianNormalizer(Normalizer):
-    with open(resolve_resource_file("text/uk-ua/normalize.json"),
-              encoding='utf8') as f:
-        _default_config = json.load(f)
+    _default_config = resource_cache.get("text/uk-ua/normalize.json")
 
 
 def normalize_uk(text, remove_articles=True):
@@ -1652,6 +1323,7 @@ def normalize_uk(text, remove_articles=True):
     return UkrainianNormalizer().normalize(text, remove_articles)
 
 
+@word_memo("uk")
 def _text_uk_inflection_normalize(word, arg):
     """
     Ukrainian Inflection normalizer.
@@ -1669,7 +1341,7 @@ def _text_uk_inflection_normalize(word, arg):
     """
 
 
-    if arg == 1:  # _extract_whole_number_with_text_uk
+    if arg == 1:  # _NUMBER_PARSER_UK
         if word in ["одна", "одним", "одно", "одною", "одного", "одної", "одному", "одній", "одного", "одну"]:
             return "один"
         return _plurals_normalizer(word)
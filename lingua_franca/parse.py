@@ -13,21 +13,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
-
-from quebra_frases import span_indexed_word_tokenize
+from collections import deque
+from itertools import islice
 
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, localized_function, UnsupportedLanguageError, \
-    resolve_resource_file, FunctionNotLocalizedError, get_full_lang_code
+    FunctionNotLocalizedError, get_full_lang_code, get_default_loc, \
+    load_language, bind
+from lingua_franca.datetime_cache import cache_datetimes
 from lingua_franca.lang.parse_common import match_yes_or_no
+from lingua_franca.resources import resource_cache, lowercase_inverse
 from lingua_franca.util import match_one, fuzzy_match, MatchStrategy
-from lingua_franca.util.colors import Color, ColorOutOfSpace
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "extract_number",
                          "extract_duration",
                          "extract_datetime",
+                         "extract_datetimes",
+                         "extract_temporal_expression",
                          "extract_langcode",
                          "normalize",
                          "get_gender",
@@ -53,11 +56,12 @@ def get_color(text, lang=''):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
+    from lingua_franca.util.colors import Color, ColorOutOfSpace
+
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    COLORS = resource_cache.get(f"text/{lang}/colors.json",
+                                lowercase_inverse) or \
+        resource_cache.get("text/webcolors.json", lowercase_inverse)
 
     text = text.lower().strip()
     if text in COLORS:
@@ -81,11 +85,13 @@ def extract_color_spans(text, lang=''):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
+    from quebra_frases import span_indexed_word_tokenize
+    from lingua_franca.util.colors import Color
+
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    COLORS = resource_cache.get(f"text/{lang}/colors.json",
+                                lowercase_inverse) or \
+        resource_cache.get("text/webcolors.json", lowercase_inverse)
 
     color_spans = []
     text = text.lower()
@@ -123,21 +129,26 @@ def yes_or_no(text, lang=""):
     return match_yes_or_no(text, lang)
 
 
+def _spoken_lang_names(languages):
+    """Map the spoken names of languages to their codes"""
+    names = {}
+    for k, v in languages.items():
+        if isinstance(v, str):
+            v = [v]
+        # list of spoken names for this language
+        # multiple valid spellings may exist
+        for l in v:
+            names[l] = k
+    return names
+
+
 # TODO - variant kwarg - ISO 639-2 vs ISO 639-1
 @localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
 def extract_langcode(text, lang=""):
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
-                    resolve_resource_file("text/en-us/langs.json")
-    LANGUAGES = {}
-    with open(resource_file) as f:
-        for k, v in json.load(f).items():
-            if isinstance(v, str):
-                v = [v]
-            # list of spoken names for this language
-            # multiple valid spellings may exist
-            for l in v:
-                LANGUAGES[l] = k
+    LANGUAGES = resource_cache.get(f"text/{lang}/langs.json",
+                                   _spoken_lang_names) or \
+        resource_cache.get("text/en-us/langs.json", _spoken_lang_names)
     return match_one(text, LANGUAGES, strategy=MatchStrategy.TOKEN_SET_RATIO)
 
 
@@ -160,6 +171,77 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
+# the language bound in each worker process of extract_numbers_batch
+_batch_worker = None
+
+
+def _init_batch_worker(lang):
+    global _batch_worker
+    load_language(lang)
+    _batch_worker = bind(lang)
+
+
+def _extract_numbers_chunk(texts, short_scale, ordinals):
+    extract = _batch_worker.extract_numbers
+    return [extract(text, short_scale=short_scale, ordinals=ordinals)
+            for text in texts]
+
+
+def extract_numbers_batch(texts, short_scale=True, ordinals=False, lang='',
+                          workers=None, chunksize=64):
+    """
+        Extracts the numbers of many strings, one list per string.
+
+        Same as calling `extract_numbers` on each string, but the language
+        is resolved once for the whole batch rather than on every call.
+        With `workers`, the strings are split in chunks of `chunksize`
+        and spread over a pool of processes, each of which loads the
+        language once when it starts.
+
+        Results are yielded in the order of `texts`, as soon as they are
+        available, and only a few chunks are read ahead of the results,
+        so `texts` may be a generator over a large corpus.
+
+    Args:
+        texts (iterable): the strings to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead
+            of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): number of worker processes, if omitted
+                                 or 1 the strings are parsed in this process
+        chunksize (int): number of strings sent to a worker at once
+    Returns:
+        generator: a list of extracted numbers for each string, as
+                   `extract_numbers` would return
+    """
+    bound = bind(lang or get_default_loc())
+    if not workers or workers <= 1:
+        extract = bound.extract_numbers
+        for text in texts:
+            yield extract(text, short_scale=short_scale, ordinals=ordinals)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    texts = iter(texts)
+    with ProcessPoolExecutor(workers, initializer=_init_batch_worker,
+                             initargs=(bound.full_lang,)) as pool:
+        pending = deque()
+        while True:
+            # keep every worker busy, without reading all of `texts`
+            while len(pending) < 2 * workers:
+                chunk = list(islice(texts, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_extract_numbers_chunk, chunk,
+                                           short_scale, ordinals))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
 @localized_function()
 def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """Takes in a string and extracts a number.
@@ -211,6 +293,7 @@ def extract_duration(text, lang=''):
     """
 
 
+@cache_datetimes
 @localized_function()
 def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
@@ -265,6 +348,79 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+@localized_function()
+def extract_datetimes(text, anchorDate=None, lang='', default_time=None):
+    """
+    Extracts every date and time expression from a sentence, with its
+    span in the sentence.
+
+    Where extract_datetime() merges all the date and time words it finds
+    into one date, this parses each run of them on its own, from a single
+    cleaning of the text, so that finding every date in a message doesn't
+    take parsing its leftover string again and again.
+
+    Args:
+        text (str): the text to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            an expression.
+
+    Returns:
+        (list): list of tuples with each datetime found and its span in
+                the text [(datetime, (start_idx, end_idx))], in the order
+                of the text. Empty if no date or time related text is
+                found.
+
+    Examples:
+
+        >>> extract_datetimes(
+        ... "move the meeting from monday to wednesday at 3",
+        ... datetime(2017, 6, 27, 13, 4)
+        ... )
+        [(datetime.datetime(2017, 7, 3, 0, 0), (17, 28)),
+         (datetime.datetime(2017, 6, 28, 3, 0), (32, 46))]
+    """
+
+
+@localized_function()
+def extract_temporal_expression(text, anchorDate=None, lang='',
+                                default_time=None):
+    """
+    Extracts a date and time expression from a sentence, apart from the
+    anchor it is relative to.
+
+    The expression holds the offsets, absolute fields and qualifiers
+    extract_datetime() builds its date from, and
+    lingua_franca.temporal.resolve() applies it to many anchors without
+    parsing the sentence again for each of them.
+
+    Args:
+        text (str): the text to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            the words read against it, such as "next monday" or "at 5".
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+
+    Returns:
+        TemporalExpression: see lingua_franca.temporal, with the leftover
+                            text as its leftover attribute, or None if no
+                            date or time related text is found.
+
+    Examples:
+
+        >>> expression = extract_temporal_expression("in 3 days at 8 pm")
+        >>> expression.days, expression.hour, expression.minute
+        (3, 20, 0)
+        >>> resolve(expression, [datetime(2017, 6, 27, 13, 4)])
+        [datetime.datetime(2017, 6, 30, 20, 0, tzinfo=tzlocal())]
+    """
+
+
 @localized_function()
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
@@ -0,0 +1,195 @@
+"""Parse-once cache of the resource files in `lingua_franca/res/`.
+
+Resources such as `text/<lang>/colors.json` are needed on every call of the
+functions using them. `resource_cache` loads each of them once, along with
+the structure derived from it by the caller (an inverted dict, lowercased
+words, ...), and hands out that same object on every later call.
+
+Example:
+    >>> names = resource_cache.get("text/en-us/colors.json",
+    ...                            derive=lowercase_inverse)
+    >>> names["absolute zero"]
+    '#0048BA'
+
+The cached objects are shared, and must not be modified. Call
+`resource_cache.invalidate()` after changing a resource file, or
+`lingua_franca.refresh_resource_index()` after adding or removing one.
+With `lingua_franca.config.check_resource_mtimes` set, changed files are
+reloaded without either.
+"""
+import json
+import os
+import sys
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+
+from lingua_franca import config, internal
+from lingua_franca.internal import resolve_resource_file
+
+
+def _read_json(path):
+    with open(path, encoding="utf8") as f:
+        return _freeze(json.load(f))
+
+
+def _read_word_file(path):
+    """Non-comment lines of a .word file"""
+    with open(path, encoding="utf8") as f:
+        return tuple(line.strip() for line in f
+                     if not line.strip().startswith("#"))
+
+
+def _read_text(path):
+    with open(path, encoding="utf8") as f:
+        return f.read()
+
+
+_READERS = {".json": _read_json,
+            ".word": _read_word_file}
+
+
+def _freeze(value):
+    """Read-only copy of decoded JSON"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def lowercase_inverse(mapping):
+    """Invert a mapping, lowercasing the new keys
+
+    e.g. {"#0048BA": "Absolute Zero"} becomes {"absolute zero": "#0048BA"}
+    """
+    return MappingProxyType({v.lower(): k for k, v in mapping.items()})
+
+
+def _size_of(value, seen):
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, MappingProxyType):
+        # the proxy does not report the dict it wraps
+        value = dict(value)
+    if isinstance(value, dict):
+        size += sum(_size_of(k, seen) + _size_of(v, seen)
+                    for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_size_of(v, seen) for v in value)
+    return size
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _Entry:
+    __slots__ = ("path", "mtime", "checked", "value")
+
+    def __init__(self, path, value):
+        self.path = path
+        self.mtime = _get_mtime(path) if path else None
+        self.checked = monotonic()
+        self.value = value
+
+
+class ResourceCache:
+    """Resources loaded once, keyed by resource name and derivation
+
+    Resources are found with `lingua_franca.resolve_resource_file`, so
+    user overrides take precedence over the packaged files. Missing
+    resources are cached too, as None.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, res_name, derive=None):
+        """Get a loaded resource
+
+        Args:
+            res_name (str): resource name, e.g. "text/en-us/colors.json"
+            derive (callable, optional): builds the structure to cache from
+                the loaded resource. It is part of the cache key, so it
+                must be the same function object on every call, typically
+                a module level function.
+
+        Returns:
+            The decoded resource (read-only mappings and tuples for .json,
+            a tuple of the non-comment lines for .word, the text otherwise)
+            passed through `derive`, or None if the resource doesn't exist.
+        """
+        key = (res_name, derive)
+        entry = self._entries.get(key)
+        if entry is not None and not self._is_stale(res_name, entry):
+            with self._lock:
+                self.hits += 1
+            return entry.value
+
+        with self._lock:
+            self.misses += 1
+            path = resolve_resource_file(res_name)
+            value = None
+            if path:
+                reader = _READERS.get(os.path.splitext(path)[1], _read_text)
+                value = reader(path)
+                if derive is not None:
+                    value = derive(value)
+            self._entries[key] = _Entry(path, value)
+        return value
+
+    def _is_stale(self, res_name, entry):
+        if not config.check_resource_mtimes:
+            return False
+        if monotonic() - entry.checked < internal.RESOURCE_CHECK_INTERVAL:
+            return False
+        path = resolve_resource_file(res_name)
+        if path != entry.path or \
+                (path and _get_mtime(path) != entry.mtime):
+            return True
+        entry.checked = monotonic()
+        return False
+
+    def invalidate(self, res_name=None):
+        """Forget loaded resources, so that they are read again
+
+        Args:
+            res_name (str, optional): forget only this resource, and what
+                was derived from it
+        """
+        with self._lock:
+            if res_name is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries
+                            if key[0] == res_name]:
+                    del self._entries[key]
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: {"entries": number of cached resources,
+                   "hits": calls answered from the cache,
+                   "misses": calls which loaded a resource,
+                   "memory": approximate size of the cached objects, in
+                             bytes}
+        """
+        seen = set()
+        entries = list(self._entries.values())
+        return {"entries": len(entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory": sum(_size_of(entry.value, seen)
+                              for entry in entries)}
+
+
+resource_cache = ResourceCache()
@@ -0,0 +1,197 @@
+"""Temporal expressions: what a date and time phrase says, apart from the
+anchor it is relative to.
+
+`lingua_franca.parse.extract_temporal_expression` parses a phrase into a
+`TemporalExpression`, its offsets ("in 3 days"), absolute fields ("june
+5th", "at 5 pm") and qualifiers, and `resolve` applies it to any number
+of anchors with integer arithmetic on ordinal days and seconds, where
+`extract_datetime` would parse the phrase again for each anchor and build
+its result through a relativedelta for each offset.
+
+Some phrases are read against the anchor they are parsed at, "next
+monday" against its weekday or "at 5" against its time of day. An
+expression records the fields of that anchor it was read against, and is
+parsed again from its words for the anchors which differ in them, once
+per value of those fields in each call of `resolve`.
+
+Example:
+    >>> expression = extract_temporal_expression("tomorrow at 5 pm",
+    ...                                          datetime(2017, 6, 27))
+    >>> resolve(expression, [datetime(2017, 6, 27, 13, 4),
+    ...                      datetime(2017, 6, 30, 8, 0)])
+    [datetime.datetime(2017, 6, 28, 17, 0, tzinfo=...),
+     datetime.datetime(2017, 7, 1, 17, 0, tzinfo=...)]
+"""
+from calendar import monthrange
+from datetime import date, datetime, time
+
+from lingua_franca import config
+from lingua_franca.time import default_timezone
+
+# the fields of an anchor the parse of a phrase may be read against
+_ANCHOR_FIELDS = {
+    "weekday": lambda anchor: anchor.weekday(),
+    "year": lambda anchor: anchor.year,
+    "month": lambda anchor: (anchor.year, anchor.month),
+    "date": lambda anchor: anchor.toordinal(),
+    "time": lambda anchor: (anchor.hour, anchor.minute),
+}
+
+
+class TemporalExpression:
+    """What a date and time phrase says, apart from its anchor
+
+    Attributes:
+        years, months, days, hours, minutes, seconds (int): offsets from
+            the anchor, applied in that order
+        date (tuple): (year, month, day) of an explicit date, or None
+        has_year (bool): if False the year of date is the anchor's, or
+            the next one once that date has passed
+        hour, minute (int): time of day, or None
+        day_specified (bool): if False a time of day which has already
+            passed on the day of the anchor is the next day's
+        default_time (datetime.time): time of day when neither a date nor
+            an offset of less than a day is given
+        now (bool): the phrase is the anchor itself, "now"
+        leftover (str): the text the phrase isn't made of
+        anchored (dict): the fields of the anchor the phrase was read
+            against ("weekday", "year", "month", "date" or "time"), with
+            their values
+        reparse (function): reparse(anchor) is the TemporalExpression of
+            the phrase read against anchor, or None
+    """
+
+    def __init__(self, years=0, months=0, days=0, hours=0, minutes=0,
+                 seconds=0, date=None, has_year=False, hour=None,
+                 minute=None, day_specified=False, default_time=None,
+                 now=False, leftover="", anchored=(), anchor=None,
+                 reparse=None):
+        self.years = years
+        self.months = months
+        self.days = days
+        self.hours = hours
+        self.minutes = minutes
+        self.seconds = seconds
+        self.date = date
+        self.has_year = has_year
+        self.hour = hour
+        self.minute = minute
+        self.day_specified = day_specified
+        self.default_time = default_time or time(0, 0, 0)
+        self.now = now
+        self.leftover = leftover
+        self.anchored = {field: _ANCHOR_FIELDS[field](anchor)
+                         for field in sorted(anchored)}
+        self.reparse = reparse
+
+    def __repr__(self):
+        fields = ("years", "months", "days", "hours", "minutes", "seconds",
+                  "date", "has_year", "hour", "minute", "day_specified",
+                  "now", "leftover")
+        return "{}({})".format(self.__class__.__name__, ", ".join(
+            "{}={!r}".format(field, getattr(self, field))
+            for field in fields))
+
+    def at(self, anchor):
+        """The datetime of the expression at anchor, the one
+        extract_datetime gives at anchor if anchor has the values of the
+        fields in `anchored`, see resolve() for the others
+
+        Args:
+            anchor (datetime): used as it is, naive or not
+
+        Returns:
+            datetime: with the tzinfo of anchor
+        """
+        if self.now:
+            return anchor.replace(microsecond=0)
+
+        if self.date:
+            year, month, day = self.date
+            if not self.has_year:
+                year = anchor.year if (anchor.month, anchor.day) < \
+                    (month, day) else anchor.year + 1
+            seconds = 0
+        else:
+            year, month, day = anchor.year, anchor.month, anchor.day
+            if self.hours or self.minutes or self.seconds:
+                seconds = anchor.hour * 3600 + anchor.minute * 60 + \
+                    anchor.second
+            else:
+                seconds = self.default_time.hour * 3600 + \
+                    self.default_time.minute * 60 + self.default_time.second
+
+        # like relativedelta, the day is kept within the month after
+        # each of the years and months
+        if self.years:
+            year += self.years
+            day = min(day, monthrange(year, month)[1])
+        if self.months:
+            year, month = divmod(year * 12 + month - 1 + self.months, 12)
+            month += 1
+            day = min(day, monthrange(year, month)[1])
+        days, seconds = divmod(seconds + self.hours * 3600 +
+                               self.minutes * 60 + self.seconds, 86400)
+        ordinal = date(year, month, day).toordinal() + self.days + days
+
+        if self.hour is not None:
+            if not 0 <= self.hour <= 23 or not 0 <= self.minute <= 59:
+                raise ValueError("time of day out of range")
+            seconds = self.hour * 3600 + self.minute * 60 + seconds % 60
+            if (self.hour or self.minute) and not self.date and \
+                    not self.day_specified and \
+                    (anchor.toordinal(), anchor.hour * 3600 +
+                     anchor.minute * 60 + anchor.second,
+                     anchor.microsecond) > (ordinal, seconds, 0):
+                ordinal += 1
+
+        day = date.fromordinal(ordinal)
+        return datetime(day.year, day.month, day.day, seconds // 3600,
+                        seconds // 60 % 60, seconds % 60,
+                        tzinfo=anchor.tzinfo)
+
+
+def _read_against(expression, anchor, variants):
+    """expression, or its phrase parsed again if anchor differs in a
+    field of the one it was read against
+
+    Args:
+        variants (dict): the expressions parsed again so far, by the
+            expression they were parsed for and the fields of the anchor
+    """
+    while expression is not None and expression.anchored:
+        fields = tuple(_ANCHOR_FIELDS[field](anchor)
+                       for field in expression.anchored)
+        if fields == tuple(expression.anchored.values()):
+            break
+        key = (id(expression), fields)
+        if key not in variants:
+            variants[key] = expression.reparse(anchor)
+        expression = variants[key]
+    return expression
+
+
+def resolve(expression, anchors):
+    """The datetimes of a temporal expression at each of many anchors
+
+    Args:
+        expression (TemporalExpression): as returned by
+            lingua_franca.parse.extract_temporal_expression
+        anchors (iterable): datetimes, naive ones are made local as
+            config.inject_timezones asks
+
+    Returns:
+        [datetime]: the datetime at each anchor, in the order of anchors,
+                    None where the phrase read against an anchor has no
+                    date
+    """
+    # as lingua_franca.time.to_local, looking the timezone up once
+    local = default_timezone() if config.inject_timezones else None
+    variants = {}
+    dates = []
+    for anchor in anchors:
+        if local is not None and anchor.tzinfo is None:
+            anchor = anchor.replace(tzinfo=local).astimezone(local)
+        read = _read_against(expression, anchor, variants)
+        dates.append(read.at(anchor) if read is not None else None)
+    return dates
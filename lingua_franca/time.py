@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 from datetime import datetime
-from dateutil.tz import gettz, tzlocal
 
 
 # used to calculate timespans
@@ -25,6 +24,8 @@ __default_tz = None
 
 
 def set_default_tz(tz):
+    from dateutil.tz import gettz
+
     global __default_tz
     if isinstance(tz, str):
         tz = gettz(tz)
@@ -41,7 +42,10 @@ def default_timezone():
     Returns:
         (datetime.tzinfo): Definition of the default timezone
     """
-    return __default_tz or tzlocal()
+    if __default_tz:
+        return __default_tz
+    from dateutil.tz import tzlocal
+    return tzlocal()
 
 
 def now_utc():
@@ -50,6 +54,7 @@ def now_utc():
     Returns:
         (datetime): The current time in Universal Time, aka GMT
     """
+    from dateutil.tz import gettz
     return datetime.utcnow().replace(tzinfo=gettz("UTC"))
 
 
@@ -74,6 +79,7 @@ def to_utc(dt):
     Returns:
         (datetime): time converted to UTC
     """
+    from dateutil.tz import gettz
     tz = gettz("UTC")
     if not dt.tzinfo:
         dt = dt.replace(tzinfo=default_timezone())
@@ -102,6 +108,7 @@ def to_system(dt):
     Returns:
         (datetime): time converted to the operation system's timezone
     """
+    from dateutil.tz import tzlocal
     tz = tzlocal()
     if not dt.tzinfo:
         dt = dt.replace(tzinfo=default_timezone())
@@ -1,8 +1,5 @@
-from difflib import SequenceMatcher
 from enum import IntEnum, auto
 
-import rapidfuzz
-
 
 class MatchStrategy(IntEnum):
     SIMPLE_RATIO = auto()
@@ -21,6 +18,11 @@ def fuzzy_match(x, against, strategy=MatchStrategy.SIMPLE_RATIO):
         float: match percentage -- 1.0 for perfect match,
                down to 0.0 for no match at all.
     """
+    # imported here, rather than at module level, so that importing
+    # lingua_franca doesn't pay for these unless fuzzy matching is used
+    from difflib import SequenceMatcher
+    import rapidfuzz
+
     if strategy == MatchStrategy.RATIO:
         score = rapidfuzz.fuzz.ratio(x, against) / 100
     elif strategy == MatchStrategy.PARTIAL_RATIO:
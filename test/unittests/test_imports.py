@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+import unittest
+from os.path import dirname
+
+ROOT_DIR = dirname(dirname(dirname(__file__)))
+
+# third party packages which must only be imported when they're first used
+LAZY_PACKAGES = ("colour", "webcolors", "rapidfuzz", "quebra_frases",
+                 "dateutil")
+
+# generous, to allow for differences between python versions, but far below
+# the ~120 modules imported when the dependencies above were loaded eagerly
+MAX_FORMAT_IMPORTS = 80
+
+
+def imported_modules(statement):
+    """ Run `statement` in a fresh interpreter
+
+    Returns:
+        list(str): the modules it added to sys.modules
+    """
+    script = ("import json, sys\n"
+              "before = set(sys.modules)\n"
+              "{}\n"
+              "print(json.dumps(sorted(set(sys.modules) - before)))"
+              .format(statement))
+    output = subprocess.check_output([sys.executable, "-c", script],
+                                     cwd=ROOT_DIR, universal_newlines=True)
+    return json.loads(output.splitlines()[-1])
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_format_import(self):
+        modules = imported_modules("import lingua_franca.format")
+        for package in LAZY_PACKAGES:
+            self.assertFalse([m for m in modules
+                              if m.split(".")[0] == package], package)
+        if "ovos_config" not in modules:
+            self.assertLessEqual(len(modules), MAX_FORMAT_IMPORTS)
+
+    def test_parse_import(self):
+        modules = imported_modules("import lingua_franca.parse")
+        for package in LAZY_PACKAGES:
+            self.assertFalse([m for m in modules
+                              if m.split(".")[0] == package], package)
+
+    def test_nice_time_import(self):
+        modules = imported_modules(
+            "import datetime, lingua_franca, lingua_franca.format\n"
+            "lingua_franca.load_language('en')\n"
+            "lingua_franca.format.nice_time(datetime.datetime.now())")
+        for package in ("colour", "webcolors", "rapidfuzz", "quebra_frases"):
+            self.assertFalse([m for m in modules
+                              if m.split(".")[0] == package], package)
+
+    def test_imported_on_first_use(self):
+        modules = imported_modules(
+            "import lingua_franca, lingua_franca.parse\n"
+            "lingua_franca.load_language('en')\n"
+            "lingua_franca.parse.get_color('red')\n"
+            "lingua_franca.parse.extract_langcode('english')")
+        for package in ("colour", "webcolors", "rapidfuzz"):
+            self.assertTrue([m for m in modules
+                             if m.split(".")[0] == package], package)
@@ -1,12 +1,19 @@
+import asyncio
+import os
+import tempfile
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
 from sys import version
+from unittest.mock import patch
 
 import lingua_franca
 import lingua_franca.parse
 import lingua_franca.format
+from lingua_franca.instrumentation import get_call_stats, reset_call_stats
 
 from lingua_franca.internal import localized_function, _SUPPORTED_LANGUAGES
+import lingua_franca.internal
 
 
 def unload_all_languages():
@@ -115,6 +122,21 @@ class TestLanguageLoading(unittest.TestCase):
             lingua_franca.parse.extract_number("uno", lang="es")
         unload_all_languages()
 
+    def test_load_on_demand_keeps_loaded_langs(self):
+        unload_all_languages()
+        lingua_franca.load_language("en")
+        lingua_franca.config.load_langs_on_demand = True
+        for _ in range(3):
+            self.assertEqual(
+                lingua_franca.parse.extract_number("dos", lang="es"), 2)
+        lingua_franca.config.load_langs_on_demand = False
+        # Spanish was resolved once, and kept aside, without being loaded
+        self.assertEqual(lingua_franca.get_active_langs(), ["en"])
+        self.assertEqual(lingua_franca.get_default_lang(), "en")
+        self.assertIn(("parse", "es"),
+                      lingua_franca.internal._on_demand_functions)
+        unload_all_languages()
+
     def test_load_language(self):
         lingua_franca.load_language('en')
 
@@ -200,6 +222,306 @@ class TestLocalizerEdgeCases(unittest.TestCase):
         unload_all_languages()
 
 
+class TestResolvedFunctions(unittest.TestCase):
+    def test_resolved_table_follows_loaded_langs(self):
+        unload_all_languages()
+        lingua_franca.load_language('en')
+        # registering a language doesn't import its modules
+        self.assertIsNone(
+            lingua_franca.internal._localized_functions["parse"]["en"])
+        self.assertNotIn(("parse", "extract_number", "en"),
+                         lingua_franca.internal._resolved_functions)
+
+        self.assertEqual(lingua_franca.parse.extract_number("one"), 1)
+        resolved = lingua_franca.internal._resolved_functions
+        self.assertIs(resolved[("parse", "extract_number", "en")].function,
+                      lingua_franca.lang.parse_en.extract_number_en)
+        self.assertIn("short_scale",
+                      resolved[("parse", "extract_number", "en")].kwargs)
+        self.assertIsInstance(resolved[("parse", "is_ordinal", "en")],
+                              lingua_franca.internal.FunctionNotLocalizedError)
+        self.assertNotIn(("parse", "extract_number", "es"), resolved)
+
+        # loading another language keeps what was already resolved
+        lingua_franca.load_language('es')
+        self.assertIn(("parse", "extract_number", "en"),
+                      lingua_franca.internal._resolved_functions)
+        lingua_franca.format.pronounce_number(1, lang='es')
+        self.assertIn(("format", "pronounce_number", "es"),
+                      lingua_franca.internal._resolved_functions)
+        lingua_franca.unload_language('es')
+        self.assertNotIn(("format", "pronounce_number", "es"),
+                         lingua_franca.internal._resolved_functions)
+        unload_all_languages()
+
+
+class TestBind(unittest.TestCase):
+    def setUp(self):
+        unload_all_languages()
+
+    def tearDown(self):
+        lingua_franca.config.load_langs_on_demand = False
+        unload_all_languages()
+
+    def test_bind_resolves_lang_codes(self):
+        lingua_franca.load_language('en')
+        lf = lingua_franca.bind('en')
+        self.assertEqual(lf.lang, 'en')
+        self.assertEqual(lf.full_lang, 'en-us')
+        lf = lingua_franca.bind('en-AU')
+        self.assertEqual(lf.lang, 'en')
+        self.assertEqual(lf.full_lang, 'en-au')
+        with self.assertRaises(lingua_franca.internal.UnsupportedLanguageError):
+            lingua_franca.bind('bob robertson')
+        with self.assertRaises(TypeError):
+            lingua_franca.bind(12)
+
+    def test_bind_requires_loaded_lang(self):
+        lingua_franca.load_language('en')
+        with self.assertRaises(ModuleNotFoundError):
+            lingua_franca.bind('es')
+        lingua_franca.config.load_langs_on_demand = True
+        self.assertEqual(lingua_franca.bind('es').extract_number('dos'), 2)
+
+    def test_bind_matches_decorated_functions(self):
+        lingua_franca.load_languages(['en', 'es'])
+        lf = lingua_franca.bind('es')
+        # localized functions are referenced directly
+        self.assertIs(lf.extract_number,
+                      lingua_franca.lang.parse_es.extract_number_es)
+        self.assertEqual(lf.extract_number('dos'),
+                         lingua_franca.parse.extract_number('dos', lang='es'))
+        self.assertEqual(lf.pronounce_number(21, places=0),
+                         lingua_franca.format.pronounce_number(21, lang='es',
+                                                               places=0))
+        # generic fallbacks run with the bound language
+        self.assertEqual(lf.nice_duration(90),
+                         lingua_franca.format.nice_duration(90, lang='es'))
+        self.assertEqual(lf.nice_number(5.5, False),
+                         lingua_franca.format.nice_number(5.5, 'es', False))
+        self.assertEqual(lf.pronounce_lang('en'),
+                         lingua_franca.format.pronounce_lang('en', lang='es'))
+
+    def test_bind_function_not_localized(self):
+        lingua_franca.load_language('en')
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.bind('en').is_ordinal("twelve")
+
+
+class TestLanguageScope(unittest.TestCase):
+    def setUp(self):
+        unload_all_languages()
+        lingua_franca.load_languages(['en', 'es', 'pt'])
+
+    def tearDown(self):
+        unload_all_languages()
+
+    def test_scope_sets_default(self):
+        self.assertEqual(lingua_franca.get_default_lang(), 'en')
+        with lingua_franca.language('es'):
+            self.assertEqual(lingua_franca.get_default_lang(), 'es')
+            self.assertEqual(lingua_franca.get_default_loc(), 'es-es')
+            self.assertEqual(lingua_franca.parse.extract_number('dos'), 2)
+            with lingua_franca.language('pt-PT'):
+                self.assertEqual(lingua_franca.get_default_loc(), 'pt-pt')
+            self.assertEqual(lingua_franca.get_default_lang(), 'es')
+        self.assertEqual(lingua_franca.get_default_lang(), 'en')
+        self.assertEqual(lingua_franca.get_default_loc(), 'en-us')
+        self.assertEqual(lingua_franca.get_active_langs(), ['en', 'es', 'pt'])
+
+    def test_scope_rejects_bad_lang(self):
+        with self.assertRaises(
+                lingua_franca.internal.UnsupportedLanguageError):
+            with lingua_franca.language('bob robertson'):
+                pass
+        self.assertEqual(lingua_franca.get_default_lang(), 'en')
+
+    def test_scope_per_thread(self):
+        words = {'en': 'two', 'es': 'dos', 'pt': 'dois'}
+
+        def extract(lang):
+            with lingua_franca.language(lang):
+                return [lingua_franca.parse.extract_number(words[lang])
+                        for _ in range(50)]
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(extract, ['en', 'es', 'pt'] * 4))
+        self.assertTrue(all(result == [2] * 50 for result in results))
+
+    def test_scope_per_task(self):
+        async def extract(lang, word):
+            with lingua_franca.language(lang):
+                await asyncio.sleep(0)
+                return lingua_franca.parse.extract_number(word)
+
+        async def main():
+            return await asyncio.gather(extract('es', 'dos'),
+                                        extract('pt', 'dois'),
+                                        extract('en', 'two'))
+
+        self.assertEqual(asyncio.run(main()), [2, 2, 2])
+
+
+class TestCallStats(unittest.TestCase):
+    def setUp(self):
+        unload_all_languages()
+        reset_call_stats()
+        lingua_franca.load_language('en')
+
+    def tearDown(self):
+        lingua_franca.config.collect_call_stats = False
+        reset_call_stats()
+        unload_all_languages()
+
+    def test_disabled_by_default(self):
+        lingua_franca.parse.extract_number("one")
+        self.assertEqual(get_call_stats(), {})
+
+    def test_call_stats(self):
+        lingua_franca.config.collect_call_stats = True
+        for _ in range(3):
+            lingua_franca.parse.extract_number("one", lang="en-us")
+        # nice_number has no localized version in 'cz', and falls back
+        lingua_franca.format.nice_number(123, lang='cz')
+        with self.assertRaises(lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.parse.is_ordinal("twelve")
+
+        stats = get_call_stats()
+        number_stats = stats["extract_number"]["en"]
+        self.assertEqual(number_stats["calls"], 3)
+        self.assertEqual(number_stats["fallbacks"], 0)
+        self.assertEqual(number_stats["errors"], 0)
+        self.assertGreater(number_stats["total_time"], 0)
+        self.assertLessEqual(number_stats["p50"], number_stats["p99"])
+        self.assertLessEqual(number_stats["p99"], number_stats["max_time"])
+
+        self.assertEqual(stats["nice_number"]["cz"]["fallbacks"], 1)
+        self.assertEqual(stats["is_ordinal"]["en"]["errors"], 1)
+
+        reset_call_stats()
+        self.assertEqual(get_call_stats(), {})
+
+    def test_call_stats_threads(self):
+        lingua_franca.config.collect_call_stats = True
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: lingua_franca.parse.extract_number("one"),
+                          range(200)))
+        self.assertEqual(get_call_stats()["extract_number"]["en"]["calls"],
+                         200)
+
+
+class TestResourceIndex(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        lingua_franca.refresh_resource_index()
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+        lingua_franca.config.check_resource_mtimes = False
+        lingua_franca.refresh_resource_index()
+
+    def write_resource(self, res_name):
+        path = os.path.join(self.data_dir.name, res_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("{}")
+        return path
+
+    def test_precedence(self):
+        res_name = "text/en-us/colors.json"
+        packaged = lingua_franca.resolve_resource_file(res_name)
+        self.assertTrue(packaged.endswith(os.path.join("res", res_name)))
+        override = self.write_resource(res_name)
+        lingua_franca.refresh_resource_index()
+        self.assertEqual(lingua_franca.resolve_resource_file(
+            res_name, data_dir=self.data_dir.name), override)
+        self.assertEqual(lingua_franca.resolve_resource_file(res_name),
+                         packaged)
+        self.assertEqual(lingua_franca.resolve_resource_file(override),
+                         override)
+        self.assertIsNone(lingua_franca.resolve_resource_file("no/such.json"))
+
+    def test_working_directory_first(self):
+        res_name = "text/en-us/colors.json"
+        self.write_resource(res_name)
+        cwd = os.getcwd()
+        os.chdir(self.data_dir.name)
+        try:
+            self.assertEqual(lingua_franca.resolve_resource_file(res_name),
+                             res_name)
+        finally:
+            os.chdir(cwd)
+
+    def test_no_filesystem_probing(self):
+        res_name = "text/en-us/colors.json"
+        expected = lingua_franca.resolve_resource_file(res_name)
+        with patch("os.path.isfile") as isfile, patch("os.stat") as stat:
+            self.assertEqual(lingua_franca.resolve_resource_file(res_name),
+                             expected)
+            isfile.assert_not_called()
+            stat.assert_not_called()
+
+    def test_refresh(self):
+        res_name = "text/xx-xx/new.json"
+        self.assertIsNone(lingua_franca.resolve_resource_file(
+            res_name, data_dir=self.data_dir.name))
+        path = self.write_resource(res_name)
+        self.assertIsNone(lingua_franca.resolve_resource_file(
+            res_name, data_dir=self.data_dir.name))
+        lingua_franca.refresh_resource_index()
+        self.assertEqual(lingua_franca.resolve_resource_file(
+            res_name, data_dir=self.data_dir.name), path)
+
+    def test_mtime_invalidation(self):
+        lingua_franca.config.check_resource_mtimes = True
+        res_name = "new.json"
+        self.assertIsNone(lingua_franca.resolve_resource_file(
+            res_name, data_dir=self.data_dir.name))
+        path = self.write_resource(res_name)
+        with patch.object(lingua_franca.internal,
+                          "RESOURCE_CHECK_INTERVAL", 0):
+            self.assertEqual(lingua_franca.resolve_resource_file(
+                res_name, data_dir=self.data_dir.name), path)
+            os.remove(path)
+            self.assertIsNone(lingua_franca.resolve_resource_file(
+                res_name, data_dir=self.data_dir.name))
+
+    def test_new_directory_invalidation(self):
+        lingua_franca.config.check_resource_mtimes = True
+        res_name = "text/xx-xx/new.json"
+        self.assertIsNone(lingua_franca.resolve_resource_file(
+            res_name, data_dir=self.data_dir.name))
+        path = self.write_resource(res_name)
+        with patch.object(lingua_franca.internal,
+                          "RESOURCE_CHECK_INTERVAL", 0):
+            self.assertEqual(lingua_franca.resolve_resource_file(
+                res_name, data_dir=self.data_dir.name), path)
+
+    def test_symlinked_directory(self):
+        with tempfile.TemporaryDirectory() as target:
+            os.makedirs(os.path.join(target, "xx-xx"))
+            with open(os.path.join(target, "xx-xx", "new.json"), "w") as f:
+                f.write("{}")
+            os.symlink(target, os.path.join(self.data_dir.name, "text"))
+            # a link back up the tree must not be followed forever
+            os.symlink(self.data_dir.name,
+                       os.path.join(target, "xx-xx", "loop"))
+            self.assertEqual(lingua_franca.resolve_resource_file(
+                "text/xx-xx/new.json", data_dir=self.data_dir.name),
+                os.path.join(self.data_dir.name, "text", "xx-xx", "new.json"))
+
+    def test_lazy_index(self):
+        self.write_resource("text/xx-xx/new.json")
+        self.write_resource("unrelated/other.json")
+        lingua_franca.resolve_resource_file("text/xx-xx/new.json",
+                                            data_dir=self.data_dir.name)
+        root = lingua_franca.internal._resource_roots[self.data_dir.name]
+        self.assertEqual(set(root.dirs), {os.path.join("text", "xx-xx")})
+        self.assertIsNone(lingua_franca.resolve_resource_file(
+            "../new.json", data_dir=os.path.join(self.data_dir.name, "text")))
+
+
 class TestGetter(unittest.TestCase):
     def test_primary_lang_code(self):
         unload_all_languages()
@@ -14,15 +14,23 @@
 # limitations under the License.
 #
 import unittest
-from datetime import datetime
+from datetime import datetime, time
 
 from dateutil import tz
 
-from lingua_franca import load_language, unload_language, set_default_lang
-from lingua_franca.lang.parse_common import tokenize, Token, Normalizer
-from lingua_franca.parse import extract_datetime, fuzzy_match, match_one, extract_langcode, yes_or_no
+from lingua_franca import config, load_language, unload_language, \
+    set_default_lang
+from lingua_franca.lang.parse_common import tokenize, Token, Normalizer, \
+    NumberLexer, word_memo, get_word_memo_stats, clear_word_memos, \
+    is_numeric, TokenBuffer, partition_list, compile_substitutions, \
+    SourceText
+from lingua_franca.parse import extract_datetime, fuzzy_match, match_one, extract_langcode, yes_or_no, \
+    extract_number, extract_numbers, extract_numbers_batch
 from lingua_franca.time import default_timezone, now_local, set_default_tz
+from lingua_franca.datetime_cache import get_datetime_cache_stats, \
+    clear_datetime_cache
 from lingua_franca.internal import FunctionNotLocalizedError
+from lingua_franca.lang.parse_en import _NUMBER_PARSER_EN
 
 
 def setUpModule():
@@ -126,6 +134,408 @@ class TestTokenize(unittest.TestCase):
                           Token("`", 20), Token(".", 21)])
 
 
+class TestTokenBuffer(unittest.TestCase):
+    def test_tokenize(self):
+        text = 'One small step for #1 man'
+        tokens = TokenBuffer.tokenize(text)
+        self.assertEqual(tokens, tokenize(text))
+        self.assertEqual(list(tokens), tokenize(text))
+        self.assertEqual(tokens.lowered,
+                         ['one', 'small', 'step', 'for', '#', '1', 'man'])
+        self.assertEqual(tokens[2], Token('step', 2))
+        self.assertIsNone(tokens.spans)
+
+    def test_split(self):
+        tokens = TokenBuffer.split("Two, and  half!")
+        self.assertEqual(tokens.words, ['Two', 'and', 'half'])
+        self.assertEqual(tokens.spans, [(0, 3), (5, 8), (10, 14)])
+
+    def test_of(self):
+        tokens = TokenBuffer.tokenize('one two three')
+        self.assertIs(TokenBuffer.of(tokens), tokens)
+        self.assertEqual(TokenBuffer.of([Token('two', 1), Token('x', 5)]),
+                         [Token('two', 1), Token('x', 5)])
+
+    def test_slice(self):
+        tokens = TokenBuffer.tokenize('one two three four')
+        self.assertEqual(tokens[1:3], [Token('two', 1), Token('three', 2)])
+        self.assertEqual(tokens[1:3].lowered, ['two', 'three'])
+
+    def test_replace(self):
+        tokens = TokenBuffer.tokenize('One two three four')
+        copy = tokens.copy()
+        copy.replace(0, 1, 'X')
+        self.assertEqual(copy, [Token('X', 0), Token('X', 1),
+                                Token('three', 2), Token('four', 3)])
+        self.assertEqual(copy.lowered[:2], ['x', 'x'])
+        self.assertEqual(tokens.words, ['One', 'two', 'three', 'four'])
+        copy[3] = Token('Five', 7)
+        self.assertEqual(copy[3], Token('Five', 7))
+        self.assertEqual(copy.lowered[3], 'five')
+
+    def test_partition(self):
+        for text in ('two and a half', 'and two and', 'one', '',
+                     'and', 'a b and and c'):
+            self.assertEqual(
+                TokenBuffer.tokenize(text).partition('and'),
+                partition_list(tokenize(text), lambda t: t.word == 'and'))
+
+
+class TestNumberLexer(unittest.TestCase):
+    def setUp(self):
+        self.lexer = NumberLexer(case_folded=NumberLexer.FRACTION)
+        self.lexer.add_all({"twenty": 20, "one": 1, "hundred": 100},
+                           NumberLexer.NUMBER)
+        self.lexer.add_all(["twenty"], NumberLexer.SUM)
+        self.lexer.add_all({"half": 0.5}, NumberLexer.FRACTION)
+        self.lexer.add("one hundred", NumberLexer.NUMBER, 100)
+
+    def test_classify(self):
+        entry = self.lexer.classify("twenty")
+        self.assertEqual(entry.kinds, NumberLexer.NUMBER | NumberLexer.SUM)
+        self.assertEqual(entry.values[NumberLexer.NUMBER], 20)
+        self.assertFalse(self.lexer.classify("apple"))
+        self.assertFalse(self.lexer.classify(""))
+
+    def test_classify_digits(self):
+        self.assertEqual(self.lexer.classify("42").values,
+                         {NumberLexer.DIGITS: 42})
+        self.assertEqual(self.lexer.classify("4.5").values,
+                         {NumberLexer.DIGITS: 4.5})
+        self.assertEqual(self.lexer.classify("3/4").kinds,
+                         NumberLexer.DIGIT_FRACTION)
+        self.assertFalse(self.lexer.classify("4th"))
+
+    def test_case_folded(self):
+        self.assertEqual(self.lexer.classify("Half").values,
+                         {NumberLexer.FRACTION: 0.5})
+        self.assertFalse(self.lexer.classify("Twenty"))
+
+    def test_match(self):
+        words = ["one", "hundred", "apples"]
+        entry, end = self.lexer.match(words)
+        self.assertEqual((entry.values[NumberLexer.NUMBER], end), (100, 2))
+        entry, end = self.lexer.match(words, 1)
+        self.assertEqual((entry.values[NumberLexer.NUMBER], end), (100, 2))
+        entry, end = self.lexer.match(words, 2)
+        self.assertEqual((bool(entry), end), (False, 2))
+        entry, end = self.lexer.match(["one", "apple"])
+        self.assertEqual((entry.values[NumberLexer.NUMBER], end), (1, 1))
+
+    def test_words(self):
+        self.assertEqual(set(self.lexer.words(NumberLexer.SUM)), {"twenty"})
+        self.lexer.add("thirty", NumberLexer.SUM)
+        self.assertEqual(set(self.lexer.words(NumberLexer.SUM)),
+                         {"twenty", "thirty"})
+
+
+class TestExtractDigits(unittest.TestCase):
+    TEXTS = ["set a timer for 5 minutes", "call 555 then 1234",
+             "it is 2.5 or 1/3, the minus sign is here", "no numbers",
+             "five minutes", "call 555 1234", "minus 5", "5 a day",
+             "5th of 6", "1/0 of it", "one and 1/2", "20 years",
+             "a, 5", "don't wait 5", "Infinity and beyond"]
+
+    def setUp(self):
+        from lingua_franca.lang.parse_en import _NUMBER_PARSER_EN
+        self.parser = _NUMBER_PARSER_EN
+
+    def test_extract_digits(self):
+        self.assertEqual(self.parser.extract_digits(
+            "set a timer for 5 minutes."), [5])
+        self.assertEqual(self.parser.extract_digits(
+            "it is 2.5 or 1/4 as the minus sign is here"), [2.5, 0.25])
+        self.assertEqual(self.parser.extract_digits("no numbers"), [])
+        self.assertEqual(self.parser.extract_digits(""), [])
+
+    def test_parsed_texts(self):
+        # number words, numbers next to each other or next to a word
+        # which may start a number, and what tokenize() splits differently
+        for text in ("five minutes", "call 555 1234", "minus 5", "5 a day",
+                     "5th of 6", "1/0 of it", "20 years", "don't wait 5",
+                     "Infinity and beyond", "(5)", "-5 degrees"):
+            self.assertIsNone(self.parser.extract_digits(text), text)
+
+    def test_same_as_extract_numbers_with_text(self):
+        for text in self.TEXTS:
+            for ordinals in (False, True, None):
+                numbers = self.parser.extract_digits(text, ordinals)
+                if numbers is not None:
+                    self.assertEqual(numbers, [
+                        number.value for number in
+                        self.parser.extract_numbers_with_text(
+                            TokenBuffer.tokenize(text), True, ordinals)])
+                    self.assertEqual(
+                        self.parser.extract_number(text, True, ordinals),
+                        self.parser.extract_number_with_text(
+                            TokenBuffer.tokenize(text), True,
+                            ordinals).value)
+
+
+class TestExtractNumbersBatch(unittest.TestCase):
+    TEXTS = ["two hundred and five apples", "no numbers here",
+             "the third of three", "one and a half cups", "",
+             "1.5 million and twenty two"]
+
+    def test_same_as_extract_numbers(self):
+        for kwargs in ({}, {"ordinals": True}, {"short_scale": False}):
+            self.assertEqual(
+                list(extract_numbers_batch(self.TEXTS, lang="en-us",
+                                           **kwargs)),
+                [extract_numbers(text, lang="en-us", **kwargs)
+                 for text in self.TEXTS])
+
+    def test_default_lang(self):
+        self.assertEqual(list(extract_numbers_batch(self.TEXTS)),
+                         [extract_numbers(text) for text in self.TEXTS])
+
+    def test_streams_iterables(self):
+        results = extract_numbers_batch(iter(self.TEXTS))
+        self.assertEqual(next(results), extract_numbers(self.TEXTS[0]))
+        self.assertEqual(list(results),
+                         [extract_numbers(text) for text in self.TEXTS[1:]])
+
+    def test_workers(self):
+        texts = self.TEXTS * 5
+        self.assertEqual(
+            list(extract_numbers_batch(iter(texts), ordinals=True,
+                                       workers=2, chunksize=4)),
+            [extract_numbers(text, ordinals=True) for text in texts])
+
+    def test_language_not_loaded(self):
+        with self.assertRaises(ModuleNotFoundError):
+            next(extract_numbers_batch(["dva"], lang="cs"))
+
+
+class TestExtractNumberAgrees(unittest.TestCase):
+    """extract_number is the first number extract_numbers finds"""
+    TEXTS = {
+        "eu": ["hogeita hamarrena", "berrogeita hamabi", "bi eta erdi",
+               "hamalau eta milarena", "sei puntu bi", "bi puntu zero bi",
+               "erdi bat", "2.0", "1/4", "ez dago zenbakirik"],
+        "da": ["to", "2", "to og en halv", "tyve",
+               "der er ingen tal her"],
+        "es": ["dos", "2.0", "medio tercio", "dos y medio",
+               "seis punto cero dos", "no hay números"],
+        "fr": ["deux", "ça fait virgule 2 cm", "un demi", "deux et demi",
+               "deux virgule zéro deux", "pas de chiffres"],
+        "it": ["2", "un paio di migliaia di birre", "un sesto terzo",
+               "zero gatti", "meno 2", "sei miliardi", "due e mezzo",
+               "nessun numero"],
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        for lang in cls.TEXTS:
+            load_language(lang)
+
+    @classmethod
+    def tearDownClass(cls):
+        for lang in cls.TEXTS:
+            unload_language(lang)
+
+    def test_first_of_extract_numbers(self):
+        for lang, texts in self.TEXTS.items():
+            for text in texts:
+                numbers = extract_numbers(text, lang=lang)
+                self.assertEqual(extract_number(text, lang=lang),
+                                 numbers[0] if numbers else False,
+                                 (lang, text))
+
+
+class TestWordMemo(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        @word_memo("test")
+        def is_long(word, length=3):
+            self.calls.append(word)
+            return len(word) > length
+
+        self.is_long = is_long
+        self.addCleanup(clear_word_memos, "test")
+
+    def test_memoized(self):
+        self.assertTrue(self.is_long("apple"))
+        self.assertTrue(self.is_long("apple"))
+        self.assertFalse(self.is_long("apple", length=5))
+        self.assertEqual(self.calls, ["apple", "apple"])
+        self.assertEqual(get_word_memo_stats("test"),
+                         {"test": {"is_long": {"hits": 1, "misses": 2,
+                                               "entries": 2}}})
+        self.assertEqual(self.is_long.__name__, "is_long")
+
+    def test_bounded(self):
+        size = config.word_memo_size
+        config.word_memo_size = 2
+        self.addCleanup(setattr, config, "word_memo_size", size)
+        for word in ("one", "three", "seven", "one"):
+            self.is_long(word)
+        stats = get_word_memo_stats("test")["test"]["is_long"]
+        self.assertEqual(stats, {"hits": 0, "misses": 4, "entries": 2})
+
+    def test_clear(self):
+        self.is_long("apple")
+        clear_word_memos("test")
+        self.is_long("apple")
+        self.assertEqual(self.calls, ["apple", "apple"])
+        self.assertEqual(get_word_memo_stats("test")["test"]["is_long"],
+                         {"hits": 0, "misses": 2, "entries": 1})
+
+    def test_common(self):
+        self.assertTrue(is_numeric("4.5"))
+        self.assertFalse(is_numeric("four"))
+        self.assertIn("is_numeric", get_word_memo_stats()["common"])
+
+
+class TestDatetimeCache(unittest.TestCase):
+    def setUp(self):
+        size = config.datetime_cache_size
+        config.datetime_cache_size = 100
+        self.addCleanup(setattr, config, "datetime_cache_size", size)
+        self.addCleanup(clear_datetime_cache)
+        clear_datetime_cache()
+        self.anchor = datetime(2017, 6, 27, 13, 4, 5, 250, tzinfo=tz.UTC)
+
+    def uncached(self, *args, **kwargs):
+        size = config.datetime_cache_size
+        config.datetime_cache_size = 0
+        try:
+            return extract_datetime(*args, **kwargs)
+        finally:
+            config.datetime_cache_size = size
+
+    def assertCached(self, text, anchors):
+        for anchor in anchors:
+            self.assertEqual(extract_datetime(text, anchor),
+                             self.uncached(text, anchor))
+        self.assertEqual(get_datetime_cache_stats()["hits"],
+                         len(anchors) - 1)
+
+    def test_moves_with_anchor(self):
+        self.assertCached("remind me in 10 minutes",
+                          [self.anchor, self.anchor.replace(second=35),
+                           self.anchor.replace(second=59, microsecond=0)])
+
+    def test_stays_put(self):
+        self.assertCached("tomorrow at 5 pm",
+                          [self.anchor, self.anchor.replace(second=0),
+                           self.anchor.replace(second=40)])
+
+    def test_no_date(self):
+        self.assertCached("hello world", [self.anchor, self.anchor])
+
+    def test_key(self):
+        extract_datetime("tomorrow", self.anchor)
+        extract_datetime("tomorrow", self.anchor.replace(minute=5))
+        extract_datetime("Tomorrow", self.anchor)
+        extract_datetime("tomorrow", self.anchor, default_time=time(9))
+        self.assertEqual(get_datetime_cache_stats()["entries"], 4)
+
+    def test_granularity(self):
+        granularity = config.datetime_cache_granularity
+        config.datetime_cache_granularity = 15
+        self.addCleanup(setattr, config, "datetime_cache_granularity",
+                        granularity)
+        self.assertCached("in 2 hours", [self.anchor,
+                                         self.anchor.replace(second=14)])
+        extract_datetime("in 2 hours", self.anchor.replace(second=15))
+        self.assertEqual(get_datetime_cache_stats()["entries"], 2)
+
+    def test_granularity_within_a_minute(self):
+        granularity = config.datetime_cache_granularity
+        config.datetime_cache_granularity = 3600
+        self.addCleanup(setattr, config, "datetime_cache_granularity",
+                        granularity)
+        anchor = self.anchor.replace(hour=16, minute=10)
+        self.assertEqual(extract_datetime("at 4:30 pm", anchor)[0],
+                         datetime(2017, 6, 27, 16, 30, tzinfo=tz.UTC))
+        self.assertEqual(
+            extract_datetime("at 4:30 pm", anchor.replace(minute=45))[0],
+            datetime(2017, 6, 28, 16, 30, tzinfo=tz.UTC))
+        self.assertEqual(get_datetime_cache_stats()["hits"], 0)
+
+    def test_on_the_minute(self):
+        anchor = self.anchor.replace(hour=16, minute=30)
+        self.assertCached("at 4:30 pm", [anchor, anchor.replace(second=40)])
+        on_minute = anchor.replace(second=0, microsecond=0)
+        for _ in range(2):
+            self.assertEqual(extract_datetime("at 4:30 pm", on_minute)[0],
+                             datetime(2017, 6, 27, 16, 30, tzinfo=tz.UTC))
+        self.assertEqual(get_datetime_cache_stats()["hits"], 2)
+
+    def test_eviction(self):
+        config.datetime_cache_size = 2
+        for text in ("today", "tomorrow", "today", "yesterday", "tomorrow"):
+            extract_datetime(text, self.anchor)
+        self.assertEqual(get_datetime_cache_stats(),
+                         {"hits": 1, "misses": 4, "evictions": 2,
+                          "entries": 2, "hit_rate": 0.2})
+
+    def test_disabled(self):
+        config.datetime_cache_size = 0
+        extract_datetime("today", self.anchor)
+        self.assertEqual(get_datetime_cache_stats()["misses"], 0)
+
+
+class TestCompileSubstitutions(unittest.TestCase):
+    def test_longest_wins(self):
+        substitute = compile_substitutions({"o clock": "o'clock",
+                                            "o": "0", "clock": "timer"})
+        self.assertEqual(substitute("2 o clock o"), "2 o'clock 0")
+
+    def test_not_searched_again(self):
+        substitute = compile_substitutions({"ab": "b", "b": "c"})
+        self.assertEqual(substitute("aab"), "ab")
+
+    def test_words(self):
+        substitute = compile_substitutions(words={"the": "", "an": "a"})
+        self.assertEqual(substitute(" the theme an ant ").split(),
+                         ["theme", "a", "ant"])
+        self.assertEqual(substitute(" the the an ").split(), ["a"])
+
+    def test_delete(self):
+        substitute = compile_substitutions(words={"the": ""}, delete="?,")
+        self.assertEqual(substitute("at the, end?").split(), ["at", "end"])
+        self.assertEqual(compile_substitutions(delete=".")("a.b"), "ab")
+
+    def test_overlap(self):
+        with self.assertRaises(ValueError):
+            compile_substitutions({"the": ""}, words={"the": ""})
+
+
+class TestSourceText(unittest.TestCase):
+    def spans(self, words):
+        return [(word, word.span()) for word in words]
+
+    def test_str_methods(self):
+        text = SourceText(" Next  Tuesdays, at noon ")
+        words = text.strip().lower().replace("tuesdays,", "tuesday").split()
+        self.assertEqual(words, ["next", "tuesday", "at", "noon"])
+        self.assertEqual(self.spans(words),
+                         [("next", (1, 5)), ("tuesday", (7, 14)),
+                          ("at", (17, 19)), ("noon", (20, 24))])
+        self.assertEqual((words[0] + " " + words[1]).span(), (1, 14))
+        self.assertEqual(("the " + words[1][:3]).span(), (7, 10))
+        self.assertNotIsInstance(SourceText.joined(" ", ["a", "b"]),
+                                 SourceText)
+
+    def test_compile_substitutions(self):
+        substitute = compile_substitutions({"o clock": "o'clock"},
+                                           words={"the": ""}, delete="?")
+        words = substitute(SourceText("at the 5 o clock?")).split()
+        self.assertEqual(self.spans(words),
+                         [("at", (0, 2)), ("5", (7, 8)),
+                          ("o'clock", (9, 16))])
+
+    def test_numbers(self):
+        words = _NUMBER_PARSER_EN.convert_words_to_numbers(
+            SourceText("in Twenty Two minutes")).split()
+        self.assertEqual(self.spans(words),
+                         [("in", (0, 2)), ("22", (3, 13)),
+                          ("minutes", (14, 21))])
+
+
 class TestRemoveSymbols(unittest.TestCase):
     def test_remove_symbols_empty_string(self):
         self.assertEqual(Normalizer().remove_symbols(""), "")
@@ -19,6 +19,7 @@ from datetime import datetime, time, timedelta
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import (
     extract_datetime,
+    extract_datetimes,
     extract_duration,
     extract_number,
     extract_numbers,
@@ -459,6 +460,16 @@ class TestExtractDatetime(unittest.TestCase):
 
         self.assertEqual(default, res[0].time())
 
+    def test_extractdatetimes_de(self):
+        text = "morgen um 5 uhr und am freitag abend"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(
+            [(date.replace(tzinfo=None), text[start:end]) for
+             date, (start, end) in extract_datetimes(text, anchor,
+                                                     lang='de-de')],
+            [(datetime(2017, 6, 28, 5, 0), "morgen um 5 uhr"),
+             (datetime(2017, 6, 30, 19, 0), "am freitag abend")])
+
 
 class TestExtractDuration(unittest.TestCase):
     def test_extract_duration_de(self):
@@ -21,7 +21,8 @@ from dateutil.relativedelta import relativedelta
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetimes
+from lingua_franca.parse import extract_temporal_expression
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_langcode
 from lingua_franca.parse import extract_number, extract_numbers
@@ -32,6 +33,7 @@ from lingua_franca.time import default_timezone, to_local, DAYS_IN_1_YEAR, DAYS_
 from lingua_franca.parse import extract_langcode
 from lingua_franca.parse import yes_or_no
 from lingua_franca.time import default_timezone, to_local
+from lingua_franca.temporal import resolve
 from lingua_franca.util.colors import Color, ColorOutOfSpace
 
 
@@ -386,6 +388,8 @@ class TestExtractNumber(unittest.TestCase):
                                         ordinals=False), 2 / 5)
         self.assertEqual(extract_number("2 fifths",
                                         ordinals=None), 2)
+        self.assertEqual(extract_numbers("2 fifths", ordinals=True),
+                         [2, 0.2])
 
         self.assertEqual(extract_number("Twenty two and Three Fifths"), 22.6)
 
@@ -444,6 +448,9 @@ class TestExtractNumber(unittest.TestCase):
         self.assertEqual(extract_number("one fourth cup"), 0.25)
         self.assertEqual(extract_number("2/3 cups"), 2.0 / 3.0)
         self.assertEqual(extract_number("3/4 cups"), 3.0 / 4.0)
+        # not a fraction, nor a number
+        self.assertEqual(extract_number("1/0 cups"), False)
+        self.assertEqual(extract_numbers("seventeen 1/0"), [17.0])
         self.assertEqual(extract_number("1 and 3/4 cups"), 1.75)
         self.assertEqual(extract_number("1 cup and a half"), 1.5)
         self.assertEqual(extract_number("one cup and a half"), 1.5)
@@ -559,6 +566,28 @@ class TestExtractNumber(unittest.TestCase):
                                          " half test"),
                          [7.0, 8.0, 9.5])
 
+    def test_multiple_numbers_long_utterance(self):
+        phrase = "two hundred grams of flour, three eggs, " \
+                 "twenty five ml of milk, "
+        self.assertEqual(extract_numbers(phrase * 50), [200, 3, 25] * 50)
+        self.assertEqual(extract_numbers(phrase * 50 + "one and a half"),
+                         [200, 3, 25] * 50 + [1.5])
+        self.assertEqual(extract_numbers("five five five one two " * 20),
+                         [5, 5, 5, 1, 2] * 20)
+
+    def test_fractions_and_decimals_long_utterance(self):
+        self.assertEqual(extract_numbers("two point one half"), [2.0, 0.5])
+        self.assertEqual(extract_numbers("three point a quarter"),
+                         [3.0, 0.25])
+        self.assertEqual(extract_numbers("seven cats and nothing point "
+                                         "three dogs"), [7.3])
+        self.assertEqual(extract_numbers("seven cats " * 200 +
+                                         "and nothing point " +
+                                         "three dogs " * 200),
+                         [7] * 199 + [7.3] + [3] * 199)
+        self.assertEqual(extract_numbers("two eggs " * 200 + "and a half"),
+                         [2] * 199 + [2.5])
+
 
 class TestExtractDuration(unittest.TestCase):
     def test_extract_duration_en(self):
@@ -1697,6 +1726,125 @@ class TestExtractDateTime(unittest.TestCase):
             datetime(2019, 7, 4, 11, 21, 2, tzinfo=default_timezone()))
 
 
+class TestExtractDatetimes(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+
+    def spans(self, text):
+        return [(date.strftime("%Y-%m-%d %H:%M:%S"), text[start:end])
+                for date, (start, end)
+                in extract_datetimes(text, self.now)]
+
+    def test_extract_datetimes(self):
+        self.assertEqual(
+            self.spans("remind me tomorrow at 5 pm and on friday evening"),
+            [("2017-06-28 17:00:00", "tomorrow at 5 pm"),
+             ("2017-06-30 19:00:00", "on friday evening")])
+        self.assertEqual(
+            self.spans("from monday to wednesday at 3"),
+            [("2017-07-03 00:00:00", "from monday"),
+             ("2017-06-28 03:00:00", "wednesday at 3")])
+        self.assertEqual(self.spans("today at 5 pm and on friday"),
+                         [("2017-06-27 17:00:00", "today at 5 pm"),
+                          ("2017-06-30 00:00:00", "on friday")])
+        self.assertEqual(self.spans("now and tomorrow"),
+                         [("2017-06-27 13:04:00", "now"),
+                          ("2017-06-28 00:00:00", "tomorrow")])
+
+    def test_extract_datetimes_one_expression(self):
+        self.assertEqual(self.spans("lets meet in 2 hours and 30 minutes"),
+                         [("2017-06-27 15:34:00",
+                           "in 2 hours and 30 minutes")])
+        self.assertEqual(
+            self.spans("remind me to call mom in 8 weeks and 2 days"),
+            [("2017-08-24 00:00:00", "in 8 weeks and 2 days")])
+        # "night" qualifies the date, and is in its span
+        self.assertEqual(self.spans("set an alarm for tomorrow night"),
+                         [("2017-06-28 22:00:00", "for tomorrow night")])
+
+    def test_extract_datetimes_agrees_with_extract_datetime(self):
+        text = "what's the weather like on June 3rd 2020 at 8 am?"
+        self.assertEqual([date for date, _ in
+                          extract_datetimes(text, self.now)],
+                         [extract_datetime(text, self.now)[0]])
+
+    def test_extract_datetimes_none(self):
+        self.assertEqual(extract_datetimes("", self.now), [])
+        self.assertEqual(extract_datetimes("no date here", self.now), [])
+
+    def test_extract_datetimes_default_time(self):
+        default = time(9, 0, 0)
+        dates = extract_datetimes("on friday and on saturday", self.now,
+                                  default_time=default)
+        self.assertEqual([date.time() for date, _ in dates],
+                         [default, default])
+
+
+class TestTemporalExpression(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        # every day of a year, at times of day before and after 13:04
+        self.anchors = [self.now + timedelta(days=day, hours=day % 24,
+                                             minutes=day % 60)
+                        for day in range(366)]
+
+    def test_extract_temporal_expression(self):
+        expression = extract_temporal_expression("lets meet in 3 days at 8 pm",
+                                                 self.now)
+        self.assertEqual(expression.days, 3)
+        self.assertEqual((expression.hour, expression.minute), (20, 0))
+        self.assertIsNone(expression.date)
+        self.assertEqual(expression.leftover, "lets meet")
+        self.assertEqual(expression.anchored, {})
+
+        expression = extract_temporal_expression("june 5th 2018", self.now)
+        self.assertEqual(expression.date, (2018, 6, 5))
+        self.assertTrue(expression.has_year)
+
+        self.assertIsNone(extract_temporal_expression("no date here",
+                                                      self.now))
+
+    def test_anchored(self):
+        self.assertEqual(
+            extract_temporal_expression("next monday", self.now).anchored,
+            {"weekday": self.now.weekday()})
+        self.assertEqual(
+            extract_temporal_expression("at 5", self.now).anchored,
+            {"time": (13, 4)})
+
+    def test_resolve(self):
+        for text in ("tomorrow at 5 pm", "in 3 days", "in 2 hours",
+                     "next monday", "at 5", "june 5th", "on the 31st of may",
+                     "in 1 month", "in a year", "next weekend", "now",
+                     "last friday at 8", "in 10 minutes"):
+            expression = extract_temporal_expression(text, self.now)
+            self.assertEqual(
+                resolve(expression, self.anchors),
+                [extract_datetime(text, anchor)[0]
+                 for anchor in self.anchors], text)
+
+    def test_resolve_default_time(self):
+        default = time(9, 0, 0)
+        expression = extract_temporal_expression("on friday", self.now,
+                                                 default_time=default)
+        self.assertEqual(
+            resolve(expression, self.anchors),
+            [extract_datetime("on friday", anchor, default_time=default)[0]
+             for anchor in self.anchors])
+
+    def test_resolve_end_of_month(self):
+        expression = extract_temporal_expression("in 1 month", self.now)
+        self.assertEqual(
+            resolve(expression, [datetime(2020, 1, 31, 8, 0),
+                                 datetime(2021, 1, 31, 8, 0)]),
+            [datetime(2020, 2, 29, 0, 0, tzinfo=default_timezone()),
+             datetime(2021, 2, 28, 0, 0, tzinfo=default_timezone())])
+
+    def test_resolve_nothing(self):
+        expression = extract_temporal_expression("tomorrow", self.now)
+        self.assertEqual(resolve(expression, []), [])
+
+
 class TestGender(unittest.TestCase):
     # TODO not localized; needed in english?
     def test_gender(self):
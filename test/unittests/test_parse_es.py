@@ -19,7 +19,8 @@ import unittest
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import (normalize, extract_numbers, extract_number,
-                                 extract_datetime, yes_or_no, extract_duration)
+                                 extract_datetime, extract_datetimes,
+                                 yes_or_no, extract_duration)
 from lingua_franca.lang.parse_es import extract_datetime_es, is_fractional_es
 from lingua_franca.time import default_timezone, to_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 from lingua_franca.util.colors import Color, ColorOutOfSpace
@@ -228,6 +229,17 @@ class TestDatetime_es(unittest.TestCase):
         """Check that None is returned if no time is found in sentence."""
         self.assertEqual(extract_datetime('no hay tiempo', lang='es-es'), None)
 
+    def test_extractdatetimes_es(self):
+        text = "mueve la reunión del lunes al miércoles a las 3"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        # "miércoles" is not a date on its own for the parser
+        self.assertEqual(
+            [(date.replace(tzinfo=None), text[start:end]) for
+             date, (start, end) in extract_datetimes(text, anchor,
+                                                     lang='es-es')],
+            [(datetime(2017, 7, 3, 0, 0), "del lunes"),
+             (datetime(2017, 6, 28, 3, 0), "a las 3")])
+
     @unittest.skip("These phrases are not parsing correctly.")
     def test_extract_datetime_relative_failing(self):
         # parses as "morning" and returns 8:00 on anchorDate
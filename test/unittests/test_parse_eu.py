@@ -111,6 +111,11 @@ class TestNormalize(unittest.TestCase):
             "hamalau eta milarena", lang='eu'), 14.001)
 
         self.assertEqual(extract_number("bi puntu zero bi", lang='eu'), 2.02)
+        self.assertEqual(extract_number("bat eta bi", lang='eu'), 1.2)
+        self.assertEqual(extract_number("mila", lang='eu'), 1000)
+        self.assertEqual(extract_number("mila zaldi", lang='eu'), 1000)
+        self.assertEqual(extract_numbers("mila zaldi", lang='eu'), [1000])
+        self.assertEqual(extract_numbers("mila eta bat", lang='eu'), [1001])
 
     def test_isFraction_eu(self):
         self.assertEqual(isFractional_eu("hogeirena"), 1.0 / 20)
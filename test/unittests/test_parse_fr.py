@@ -21,8 +21,10 @@ from lingua_franca.internal import FunctionNotLocalizedError
 from lingua_franca.time import default_timezone
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetimes
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_numbers
 from lingua_franca.parse import normalize
 
 
@@ -97,6 +99,16 @@ class TestNormalize_fr(unittest.TestCase):
         self.assertEqual(extract_number("un 20e",
                                         lang="fr-fr"), 1.0 / 20.0)
 
+    def test_extractnumbers_fr(self):
+        self.assertEqual(extract_numbers("mange trente-et-une bougies et deux"
+                                         " gâteaux", lang="fr-fr"), [31, 2])
+        self.assertEqual(extract_numbers("voici le premier test et 2 tests",
+                                         lang="fr-fr"), [1, 2])
+        self.assertEqual(extract_numbers("un bol et demi puis trois quarts "
+                                         "de bol", lang="fr-fr"), [1.5, 0.75])
+        self.assertEqual(extract_numbers("2 virgule 0 2 cm et 1/3 de litre",
+                                         lang="fr-fr"), [2.02, 1.0 / 3.0])
+
     def test_extractdatetime_fr(self):
         def extractWithFormat_fr(text):
             date = datetime(2017, 6, 27, 0, 0, tzinfo=default_timezone())
@@ -331,6 +343,22 @@ class TestNormalize_fr(unittest.TestCase):
                                anchor, lang='fr-fr', default_time=default)
         self.assertEqual(default, res[0].time())
 
+    def test_extractdatetimes_fr(self):
+        text = "déplace la réunion de lundi à mercredi à 3 heures"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(
+            [(date.replace(tzinfo=None), text[start:end]) for
+             date, (start, end) in extract_datetimes(text, anchor,
+                                                     lang='fr-fr')],
+            [(datetime(2017, 7, 3, 0, 0), "de lundi"),
+             (datetime(2017, 6, 28, 3, 0), "mercredi à 3 heures")])
+        text = "commencer l'invasion jeudi à minuit"
+        self.assertEqual(
+            [(date.replace(tzinfo=None), text[start:end]) for
+             date, (start, end) in extract_datetimes(text, anchor,
+                                                     lang='fr-fr')],
+            [(datetime(2017, 6, 29, 0, 0), "jeudi à minuit")])
+
     def test_extract_duration_fr(self):
         self.assertEqual(extract_duration("10 secondes", lang="fr-fr"),
                          (timedelta(seconds=10.0), ""))
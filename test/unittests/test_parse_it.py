@@ -18,7 +18,7 @@ from datetime import datetime, time
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import get_gender
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetimes
 from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
 from lingua_franca.time import default_timezone
@@ -749,7 +749,7 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers('questo è  test dieci undici dodici',
                                          lang='it'), [10.0, 11.0, 12.0])
         self.assertEqual(extract_numbers('test dodici gatti ventuno',
-                                         lang='it'), [21.0, 12.0])
+                                         lang='it'), [12.0, 21.0])
         self.assertEqual(extract_numbers('1 cane, sette maiali, macdonald ' +
                                          'aveva la fattoria, 3 volte' +
                                          ' 5 macarena',
@@ -774,7 +774,7 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers('seimilioni', lang='it',
                                          short_scale=False), [6e6])
         self.assertEqual(extract_numbers('dodici maiali accompagnano \
-         seimiliardi di batteri', lang='it', short_scale=True), [6e9, 12])
+         seimiliardi di batteri', lang='it', short_scale=True), [12, 6e9])
 
         # TODO case when pronounced/extracted number don't match
         # fractional numbers often fail
@@ -794,6 +794,16 @@ class TestNormalize(unittest.TestCase):
                                anchor, lang='it-it', default_time=default)
         self.assertEqual(default, res[0].time())
 
+    def test_extractdatetimes_it(self):
+        text = "sposta la riunione da lunedì a mercoledì alle 3"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(
+            [(date.replace(tzinfo=None), text[start:end]) for
+             date, (start, end) in extract_datetimes(text, anchor,
+                                                     lang='it-it')],
+            [(datetime(2017, 7, 3, 0, 0), "da lunedì"),
+             (datetime(2017, 6, 28, 3, 0), "a mercoledì alle 3")])
+
     def test_gender_it(self):
         """
         Test cases for Italian grammar , lang='it'
@@ -18,7 +18,7 @@ import unittest
 from datetime import datetime, time, timedelta
 
 from lingua_franca import load_language, set_default_lang, unload_language
-from lingua_franca.parse import extract_datetime, extract_number, normalize, extract_duration
+from lingua_franca.parse import extract_datetime, extract_number, extract_numbers, normalize, extract_duration
 from lingua_franca.time import default_timezone
 
 
@@ -75,6 +75,8 @@ class TestParsing(unittest.TestCase):
                                         lang=LANG), 1.5)
         self.assertEqual(extract_number("anderhalf kopje",
                                         lang=LANG), 1.5)
+        self.assertEqual(extract_numbers("twee komma een half", lang=LANG),
+                         [2.0, 0.5])
         self.assertEqual(extract_number("driekwart kopje", lang=LANG),
                          3.0 / 4.0)
         self.assertEqual(extract_number("driekwart kopje", lang=LANG),
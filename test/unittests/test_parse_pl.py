@@ -58,6 +58,7 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_number("2/3 szklanki"), 2.0 / 3.0)
         self.assertEqual(extract_number("3/4 szklanki"), 3.0 / 4.0)
         self.assertEqual(extract_number("1 i 3/4 szklanki"), 1.75)
+        self.assertEqual(extract_number("szklanki 3/4"), 3.0 / 4.0)
         self.assertEqual(extract_number("1 szklanka i jedna druga"), 1.5)
         self.assertEqual(extract_number("jedna szklanka i jedna druga"), 1.5)
         self.assertEqual(extract_number("jeden i jedna druga szklanki"), 1.5)
@@ -532,6 +533,22 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual(extract_numbers("to jest siedem osiem dziewięć i"
                                          " pół test"),
                          [7.0, 8.0, 9.5])
+        self.assertEqual(extract_numbers("1/2 szklanki i 3/4"), [0.5, 0.75])
+
+    def test_fraction_after_number_with_ordinals(self):
+        # with ordinals the fraction isn't read with the number before it
+        self.assertEqual(extract_numbers("trzy piąte", ordinals=True),
+                         [3, 0.2])
+        self.assertEqual(extract_numbers("Dwadzieścia dwa i trzy piąte",
+                                         ordinals=True), [22, 3, 0.2])
+        self.assertEqual(extract_numbers("jedna szklanka i jedna druga",
+                                         ordinals=True), [1, 1, 0.5])
+        for text in ("trzy piąte", "Dwadzieścia dwa i trzy piąte",
+                     "jedna szklanka i jedna druga"):
+            self.assertEqual(extract_number(text, ordinals=True),
+                             extract_numbers(text, ordinals=True)[0])
+        self.assertEqual(extract_numbers("Dwadzieścia dwa i trzy piąte"),
+                         [22.6])
 
 
 if __name__ == "__main__":
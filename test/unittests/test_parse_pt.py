@@ -18,7 +18,7 @@ from datetime import datetime, time, timedelta
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import get_color, extract_color_spans
-from lingua_franca.parse import get_gender, extract_datetime, extract_number, normalize, yes_or_no, \
+from lingua_franca.parse import get_gender, extract_datetime, extract_datetimes, extract_number, normalize, yes_or_no, \
     extract_duration
 from lingua_franca.time import default_timezone, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 from lingua_franca.util.colors import Color, ColorOutOfSpace
@@ -257,6 +257,16 @@ class TestNormalize(unittest.TestCase):
             anchor, lang='pt-pt', default_time=default)
         self.assertEqual(default, res[0].time())
 
+    def test_extractdatetimes_pt(self):
+        text = "mova a reunião de segunda até quarta às 3"
+        anchor = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(
+            [(date.replace(tzinfo=None), text[start:end]) for
+             date, (start, end) in extract_datetimes(text, anchor,
+                                                     lang='pt-pt')],
+            [(datetime(2017, 7, 3, 0, 0), "de segunda"),
+             (datetime(2017, 6, 28, 3, 0), "quarta às 3")])
+
 
 class TestExtractDuration(unittest.TestCase):
     def test_extract_duration(self):
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from threading import Thread
+from unittest.mock import patch
+
+import lingua_franca
+import lingua_franca.parse
+from lingua_franca.resources import ResourceCache, lowercase_inverse
+
+
+class TestResourceCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResourceCache()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        lingua_franca.config.check_resource_mtimes = False
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_load_once(self):
+        colors = self.cache.get("text/en-us/colors.json")
+        self.assertEqual(colors["#0048BA"], "Absolute Zero")
+        self.assertIs(self.cache.get("text/en-us/colors.json"), colors)
+        names = self.cache.get("text/en-us/colors.json", lowercase_inverse)
+        self.assertEqual(names["absolute zero"], "#0048BA")
+        self.assertIs(self.cache.get("text/en-us/colors.json",
+                                     lowercase_inverse), names)
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 2)
+        self.assertGreater(stats["memory"], 0)
+
+    def test_concurrent_hits(self):
+        self.cache.get("text/en-us/colors.json")
+        threads = [Thread(target=lambda: [self.cache.get(
+            "text/en-us/colors.json") for _ in range(1000)])
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.cache.get_stats()["hits"], 8000)
+
+    def test_read_only(self):
+        colors = self.cache.get("text/en-us/colors.json")
+        with self.assertRaises(TypeError):
+            colors["#000000"] = "Not Black"
+        self.assertIsInstance(self.cache.get("text/en-us/langs.json")["el"],
+                              (str, tuple))
+
+    def test_missing(self):
+        self.assertIsNone(self.cache.get("text/xx-xx/colors.json"))
+        self.assertIsNone(self.cache.get("text/xx-xx/colors.json"))
+        self.assertEqual(self.cache.get_stats()["misses"], 1)
+
+    def test_word_file(self):
+        path = self.write("and.word", "# a comment\nund\n")
+        with patch("lingua_franca.resources.resolve_resource_file",
+                   return_value=path):
+            self.assertEqual(self.cache.get("and.word"), ("und",))
+
+    def test_invalidate(self):
+        path = self.write("test.json", '{"a": 1}')
+        with patch("lingua_franca.resources.resolve_resource_file",
+                   return_value=path):
+            self.assertEqual(self.cache.get("test.json")["a"], 1)
+            self.write("test.json", '{"a": 2}')
+            self.assertEqual(self.cache.get("test.json")["a"], 1)
+            self.cache.invalidate("other.json")
+            self.assertEqual(self.cache.get("test.json")["a"], 1)
+            self.cache.invalidate("test.json")
+            self.assertEqual(self.cache.get("test.json")["a"], 2)
+            self.write("test.json", '{"a": 3}')
+            self.cache.invalidate()
+            self.assertEqual(self.cache.get("test.json")["a"], 3)
+
+    def test_mtime_invalidation(self):
+        lingua_franca.config.check_resource_mtimes = True
+        path = self.write("test.json", '{"a": 1}')
+        with patch("lingua_franca.resources.resolve_resource_file",
+                   return_value=path), \
+                patch("lingua_franca.internal.RESOURCE_CHECK_INTERVAL", 0):
+            self.assertEqual(self.cache.get("test.json")["a"], 1)
+            self.write("test.json", '{"a": 2}')
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(self.cache.get("test.json")["a"], 2)
+
+
+class TestCachedCallers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        lingua_franca.load_language("en")
+
+    def test_no_file_reads(self):
+        lingua_franca.parse.extract_langcode("english", lang="en")
+        lingua_franca.parse.get_color("absolute zero", lang="en")
+        lingua_franca.parse.yes_or_no("yes", lang="en-us")
+        with patch("builtins.open") as mock_open:
+            self.assertEqual(lingua_franca.parse.extract_langcode(
+                "english", lang="en")[0], "en")
+            self.assertEqual(lingua_franca.parse.get_color(
+                "absolute zero", lang="en").hex, "#0048ba")
+            self.assertTrue(lingua_franca.parse.yes_or_no("yes", lang="en-us"))
+            mock_open.assert_not_called()
+
+    def test_normalizer_config(self):
+        # loaded through resource_cache, read-only
+        from lingua_franca.lang.parse_en import EnglishNormalizer
+        with self.assertRaises(TypeError):
+            EnglishNormalizer._default_config["lowercase"] = True